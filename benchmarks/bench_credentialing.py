@@ -0,0 +1,150 @@
+# -*- encoding: utf-8 -*-
+"""
+benchmarks.bench_credentialing module
+
+Credential issuance and verification along chains. Each credential after the
+first of a chain has a not issuee to issuee (NI2I) edge to the previous one
+so verification checks the schema, the TEL state, and one edge per
+credential. Issuance includes the TEL iss event and its anchoring interaction
+event in the issuer's KEL.
+
+Usage:
+    python benchmarks/bench_credentialing.py --creds 100 --chains 1 10
+"""
+import argparse
+import time
+
+from keri.app import habbing
+from keri.core import coring, scheming
+from keri.core.eventing import SealEvent
+from keri.vc import proving
+from keri.vdr import credentialing, verifying
+
+Salt = b'0123456789abcdef'
+
+
+def makeSchema(db):
+    """
+    Returns:
+        said (str): qb64 SAID of credential schema pinned in db
+
+    Parameters:
+        db (Baser): database of schema cache
+    """
+    sad = {
+        "$id": "",
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "title": "Benchmark Credential",
+        "type": "object",
+        "properties": {
+            "v": {"type": "string"},
+            "d": {"type": "string"},
+            "i": {"type": "string"},
+            "ri": {"type": "string"},
+            "s": {"type": "string"},
+            "a": {"type": "object"},
+            "e": {"type": "object"},
+        },
+        "required": ["v", "d", "i", "ri", "s", "a"],
+    }
+    _, sad = coring.Saider.saidify(sad=sad, label=coring.Saids.dollar)
+    schemer = scheming.Schemer(sed=sad)
+    db.schema.pin(schemer.said, schemer)
+    return schemer.said
+
+
+def anchor(hab, reg, pre, said):
+    """ Anchor TEL event said of pre in an interaction event of hab and
+    process it into the registry of reg
+
+    Parameters:
+        hab (Hab): issuer whose KEL anchors TEL event
+        reg (Registry): registry of TEL event
+        pre (str): qb64 prefix of TEL
+        said (str): qb64 SAID of TEL event
+    """
+    hab.interact(data=[SealEvent(pre, "0", said)._asdict()])
+    seqner = coring.Seqner(sn=hab.kever.sn)
+    reg.anchorMsg(pre=pre, regd=said, seqner=seqner, saider=hab.kever.serder.saider)
+
+
+def benchIssue(creds, chain):
+    """
+    Returns:
+        result (dict): microseconds per credential of issuance and verification
+
+    Parameters:
+        creds (int): number of credentials
+        chain (int): number of credentials in each chain
+    """
+    with habbing.openHab(name="issuer", temp=True, salt=Salt) as (hby, hab):
+        schema = makeSchema(hby.db)
+        regery = credentialing.Regery(hby=hby, name="issuer", temp=True)
+        registry = regery.makeRegistry(prefix=hab.pre, name="bench")
+        anchor(hab, registry, registry.regk, registry.regd)
+        regery.processEscrows()
+
+        creders = []
+        issue = 0.0
+        for idx in range(creds):
+            start = time.perf_counter()
+            source = None
+            if idx % chain:
+                _, source = coring.Saider.saidify(sad=dict(d="", prev=dict(n=creders[-1].said,
+                                                                           o="NI2I")))
+            data = dict(d="", dt="2021-06-27T21:26:21.233257+00:00", n=idx)
+            _, data = coring.Saider.saidify(sad=data)
+            creder = proving.credential(issuer=hab.pre, schema=schema, data=data,
+                                        status=registry.regk, source=source)
+            iss = registry.issue(said=creder.said)
+            anchor(hab, registry, iss.pre, iss.said)
+            regery.processEscrows()
+            issue += time.perf_counter() - start
+            creders.append(creder)
+
+        verifier = verifying.Verifier(hby=hby, reger=regery.reger)
+        seqner = coring.Seqner(sn=hab.kever.sn)
+        start = time.perf_counter()
+        for creder in creders:
+            verifier.processCredential(creder, prefixer=hab.kever.prefixer, seqner=seqner,
+                                       saider=hab.kever.serder.saider)
+        verify = time.perf_counter() - start
+        assert len(verifier.cues) == creds
+        assert all(cue["kin"] == "saved" for cue in verifier.cues)
+
+    return dict(issue=issue / creds * 1e6, verify=verify / creds * 1e6)
+
+
+def results(creds=100, chains=(1, 10)):
+    """
+    Returns:
+        results (list): of measurement dicts for benchmark suite
+
+    Parameters:
+        creds (int): number of credentials
+        chains (iterable): numbers of credentials in each chain
+    """
+    records = []
+    for chain in chains:
+        for name, value in benchIssue(creds, chain).items():
+            records.append(dict(name=f"credentialing.{name}", params=dict(creds=creds, chain=chain),
+                                unit="usec/cred", value=value))
+    return records
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Credential issuance and chain verification")
+    parser.add_argument("--creds", type=int, default=100,
+                        help="number of credentials")
+    parser.add_argument("--chains", type=int, nargs="+", default=[1, 10],
+                        help="numbers of credentials in each chain")
+    args = parser.parse_args()
+
+    for chain in args.chains:
+        result = benchIssue(args.creds, chain)
+        print(f"creds={args.creds} chain={chain:>4} issue usec={result['issue']:9.1f} "
+              f"verify usec={result['verify']:9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+# -*- encoding: utf-8 -*-
+"""
+benchmarks.bench_eventing module
+
+Kevery acceptance of inception, rotation, and interaction events of witnessed
+identifiers, non-transferable receipt processing, and Baser replay of the
+accepted key event logs both as a clone stream and as a bulk import.
+
+Every identifier has the same witnesses, its threshold of accountable
+duplicity is all of them and every event carries all witness signatures so
+acceptance verifies one controller signature plus one signature per witness.
+All keys derive from fixed salts so the streams are the same on every run.
+
+Usage:
+    python benchmarks/bench_eventing.py --aids 200 --wits 0 3 7
+"""
+import argparse
+import time
+
+from keri.app import importing
+from keri.core import coring, eventing, parsing
+from keri.db import basing
+
+Salt = b'0123456789abcdef'
+
+
+def makeWitnesses(count, salt=Salt):
+    """
+    Returns:
+        signers (list): count non-transferable witness Signer instances
+
+    Parameters:
+        count (int): number of witnesses
+        salt (bytes): fixed salt so witnesses are deterministic
+    """
+    salter = coring.Salter(raw=salt)
+    return [salter.signer(path=f"wit{idx}", transferable=False, temp=True)
+            for idx in range(count)]
+
+
+def makeStreams(aids, wits, salt=Salt):
+    """
+    Returns:
+        streams (dict): of bytearray keyed by ilk. Each stream holds one event
+            of that ilk for each of aids identifiers with controller and
+            witness signatures attached. Streams icp, rot, then ixn are in
+            order for each identifier.
+
+    Parameters:
+        aids (int): number of identifiers
+        wits (list): witness Signer instances of every identifier
+        salt (bytes): fixed salt so streams are deterministic
+    """
+    salter = coring.Salter(raw=salt)
+    prefixes = [wit.verfer.qb64 for wit in wits]
+    toad = len(wits)
+    streams = {coring.Ilks.icp: bytearray(), coring.Ilks.rot: bytearray(),
+               coring.Ilks.ixn: bytearray()}
+
+    for aid in range(aids):
+        signers = [salter.signer(path=f"{aid:x}.{sn}", temp=True) for sn in range(3)]
+        ndigs = [[coring.Diger(ser=signer.verfer.qb64b).qb64] for signer in signers]
+
+        icp = eventing.incept(keys=[signers[0].verfer.qb64], ndigs=ndigs[1],
+                              toad=toad, wits=prefixes)
+        rot = eventing.rotate(pre=icp.pre, keys=[signers[1].verfer.qb64],
+                              dig=icp.said, sn=1, ndigs=ndigs[2], toad=toad,
+                              wits=prefixes)
+        ixn = eventing.interact(pre=icp.pre, dig=rot.said, sn=2)
+
+        for serder, signer in ((icp, signers[0]), (rot, signers[1]), (ixn, signers[1])):
+            sigers = [signer.sign(ser=serder.raw, index=0)]
+            wigers = [wit.sign(ser=serder.raw, index=idx) for idx, wit in enumerate(wits)]
+            streams[serder.ked["t"]].extend(eventing.messagize(serder=serder,
+                                                               sigers=sigers,
+                                                               wigers=wigers or None))
+    return streams
+
+
+def makeReceipts(db, receiptors):
+    """
+    Returns:
+        stream (bytearray): non-transferable receipts of the latest event of
+            every identifier in db, one receipt message per receiptor
+
+    Parameters:
+        db (Baser): database with accepted key event logs
+        receiptors (list): non-transferable Signer instances of receiptors
+    """
+    stream = bytearray()
+    for pre, kever in db.kevers.items():
+        serder = eventing.receipt(pre=pre, sn=kever.sn, said=kever.serder.said)
+        for receiptor in receiptors:
+            cigar = receiptor.sign(ser=kever.serder.raw)
+            stream.extend(eventing.messagize(serder=serder, cigars=[cigar]))
+    return stream
+
+
+def benchAccept(aids, wits):
+    """
+    Returns:
+        result (dict): of microseconds per event keyed by measurement name
+            for acceptance of each ilk, receipts, clone replay, and bulk import
+
+    Parameters:
+        aids (int): number of identifiers
+        wits (int): number of witnesses of each identifier
+    """
+    witnesses = makeWitnesses(wits)
+    streams = makeStreams(aids, witnesses)
+    result = {}
+
+    with basing.openDB(name="bench", temp=True) as db:
+        kvy = eventing.Kevery(db=db, lax=True, local=False, direct=False)
+        psr = parsing.Parser(framed=True, kvy=kvy)
+        for ilk, stream in streams.items():
+            start = time.perf_counter()
+            psr.parse(ims=stream)
+            result[ilk] = (time.perf_counter() - start) / aids * 1e6
+        assert all(kever.sn == 2 for kever in db.kevers.values())
+        assert len(db.kevers) == aids
+
+        receiptors = makeWitnesses(3, salt=Salt[::-1])
+        stream = makeReceipts(db, receiptors)
+        start = time.perf_counter()
+        psr.parse(ims=stream)
+        result["rct"] = (time.perf_counter() - start) / (aids * len(receiptors)) * 1e6
+        assert db.cnt(db.rcts) == aids * len(receiptors)
+
+        events = db.cnt(db.fels)
+        start = time.perf_counter()
+        clone = bytearray()
+        for msg in db.cloneAllPreIter():
+            clone.extend(msg)
+        result["clone"] = (time.perf_counter() - start) / events * 1e6
+
+    with basing.openDB(name="import", temp=True) as db:
+        stats = importing.Importer(db=db).load(clone)
+        assert stats.events == events
+        result["import"] = stats.elapsed / events * 1e6
+
+    return result
+
+
+def results(aids=200, wits=(0, 3, 7)):
+    """
+    Returns:
+        results (list): of measurement dicts for benchmark suite
+
+    Parameters:
+        aids (int): number of identifiers
+        wits (iterable): numbers of witnesses of each identifier
+    """
+    records = []
+    for count in wits:
+        for name, value in benchAccept(aids, count).items():
+            records.append(dict(name=f"eventing.{name}", params=dict(aids=aids, wits=count),
+                                unit="usec/event", value=value))
+    return records
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Kevery acceptance, receipts, and replay")
+    parser.add_argument("--aids", type=int, default=200,
+                        help="number of identifiers")
+    parser.add_argument("--wits", type=int, nargs="+", default=[0, 3, 7],
+                        help="numbers of witnesses of each identifier")
+    args = parser.parse_args()
+
+    for wits in args.wits:
+        result = benchAccept(args.aids, wits)
+        print(f"aids={args.aids} wits={wits:>2} usec/event " +
+              " ".join(f"{name}={value:8.1f}" for name, value in result.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# -*- encoding: utf-8 -*-
+"""
+benchmarks.bench_keeping module
+
+Key pair generation by Manager.incept and signing by Manager.sign for salty
+key pairs, both with plain keystore secrets and with secrets encrypted to an
+authentication and encryption identifier (aeid) as a Habery with a passcode
+stores them.
+
+Usage:
+    python benchmarks/bench_keeping.py --count 500
+"""
+import argparse
+import time
+
+from keri.app import keeping
+from keri.core import coring
+
+Salt = b'0123456789abcdef'
+
+
+def benchManager(count, encrypt=False):
+    """
+    Returns:
+        result (dict): microseconds per operation of incept and sign
+
+    Parameters:
+        count (int): number of key pairs incepted and of signatures made
+        encrypt (bool): True means keystore secrets are encrypted
+    """
+    salt = coring.Salter(raw=Salt).qb64
+    kwa = {}
+    if encrypt:
+        signer = coring.Salter(raw=Salt[::-1]).signer(transferable=False, temp=True)
+        kwa = dict(seed=signer.qb64, aeid=signer.verfer.qb64)
+
+    with keeping.openKS(name="bench") as ks:
+        manager = keeping.Manager(ks=ks, salt=salt, **kwa)
+
+        start = time.perf_counter()
+        pubs = [manager.incept(stem=f"bench{idx}", temp=True)[0][0].qb64
+                for idx in range(count)]
+        incept = time.perf_counter() - start
+
+        ser = b"abcdefghijklmnopqrstuvwxyz0123456789" * 8
+        start = time.perf_counter()
+        for pub in pubs:
+            manager.sign(ser=ser, pubs=[pub])
+        sign = time.perf_counter() - start
+
+    return dict(incept=incept / count * 1e6, sign=sign / count * 1e6)
+
+
+def results(count=500):
+    """
+    Returns:
+        results (list): of measurement dicts for benchmark suite
+
+    Parameters:
+        count (int): number of key pairs incepted and of signatures made
+    """
+    records = []
+    for encrypt in (False, True):
+        for name, value in benchManager(count, encrypt=encrypt).items():
+            records.append(dict(name=f"keeping.{name}", params=dict(count=count, encrypt=encrypt),
+                                unit="usec/op", value=value))
+    return records
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manager key generation and signing")
+    parser.add_argument("--count", type=int, default=500,
+                        help="number of key pairs incepted and of signatures made")
+    args = parser.parse_args()
+
+    for encrypt in (False, True):
+        result = benchManager(args.count, encrypt=encrypt)
+        print(f"count={args.count} encrypt={encrypt!s:<5} incept usec={result['incept']:9.1f} "
+              f"sign usec={result['sign']:9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+# -*- encoding: utf-8 -*-
+"""
+benchmarks.bench_kli module
+
+Import time of kli subcommands. Runs each command with --help under
+python -X importtime in a fresh interpreter and sums the cumulative import
+time of the top level imports. With --check exits nonzero when any command
+is over its budget so the budgets guard against import time regressions
+such as a command module importing the whole command tree or a heavy
+dependency at module level.
+
+Usage:
+    python benchmarks/bench_kli.py --check
+    python benchmarks/bench_kli.py --commands "version" "vc create" --reps 5
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+# budget of import time in milliseconds per command
+Budgets = {
+    "version": 250,
+    "status": 900,
+    "list": 900,
+    "incept": 900,
+    "vc create": 1000,
+}
+
+
+def importTime(command):
+    """
+    Returns:
+        tuple: (imports, elapsed) where imports (float) is milliseconds of
+            cumulative import time of top level imports and elapsed (float) is
+            milliseconds of wall time of process
+
+    Parameters:
+        command (str): kli subcommand words separated by spaces
+    """
+    args = [sys.executable, "-X", "importtime", "-m", "keri.app.cli.kli",
+            *command.split(), "--help"]
+    start = time.perf_counter()
+    proc = subprocess.run(args, capture_output=True, text=True)
+    elapsed = (time.perf_counter() - start) * 1e3
+    if proc.returncode != 0:
+        raise RuntimeError(f"kli {command} failed: {proc.stderr[-500:]}")
+
+    total = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit() and not name.startswith("  "):  # top level
+            total += int(cumulative)
+    return total / 1e3, elapsed
+
+
+def results(commands=tuple(Budgets), reps=3):
+    """
+    Returns:
+        results (list): of measurement dicts for benchmark suite
+
+    Parameters:
+        commands (iterable): kli subcommands to measure
+        reps (int): runs per command, median is reported
+    """
+    records = []
+    for command in commands:
+        runs = [importTime(command) for _ in range(reps)]
+        records.append(dict(name="kli.import", params=dict(command=command), unit="msec",
+                            value=statistics.median(run[0] for run in runs)))
+    return records
+
+
+def main():
+    parser = argparse.ArgumentParser(description="kli import time budgets")
+    parser.add_argument("--commands", nargs="+", default=list(Budgets),
+                        help="kli subcommands to measure")
+    parser.add_argument("--reps", type=int, default=3,
+                        help="runs per command, median is reported")
+    parser.add_argument("--check", action="store_true",
+                        help="exit 1 when a command is over its budget")
+    args = parser.parse_args()
+
+    over = []
+    for command in args.commands:
+        runs = [importTime(command) for _ in range(args.reps)]
+        imports = statistics.median(run[0] for run in runs)
+        elapsed = statistics.median(run[1] for run in runs)
+        budget = Budgets.get(command)
+        status = "" if budget is None else ("ok" if imports <= budget else "OVER")
+        if status == "OVER":
+            over.append(command)
+        print(f"kli {command:<12} import msec={imports:8.1f} wall msec={elapsed:8.1f} "
+              f"budget msec={budget if budget is not None else '-':>6} {status}")
+
+    if args.check and over:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# -*- encoding: utf-8 -*-
+"""
+benchmarks.bench_parsing module
+
+Parser throughput on large KEL replay streams.
+
+Shows that extraction time scales linearly with the number of events in the
+stream. The parser strips each extracted message and attachment off the
+front of the incoming bytearray. CPython implements front deletion of a
+bytearray by advancing its logical start so this is amortized O(1) and needs
+no separate cursor.
+
+Usage:
+    python benchmarks/bench_parsing.py --counts 1000 10000 100000
+"""
+import argparse
+import time
+
+from keri.core import coring, eventing, parsing
+
+
+def makeStream(count, salt=b'0123456789abcdef'):
+    """
+    Returns:
+        stream (bytearray): count signed KEL events, an inception followed by
+            count - 1 interactions each with attached controller signature.
+
+    Parameters:
+        count (int): number of events in stream
+        salt (bytes): fixed salt so stream is deterministic
+    """
+    signer = coring.Salter(raw=salt).signer(path="00", transferable=True,
+                                             temp=True)
+    nxt = coring.Salter(raw=salt).signer(path="01", transferable=True,
+                                          temp=True)
+    serder = eventing.incept(keys=[signer.verfer.qb64],
+                             ndigs=[coring.Diger(ser=nxt.verfer.qb64b).qb64])
+    pre = serder.pre
+    stream = bytearray()
+    for sn in range(count):
+        if sn:
+            serder = eventing.interact(pre=pre, dig=serder.said, sn=sn)
+        siger = signer.sign(ser=serder.raw, index=0)
+        stream.extend(serder.raw)
+        stream.extend(coring.Counter(code=coring.CtrDex.ControllerIdxSigs).qb64b)
+        stream.extend(siger.qb64b)
+
+    return stream
+
+
+class Counting:
+    """Stand in for Kevery that only counts dispatched events"""
+
+    def __init__(self):
+        self.count = 0
+
+    def processEvent(self, **kwa):
+        self.count += 1
+
+
+def benchParse(count):
+    """
+    Returns:
+        elapsed (float): seconds to extract all count events from stream
+
+    Parameters:
+        count (int): number of events in stream
+    """
+    stream = makeStream(count)
+    kvy = Counting()
+    start = time.perf_counter()
+    parsing.Parser().parse(ims=stream, kvy=kvy)
+    elapsed = time.perf_counter() - start
+    assert kvy.count == count
+    return elapsed
+
+
+def results(counts=(1000, 10000)):
+    """
+    Returns:
+        results (list): of measurement dicts for benchmark suite
+
+    Parameters:
+        counts (iterable): numbers of events in each stream
+    """
+    return [dict(name="parsing.parse", params=dict(events=count), unit="usec/event",
+                 value=benchParse(count) / count * 1e6)
+            for count in counts]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parser stream throughput")
+    parser.add_argument("--counts", type=int, nargs="+",
+                        default=[1000, 10000, 100000],
+                        help="numbers of events in each stream")
+    args = parser.parse_args()
+
+    for count in args.counts:
+        elapsed = benchParse(count)
+        print(f"events={count:>8} seconds={elapsed:8.3f} "
+              f"usec/event={elapsed / count * 1e6:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
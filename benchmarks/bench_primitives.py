@@ -0,0 +1,98 @@
+# -*- encoding: utf-8 -*-
+"""
+benchmarks.bench_primitives module
+
+Primitive extraction throughput of Matter, Indexer, and Counter from qb64
+and qb2 streams. Each measurement builds a stream of many primitives of one
+code and extracts them all with strip=True the way the parser does.
+
+Usage:
+    python benchmarks/bench_primitives.py --count 20000
+"""
+import argparse
+import time
+
+from keri.core import coring
+
+
+def makeSamples():
+    """
+    Returns:
+        samples (list): of (name, klas, primitive) triples covering fixed size,
+            variable size, indexed, and count codes
+    """
+    seed = b"\x01" * 32
+    signer = coring.Signer(raw=seed, transferable=True)
+    sig = signer.sign(b"abc", index=3)
+    return [
+        ("Matter ed25519 verfer", coring.Matter, signer.verfer),
+        ("Matter blake3 digest", coring.Matter, coring.Diger(ser=b"abc")),
+        ("Matter seqner", coring.Matter, coring.Seqner(sn=5)),
+        ("Matter variable bytes", coring.Matter,
+         coring.Matter(raw=b"\x00" * 61, code=coring.MtrDex.Bytes_L0)),
+        ("Indexer ed25519 siger", coring.Indexer, sig),
+        ("Counter controller sigs", coring.Counter,
+         coring.Counter(code=coring.CtrDex.ControllerIdxSigs, count=3)),
+    ]
+
+
+def benchExfil(klas, stream, count, binary=False):
+    """
+    Returns:
+        rate (float): primitives extracted per second
+
+    Parameters:
+        klas (type): primitive class to extract with
+        stream (bytes): count concatenated primitives
+        count (int): number of primitives in stream
+        binary (bool): True means stream is qb2 else qb64
+    """
+    ims = bytearray(stream)
+    start = time.perf_counter()
+    if binary:
+        for _ in range(count):
+            klas(qb2=ims, strip=True)
+    else:
+        for _ in range(count):
+            klas(qb64b=ims, strip=True)
+    elapsed = time.perf_counter() - start
+    assert not ims
+    return count / elapsed
+
+
+def results(count=20000):
+    """
+    Returns:
+        results (list): of measurement dicts for benchmark suite
+
+    Parameters:
+        count (int): primitives per measurement
+    """
+    records = []
+    for name, klas, prim in makeSamples():
+        for encoding, stream, binary in (("qb64", prim.qb64b, False), ("qb2", prim.qb2, True)):
+            rate = benchExfil(klas, stream * count, count, binary=binary)
+            records.append(dict(name="primitives.exfil", params=dict(prim=name, encoding=encoding),
+                                unit="per sec", value=rate))
+        start = time.perf_counter()
+        for _ in range(count):
+            klas(qb64b=prim.qb64b).qb2
+        records.append(dict(name="primitives.encode", params=dict(prim=name, encoding="qb2"),
+                            unit="per sec", value=count / (time.perf_counter() - start)))
+    return records
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Primitive extraction throughput")
+    parser.add_argument("--count", type=int, default=20000,
+                        help="primitives per measurement")
+    args = parser.parse_args()
+
+    for name, klas, prim in makeSamples():
+        qb64 = benchExfil(klas, prim.qb64b * args.count, args.count)
+        qb2 = benchExfil(klas, prim.qb2 * args.count, args.count, binary=True)
+        print(f"{name:<24} qb64 per sec={qb64:>11,.0f} qb2 per sec={qb2:>11,.0f}")
+
+
+if __name__ == "__main__":
+    main()
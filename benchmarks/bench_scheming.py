@@ -0,0 +1,132 @@
+# -*- encoding: utf-8 -*-
+"""
+benchmarks.bench_scheming module
+
+JSON schema validation cost of a batch of credential attribute blocks.
+Compares jsonschema.validate, which checks and compiles the schema on every
+call, with the validators cached by schema SAID in scheming.ValidatorCache.
+
+Usage:
+    python benchmarks/bench_scheming.py --creds 10000 --schemas 1 4 16
+"""
+import argparse
+import json
+import time
+
+import jsonschema
+
+from keri.core import coring, scheming
+
+
+def makeSchema(idx):
+    """
+    Returns:
+        schemer (Schemer): saidified credential attributes schema
+
+    Parameters:
+        idx (int): distinguishes otherwise identical schemas
+    """
+    sad = {
+        "$id": "",
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "title": f"Credential {idx}",
+        "type": "object",
+        "properties": {
+            "d": {"type": "string"},
+            "i": {"type": "string"},
+            "dt": {"type": "string", "format": "date-time"},
+            "LEI": {"type": "string", "pattern": "^[A-Z0-9]{18}[0-9]{2}$"},
+            "n": {"type": "integer", "minimum": 0},
+        },
+        "additionalProperties": False,
+        "required": ["d", "i", "dt", "LEI", "n"],
+    }
+    _, sad = coring.Saider.saidify(sad=sad, label=coring.Saids.dollar)
+    return scheming.Schemer(sed=sad)
+
+
+def makeCreds(count):
+    """
+    Returns:
+        raws (list): serialized credential attribute blocks
+
+    Parameters:
+        count (int): number of credentials
+    """
+    pre = coring.Diger(ser=b"issuee").qb64
+    return [json.dumps(dict(d=coring.Diger(ser=b"%d" % n).qb64, i=pre,
+                            dt="2021-06-27T21:26:21.233257+00:00",
+                            LEI="254900OPPU84GM83MG36", n=n)).encode()
+            for n in range(count)]
+
+
+def benchValidate(schemers, raws):
+    """
+    Returns:
+        elapsed (float): seconds per credential using jsonschema.validate
+
+    Parameters:
+        schemers (list): Schemer instances used round robin
+        raws (list): serialized credentials
+    """
+    start = time.perf_counter()
+    for n, raw in enumerate(raws):
+        jsonschema.validate(instance=json.loads(raw), schema=schemers[n % len(schemers)].sed)
+    return (time.perf_counter() - start) / len(raws)
+
+
+def benchCached(schemers, raws):
+    """
+    Returns:
+        elapsed (float): seconds per credential using Schemer.verify
+
+    Parameters:
+        schemers (list): Schemer instances used round robin
+        raws (list): serialized credentials
+    """
+    scheming.validators.clear()
+    start = time.perf_counter()
+    for n, raw in enumerate(raws):
+        schemers[n % len(schemers)].verify(raw=raw)
+    return (time.perf_counter() - start) / len(raws)
+
+
+def results(creds=10000, schemas=(1, 16)):
+    """
+    Returns:
+        results (list): of measurement dicts for benchmark suite
+
+    Parameters:
+        creds (int): number of credentials in batch
+        schemas (iterable): numbers of distinct schemas used round robin
+    """
+    raws = makeCreds(creds)
+    records = []
+    for count in schemas:
+        schemers = [makeSchema(idx) for idx in range(count)]
+        records.append(dict(name="scheming.cached", params=dict(creds=creds, schemas=count),
+                            unit="usec/cred", value=benchCached(schemers, raws) * 1e6))
+    return records
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSON schema validator cache")
+    parser.add_argument("--creds", type=int, default=10000,
+                        help="number of credentials in batch")
+    parser.add_argument("--schemas", type=int, nargs="+", default=[1, 4, 16],
+                        help="numbers of distinct schemas used round robin")
+    args = parser.parse_args()
+
+    raws = makeCreds(args.creds)
+    for count in args.schemas:
+        schemers = [makeSchema(idx) for idx in range(count)]
+        full = benchValidate(schemers, raws)
+        cached = benchCached(schemers, raws)
+        cache = scheming.validators
+        print(f"creds={args.creds} schemas={count:>3} "
+              f"validate usec={full * 1e6:9.2f} cached usec={cached * 1e6:9.2f} "
+              f"speedup={full / cached:5.2f} hits={cache.hits} misses={cache.misses}")
+
+
+if __name__ == "__main__":
+    main()
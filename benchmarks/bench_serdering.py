@@ -0,0 +1,161 @@
+# -*- encoding: utf-8 -*-
+"""
+benchmarks.bench_serdering module
+
+SAID verification cost of Serder deserialization across message sizes and
+serialization kinds. Compares the splice fast path of Serder._verify with
+the full path that reserializes a dummied copy of the sad. Also measures
+creation of KERI interaction events and creation and verification of ACDC
+credentials with many attributes.
+
+Usage:
+    python benchmarks/bench_serdering.py --seals 0 10 100 1000 --reps 2000
+"""
+import argparse
+import time
+
+from keri.core import coring, eventing, serdering
+from keri.kering import Serials
+from keri.vc import proving
+
+
+def makeRaw(seals, kind=Serials.json):
+    """
+    Returns:
+        raw (bytes): serialized interaction event with seals anchored seals
+
+    Parameters:
+        seals (int): number of event seals in data field
+        kind (str): serialization kind
+    """
+    pre = coring.Diger(ser=b"pre").qb64
+    data = [dict(i=pre, s=f"{sn:x}", d=coring.Diger(ser=b"%d" % sn).qb64)
+            for sn in range(seals)]
+    serder = eventing.interact(pre=pre, dig=coring.Diger(ser=b"dig").qb64,
+                               sn=1, data=data, kind=kind)
+    return serder.raw
+
+
+def makeCreder(attrs, kind=Serials.json):
+    """
+    Returns:
+        creder (Creder): credential with attrs attributes in its subject
+
+    Parameters:
+        attrs (int): number of attributes in subject
+        kind (str): serialization kind
+    """
+    pre = coring.Diger(ser=b"pre").qb64
+    data = dict(d="", i=pre, dt="2021-06-27T21:26:21.233257+00:00")
+    data.update({f"attr{idx}": coring.Diger(ser=b"%d" % idx).qb64 for idx in range(attrs)})
+    _, data = coring.Saider.saidify(sad=data)
+    return proving.credential(issuer=pre, schema=coring.Diger(ser=b"schema").qb64,
+                              data=data, status=coring.Diger(ser=b"regk").qb64,
+                              kind=kind)
+
+
+def benchCreate(seals, reps, kind=Serials.json):
+    """
+    Returns:
+        result (dict): seconds per creation of KERI interaction event and of
+            ACDC credential with seals anchored seals or attributes
+
+    Parameters:
+        seals (int): number of anchored seals and of credential attributes
+        reps (int): number of repetitions
+        kind (str): serialization kind
+    """
+    start = time.perf_counter()
+    for _ in range(reps):
+        makeRaw(seals, kind=kind)
+    keri = (time.perf_counter() - start) / reps
+    start = time.perf_counter()
+    for _ in range(reps):
+        makeCreder(seals, kind=kind)
+    acdc = (time.perf_counter() - start) / reps
+    return dict(keri=keri, acdc=acdc)
+
+
+def benchVerifyACDC(raw, reps):
+    """
+    Returns:
+        elapsed (float): seconds per ACDC deserialization with verification
+
+    Parameters:
+        raw (bytes): serialized credential
+        reps (int): number of repetitions
+    """
+    start = time.perf_counter()
+    for _ in range(reps):
+        serdering.SerderACDC(raw=raw)
+    return (time.perf_counter() - start) / reps
+
+
+def benchVerify(raw, reps, splice=True):
+    """
+    Returns:
+        elapsed (float): seconds per deserialization with verification
+
+    Parameters:
+        raw (bytes): serialized event
+        reps (int): number of repetitions
+        splice (bool): True means use splice fast path
+    """
+    serdering.Serder.Splice = splice
+    try:
+        start = time.perf_counter()
+        for _ in range(reps):
+            serdering.SerderKERI(raw=raw)
+        return (time.perf_counter() - start) / reps
+    finally:
+        serdering.Serder.Splice = True
+
+
+def results(seals=(0, 10, 100), reps=2000):
+    """
+    Returns:
+        results (list): of measurement dicts for benchmark suite
+
+    Parameters:
+        seals (iterable): numbers of anchored seals and of credential attributes
+        reps (int): repetitions per measurement
+    """
+    records = []
+    for kind in (Serials.json, Serials.cbor, Serials.mgpk):
+        for count in seals:
+            params = dict(kind=kind, seals=count)
+            times = max(reps // max(count // 10, 1), 10)
+            created = benchCreate(count, times, kind=kind)
+            measures = dict(
+                keri_create=created["keri"],
+                keri_verify=benchVerify(makeRaw(count, kind=kind), times),
+                acdc_create=created["acdc"],
+                acdc_verify=benchVerifyACDC(makeCreder(count, kind=kind).raw, times),
+            )
+            for name, value in measures.items():
+                records.append(dict(name=f"serdering.{name}", params=params,
+                                    unit="usec/msg", value=value * 1e6))
+    return records
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serder SAID verification")
+    parser.add_argument("--seals", type=int, nargs="+", default=[0, 10, 100, 1000],
+                        help="numbers of anchored seals in each event")
+    parser.add_argument("--reps", type=int, default=2000,
+                        help="repetitions per measurement")
+    args = parser.parse_args()
+
+    for kind in (Serials.json, Serials.cbor, Serials.mgpk):
+        for seals in args.seals:
+            raw = makeRaw(seals, kind=kind)
+            reps = max(args.reps // max(seals // 10, 1), 10)
+            full = benchVerify(raw, reps, splice=False)
+            fast = benchVerify(raw, reps, splice=True)
+            print(f"kind={kind} seals={seals:>5} bytes={len(raw):>7} "
+                  f"full usec={full * 1e6:9.2f} splice usec={fast * 1e6:9.2f} "
+                  f"speedup={full / fast:5.2f}")
+
+
+if __name__ == "__main__":
+    main()
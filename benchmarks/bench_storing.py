@@ -0,0 +1,94 @@
+# -*- encoding: utf-8 -*-
+"""
+benchmarks.bench_storing module
+
+Mailbox store and stream throughput. Stores messages round robin across
+topics with Mailboxer.storeMsg then streams every topic from the start with
+Mailboxer.cloneTopicIter the way a mailbox query does.
+
+Usage:
+    python benchmarks/bench_storing.py --msgs 10000 --topics 1 100
+"""
+import argparse
+import json
+import time
+
+from keri.app import storing
+from keri.core import coring
+from keri.db import dbing
+
+Salt = b'0123456789abcdef'
+
+
+def makeMsgs(count):
+    """
+    Returns:
+        msgs (list): count distinct serialized exn like messages
+
+    Parameters:
+        count (int): number of messages
+    """
+    pre = coring.Salter(raw=Salt).signer(temp=True).verfer.qb64
+    return [json.dumps(dict(t="exn", i=pre, r="/fwd", a=dict(n=idx, m="x" * 200)))
+            for idx in range(count)]
+
+
+def benchMailbox(count, topics):
+    """
+    Returns:
+        result (dict): microseconds per message of store and stream
+
+    Parameters:
+        count (int): number of messages
+        topics (int): number of topics messages are stored round robin across
+    """
+    msgs = makeMsgs(count)
+    names = [f"{coring.Diger(ser=b'%d' % idx).qb64}/fwd" for idx in range(topics)]
+
+    with dbing.openLMDB(cls=storing.Mailboxer, name="bench") as mbx:
+        start = time.perf_counter()
+        for idx, msg in enumerate(msgs):
+            mbx.storeMsg(topic=names[idx % topics], msg=msg)
+        store = time.perf_counter() - start
+
+        start = time.perf_counter()
+        streamed = sum(1 for name in names for _ in mbx.cloneTopicIter(name))
+        stream = time.perf_counter() - start
+        assert streamed == count
+
+    return dict(store=store / count * 1e6, stream=stream / count * 1e6)
+
+
+def results(count=10000, topics=(1, 100)):
+    """
+    Returns:
+        results (list): of measurement dicts for benchmark suite
+
+    Parameters:
+        count (int): number of messages
+        topics (iterable): numbers of topics
+    """
+    records = []
+    for tops in topics:
+        for name, value in benchMailbox(count, tops).items():
+            records.append(dict(name=f"storing.{name}", params=dict(msgs=count, topics=tops),
+                                unit="usec/msg", value=value))
+    return records
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mailbox store and stream")
+    parser.add_argument("--msgs", type=int, default=10000,
+                        help="number of messages")
+    parser.add_argument("--topics", type=int, nargs="+", default=[1, 100],
+                        help="numbers of topics messages are stored across")
+    args = parser.parse_args()
+
+    for topics in args.topics:
+        result = benchMailbox(args.msgs, topics)
+        print(f"msgs={args.msgs} topics={topics:>5} store usec={result['store']:8.2f} "
+              f"stream usec={result['stream']:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
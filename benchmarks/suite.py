@@ -0,0 +1,162 @@
+# -*- encoding: utf-8 -*-
+"""
+benchmarks.suite module
+
+Runs the results function of every benchmark module and writes all
+measurements with the commit, interpreter, and platform they were taken on
+as one JSON document so runs on different commits can be compared. With
+--baseline compares against an earlier document and exits nonzero when any
+measurement regressed by more than --threshold.
+
+All benchmarks run offline on temporary databases and derive their keys from
+fixed salts so each run measures the same work.
+
+Usage:
+    python benchmarks/suite.py --output bench.json
+    python benchmarks/suite.py --quick --only eventing credentialing
+    python benchmarks/suite.py --output new.json --baseline bench.json --threshold 0.2
+"""
+import argparse
+import datetime
+import importlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+# benchmark modules with keyword arguments of their results function for full
+# and for quick runs
+Benches = {
+    "primitives": (dict(), dict(count=2000)),
+    "serdering": (dict(), dict(seals=(0, 10), reps=200)),
+    "parsing": (dict(), dict(counts=(1000,))),
+    "eventing": (dict(), dict(aids=20, wits=(0, 3))),
+    "credentialing": (dict(), dict(creds=20, chains=(1, 10))),
+    "storing": (dict(), dict(count=1000, topics=(1, 10))),
+    "keeping": (dict(), dict(count=50)),
+    "scheming": (dict(), dict(creds=1000)),
+    "kli": (dict(), dict(commands=("version",), reps=1)),
+}
+
+# units in which a larger value is better, all others are costs
+Rates = ("per sec",)
+
+
+def commit():
+    """
+    Returns:
+        commit (str | None): git commit hash of working tree or None when not
+            in a git checkout
+    """
+    try:
+        proc = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True,
+                              text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    except OSError:
+        return None
+    return proc.stdout.strip() if proc.returncode == 0 else None
+
+
+def run(names, quick=False):
+    """
+    Returns:
+        doc (dict): run metadata and list of measurement dicts
+
+    Parameters:
+        names (iterable): benchmark module names without bench_ prefix
+        quick (bool): True means run with smaller workloads
+    """
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    records = []
+    for name in names:
+        kwa = Benches[name][1 if quick else 0]
+        start = time.perf_counter()
+        module = importlib.import_module(f"bench_{name}")
+        for record in module.results(**kwa):
+            record["params"] = {key: list(val) if isinstance(val, tuple) else val
+                                for key, val in record["params"].items()}
+            records.append(record)
+        print(f"{name:<14} {time.perf_counter() - start:7.1f} seconds", file=sys.stderr)
+
+    return dict(commit=commit(),
+                date=datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                python=platform.python_version(),
+                implementation=platform.python_implementation(),
+                platform=platform.platform(),
+                machine=platform.machine(),
+                quick=quick,
+                results=records)
+
+
+def key(record):
+    """
+    Returns:
+        key (str): identity of measurement across runs
+    """
+    return f"{record['name']} {json.dumps(record['params'], sort_keys=True)}"
+
+
+def compare(doc, baseline, threshold=0.1):
+    """
+    Returns:
+        regressions (list): of (key, old, new, change) of measurements in both
+            doc and baseline that are worse by more than threshold. Change is
+            the fractional increase in cost, so rates are inverted first.
+
+    Parameters:
+        doc (dict): current run
+        baseline (dict): earlier run
+        threshold (float): fraction of allowed increase in cost
+    """
+    olds = {key(record): record for record in baseline["results"]}
+    regressions = []
+    for record in doc["results"]:
+        old = olds.get(key(record))
+        if old is None or not old["value"] or not record["value"]:
+            continue
+        if record["unit"] in Rates:
+            change = old["value"] / record["value"] - 1.0
+        else:
+            change = record["value"] / old["value"] - 1.0
+        print(f"{key(record):<72} {old['value']:12.2f} {record['value']:12.2f} "
+              f"{record['unit']:<10} {change:+7.1%}", file=sys.stderr)
+        if change > threshold:
+            regressions.append((key(record), old["value"], record["value"], change))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="KERI benchmark suite")
+    parser.add_argument("--only", nargs="+", choices=list(Benches), default=list(Benches),
+                        help="benchmarks to run")
+    parser.add_argument("--quick", action="store_true",
+                        help="run smaller workloads such as for a smoke test")
+    parser.add_argument("--output", "-o", default="-",
+                        help="file to write JSON results to, default is stdout")
+    parser.add_argument("--baseline", default=None,
+                        help="JSON results of earlier run to compare with")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="fraction of cost increase over baseline that is a regression")
+    args = parser.parse_args()
+
+    doc = run(args.only, quick=args.quick)
+    out = json.dumps(doc, indent=2)
+    if args.output == "-":
+        print(out)
+    else:
+        with open(args.output, "w") as f:
+            f.write(out + "\n")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(doc, baseline, threshold=args.threshold)
+        for name, old, new, change in regressions:
+            print(f"REGRESSION {name} {old:.2f} -> {new:.2f} ({change:+.1%})", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
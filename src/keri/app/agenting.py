@@ -506,7 +506,7 @@ class WitnessInquisitor(doing.DoDoer):
 
             yield self.tock
 
-    def query(self, pre, r="logs", sn=0, src=None, hab=None, anchor=None, wits=None, **kwa):
+    def query(self, pre, r="logs", sn=0, src=None, hab=None, anchor=None, wits=None, fn=None, **kwa):
         """ Create, sign and return a `qry` message against the attester for the prefix
 
         Parameters:
@@ -517,6 +517,7 @@ class WitnessInquisitor(doing.DoDoer):
             sn (int): optional specific sequence number to query for
             anchor (Seal) anchor to search for
             wits (list) witnesses to query
+            fn (int): optional first seen number from which to resume replay
 
         Returns:
             bytearray: signed query event
@@ -525,6 +526,8 @@ class WitnessInquisitor(doing.DoDoer):
         qry = dict(s=sn)
         if anchor is not None:
             qry["a"] = anchor
+        if fn is not None:
+            qry["fn"] = fn
 
         msg = dict(src=src, pre=pre, r=r, q=qry, wits=wits)
         if hab is not None:
@@ -28,6 +28,8 @@ parser.add_argument('--passcode', '-p', help='22 character encryption passcode f
 parser.add_argument("--files", help="export artifacts to individual files keyed off of AIDs or SAIDS, default is "
                                     "stdout", action="store_true")
 parser.add_argument("--ends", help="export service end points", action="store_true")
+parser.add_argument("--fn", help="first seen number from which to resume KEL export, default is 0",
+                    type=int, default=0)
 
 
 def export(args):
@@ -40,15 +42,17 @@ def export(args):
                     base=args.base,
                     bran=args.bran,
                     ends=args.ends,
-                    files=args.files,)
+                    files=args.files,
+                    fn=args.fn)
     return [ed]
 
 
 class ExportDoer(doing.DoDoer):
 
-    def __init__(self, name, alias, base, bran, ends, files):
+    def __init__(self, name, alias, base, bran, ends, files, fn=0):
         self.files = files
         self.ends = ends
+        self.fn = fn
 
         self.hby = existing.setupHby(name=name, base=base, bran=bran)
         self.hab = self.hby.habByName(alias)
@@ -88,14 +92,11 @@ class ExportDoer(doing.DoDoer):
         if self.files:
             f = open(f"{pre}-kel.cesr", "w")
 
-        for msg in self.hby.db.clonePreIter(pre=pre):
+        for _, chunk in self.hby.db.streamPreIter(pre=pre, fn=self.fn):
             if f is not None:
-                f.write(msg.decode("utf-8"))
+                f.write(chunk.decode("utf-8"))
             else:
-                serder = coring.Serder(raw=msg)
-                atc = msg[serder.size:]
-                sys.stdout.write(serder.raw.decode("utf-8"))
-                sys.stdout.write(atc.decode("utf-8"))
+                sys.stdout.write(chunk.decode("utf-8"))
 
         if f is not None:
             f.close()
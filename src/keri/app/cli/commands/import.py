@@ -0,0 +1,113 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.kli.commands module
+
+"""
+import argparse
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from hio import help
+from hio.base import doing
+
+from keri.app import importing
+from keri.app.cli.common import existing
+from keri.core import eventing, parsing
+
+logger = help.ogler.getLogger()
+
+parser = argparse.ArgumentParser(description='Import key event logs from a first seen replay stream such as kli '
+                                             'export output')
+parser.set_defaults(handler=lambda args: importKELs(args))
+parser.add_argument('--name', '-n', help='keystore name and file location of KERI keystore', required=True)
+parser.add_argument('--base', '-b', help='additional optional prefix to file location of KERI keystore',
+                    required=False, default="")
+parser.add_argument('--passcode', '-p', help='22 character encryption passcode for keystore (is not saved)',
+                    dest="bran", default=None)  # passcode => bran
+parser.add_argument("--file", "-f", help="file of replay stream to import, default is stdin", default="-")
+parser.add_argument("--bulk", help="bulk import already validated events with batched commits, no cues and "
+                                   "escrows processed once at end", action="store_true")
+parser.add_argument("--batch", help="messages per transaction in bulk mode", type=int,
+                    default=importing.Importer.BatchSize)
+parser.add_argument("--workers", type=int, default=None,
+                    help="verify signatures of each batch in bulk mode in this many worker processes, "
+                         "0 means one per cpu. Default is to verify on the main loop.")
+
+
+def importKELs(args):
+    """ Command line import key event logs handler
+
+    """
+    ld = ImportDoer(name=args.name,
+                    base=args.base,
+                    bran=args.bran,
+                    file=args.file,
+                    bulk=args.bulk,
+                    batch=args.batch,
+                    workers=args.workers)
+    return [ld]
+
+
+class ImportDoer(doing.DoDoer):
+    ChunkSize = 65536  # bytes of replay stream read at a time in bulk mode
+
+    def __init__(self, name, base, bran, file="-", bulk=False, batch=None, workers=None):
+        self.file = file
+        self.bulk = bulk
+        self.batch = batch
+        self.workers = workers
+
+        self.hby = existing.setupHby(name=name, base=base, bran=bran)
+
+        doers = [doing.doify(self.importDo)]
+
+        super(ImportDoer, self).__init__(doers=doers)
+
+    def importDo(self, tymth, tock=0.0):
+        """ Import replay stream into key event logs of keystore
+
+        Parameters:
+            tymth (function): injected function wrapper closure returned by .tymen() of
+                Tymist instance. Calling tymth() returns associated Tymist .tyme.
+            tock (float): injected initial tock value
+
+        Returns:  doifiable Doist compatible generator method
+
+        """
+        # enter context
+        self.wind(tymth)
+        self.tock = tock
+        _ = (yield self.tock)
+
+        f = sys.stdin.buffer if self.file == "-" else open(self.file, "rb")
+        try:
+            chunks = iter(lambda: f.read(self.ChunkSize), b"")
+            if self.bulk and self.workers is not None:
+                with ProcessPoolExecutor(max_workers=self.workers if self.workers else None) as pool:
+                    importer = importing.Importer(db=self.hby.db, size=self.batch, pool=pool)
+                    stats = importer.load(bytearray(), chunks=chunks)
+            elif self.bulk:
+                importer = importing.Importer(db=self.hby.db, size=self.batch)
+                stats = importer.load(bytearray(), chunks=chunks)
+            else:
+                stats = importing.ImportStats()
+                fels = self.hby.db.cnt(self.hby.db.fels)
+                kvy = eventing.Kevery(db=self.hby.db, lax=True, local=False, cloned=True, direct=False)
+                start = time.perf_counter()
+                parsing.Parser(framed=False, kvy=kvy).parse(ims=bytearray(b"".join(chunks)))
+                kvy.processEscrows()
+                stats.elapsed = time.perf_counter() - start
+                stats.events = self.hby.db.cnt(self.hby.db.fels) - fels
+        finally:
+            if f is not sys.stdin.buffer:
+                f.close()
+
+        print(f"Imported {stats.events} events in {stats.elapsed:.3f} seconds, "
+              f"{stats.rate:.1f} events/second")
+        if stats.failed:
+            print(f"Failed to import {stats.failed} messages, see log for errors", file=sys.stderr)
+
+        self.hby.close()
+        return True
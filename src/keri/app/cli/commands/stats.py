@@ -0,0 +1,90 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.kli.commands module
+
+"""
+import argparse
+import json
+import sys
+import urllib.parse
+import urllib.request
+
+from hio import help
+from hio.base import doing
+
+from keri.app.cli.common import existing
+from keri.help import metering
+
+logger = help.ogler.getLogger()
+
+parser = argparse.ArgumentParser(description='Print runtime metrics of a witness started with --metrics or escrow '
+                                             'and database statistics of a local keystore')
+parser.set_defaults(handler=lambda args: handler(args))
+parser.add_argument("--url", "-u", help="URL of running witness HTTP port or of its /metrics endpoint",
+                    default=None)
+parser.add_argument('--name', '-n', help='keystore name and file location of KERI keystore', default=None)
+parser.add_argument('--base', '-b', help='additional optional prefix to file location of KERI keystore',
+                    required=False, default="")
+parser.add_argument('--passcode', '-p', help='22 character encryption passcode for keystore (is not saved)',
+                    dest="bran", default=None)  # passcode => bran
+parser.add_argument("--json", help="print metrics as JSON instead of Prometheus text", action="store_true")
+
+
+def handler(args):
+    kwa = dict(args=args)
+    return [doing.doify(stats, **kwa)]
+
+
+def metricsUrl(url, fmt=None):
+    """
+    Returns:
+        url (str): of /metrics endpoint of url when url has no path
+
+    Parameters:
+        url (str): witness HTTP URL or metrics endpoint URL
+        fmt (str | None): format query parameter, None means Prometheus text
+    """
+    parts = urllib.parse.urlsplit(url)
+    path = parts.path if parts.path.strip("/") else "/metrics"
+    query = urllib.parse.urlencode(dict(format=fmt)) if fmt else parts.query
+    return urllib.parse.urlunsplit((parts.scheme, parts.netloc, path, query, ""))
+
+
+def stats(tymth, tock=0.0, **opts):
+    """ Command line stats handler
+
+    """
+    _ = (yield tock)
+    args = opts["args"]
+
+    if args.url is None and args.name is None:
+        print("one of --url or --name is required", file=sys.stderr)
+        return -1
+
+    if args.url is not None:
+        with urllib.request.urlopen(metricsUrl(args.url, "json" if args.json else None)) as rep:
+            body = rep.read().decode("utf-8")
+        if args.json:
+            print(json.dumps(json.loads(body), indent=1))
+        else:
+            print(body, end="")
+        return True
+
+    from keri.app import indirecting
+
+    mtr = metering.Meter()
+    with existing.existingHby(name=args.name, base=args.base, bran=args.bran) as hby:
+        indirecting.meterDbs(dbs=dict(baser=hby.db), mtr=mtr)
+        indirecting.meterEscrows(db=hby.db, mtr=mtr)
+        mtr.gauge("keri_kels", help="Identifiers with key event logs",
+                  fn=lambda: hby.db.cnt(hby.db.states.sdb))
+        mtr.gauge("keri_first_seen_events", help="Events in first seen event logs",
+                  fn=lambda: hby.db.cnt(hby.db.fels))
+
+        if args.json:
+            print(json.dumps(mtr.snapshot(), indent=1))
+        else:
+            print(mtr.render(), end="")
+
+    return True
@@ -47,6 +47,16 @@ parser.add_argument('--config-file',
 parser.add_argument("--keypath", action="store", required=False, default=None)
 parser.add_argument("--certpath", action="store", required=False, default=None)
 parser.add_argument("--cafilepath", action="store", required=False, default=None)
+parser.add_argument("--workers", action="store", type=int, required=False, default=None,
+                    help="parse and verify inbound HTTP messages in this many worker processes, "
+                         "0 means one per cpu. Default is to parse on the main loop.")
+parser.add_argument("--signer-cache", dest="signerCache", action="store", type=int, required=False,
+                    default=0, help="cache this many decrypted signing keys in memory for receipting. "
+                                    "Default 0 is no cache.")
+parser.add_argument("--metrics", action="store_true", required=False, default=False,
+                    help="record runtime metrics and serve them at /metrics of the HTTP port. "
+                         "The endpoint is not authenticated so anyone who can reach the HTTP port "
+                         "can read them. Read them with kli stats.")
 
 
 def launch(args):
@@ -68,14 +78,18 @@ def launch(args):
                configFile=args.configFile,
                keypath=args.keypath,
                certpath=args.certpath,
-               cafilepath=args.cafilepath)
+               cafilepath=args.cafilepath,
+               workers=args.workers,
+               signerCache=args.signerCache,
+               metrics=args.metrics)
 
     logger.info("\n******* Ended Witness for %s listening: http/%s, tcp/%s"
                 ".******\n\n", args.name, args.http, args.tcp)
 
 
 def runWitness(name="witness", base="", alias="witness", bran="", tcp=5631, http=5632, expire=0.0,
-               configDir="", configFile="", keypath=None, certpath=None, cafilepath=None):
+               configDir="", configFile="", keypath=None, certpath=None, cafilepath=None,
+               workers=None, signerCache=0, metrics=False):
     """
     Setup and run one witness
     """
@@ -91,10 +105,11 @@ def runWitness(name="witness", base="", alias="witness", bran="", tcp=5631, http
     if configFile is not None:
         cf = configing.Configer(name=configFile, headDirPath=configDir, temp=False, reopen=True, clear=False)
 
+    cache = keeping.SignerCache(size=signerCache) if signerCache else None
     if aeid is None:
-        hby = habbing.Habery(name=name, base=base, bran=bran, cf=cf)
+        hby = habbing.Habery(name=name, base=base, bran=bran, cf=cf, cache=cache)
     else:
-        hby = existing.setupHby(name=name, base=base, bran=bran, cf=cf)
+        hby = existing.setupHby(name=name, base=base, bran=bran, cf=cf, cache=cache)
 
     hbyDoer = habbing.HaberyDoer(habery=hby)  # setup doer
     doers = [hbyDoer]
@@ -105,6 +120,8 @@ def runWitness(name="witness", base="", alias="witness", bran="", tcp=5631, http
                                           httpPort=http,
                                           keypath=keypath,
                                           certpath=certpath,
-                                          cafilepath=cafilepath))
+                                          cafilepath=cafilepath,
+                                          workers=workers,
+                                          metrics=metrics))
 
-    directing.runController(doers=doers, expire=expire)
+    directing.runController(doers=doers, expire=expire, metered=metrics)
@@ -12,7 +12,7 @@ from keri import kering
 from keri.app import habbing, keeping
 
 
-def setupHby(name, base="", bran=None, cf=None):
+def setupHby(name, base="", bran=None, cf=None, cache=None):
     """ Create Habery off of existing directory
 
     Parameters:
@@ -20,6 +20,7 @@ def setupHby(name, base="", bran=None, cf=None):
         base(str): optional base directory prefix
         bran(str): optional passcode if the Habery was created encrypted
         cf (Configer): optional configuration for loading reference data
+        cache (SignerCache): optional cache of decrypted signers
 
     Returns:
           Habery:  the configured habery
@@ -44,7 +45,7 @@ def setupHby(name, base="", bran=None, cf=None):
                 bran = bran.replace("-", "")
 
             retries += 1
-            hby = habbing.Habery(name=name, base=base, bran=bran, cf=cf, free=True)
+            hby = habbing.Habery(name=name, base=base, bran=bran, cf=cf, free=True, cache=cache)
             break
         except (kering.AuthError, ValueError):
             if retries >= 3:
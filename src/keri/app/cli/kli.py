@@ -3,26 +3,77 @@
 keri.kli.commands module
 
 """
-import multicommand
+import importlib
+import pkgutil
+import sys
+
 from keri import help
 
-from keri.app import directing
 from keri.app.cli import commands
 
 logger = help.ogler.getLogger()
 
+Tock = 0.03125  # same as directing.runController
+
+
+def resolve(argv, pkg=commands, prog="kli"):
+    """ Resolve subcommand module from leading command words of argv
+
+    Walks command packages on disk and imports only the packages and module
+    named by argv, instead of every command module as multicommand does, so
+    each kli invocation only pays the import time of the command that runs.
+
+    Parameters:
+        argv (list): command line arguments without program name
+        pkg (module): command package to resolve within
+        prog (str): program name of pkg for usage messages
+
+    Returns:
+        tuple: (parser, rest) where parser (ArgumentParser) parses rest (list)
+            of argv. When argv does not name a command module then parser is the
+            full multicommand parser of the deepest package named so that usage
+            and help list its subcommands
+    """
+    import multicommand
+
+    for idx, word in enumerate(argv):
+        infos = {info.name: info for info in pkgutil.iter_modules(pkg.__path__)}
+        if word.startswith("-") or word not in infos:
+            break
+
+        mod = importlib.import_module(f"{pkg.__name__}.{word}")
+        prog = f"{prog} {word}"
+        if infos[word].ispkg:
+            pkg = mod
+            continue
+
+        parser = getattr(mod, multicommand.PARSER_VARIABLE, None)
+        if parser is None:
+            break
+        parser.prog = prog
+        return parser, argv[idx + 1:]
+
+    else:
+        idx = len(argv)
+
+    parser = multicommand.create_parser(pkg, prog=prog)
+    parser.prog = prog
+    return parser, argv[idx:]
+
 
 def main():
-    parser = multicommand.create_parser(commands)
-    args = parser.parse_args()
+    parser, rest = resolve(sys.argv[1:])
+    args = parser.parse_args(rest)
 
     if not hasattr(args, 'handler'):
         parser.print_help()
         return
 
     try:
+        from hio.base import doing
+
         doers = args.handler(args)
-        directing.runController(doers=doers, expire=0.0)
+        doing.Doist(limit=0.0, tock=Tock, real=True).do(doers=doers)
 
     except Exception as ex:
         import os
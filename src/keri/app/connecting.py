@@ -12,15 +12,71 @@ from keri import kering
 
 
 class Organizer:
-    """ Organizes contacts relating contact information to AIDs """
+    """ Organizes contacts relating contact information to AIDs
 
-    def __init__(self, hby):
+    Contact field values are kept in an inverted index, .db.cidx, keyed by
+    field, casefolded value and prefix so that exact and prefix searches read
+    only the matching branch of the index instead of every contact field.
+    Indexed values are truncated to MaxIdxLen so index keys fit in an LMDB key
+    and matches are always confirmed against the stored field value.
+
+    Attributes:
+        hby (Habery): database environment for contact information
+        fields (Optional(tuple)): names of fields to index, None means all fields
+
+    """
+    MaxIdxLen = 96  # max chars of field value in index key
+
+    def __init__(self, hby, fields=None):
         """ Create contact Organizer
 
+        All Organizers over the same database should be configured with the
+        same fields because the index is shared. Call reindex after changing them.
+
         Parameters:
             hby (Habery): database environment for contact information
+            fields (Optional(Iterable)): names of fields to index, None means all
         """
         self.hby = hby
+        self.fields = tuple(fields) if fields is not None else None
+
+        if (next(self.hby.db.cidx.getItemIter(), None) is None and
+                next(self.hby.db.cfld.getItemIter(), None) is not None):
+            self.reindex()  # contacts stored before index existed
+
+    def indexed(self, field):
+        """ Returns True if values of field are kept in the index """
+        return self.fields is None or field in self.fields
+
+    def _idxkeys(self, pre, field, val):
+        """ Returns index keys tuple for val of field of contact pre """
+        return field, str(val).casefold()[:self.MaxIdxLen], pre
+
+    def _index(self, pre, field, val):
+        """ Adds val of field for contact pre to index when field is indexed """
+        if self.indexed(field):
+            self.hby.db.cidx.pin(keys=self._idxkeys(pre, field, val), val=pre)
+
+    def _unindex(self, pre, field, val):
+        """ Removes val of field for contact pre from index """
+        self.hby.db.cidx.rem(keys=self._idxkeys(pre, field, val))
+
+    def reindex(self):
+        """ Rebuild the index of contact fields from all stored contact fields
+
+        Returns:
+            int: number of field values indexed
+
+        """
+        count = 0
+        with self.hby.db.txn():
+            self.hby.db.cidx.trim()
+            for (pre, field), val in self.hby.db.cfld.getItemIter():
+                if self.indexed(field):
+                    self._index(pre, field, val)
+                    count += 1
+
+        return count
 
     def update(self, pre, data):
         """ Add or update contact information in data for the identifier prefix
@@ -33,17 +89,23 @@ class Organizer:
         existing = self.get(pre)
         if existing is None:
             existing = dict()
+        existing.pop("id", None)
 
+        old = dict(existing)
         existing |= data
 
         raw = json.dumps(existing).encode("utf-8")
         cigar = self.hby.signator.sign(ser=raw)
 
-        self.hby.db.ccigs.pin(keys=(pre,), val=cigar)
-        self.hby.db.cons.pin(keys=(pre,), val=raw)
+        with self.hby.db.txn():
+            self.hby.db.ccigs.pin(keys=(pre,), val=cigar)
+            self.hby.db.cons.pin(keys=(pre,), val=raw)
 
-        for field, val in data.items():
-            self.hby.db.cfld.pin(keys=(pre, field), val=val)
+            for field, val in data.items():
+                if field in old:
+                    self._unindex(pre, field, old[field])
+                self.hby.db.cfld.pin(keys=(pre, field), val=val)
+                self._index(pre, field, val)
 
     def replace(self, pre, data):
         """ Replace all contact information for identifier prefix with data
@@ -53,8 +115,9 @@ class Organizer:
             data (dict): data to replace contact information with
 
         """
-        self.rem(pre)
-        self.update(pre, data)
+        with self.hby.db.txn():
+            self.rem(pre)
+            self.update(pre, data)
 
     def set(self, pre, field, val):
         """ Add or replace one value in contact information for identifier prefix
@@ -68,7 +131,6 @@ class Organizer:
         data = self.get(pre) or dict()
         data[field] = val
         self.replace(pre, data)
-        self.hby.db.cfld.pin(keys=(pre, field), val=val)
 
     def unset(self, pre, field):
         """ Remove field from contact information for identifier prefix
@@ -81,7 +143,6 @@ class Organizer:
         data = self.get(pre)
         del data[field]
         self.replace(pre, data)
-        self.hby.db.cfld.rem(keys=(pre, field))
 
     def rem(self, pre):
         """ Remove all contact information for identifier prefix
@@ -90,11 +151,15 @@ class Organizer:
             pre (str): qb64 identifier prefix for contact to remove
 
         Returns:
+            bool: True if any contact fields were removed
 
         """
-        self.hby.db.ccigs.rem(keys=(pre,))
-        self.hby.db.cons.rem(keys=(pre,))
-        return self.hby.db.cfld.trim(keys=(pre,))
+        with self.hby.db.txn():
+            for (_, field), val in self.hby.db.cfld.getItemIter(keys=(pre, "")):
+                self._unindex(pre, field, val)
+            self.hby.db.ccigs.rem(keys=(pre,))
+            self.hby.db.cons.rem(keys=(pre,))
+            return self.hby.db.cfld.trim(keys=(pre, ""))
 
     def get(self, pre, field=None):
         """ Retrieve all contact information for identifier prefix
@@ -125,20 +190,30 @@ class Organizer:
         data["id"] = pre
         return data
 
-    def list(self):
-        """ Return list of all contact information for all remote identifiers
+    def list(self, after=None, limit=None):
+        """ Return list of contact information for remote identifiers in prefix order
+
+        Parameters:
+            after (Optional(str)): prefix of last contact of previous page,
+                None means start with first contact
+            limit (Optional(int)): max number of contacts to return, None means all
 
         Returns:
-            list: All contact information
+            list: contact information of at most limit contacts after after
 
         """
         key = ""
         data = None
         contacts = []
-        for (pre, field), val in self.hby.db.cfld.getItemIter():
+        start = (after, "") if after is not None else b""
+        for (pre, field), val in self.hby.db.cfld.getItemIter(start=start):
+            if pre == after:
+                continue
             if pre != key:
                 if data is not None:
                     contacts.append(data)
+                    if limit is not None and len(contacts) >= limit:
+                        return contacts
                 data = dict(id=pre)
                 key = pre
 
@@ -149,6 +224,47 @@ class Organizer:
 
         return contacts
 
+    def search(self, field, val, prefix=False, after=None, limit=None):
+        """ Search index for contacts whose field matches val ignoring case
+
+        Parameters:
+            field (str): indexed field name to search
+            val (str): value to match
+            prefix (bool): True means match values that start with val,
+                False means match whole value
+            after (Optional(dict)): last contact of previous page, None means
+                start with first match. Matches are ordered by value then prefix
+            limit (Optional(int)): max number of contacts to return, None means all
+
+        Returns:
+            list: contact information of matching contacts
+
+        """
+        if not self.indexed(field):
+            raise kering.ConfigurationError(f"contact field {field} is not indexed")
+
+        val = str(val).casefold()
+        top = (field, val[:self.MaxIdxLen]) if prefix else (field, val[:self.MaxIdxLen], "")
+        start = self._idxkeys(after["id"], field, after[field]) if after is not None else b""
+
+        contacts = []
+        for _, pre in self.hby.db.cidx.getItemIter(keys=top, start=start):
+            if after is not None and pre == after["id"]:
+                continue  # resume after last contact of previous page
+
+            actual = self.hby.db.cfld.get(keys=(pre, field))  # confirm truncated or dotted keys
+            if actual is None:
+                continue
+            actual = str(actual).casefold()
+            if not (actual.startswith(val) if prefix else actual == val):
+                continue
+
+            contacts.append(self.get(pre))
+            if limit is not None and len(contacts) >= limit:
+                break
+
+        return contacts
+
     def find(self, field, val):
         """ Find all contact information for all contacts that have the val in field
 
@@ -162,8 +278,8 @@ class Organizer:
         """
         pres = []
         prog = re.compile(f".*{val}.*", re.I)
-        for (pre, f), v in self.hby.db.cfld.getItemIter():
-            if f == field and prog.match(v):
+        for pre, v in self._fieldIter(field):
+            if prog.match(v):
                 pres.append(pre)
 
         return [self.get(pre) for pre in pres]
@@ -182,13 +298,33 @@ class Organizer:
         prog = re.compile(f".*{val}.*", re.I) if val is not None else None
 
         vals = oset()
-        for (pre, f), v in self.hby.db.cfld.getItemIter():
-            if f == field:
-                if prog is None or prog.match(v):
-                    vals.add(v)
+        for pre, v in self._fieldIter(field):
+            if prog is None or prog.match(v):
+                vals.add(v)
 
         return list(vals)
 
+    def _fieldIter(self, field):
+        """ Iterate (pre, val) of field over all contacts with field
+
+        Reads only the branch of the index for field when field is indexed
+        otherwise scans all contact fields.
+
+        Parameters:
+            field (str): field name
+
+        """
+        if not self.indexed(field):
+            for (pre, f), v in self.hby.db.cfld.getItemIter():
+                if f == field:
+                    yield pre, v
+            return
+
+        for _, pre in self.hby.db.cidx.getItemIter(keys=(field, "")):
+            v = self.hby.db.cfld.get(keys=(pre, field))
+            if v is not None:
+                yield pre, v
+
     def setImg(self, pre, typ, stream):
         """ Upload image for identifier prefix
 
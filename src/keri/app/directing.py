@@ -9,6 +9,7 @@ import itertools
 from hio.base import doing
 
 from .. import help
+from ..help import metering
 from ..core import eventing, routing
 from ..core import parsing
 from ..vdr.eventing import Tevery
@@ -656,10 +657,16 @@ class Reactant(doing.DoDoer):
                     label, len(msg))
 
 
-def runController(doers, expire=0.0):
+def runController(doers, expire=0.0, metered=False):
     """
     Utiitity Function to create doist to run doers
+
+    Parameters:
+        doers (list): doers to run
+        expire (float): seconds to run. 0.0 means until all doers are done
+        metered (bool): True means time doers with metering.MeteredDoist
     """
     tock = 0.03125
-    doist = doing.Doist(limit=expire, tock=tock, real=True)
+    klas = metering.MeteredDoist if metered else doing.Doist
+    doist = klas(limit=expire, tock=tock, real=True)
     doist.do(doers=doers)
@@ -237,7 +237,7 @@ class Habery:
             self.setup(**self._inits)  # finish setup later
 
     def setup(self, *, seed=None, aeid=None, bran=None, pidx=None, algo=None,
-              salt=None, tier=None, free=False, temp=None, ):
+              salt=None, tier=None, free=False, temp=None, cache=None):
         """
         Setup Habery. Assumes that both .db and .ks have been opened.
         This allows dependency injection of .db and .ks into Habery instance
@@ -276,6 +276,8 @@ class Habery:
                     Use quick method to stretch salts for seeds such as
                     bran salt to seed or key creation of Habs.
                     Otherwise use more resources set by tier to stretch
+            cache (keeping.SignerCache | None): opt in cache of decrypted
+                signers for .mgr. None means no cache
         """
         if not (self.ks.opened and self.db.opened):
             raise kering.ClosedError("Attempt to setup Habitat with closed "
@@ -300,7 +302,7 @@ class Habery:
 
         try:
             self.mgr = keeping.Manager(ks=self.ks, seed=seed, aeid=aeid, pidx=pidx,
-                                       algo=algo, salt=salt, tier=tier)
+                                       algo=algo, salt=salt, tier=tier, cache=cache)
         except kering.AuthError as ex:
             self.close()
             raise ex
@@ -666,6 +668,9 @@ class Habery:
         Parameters:
            clear is boolean, True means clear resource directories
         """
+        if self.mgr and self.mgr.cache is not None:
+            self.mgr.cache.clear()
+
         if self.ks:
             self.ks.close(clear=self.ks.temp or clear)
 
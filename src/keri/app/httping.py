@@ -113,7 +113,7 @@ def parseCesrHttpRequest(req):
     return cr
 
 
-def createCESRRequest(msg, client, dest, path=None):
+def createCESRRequest(msg, client, dest, path=None, headers=None):
     """
     Turns a KERI message into a CESR http request against the provided hio http Client
 
@@ -122,6 +122,7 @@ def createCESRRequest(msg, client, dest, path=None):
        dest (str): qb64 identifier prefix of destination controller
        client: hio http Client that will send the message as a CESR request
        path (str): path to post to
+       headers (dict): additional headers if any such as Last-Event-ID
 
     """
     path = path if path is not None else "/"
@@ -136,18 +137,20 @@ def createCESRRequest(msg, client, dest, path=None):
     attachments = bytearray(msg)
     body = serder.raw
 
-    headers = Hict([
+    hdrs = Hict([
         ("Content-Type", CESR_CONTENT_TYPE),
         ("Content-Length", len(body)),
         ("connection", "close"),
         (CESR_ATTACHMENT_HEADER, attachments),
         (CESR_DESTINATION_HEADER, dest)
     ])
+    if headers:
+        hdrs.update(headers)
 
     client.request(
         method="POST",
         path=path,
-        headers=headers,
+        headers=hdrs,
         body=body
     )
 
@@ -0,0 +1,310 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.app.importing module
+
+Bulk import of key event logs from a first seen replay stream
+"""
+import time
+from dataclasses import dataclass
+
+import lmdb
+
+from .. import help, kering
+from ..core import coring, eventing, parsing
+from ..core.coring import Ilks
+from .ingressing import EstIlks, Recorder, argument
+
+logger = help.ogler.getLogger()
+
+
+@dataclass
+class ImportStats:
+    """
+    Throughput of an import
+
+    Attributes:
+        msgs (int): messages parsed
+        events (int): events added to first seen event logs
+        failed (int): messages dropped by parse errors or not processed due
+            to unexpected errors
+        elapsed (float): seconds of import including final escrow processing
+    """
+    msgs: int = 0
+    events: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def rate(self):
+        """ Returns events per second """
+        return self.events / self.elapsed if self.elapsed else 0.0
+
+
+class Importer:
+    """
+    Importer imports a replay stream of already validated key events with
+    attachments in first seen order, such as from Baser.cloneAllPreIter or
+    kli export, into a Baser.
+
+    Messages are processed by a Kevery in cloned and bulk mode so the attached
+    first seen datetimes are kept, no receipt or notice cues are made and
+    escrows are not retried per event. Each batch of .size messages is first
+    parsed into recorded Kevery calls and all of its signatures are verified
+    in one pass, in parallel when .pool is provided, and recorded with
+    coring.Verfer.vouch so that acceptance does not verify them again. The
+    calls are then replayed in one transaction that is retried when the map
+    of .db is grown. Replays of cloneAllPreIter group each prefix's events
+    together so a prefix's run of events shares few commits. Escrows are
+    processed once at the end to accept any out of order events.
+
+    Each message is replayed in its own savepoint of the batch transaction.
+    A message that fails with an unexpected error is logged and counted in
+    ImportStats.failed and its writes are discarded without aborting its
+    batch.
+
+    Attributes:
+        db (Baser): database to import into
+        kvy (Kevery): bulk mode event processor
+        psr (Parser): message parser recording Kevery calls in .calls
+        calls (list): of (role, name, pa, kwa) calls of message being parsed
+        size (int): messages per transaction
+        pool (concurrent.futures.Executor | None): pool to verify signatures
+
+    """
+    BatchSize = 1000  # default messages per transaction
+
+    def __init__(self, db, size=None, cues=None, pool=None):
+        """
+        Parameters:
+            db (Baser): database to import into
+            size (int | None): messages per transaction. None means .BatchSize
+            cues (Deck | None): cues of Kevery, only cues from Kevers remain in bulk mode
+            pool (concurrent.futures.Executor | None): optional executor such
+                as ProcessPoolExecutor to verify the signatures of each batch
+                in parallel
+        """
+        self.db = db
+        self.size = size if size is not None else self.BatchSize
+        self.pool = pool
+        self.kvy = eventing.Kevery(db=db, cues=cues, lax=True, local=False,
+                                   cloned=True, direct=False, bulk=True)
+        self.calls = []
+        self.psr = parsing.Parser(framed=False,
+                                  kvy=Recorder(role="kvy", calls=self.calls))
+
+    @staticmethod
+    def fill(ims, chunks):
+        """
+        Returns True when ims has bytes after extending it with the next
+        non-empty chunk of chunks if ims was empty. False when both ims and
+        chunks are exhausted.
+
+        Parameters:
+            ims (bytearray): replay stream of messages with attachments
+            chunks (Iterator): of bytes of the rest of the stream
+        """
+        while not ims:
+            if (chunk := next(chunks, None)) is None:
+                return False
+            ims.extend(chunk)
+        return True
+
+    def record(self, ims, chunks=None):
+        """
+        Returns list of recorded call lists, one for each of up to .size
+        messages parsed from ims, of (role, name, pa, kwa) Kevery calls. The
+        list is empty for a message dropped by the parser. ims is extended
+        from chunks as needed to complete a message. A stream that ends in a
+        partial message is abandoned at that message.
+
+        Parameters:
+            ims (bytearray): replay stream of messages with attachments
+            chunks (Iterator | None): of bytes of the rest of the stream
+        """
+        chunks = chunks if chunks is not None else iter(())
+        msgs = []
+        while len(msgs) < self.size and self.fill(ims, chunks):
+            for _ in self.psr.onceParsator(ims=ims, framed=False):  # waits for more
+                if (chunk := next(chunks, None)) is not None:
+                    ims.extend(chunk)
+                    continue
+                logger.error("Import stream ends in partial message of %d "
+                             "bytes.\n", len(ims))
+                del ims[:]
+                break
+            msgs.append(list(self.calls))
+            self.calls.clear()
+        return msgs
+
+    @staticmethod
+    def touched(calls):
+        """
+        Returns set of prefixes of the events in calls whose kevers the calls
+        may change.
+
+        Parameters:
+            calls (list): of recorded (role, name, pa, kwa) calls of a message
+        """
+        return {argument(pa, kwa, "serder", 0).pre for role, name, pa, kwa in calls
+                if name == "processEvent"}
+
+    def signees(self, msgs):
+        """
+        Returns list of (verfer, sig, ser) triple lists, as for
+        coring.Verfer.verifyBatch, one for each message in msgs, of its
+        controller, witness, and non-transferable receipt signatures.
+
+        The keys and witnesses of an event are those of the latest
+        establishment event of its prefix in msgs, else of its Kever in .db.
+        A signature verified with keys not those of the key state at
+        acceptance is simply not found in the memo and verified again then.
+
+        Parameters:
+            msgs (list): of recorded call lists as from .record
+        """
+        states = {}  # prefix qb64 to (verfers, werfers) of latest est event
+        signees = []
+        for calls in msgs:
+            triples = []
+            for role, name, pa, kwa in calls:
+                serder = argument(pa, kwa, "serder", 0)
+                if name == "processReceiptCouples":
+                    triples.extend((cigar.verfer, cigar.raw, serder.raw)
+                                   for cigar in argument(pa, kwa, "cigars", 1) or []
+                                   if cigar.verfer is not None)
+                if name != "processEvent":
+                    continue
+
+                pre = serder.pre
+                if pre not in states and pre in self.db.kevers:
+                    kever = self.db.kevers[pre]
+                    states[pre] = (kever.verfers,
+                                   [coring.Verfer(qb64=wit) for wit in kever.wits])
+                verfers, werfers = states.get(pre, ([], []))
+
+                ilk = serder.ked["t"]
+                if ilk in EstIlks:
+                    if ilk in (Ilks.icp, Ilks.dip):
+                        werfers = [coring.Verfer(qb64=wit) for wit in serder.ked["b"]]
+                    else:
+                        cuts = serder.ked["br"]
+                        werfers = ([werfer for werfer in werfers if werfer.qb64 not in cuts] +
+                                   [coring.Verfer(qb64=wit) for wit in serder.ked["ba"]])
+                    verfers = serder.verfers
+                    states[pre] = (verfers, werfers)
+
+                for sigers, keys in ((kwa.get("sigers"), verfers),
+                                     (kwa.get("wigers"), werfers)):
+                    triples.extend((keys[siger.index], siger.raw, serder.raw)
+                                   for siger in sigers or [] if siger.index < len(keys))
+            signees.append(triples)
+        return signees
+
+    def vouch(self, msgs):
+        """
+        Returns list of (code, key, sig, ser) quadruple lists, as for
+        coring.Verfer.vouch, one for each message in msgs, of its signatures
+        that verified. Verifies all signatures of msgs in one batch.
+
+        Parameters:
+            msgs (list): of recorded call lists as from .record
+        """
+        signees = self.signees(msgs)
+        results = iter(coring.Verfer.verifyBatch([triple for triples in signees
+                                                  for triple in triples],
+                                                 pool=self.pool))
+        vouched = []
+        for triples in signees:
+            items = []
+            for verfer, sig, ser in triples:
+                if next(results):
+                    items.append((verfer.code, verfer.raw, bytes(sig), bytes(ser)))
+            vouched.append(items)
+        return vouched
+
+    def replay(self, msgs, vouched, stats):
+        """
+        Replays recorded calls of msgs against .kvy within the transaction of
+        .db.atomic, each message in its own savepoint. Each message's verified
+        signatures are vouched for just before it is processed so they stay
+        in the bounded memo. The kevers a message may have changed in memory
+        are dropped from .db.kevers, to be reloaded from .db, when its
+        savepoint is discarded or when the batch is retried after the map was
+        grown.
+
+        Parameters:
+            msgs (list): of recorded call lists as from .record
+            vouched (list): of verified signature lists as from .vouch
+            stats (ImportStats): of batch, reset when retried
+        """
+        if stats.msgs:  # retry of aborted batch
+            for pre in set().union(*(self.touched(calls) for calls in msgs)):
+                self.db.kevers.pop(pre, None)
+            stats.msgs = stats.failed = 0
+
+        for calls, items in zip(msgs, vouched):
+            stats.msgs += 1
+            if not calls:  # dropped by parser which logged why
+                stats.failed += 1
+                continue
+
+            coring.Verfer.vouch(items)
+            try:
+                with self.db.savepoint():
+                    try:
+                        for role, name, pa, kwa in calls:
+                            getattr(self.kvy, name)(*pa, **kwa)
+                    except kering.ValidationError as ex:  # escrowed or invalid as in Parser
+                        logger.info("Import msg validation error: %s\n",
+                                    ex.args[0] if ex.args else ex)
+            except lmdb.Error:  # MapFullError is retried by .db.atomic
+                raise
+            except Exception as ex:
+                stats.failed += 1
+                for pre in self.touched(calls):  # writes discarded so reload
+                    self.db.kevers.pop(pre, None)
+                logger.exception("Import msg error: %s\n",
+                                 ex.args[0] if ex.args else ex)
+
+    def load(self, ims, chunks=None):
+        """
+        Import all messages in ims followed by those in chunks. Supplying the
+        stream in chunks, such as read from a file, bounds the memory used to
+        about one batch.
+
+        Usage:
+            with open(path, "rb") as f:
+                stats = importer.load(bytearray(),
+                                      chunks=iter(lambda: f.read(65536), b""))
+
+        Parameters:
+            ims (bytearray): replay stream of messages with attachments.
+                Consumed as parsed
+            chunks (Iterable | None): of bytes of the rest of the stream
+
+        Returns:
+            ImportStats: throughput of import
+        """
+        stats = ImportStats()
+        start = time.perf_counter()
+        fels = self.db.cnt(self.db.fels)
+
+        chunks = iter(chunks) if chunks is not None else iter(())
+        while self.fill(ims, chunks):
+            msgs = self.record(ims, chunks)
+            vouched = self.vouch(msgs)
+            batch = ImportStats()
+            self.db.atomic(self.replay, msgs=msgs, vouched=vouched, stats=batch)
+            stats.msgs += batch.msgs
+            stats.failed += batch.failed
+
+        self.kvy.swept = None  # walk all escrows once
+        self.kvy.processEscrows()
+
+        stats.events = self.db.cnt(self.db.fels) - fels
+        stats.elapsed = time.perf_counter() - start
+        logger.info("Imported %d events from %d messages in %.3f seconds, "
+                    "%.1f events/second with %d failed messages.", stats.events,
+                    stats.msgs, stats.elapsed, stats.rate, stats.failed)
+        return stats
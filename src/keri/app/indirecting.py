@@ -6,6 +6,7 @@ keri.app.indirecting module
 simple indirect mode demo support classes
 """
 import datetime
+import json
 
 import falcon
 import time
@@ -19,14 +20,14 @@ from hio.core.tcp import serving
 from hio.help import decking
 
 import keri.app.oobiing
-from . import directing, storing, httping, forwarding, agenting, oobiing
+from . import directing, storing, httping, forwarding, agenting, oobiing, ingressing
 from .habbing import GroupHab
 from .. import help, kering
 from ..core import eventing, parsing, routing, coring
 from ..core.coring import Ilks
 from ..db import basing, dbing
 from ..end import ending
-from ..help import helping
+from ..help import helping, metering
 from ..peer import exchanging
 from ..vdr import verifying, viring
 from ..vdr.eventing import Tevery
@@ -35,10 +36,24 @@ logger = help.ogler.getLogger()
 
 
 def setupWitness(hby, alias="witness", mbx=None, aids=None, tcpPort=5631, httpPort=5632,
-                 keypath=None, certpath=None, cafilepath=None):
+                 keypath=None, certpath=None, cafilepath=None, workers=None, metrics=False):
     """
     Setup witness controller and doers
 
+    Parameters:
+        workers (int | None): when provided parse and verify HTTP inbound
+            messages in an ingressing.Ingress pool of this many worker
+            processes. 0 means one per cpu. None means parse on main loop
+        metrics (bool): True means enable metering.meter and serve its
+            metrics unauthenticated at /metrics of the HTTP port. See setupMetrics
+
+    Mailbox retention is configured by the "mailbox" section of the Habery
+    configuration file, when any, such as:
+        {"mailbox": {"age": 604800, "count": 1000, "size": 1048576,
+                     "acked": false, "period": 60.0,
+                     "topics": {"/receipt": {"age": 86400}}}}
+    where topics overrides the default policy per topic route.
+
     """
     cues = decking.Deck()
     doers = []
@@ -52,6 +67,9 @@ def setupWitness(hby, alias="witness", mbx=None, aids=None, tcpPort=5631, httpPo
     verfer = verifying.Verifier(hby=hby, reger=reger)
 
     mbx = mbx if mbx is not None else storing.Mailboxer(name=alias, temp=hby.temp)
+    if (sweeper := setupRetention(hby=hby, mbx=mbx)) is not None:
+        doers.append(sweeper)
+    doers.append(basing.Checkpointer(db=hby.db))  # periodic key state checkpoint
     forwarder = forwarding.ForwardHandler(hby=hby, mbx=mbx)
     exchanger = exchanging.Exchanger(hby=hby, handlers=[forwarder])
     clienter = httping.Clienter()
@@ -82,7 +100,14 @@ def setupWitness(hby, alias="witness", mbx=None, aids=None, tcpPort=5631, httpPo
                             exc=exchanger,
                             rvy=rvy)
 
-    httpEnd = HttpEnd(rxbs=parser.ims, mbx=mbx)
+    ingress = None
+    if workers is not None:
+        ingress = ingressing.Ingress(kvy=kvy, tvy=tvy, exc=exchanger, rvy=rvy,
+                                     workers=workers if workers else None)
+        doers.append(ingress)
+
+    httpEnd = HttpEnd(rxbs=parser.ims, mbx=mbx,
+                      frames=ingress.frames if ingress is not None else None)
     app.add_route("/", httpEnd)
     receiptEnd = ReceiptEnd(hab=hab, inbound=cues, aids=aids)
     app.add_route("/receipts", receiptEnd)
@@ -104,11 +129,124 @@ def setupWitness(hby, alias="witness", mbx=None, aids=None, tcpPort=5631, httpPo
                             kvy=kvy, tvy=tvy, rvy=rvy, exc=exchanger, replies=rep.reps,
                             responses=rep.cues, queries=httpEnd.qrycues)
 
+    if metrics:
+        setupMetrics(app=app, hby=hby, mbx=mbx, reger=verfer.reger, parser=parser,
+                     queues=dict(witness=cues, exchanger=exchanger.cues,
+                                 receipts=receiptEnd.outbound, replies=rep.reps,
+                                 responses=rep.cues, queries=httpEnd.qrycues))
+
     doers.extend(oobiRes)
     doers.extend([regDoer, httpServerDoer, rep, witStart, receiptEnd, *oobiery.doers])
     return doers
 
 
+def setupRetention(hby, mbx):
+    """
+    Configures retention policies of mbx from the "mailbox" section of the
+    configuration of hby.
+
+    Returns:
+        sweeper (storing.Sweeper | None): doer to enforce retention. None
+            when no policy configured
+
+    Parameters:
+        hby (Habery): environment with configuration .cf, if any
+        mbx (Mailboxer): mailbox storage to configure
+    """
+    conf = hby.cf.get() if hby.cf is not None else {}
+    if not (conf := conf.get("mailbox")):
+        return None
+
+    fields = ("age", "count", "size", "acked")
+    mbx.retention = storing.Retention(**{k: v for k, v in conf.items() if k in fields})
+    for route, policy in conf.get("topics", {}).items():
+        mbx.policies["/" + route.lstrip("/")] = storing.Retention(**policy)
+
+    if not (mbx.retention.bounded or any(p.bounded for p in mbx.policies.values())):
+        return None
+
+    return storing.Sweeper(mbx=mbx, period=conf.get("period", 60.0))
+
+
+def setupMetrics(app, hby, mbx=None, reger=None, parser=None, queues=None):
+    """
+    Enables metering.meter, the registry the Parser, Kevery and Doist hooks
+    record to, and registers gauges of escrow table sizes, cue queue depths,
+    parser backlog, mailbox sizes, and LMDB statistics then serves all metrics
+    of metering.meter at /metrics of app. Gauges are read only when metrics are
+    rendered. The route is not authenticated so anyone who can reach app may
+    read the metrics
+
+    Parameters:
+        app (falcon.App): HTTP app to add /metrics route to
+        hby (Habery): environment whose Baser escrows and LMDB are metered
+        mbx (Mailboxer | None): mailbox to meter
+        reger (Reger | None): registry database whose TEL escrows are metered
+        parser (Parser | None): parser whose unparsed bytes are metered
+        queues (dict | None): of Deck keyed by queue name whose depths are
+            metered
+    """
+    mtr = metering.meter
+    mtr.enabled = True
+
+    meterDbs(dbs=dict(baser=hby.db, mailbox=mbx, reger=reger), mtr=mtr)
+    meterEscrows(db=hby.db, reger=reger, mtr=mtr)
+
+    if queues:
+        mtr.gauge("keri_cue_depth", help="Cues waiting in queue", labels=("queue",),
+                  fn=lambda: {name: len(deck) for name, deck in queues.items()})
+    if parser is not None:
+        mtr.gauge("keri_parser_backlog_bytes", help="Received bytes waiting to be parsed",
+                  fn=lambda: len(parser.ims))
+    if mbx is not None:
+        mtr.gauge("keri_mailbox_messages", help="Distinct messages in mailbox",
+                  fn=lambda: mbx.cnt(mbx.msgs.sdb))
+        mtr.gauge("keri_mailbox_entries", help="Topic entries in mailbox",
+                  fn=lambda: mbx.cnt(mbx.tpcs))
+
+    app.add_route("/metrics", MetricsEnd(mtr=mtr))
+
+
+def meterDbs(dbs, mtr=None):
+    """
+    Registers gauges of LMDB environment statistics labeled by database name
+
+    Parameters:
+        dbs (dict): of LMDBer keyed by name. None values are skipped
+        mtr (Meter | None): registry. None means metering.meter
+    """
+    mtr = mtr if mtr is not None else metering.meter
+    dbs = {name: dber for name, dber in dbs.items() if dber is not None}
+
+    def stat(field):
+        return lambda: {name: dber.stats()[field] for name, dber in dbs.items() if dber.opened}
+
+    mtr.gauge("keri_lmdb_map_bytes", help="LMDB map size", labels=("db",), fn=stat("map_size"))
+    mtr.gauge("keri_lmdb_used_bytes", help="LMDB map bytes in use", labels=("db",), fn=stat("used"))
+    mtr.gauge("keri_lmdb_last_txnid", help="LMDB last committed transaction id", labels=("db",),
+              fn=stat("last_txnid"))
+    mtr.gauge("keri_lmdb_readers", help="LMDB reader slots in use", labels=("db",),
+              fn=stat("num_readers"))
+
+
+def meterEscrows(db, reger=None, mtr=None):
+    """
+    Registers gauge of escrow table sizes labeled by table name
+
+    Parameters:
+        db (Baser): database of Kevery escrows
+        reger (Reger | None): database of Tevery escrows
+        mtr (Meter | None): registry. None means metering.meter
+    """
+    mtr = mtr if mtr is not None else metering.meter
+    tables = [(db, name) for name in eventing.Kevery.Escrows]
+    if reger is not None:
+        tables.extend((reger, name) for name in Tevery.Escrows)
+
+    mtr.gauge("keri_escrow_entries", help="Entries in escrow table", labels=("escrow",),
+              fn=lambda: {name: dber.cnt(getattr(dber, name)) for dber, name in tables})
+
+
 def createHttpServer(port, app, keypath=None, certpath=None, cafilepath=None):
     """
     Create an HTTP or HTTPS server depending on whether TLS key material is present
@@ -720,7 +858,21 @@ class Poller(doing.DoDoer):
     """
     Polls remote SSE endpoint for event that are KERI messages to be processed
 
+    Holds one long lived event stream per witness. Reconnects only when the
+    stream fails, resuming each topic from the index after its last received
+    event. Topic cursors are persisted in batches, at most every FlushPeriod
+    seconds or FlushCount events, instead of once per event.
+
+    Attributes:
+        witrec (TopicsRecord | None): topic cursors of last received events
+        dirty (int): events received since cursors last persisted
+        flushed (datetime): when cursors last persisted
+        leid (str | None): id of last received event
+
     """
+    FlushPeriod = 1.0  # seconds between cursor writes while receiving
+    FlushCount = 100  # events after which cursors are written regardless
+    ConnectTimeout = 30.0  # seconds to connect before retrying
 
     def __init__(self, hab, witness, topics, msgs=None, retry=1000, **kwa):
         """
@@ -739,8 +891,12 @@ class Poller(doing.DoDoer):
         self.witness = witness
         self.topics = topics
         self.retry = retry
-        self.msgs = None if msgs is not None else decking.Deck()
+        self.msgs = msgs if msgs is not None else decking.Deck()
         self.times = dict()
+        self.witrec = None
+        self.dirty = 0
+        self.flushed = helping.nowUTC()
+        self.leid = None
 
         doers = [doing.doify(self.eventDo)]
 
@@ -758,70 +914,128 @@ class Poller(doing.DoDoer):
         self.tock = tock
         _ = (yield self.tock)
 
-        witrec = self.hab.db.tops.get((self.pre, self.witness))
-        if witrec is None:
-            witrec = basing.TopicsRecord(topics=dict())
+        self.witrec = self.hab.db.tops.get((self.pre, self.witness))
+        if self.witrec is None:
+            self.witrec = basing.TopicsRecord(topics=dict())
 
-        while self.retry > 0:
-            try:
-                client, clientDoer = agenting.httpClient(self.hab, self.witness)
-            except kering.MissingEntryError as e:
-                traceback.print_exception(e, file=sys.stderr)  # logging
-                yield self.tock
-                continue
+        try:
+            while self.retry > 0:
+                try:
+                    client, clientDoer = agenting.httpClient(self.hab, self.witness)
+                except kering.MissingEntryError as e:
+                    traceback.print_exception(e, file=sys.stderr)  # logging
+                    yield self.tock
+                    continue
 
-            self.extend([clientDoer])
+                self.extend([clientDoer])
+                self.query(client)
 
-            topics = dict()
-            q = dict(pre=self.pre, topics=topics)
-            for topic in self.topics:
-                if topic in witrec.topics:
-                    topics[topic] = witrec.topics[topic] + 1
-                else:
-                    topics[topic] = 0
+                started = helping.nowUTC()
+                while not self.failed(client):
+                    if (not client.connector.connected and helping.nowUTC() - started >
+                            datetime.timedelta(seconds=self.ConnectTimeout)):
+                        break
+
+                    while client.events:
+                        self.receive(client.events.popleft())
+                        yield self.tock
 
-            if isinstance(self.hab, GroupHab):
-                msg = self.hab.mhab.query(pre=self.pre, src=self.witness, route="mbx", query=q)
+                    self.flush()
+                    yield 0.25
+
+                self.flush(force=True)
+                self.remove([clientDoer])
+                yield self.retry / 1000
+        finally:
+            self.flush(force=True)
+
+    def query(self, client):
+        """
+        Sends signed mbx query on client for the stream of each topic from the
+        index after its last received event
+
+        Parameters:
+            client (Client): hio http client connected to .witness
+        """
+        topics = dict()
+        q = dict(pre=self.pre, topics=topics)
+        for topic in self.topics:
+            if topic in self.witrec.topics:
+                topics[topic] = self.witrec.topics[topic] + 1
             else:
-                msg = self.hab.query(pre=self.pre, src=self.witness, route="mbx", query=q)
+                topics[topic] = 0
 
-            httping.createCESRRequest(msg, client, dest=self.witness)
+        if isinstance(self.hab, GroupHab):
+            msg = self.hab.mhab.query(pre=self.pre, src=self.witness, route="mbx", query=q)
+        else:
+            msg = self.hab.query(pre=self.pre, src=self.witness, route="mbx", query=q)
 
-            while client.requests:
-                yield self.tock
+        headers = {"Last-Event-ID": self.leid} if self.leid is not None else None
+        httping.createCESRRequest(msg, client, dest=self.witness, headers=headers)
 
-            created = helping.nowUTC()
-            while True:
+    @staticmethod
+    def failed(client):
+        """
+        Returns:
+            failed (bool): True when stream of client has ended, been cut off
+                by the far side, or been answered with a non stream response
+        """
+        return bool(client.connector.cutoff or client.responses
+                    or client.respondent is not None and client.respondent.errored)
 
-                now = helping.nowUTC()
-                if now - created > datetime.timedelta(seconds=30):
-                    self.remove([clientDoer])
-                    break
+    def receive(self, evt):
+        """
+        Queues message of SSE event evt and advances cursor of its topic
 
-                while client.events:
-                    evt = client.events.popleft()
-                    if "retry" in evt:
-                        self.retry = evt["retry"]
-                    if "id" not in evt or "data" not in evt or "name" not in evt:
-                        logger.error(f"bad mailbox event: {evt}")
-                        continue
-                    idx = evt["id"]
-                    msg = evt["data"]
-                    tpc = evt["name"]
+        Returns:
+            received (bool): True when evt is a well formed mailbox event
 
-                    if not idx or not msg or not tpc:
-                        logger.error(f"bad mailbox event: {evt}")
-                        continue
+        Parameters:
+            evt (dict): SSE event with id, name, and data
+        """
+        if "retry" in evt:
+            self.retry = evt["retry"]
+        if "id" not in evt or "data" not in evt or "name" not in evt:
+            logger.error(f"bad mailbox event: {evt}")
+            return False
+        idx = evt["id"]
+        msg = evt["data"]
+        tpc = evt["name"]
+
+        if not idx or not msg or not tpc:
+            logger.error(f"bad mailbox event: {evt}")
+            return False
+
+        self.msgs.append(msg.encode("utf=8"))
+        self.witrec.topics[tpc] = int(idx)
+        self.times[tpc] = helping.nowUTC()
+        self.leid = idx
+        self.dirty += 1
+        return True
+
+    def flush(self, force=False):
+        """
+        Persists topic cursors when changed and forced or due
 
-                    self.msgs.append(msg.encode("utf=8"))
-                    yield self.tock
+        Returns:
+            flushed (bool): True when cursors written
+
+        Parameters:
+            force (bool): True means write regardless of FlushPeriod and
+                FlushCount
+        """
+        if not self.dirty or self.witrec is None:
+            return False
 
-                    witrec.topics[tpc] = int(idx)
-                    self.times[tpc] = helping.nowUTC()
-                    self.hab.db.tops.pin((self.pre, self.witness), witrec)
+        now = helping.nowUTC()
+        if not (force or self.dirty >= self.FlushCount
+                or now - self.flushed >= datetime.timedelta(seconds=self.FlushPeriod)):
+            return False
 
-                yield 0.25
-            yield self.retry / 1000
+        self.hab.db.tops.pin((self.pre, self.witness), self.witrec)
+        self.dirty = 0
+        self.flushed = now
+        return True
 
 
 class HttpEnd:
@@ -836,7 +1050,7 @@ class HttpEnd:
     TimeoutQNF = 30
     TimeoutMBX = 5
 
-    def __init__(self, rxbs=None, mbx=None, qrycues=None):
+    def __init__(self, rxbs=None, mbx=None, qrycues=None, frames=None):
         """
         Create the KEL HTTP server from the Habitat with an optional Falcon App to
         register the routes with.
@@ -845,9 +1059,13 @@ class HttpEnd:
              rxbs (bytearray): output queue of bytes for message processing
              mbx (Mailboxer): Mailbox storage
              qrycues (Deck): inbound qry response queues
+             frames (Deck): optional output queue of whole message frames for
+                 Ingress pipeline processing. When provided messages are
+                 pushed here instead of to rxbs
 
         """
         self.rxbs = rxbs if rxbs is not None else bytearray()
+        self.frames = frames
 
         self.mbx = mbx
         self.qrycues = qrycues if qrycues is not None else decking.Deck()
@@ -890,7 +1108,10 @@ class HttpEnd:
         msg = bytearray(serder.raw)
         msg.extend(cr.attachments.encode("utf-8"))
 
-        self.rxbs.extend(msg)
+        if self.frames is not None:
+            self.frames.push(msg)
+        else:
+            self.rxbs.extend(msg)
 
         ilk = serder.ked["t"]
         if ilk in (Ilks.icp, Ilks.rot, Ilks.ixn, Ilks.dip, Ilks.drt, Ilks.exn, Ilks.rpy):
@@ -940,6 +1161,13 @@ class QryRpyMailboxIterable:
 
 
 class MailboxIterable:
+    """
+    Server sent event stream of the messages stored in the mailbox of pre for
+    each of topics. Reads a topic only when the Mailboxer tail index shows it
+    advanced past the next index to send and reads no topic at all when
+    nothing was stored since the last read. The starting index of each topic
+    acknowledges receipt of the messages below it.
+    """
     TimeoutMBX = 30000000
 
     def __init__(self, mbx, pre, topics, retry=5000):
@@ -947,6 +1175,9 @@ class MailboxIterable:
         self.pre = pre
         self.topics = topics
         self.retry = retry
+        self.stored = None  # .mbx.stored at last read
+        for topic, idx in self.topics.items():
+            self.mbx.ack(self.pre + topic, idx)
 
     def __iter__(self):
         self.start = self.end = time.perf_counter()
@@ -959,23 +1190,58 @@ class MailboxIterable:
                 return bytearray(f"retry: {self.retry}\n\n".encode("utf-8"))
 
             data = bytearray()
-            for topic, idx in self.topics.items():
-                key = self.pre + topic
-                for fn, _, msg in self.mbx.cloneTopicIter(key, idx):
-                    data.extend(bytearray("id: {}\nevent: {}\nretry: {}\ndata: ".format(fn, topic, self.retry)
-                                          .encode("utf-8")))
-                    data.extend(msg)
-                    data.extend(b'\n\n')
-                    idx = idx + 1
-                    self.start = time.perf_counter()
-
-                self.topics[topic] = idx
+            if self.stored != self.mbx.stored:  # something stored since last read
+                self.stored = self.mbx.stored
+                for topic, idx in self.topics.items():
+                    key = self.pre + topic
+                    if self.mbx.tail(key) <= idx:  # topic not advanced
+                        continue
+                    for fn, _, msg in self.mbx.cloneTopicIter(key, idx):
+                        data.extend(bytearray("id: {}\nevent: {}\nretry: {}\ndata: ".format(fn, topic, self.retry)
+                                              .encode("utf-8")))
+                        data.extend(msg)
+                        data.extend(b'\n\n')
+                        idx = fn + 1  # skip ordinals of expired messages
+                        self.start = time.perf_counter()
+
+                    self.topics[topic] = idx
             self.end = time.perf_counter()
             return data
 
         raise StopIteration
 
 
+class MetricsEnd:
+    """
+    HTTP handler that serves metrics of a Meter in Prometheus text format or
+    as JSON when the format query parameter is json
+    """
+
+    def __init__(self, mtr=None):
+        """
+        Parameters:
+            mtr (Meter | None): registry to serve. None means metering.meter
+        """
+        self.meter = mtr if mtr is not None else metering.meter
+
+    def on_get(self, req, rep):
+        """ Metrics GET endpoint handler
+
+        Parameters:
+            req (Request): Falcon HTTP request object
+            rep (Response): Falcon HTTP response object
+
+        """
+        rep.set_header('Cache-Control', "no-cache")
+        rep.status = falcon.HTTP_200
+        if req.get_param("format") == "json":
+            rep.content_type = "application/json"
+            rep.data = json.dumps(self.meter.snapshot()).encode("utf-8")
+        else:
+            rep.content_type = "text/plain; version=0.0.4"
+            rep.data = self.meter.render().encode("utf-8")
+
+
 class ReceiptEnd(doing.DoDoer):
     """ Endpoint class for Witnessing receipting functionality
 
@@ -0,0 +1,349 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.app.ingressing module
+
+Multi-process parse and verify pipeline for inbound messages. Extraction,
+SAID verification, and stateless signature verification run in a pool of
+worker processes. Only the ordered stateful processing of each message runs
+on the main loop.
+"""
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from hio.base import doing
+from hio.help import decking
+
+from .. import help
+from ..core import coring, parsing
+from ..core.coring import Ilks
+from ..db import dbing
+
+logger = help.ogler.getLogger()
+
+Roles = ("kvy", "tvy", "exc", "rvy", "vry")  # Parser message processor roles
+
+EstIlks = (Ilks.icp, Ilks.rot, Ilks.dip, Ilks.drt)  # carry their signing keys
+
+# pending batch of frames in submission order where parsing is future of
+# preverify and vetting is list, empty until vetted, of [future, items]
+Batch = namedtuple("Batch", "parsing vetting")
+
+
+class Recorder:
+    """
+    Recorder stands in for a message processor, such as Kevery or Tevery, in
+    a Parser. Each method call dispatched to it by the Parser is recorded
+    instead of processed so that it may be replayed later against the real
+    processor.
+
+    Attributes:
+        role (str): processor role, one of Roles
+        calls (list): of (role, name, pa, kwa) quadruples of recorded calls
+
+    """
+
+    def __init__(self, role, calls):
+        """
+        Parameters:
+            role (str): processor role, one of Roles
+            calls (list): shared list to which to append recorded calls
+        """
+        self.role = role
+        self.calls = calls
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        def record(*pa, **kwa):
+            self.calls.append((self.role, name, pa, kwa))
+
+        return record
+
+
+def argument(pa, kwa, name, index):
+    """
+    Returns argument name of a recorded call whether passed by keyword in kwa
+    or positionally at index of pa, else None
+
+    Parameters:
+        pa (tuple): positional arguments of call
+        kwa (dict): keyword arguments of call
+        name (str): parameter name
+        index (int): position of parameter in pa
+    """
+    if name in kwa:
+        return kwa[name]
+    return pa[index] if len(pa) > index else None
+
+
+def vouchees(calls):
+    """
+    Returns list of (code, key, sig, ser) quadruples, as for coring.verifyItems,
+    of signatures in calls that may be verified without key state. These are
+    the controller signatures on establishment events which carry their own
+    signing keys and the non-transferable signatures, whose verfer is the
+    signer's prefix, of receipt couples attached to events and of replies.
+    Non-transferable receipts of rct messages sign the receipted event, not
+    the receipt, so are verified by Ingress.vet instead.
+
+    Parameters:
+        calls (list): of (role, name, pa, kwa) recorded by Recorder
+    """
+    items = []
+    for role, name, pa, kwa in calls:
+        serder = argument(pa, kwa, "serder", 0)
+        if serder is None:
+            continue
+        ser = bytes(serder.raw)
+
+        if role == "kvy" and name == "processEvent" and serder.ked["t"] in EstIlks:
+            verfers = serder.verfers
+            for siger in kwa.get("sigers") or []:
+                if siger.index < len(verfers):
+                    verfer = verfers[siger.index]
+                    items.append((verfer.code, verfer.raw, siger.raw, ser))
+
+        if name in ("processReceiptCouples", "processReply"):
+            for cigar in argument(pa, kwa, "cigars", 1) or []:
+                if cigar.verfer is not None:
+                    items.append((cigar.verfer.code, cigar.verfer.raw, cigar.raw, ser))
+
+    return items
+
+
+def preverify(frames):
+    """
+    Returns list of (msgs, vouched) duples, one for each frame in frames.
+    msgs is list of recorded call lists, one for each message parsed from the
+    frame, of (role, name, pa, kwa) processor calls. vouched is list of
+    (code, key, sig, ser) quadruples of signatures in msgs that verified.
+
+    Module level so may be pickled and run in a worker process of a pool.
+    Parsing performs extraction and SAID verification of each message.
+    A frame that ends in a partial message is abandoned at that message
+    instead of waiting for more bytes.
+
+    Parameters:
+        frames (list): of bytes each holding one or more whole messages with
+            attachments
+    """
+    results = []
+    for frame in frames:
+        ims = bytearray(frame)
+        calls = []
+        recorders = {role: Recorder(role=role, calls=calls) for role in Roles}
+        parser = parsing.Parser(framed=True, **recorders)
+        msgs = []
+        size = len(ims)
+        for _ in parser.allParsator(ims=ims):  # logs and drops bad messages
+            if calls:  # one message dispatched since last yield
+                msgs.append(list(calls))
+                calls.clear()
+            elif ims and len(ims) == size:  # no progress so partial message
+                logger.error("Ingress frame ends in partial message of "
+                             "%d bytes.\n", len(ims))
+                break
+            size = len(ims)
+        if calls:
+            msgs.append(list(calls))
+
+        items = vouchees([call for msg in msgs for call in msg])
+        vouched = [item for item, verified in
+                   zip(items, coring.verifyItems(items)) if verified]
+        results.append((msgs, vouched))
+
+    return results
+
+
+class Ingress(doing.Doer):
+    """
+    Ingress is a Doer that parses and verifies inbound frames in a pool of
+    worker processes and then dispatches the resulting processor calls on
+    the main loop strictly in the order the frames were received so that
+    per prefix ordering is preserved.
+
+    Signatures that need key state, such as those on interaction events,
+    are verified in a second pool pass using the keys of the current
+    Kever, if any, when the frame's parse completes. So are the signatures
+    of receipts over receipted events already in the database. Verified signatures are
+    recorded with coring.Verfer.vouch so that processing on the main loop
+    does not verify them again. Signatures that do not match the key state
+    at processing time are simply verified again there.
+
+    Attributes:
+        frames (Deck): inbound frames of bytes of whole messages to process
+        kvy (Kevery): route KEL message types to this instance
+        tvy (Tevery): route TEL message types to this instance
+        exc (Exchanger): route EXN message types to this instance
+        rvy (Revery): reply (RPY) message handler
+        vry (Verifier): credential processor
+        pool (concurrent.futures.Executor): worker pool
+        pending (deque): of Batch in submission order
+
+    """
+    BatchSize = 32  # maximum frames per worker task
+
+    def __init__(self, kvy=None, tvy=None, exc=None, rvy=None, vry=None,
+                 frames=None, pool=None, workers=None, **kwa):
+        """
+        Parameters:
+            kvy (Kevery): route KEL message types to this instance
+            tvy (Tevery): route TEL message types to this instance
+            exc (Exchanger): route EXN message types to this instance
+            rvy (Revery): reply (RPY) message handler
+            vry (Verifier): credential processor
+            frames (Deck): inbound frames. None means create
+            pool (concurrent.futures.Executor): worker pool. None means
+                create ProcessPoolExecutor on enter
+            workers (int): number of worker processes when creating pool.
+                None means one per cpu
+        """
+        super(Ingress, self).__init__(**kwa)
+        self.kvy = kvy
+        self.tvy = tvy
+        self.exc = exc
+        self.rvy = rvy
+        self.vry = vry
+        self.frames = frames if frames is not None else decking.Deck()
+        self.pool = pool
+        self.workers = workers
+        self._owned = False  # True when .pool created here
+        self.pending = deque()
+
+    def enter(self):
+        """ Create worker pool when not injected """
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(max_workers=self.workers)
+            self._owned = True
+
+    def recur(self, tyme):
+        """ Submit new frames then dispatch completed batches in order """
+        self.submit()
+        self.dispatch()
+        return False  # never done
+
+    def exit(self):
+        """ Shutdown worker pool when created here """
+        if self._owned and self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = None
+            self._owned = False
+
+    def submit(self):
+        """ Submit frames from .frames to .pool in batches of .BatchSize """
+        while self.frames:
+            frames = []
+            while self.frames and len(frames) < self.BatchSize:
+                frames.append(bytes(self.frames.pull()))
+            self.pending.append(Batch(parsing=self.pool.submit(preverify, frames),
+                                      vetting=[]))
+
+    def vet(self, batch):
+        """
+        Submits second pool pass for batch with parsed frames to verify
+        signatures on non-establishment events against current key state.
+        Appends future to batch.vetting.
+        """
+        items = []
+        for msgs, _ in batch.parsing.result():
+            for role, name, pa, kwa in (call for msg in msgs for call in msg):
+                if role == "kvy" and name == "processReceipt":
+                    items.extend(self.receiptees(serder=argument(pa, kwa, "serder", 0),
+                                                 cigars=argument(pa, kwa, "cigars", 1)))
+                    continue
+                if role != "kvy" or name != "processEvent":
+                    continue
+                serder = kwa["serder"]
+                if serder.ked["t"] in EstIlks:
+                    continue  # already verified by preverify
+                kever = self.kvy.kevers.get(serder.pre) if self.kvy is not None else None
+                if kever is None:
+                    continue
+                verfers = kever.verfers
+                ser = bytes(serder.raw)
+                for siger in kwa.get("sigers") or []:
+                    if siger.index < len(verfers):
+                        verfer = verfers[siger.index]
+                        items.append((verfer.code, verfer.raw, siger.raw, ser))
+
+        future = self.pool.submit(coring.verifyItems, items) if items else None
+        batch.vetting.extend([future, items])
+
+    def receiptees(self, serder, cigars):
+        """
+        Returns list of (code, key, sig, ser) quadruples of the non-transferable
+        receipt signatures cigars of receipt serder over the receipted event
+        when that event is already in the database of .kvy, else empty list
+
+        Parameters:
+            serder (SerderKERI): rct message
+            cigars (list): of Cigar receipt signatures
+        """
+        if self.kvy is None or not cigars:
+            return []
+        said = self.kvy.db.getKeLast(key=dbing.snKey(pre=serder.pre, sn=serder.sn))
+        if said is None or bytes(said).decode("utf-8") != serder.said:
+            return []  # not yet seen or stale so processReceipt escrows or rejects
+        raw = self.kvy.db.getEvt(key=dbing.dgKey(pre=serder.pre, dig=serder.said))
+        if raw is None:
+            return []
+        ser = bytes(raw)
+        return [(cigar.verfer.code, cigar.verfer.raw, cigar.raw, ser)
+                for cigar in cigars if cigar.verfer is not None]
+
+    def dispatch(self):
+        """
+        Dispatches recorded processor calls of completed batches in order.
+        Vets any completed batch not yet vetted.
+        """
+        for batch in self.pending:  # start vetting as soon as parsed
+            if not batch.vetting and batch.parsing.done():
+                if batch.parsing.exception() is None:
+                    self.vet(batch)
+
+        while self.pending:
+            batch = self.pending[0]
+            if not batch.parsing.done():
+                break
+
+            if (ex := batch.parsing.exception()) is not None:
+                self.pending.popleft()
+                logger.error("Ingress worker error: %s\n", ex)
+                continue
+
+            if not batch.vetting:  # parsed since vetting loop above
+                self.vet(batch)
+            future, items = batch.vetting
+            if future is not None:
+                if not future.done():
+                    break
+                if future.exception() is None:
+                    coring.Verfer.vouch(item for item, verified in
+                                        zip(items, future.result()) if verified)
+
+            self.pending.popleft()
+            for msgs, vouched in batch.parsing.result():
+                coring.Verfer.vouch(vouched)
+                for calls in msgs:
+                    self.process(calls)
+
+    def process(self, calls):
+        """
+        Replays recorded calls of one message against the real processors.
+        An error from a call abandons the remaining calls of the message as
+        the Parser would.
+
+        Parameters:
+            calls (list): of (role, name, pa, kwa) recorded by Recorder
+        """
+        try:
+            for role, name, pa, kwa in calls:
+                processor = getattr(self, role)
+                if processor is None:
+                    raise AttributeError(f"No {role} to process {name}.")
+                getattr(processor, name)(*pa, **kwa)
+        except Exception as ex:
+            logger.error("Ingress msg non-extraction error: %s\n",
+                         ex.args[0] if ex.args else ex)
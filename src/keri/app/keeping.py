@@ -23,7 +23,8 @@ raw = json.dumps(ked, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
 
 """
 import math
-from collections import namedtuple, deque
+import time
+from collections import namedtuple, deque, OrderedDict
 from dataclasses import dataclass, asdict, field
 
 from hio.base import doing
@@ -589,6 +590,130 @@ class Creatory:
 Initage = namedtuple("Initage", 'aeid pidx salt tier')
 
 
+def release(signer):
+    """
+    Drops the reference of signer to its private key seed so that the seed
+    may be garbage collected once no other holder references it. Signer is
+    unusable afterwards. Immutable bytes are not overwritten in place since
+    they may be shared and cache their hash.
+
+    Parameters:
+        signer (coring.Signer): signer whose .raw seed to release
+    """
+    signer._raw = b''
+
+
+class SignerCache:
+    """
+    Bounded least recently used cache of decrypted Signer instances keyed by
+    qb64 public key. Avoids a keystore read and sealed box decryption per
+    signature for hot signing keys. Each entry lives at most .ttl seconds
+    after it is cached. Seeds of evicted, expired, and cleared entries are
+    released.
+
+    Attributes:
+        size (int): max number of cached signers. Zero means do not cache
+        ttl (float | None): seconds an entry lives after cached. None means
+            until evicted
+        hits (int): number of lookups found in cache
+        misses (int): number of lookups not found in cache or expired
+        evictions (int): number of entries evicted or expired
+
+    """
+    Size = 64  # default max number of cached signers
+    TTL = 300.0  # default lifetime seconds of cached signer
+
+    def __init__(self, size=None, ttl=None):
+        """
+        Parameters:
+            size (int | None): max number of cached signers. None means .Size
+            ttl (float | None): lifetime seconds of entries. None means .TTL
+        """
+        self.size = size if size is not None else self.Size
+        self.ttl = ttl if ttl is not None else self.TTL
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._signers = OrderedDict()  # values are (signer, expiration)
+
+    def __len__(self):
+        return len(self._signers)
+
+    @property
+    def rate(self):
+        """ Returns hit rate float of lookups so far, 0.0 when none """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, pub):
+        """
+        Returns:
+            signer (coring.Signer | None): cached signer for pub or None when
+                not cached or expired
+
+        Parameters:
+            pub (str | bytes): qb64 public key
+        """
+        if hasattr(pub, "decode"):
+            pub = pub.decode("utf-8")
+
+        if (entry := self._signers.get(pub)) is not None:
+            signer, expiration = entry
+            if expiration is None or time.monotonic() < expiration:
+                self._signers.move_to_end(pub)  # most recently used
+                self.hits += 1
+                return signer
+            self.pop(pub)
+            self.evictions += 1
+
+        self.misses += 1
+        return None
+
+    def put(self, pub, signer):
+        """
+        Caches signer for pub evicting least recently used entries beyond .size
+
+        Parameters:
+            pub (str | bytes): qb64 public key
+            signer (coring.Signer): decrypted signer for pub
+        """
+        if not self.size:
+            return
+
+        if hasattr(pub, "decode"):
+            pub = pub.decode("utf-8")
+
+        if (entry := self._signers.pop(pub, None)) is not None and entry[0] is not signer:
+            release(entry[0])
+        expiration = time.monotonic() + self.ttl if self.ttl is not None else None
+        self._signers[pub] = (signer, expiration)
+        while len(self._signers) > self.size:
+            _, (evicted, _) = self._signers.popitem(last=False)  # least recently used
+            release(evicted)
+            self.evictions += 1
+
+    def pop(self, pub):
+        """
+        Removes and releases cached signer for pub if any
+
+        Parameters:
+            pub (str | bytes): qb64 public key
+        """
+        if hasattr(pub, "decode"):
+            pub = pub.decode("utf-8")
+
+        if (entry := self._signers.pop(pub, None)) is not None:
+            release(entry[0])
+
+    def clear(self):
+        """
+        Removes and releases all cached signers
+        """
+        while self._signers:
+            _, (signer, _) = self._signers.popitem()
+            release(signer)
+
+
 class Manager:
     """Manages key pairs creation, storage, and signing
     Class for managing key pair creation, storage, retrieval, and message signing.
@@ -601,6 +726,8 @@ class Manager:
             decryption key is derived seed (private signing key seed)
         inited (bool): True means fully initialized wrt database.
                           False means not yet fully initialized
+        cache (SignerCache | None): decrypted signers of hot signing keys.
+            None means look up and decrypt each private key on every use
 
     Attributes (Hidden):
 
@@ -640,12 +767,14 @@ class Manager:
 
     """
 
-    def __init__(self, *, ks=None, seed=None, **kwa):
+    def __init__(self, *, ks=None, seed=None, cache=None, **kwa):
         """
         Setup Manager.
 
         Parameters:
             ks (Keeper): key store instance (LMDB)
+            cache (SignerCache | None): opt in cache of decrypted signers used
+                by .sign. None means no cache
             seed (str): qb64 private-signing key (seed) for the aeid from which
                 the private decryption key may be derived. If aeid stored in
                 database is not empty then seed may required to do any key
@@ -675,6 +804,7 @@ class Manager:
         self.decrypter = None
         self._seed = seed if seed is not None else ""
         self.inited = False
+        self.cache = cache
 
         # save keyword arg parameters to init later if db not opened yet
         self._inits = kwa
@@ -788,6 +918,9 @@ class Manager:
         else:  # changing to empty aeid so new encrypter is None
             self.encrypter = None
 
+        if self.cache is not None:  # decrypted with old aeid
+            self.cache.clear()
+
         # fetch all secrets from db, decrypt all secrets with self.decrypter
         # unless they decrypt automatically on fetch and then re-encrypt with
         # encrypter  update db with re-encrypted values
@@ -1219,6 +1352,8 @@ class Manager:
         if erase:
             for pub in old.pubs:  # remove prior old prikeys not current old
                 self.ks.pris.rem(pub)
+                if self.cache is not None:
+                    self.cache.pop(pub)
 
         return (verfers, digers)
 
@@ -1329,27 +1464,33 @@ class Manager:
             paths = []
             # use paths to generate signers
 
-        if pubs:
-            for pub in pubs:
-                if self.aeid and not self.decrypter:
-                    raise kering.DecryptError("Unauthorized decryption attempt. "
-                                              "Aeid but no decrypter.")
-                if ((signer := self.ks.pris.get(pub, decrypter=self.decrypter))
-                        is None):
-                    raise ValueError("Missing prikey in db for pubkey={}".format(pub))
+        misses = []  # (pub, signer) to cache once signed
+        for pub in (pubs if pubs else [verfer.qb64 for verfer in verfers]):
+            if self.aeid and not self.decrypter:
+                raise kering.DecryptError("Unauthorized decryption attempt. "
+                                          "Aeid but no decrypter.")
+            if self.cache is not None and (signer := self.cache.get(pub)) is not None:
                 signers.append(signer)
+                continue
+            if ((signer := self.ks.pris.get(pub, decrypter=self.decrypter))
+                    is None):
+                raise ValueError("Missing prikey in db for pubkey={}".format(pub))
+            signers.append(signer)
+            misses.append((pub, signer))
 
-        else:
-            for verfer in verfers:
-                if self.aeid and not self.decrypter:
-                    raise kering.DecryptError("Unauthorized decryption attempt. "
-                                              "Aeid but no decrypter.")
-                if ((signer := self.ks.pris.get(verfer.qb64,
-                                                decrypter=self.decrypter))
-                        is None):
-                    raise ValueError("Missing prikey in db for pubkey={}".format(verfer.qb64))
-                signers.append(signer)
+        try:
+            return self._sign(ser, signers, indexed=indexed, indices=indices,
+                              ondices=ondices)
+        finally:
+            if self.cache is not None:  # after signing so none evicted in use
+                for pub, signer in misses:
+                    self.cache.put(pub, signer)
 
+    @staticmethod
+    def _sign(ser, signers, indexed=True, indices=None, ondices=None):
+        """
+        Returns list of Siger or Cigar of ser signed by signers as for .sign
+        """
         if indices and len(indices) != len(signers):
             raise ValueError(f"Mismatch indices length={len(indices)} and resultant"
                              f" signers length={len(signers)}")
@@ -1642,6 +1783,8 @@ class Manager:
             if erase:
                 for pub in old.pubs:  # remove prior old prikeys not current old
                     self.ks.pris.rem(pub)
+                    if self.cache is not None:
+                        self.cache.pop(pub)
 
         return (verfers, digers)
 
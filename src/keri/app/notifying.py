@@ -203,10 +203,16 @@ class Noter(dbing.LMDBer):
     Noter stores Notifications generated by the agent that are
     intended to be read and dismissed by the controller of the agent.
 
+    Notes are keyed by datetime and rid so are read in datetime order and
+    pages may resume at a datetime or after the rid of the last note read.
+    The number of unread notes is maintained in .ncnts as notes are added,
+    updated and removed.
+
     """
     TailDirPath = "keri/not"
     AltTailDirPath = ".keri/not"
     TempPrefix = "keri_not_"
+    Unread = "unread"  # key of unread counter in .ncnts
 
     def __init__(self, name="not", headDirPath=None, reopen=True, **kwa):
         """
@@ -220,6 +226,7 @@ class Noter(dbing.LMDBer):
         self.notes = None
         self.nidx = None
         self.ncigs = None
+        self.ncnts = None
 
         super(Noter, self).__init__(name=name, headDirPath=headDirPath, reopen=reopen, **kwa)
 
@@ -234,9 +241,30 @@ class Noter(dbing.LMDBer):
         self.notes = DicterSuber(db=self, subkey='nots.', sep='/', klas=Notice)
         self.nidx = subing.Suber(db=self, subkey='nidx.')
         self.ncigs = subing.CesrSuber(db=self, subkey='ncigs.', klas=coring.Cigar)
+        self.ncnts = subing.Suber(db=self, subkey='ncnts.')
+
+        if not self.readonly and self.ncnts.get(keys=(self.Unread,)) is None:
+            self.recount()  # notes stored before counter existed
 
         return self.env
 
+    def recount(self):
+        """ Recount unread notes by reading all notes
+
+        Returns:
+            int: count of unread notes
+
+        """
+        with self.txn():
+            unread = sum(1 for _, note in self.notes.getItemIter(keys=()) if not note.read)
+            self.ncnts.pin(keys=(self.Unread,), val=f"{unread:x}")
+        return unread
+
+    def _count(self, delta):
+        """ Add delta to unread counter """
+        if delta:
+            self.ncnts.pin(keys=(self.Unread,), val=f"{self.getUnreadCnt() + delta:x}")
+
     def add(self, note, cigar):
         """
         Adds note to database, keyed by the datetime and said of the note.
@@ -248,12 +276,14 @@ class Noter(dbing.LMDBer):
         """
         dt = note.datetime
         rid = note.rid
-        if self.nidx.get(keys=(rid,)) is not None:
-            return False
+        with self.txn():
+            if self.nidx.get(keys=(rid,)) is not None:
+                return False
 
-        self.nidx.pin(keys=(rid,), val=dt.encode())
-        self.ncigs.pin(keys=(rid,), val=cigar)
-        return self.notes.pin(keys=(dt, rid), val=note)
+            self.nidx.pin(keys=(rid,), val=dt.encode())
+            self.ncigs.pin(keys=(rid,), val=cigar)
+            self._count(0 if note.read else 1)
+            return self.notes.pin(keys=(dt, rid), val=note)
 
     def update(self, note, cigar):
         """
@@ -266,12 +296,18 @@ class Noter(dbing.LMDBer):
         """
         dt = note.datetime
         rid = note.rid
-        if self.nidx.get(keys=(rid,)) is None:
-            return False
+        with self.txn():
+            if (odt := self.nidx.get(keys=(rid,))) is None:
+                return False
+
+            if (old := self.notes.get(keys=(odt, rid))) is not None:
+                self._count(int(old.read) - int(note.read))
+                if odt != dt:
+                    self.notes.rem(keys=(odt, rid))
 
-        self.nidx.pin(keys=(rid,), val=dt.encode())
-        self.ncigs.pin(keys=(rid,), val=cigar)
-        return self.notes.pin(keys=(dt, rid), val=note)
+            self.nidx.pin(keys=(rid,), val=dt.encode())
+            self.ncigs.pin(keys=(rid,), val=cigar)
+            return self.notes.pin(keys=(dt, rid), val=note)
 
     def get(self, rid):
         """
@@ -303,16 +339,18 @@ class Noter(dbing.LMDBer):
         Returns:
             bool:  True if deleted
         """
-        res = self.get(rid)
-        if res is None:
-            return False
+        with self.txn():
+            res = self.get(rid)
+            if res is None:
+                return False
 
-        note, _ = res
-        dt = note.datetime
-        rid = note.rid
-        self.nidx.rem(keys=(rid,))
-        self.ncigs.rem(keys=(rid,))
-        return self.notes.rem(keys=(dt, rid))
+            note, _ = res
+            dt = note.datetime
+            rid = note.rid
+            self.nidx.rem(keys=(rid,))
+            self.ncigs.rem(keys=(rid,))
+            self._count(0 if note.read else -1)
+            return self.notes.rem(keys=(dt, rid))
 
     def getNoteCnt(self):
         """
@@ -324,33 +362,88 @@ class Noter(dbing.LMDBer):
         """
         return self.notes.cntAll()
 
+    def getUnreadCnt(self):
+        """
+        Return count of unread Notes
+
+        Returns:
+            int: count of unread items
+
+        """
+        cnt = self.ncnts.get(keys=(self.Unread,))
+        return int(cnt, 16) if cnt is not None else 0
+
     def getNotes(self, start=0, end=25):
         """
         Returns list of tuples (note, cigar) of notes for controller of agent
 
+        Offset paging reads every note before start. Use getNotePage to page
+        by key instead.
+
         Parameters:
-            start (int): number of item to start
+            start (int | datetime | str): number of item to start or datetime
+                of first note to return
             end (int): number of last item to return
 
         """
         if hasattr(start, "isoformat"):
             start = start.isoformat()
+        if isinstance(start, str):
+            return self.getNotePage(dt=start, limit=None if end == -1 else end + 1)
 
         notes = []
-        it = self.notes.getItemIter(keys=())
+        with self.txn(write=False):
+            it = self.notes.getItemIter(keys=())
+
+            # Run off the items before start
+            for _ in range(start):
+                try:
+                    next(it)
+                except StopIteration:
+                    break
+
+            for ((_, _), note) in it:
+                cig = self.ncigs.get(keys=(note.rid,))
+                notes.append((note, cig))
+                if (not end == -1) and len(notes) == (end - start) + 1:
+                    break
+
+        return notes
 
-        # Run off the items before start
-        for _ in range(start):
-            try:
-                next(it)
-            except StopIteration:
-                break
+    def getNotePage(self, after=None, dt=None, limit=25):
+        """
+        Returns list of tuples (note, cigar) of notes in datetime order starting
+        at key given by after or dt without reading the notes before it.
 
-        for ((_, _), note) in it:
-            cig = self.ncigs.get(keys=(note.rid,))
-            notes.append((note, cig))
-            if (not end == -1) and len(notes) == (end - start) + 1:
-                break
+        Parameters:
+            after (str | None): rid of last note of previous page. None means
+                start at dt
+            dt (datetime | str | None): datetime of first note to return.
+                When after is also given, datetime of note after to resume at
+                when that note has since been removed. None means first note
+            limit (int | None): max number of notes to return. None means all
+
+        """
+        if hasattr(dt, "isoformat"):
+            dt = dt.isoformat()
+
+        notes = []
+        with self.txn(write=False):
+            if after is not None and (adt := self.nidx.get(keys=(after,))) is not None:
+                keys = (adt, after)
+            elif dt is not None:  # cursor note removed so resume at its datetime
+                keys = (dt,)
+            elif after is not None:
+                return notes
+            else:
+                keys = ()
+
+            for (_, rid), note in self.notes.getItemIter(keys=keys):
+                if rid == after:
+                    continue  # resume after last note of previous page
+                notes.append((note, self.ncigs.get(keys=(rid,))))
+                if limit is not None and len(notes) >= limit:
+                    break
 
         return notes
 
@@ -469,6 +562,75 @@ class Notifier:
 
         return False
 
+    def rems(self, rids):
+        """ Delete the notes identified by the provided random IDs in one transaction
+
+        Parameters:
+            rids (Iterable): qb64 random IDs of the Notes to delete
+
+        Returns:
+            int: number of notes deleted
+        """
+        removed = []
+        with self.noter.txn():
+            for rid in rids:
+                if (res := self.noter.get(rid=rid)) is None:
+                    continue
+                if self.noter.rem(rid):
+                    removed.append(res)
+
+        for note, cig in removed:
+            # Verify the data has not been tampered with since saved to the database
+            if self.hby.signator.verify(ser=note.raw, cigar=cig):
+                signal = dict(
+                    action="rem",
+                    dt=helping.nowIso8601(),
+                    note=note.pad,
+                )
+                self.signaler.push(attrs=signal, topic="/notification", ckey="/notification")
+
+        return len(removed)
+
+    def mars(self, rids=None):
+        """ Mark as Read the notes identified by the provided random IDs in one transaction
+
+        Parameters:
+            rids (Optional(Iterable)): qb64 random IDs of the Notes to mark as read,
+                None means all unread notes
+
+        Returns:
+            int: number of notes marked as read
+        """
+        marked = []
+        with self.noter.txn():
+            if rids is None:
+                rids = [note.rid for _, note in self.noter.notes.getItemIter(keys=())
+                        if not note.read]
+
+            for rid in rids:
+                if (res := self.noter.get(rid=rid)) is None:
+                    continue
+
+                note, cig = res
+                # Verify the data has not been tampered with since saved to the database
+                if note.read or not self.hby.signator.verify(ser=note.raw, cigar=cig):
+                    continue
+
+                note.read = True
+                cig = self.hby.signator.sign(ser=note.raw)
+                if self.noter.update(note, cig):
+                    marked.append(note)
+
+        for note in marked:
+            signal = dict(
+                action="mar",
+                dt=helping.nowIso8601(),
+                note=note.pad,
+            )
+            self.signaler.push(attrs=signal, topic="/notification", ckey="/notification")
+
+        return len(marked)
+
     def getNoteCnt(self):
         """
         Return count over the all Notes
@@ -479,6 +641,16 @@ class Notifier:
         """
         return self.noter.getNoteCnt()
 
+    def getUnreadCnt(self):
+        """
+        Return count of unread Notes
+
+        Returns:
+            int: count of unread items
+
+        """
+        return self.noter.getUnreadCnt()
+
     def getNotes(self, start=0, end=24):
         """
         Returns list of tuples (note, cigar) of notes for controller of agent
@@ -497,3 +669,22 @@ class Notifier:
             notes.append(note)
 
         return notes
+
+    def getNotePage(self, after=None, dt=None, limit=25):
+        """
+        Returns list of notes in datetime order resuming after note with rid after
+
+        Parameters:
+            after (str | None): rid of last note of previous page. None means start at dt
+            dt (datetime | str | None): datetime of first note to return. None means first note
+            limit (int | None): max number of notes to return. None means all
+
+        """
+        notes = []
+        for note, cig in self.noter.getNotePage(after=after, dt=dt, limit=limit):
+            if not self.hby.signator.verify(ser=note.raw, cigar=cig):
+                raise kering.ValidationError("note stored without valid signature")
+
+            notes.append(note)
+
+        return notes
@@ -3,6 +3,8 @@
 keri.app.storing module
 
 """
+from collections import deque
+from dataclasses import dataclass
 
 from hio.base import doing
 from hio.help import decking
@@ -13,30 +15,84 @@ from .. import help
 from ..core import coring
 from ..core.coring import MtrDex
 from ..db import dbing, subing
+from ..help import helping, metering
 
 logger = help.ogler.getLogger()
 
 
+@dataclass()
+class Retention:
+    """
+    Retention policy for the messages of a mailbox topic. A message is
+    expired when any limit is exceeded. None means no limit.
+
+    Attributes:
+        age (float | None): maximum age in seconds since message stored
+        count (int | None): maximum number of newest messages kept per topic
+        size (int | None): maximum total bytes of newest messages kept per topic
+        acked (bool): True means expire messages below the cursor a client
+            has acknowledged by querying the topic from that cursor
+    """
+    age: float = None
+    count: int = None
+    size: int = None
+    acked: bool = False
+
+    @property
+    def bounded(self):
+        """ True when policy expires anything """
+        return (self.age is not None or self.count is not None
+                or self.size is not None or self.acked)
+
+
 class Mailboxer(dbing.LMDBer):
     """
     Mailboxer stores exn messages in order and provider iterator access at an index.
 
+    Attributes:
+        tails (dict): tail index mapping bytes topic to int ordinal one past
+            its last stored message, loaded lazily and advanced on append so
+            that whether a topic has anything new since fn is known without
+            reading the database. See .tail
+        stored (int): count of messages appended since opened. Readers may
+            compare it to a prior value to skip all topics when unchanged
+        retention (Retention): default retention policy of all topics
+        policies (dict): of Retention keyed by topic route, such as "/receipt",
+            overriding .retention for topics with that route
+        tpcs (lmdb._Database): insertion ordered message digests by topic
+        msgs (Suber): message bodies by digest
+        refs (Suber): hex count of topic entries referencing message by digest
+        dtms (Suber): ISO-8601 datetime message last stored by digest
+        acks (Suber): hex ordinal below which topic is acknowledged by topic
+
     """
     TailDirPath = "keri/mbx"
     AltTailDirPath = ".keri/mbx"
     TempPrefix = "keri_mbx_"
+    Tomb = b"-"  # tombstone value of newest entry of topic once expired
 
-    def __init__(self, name="mbx", headDirPath=None, reopen=True, **kwa):
+    def __init__(self, name="mbx", headDirPath=None, reopen=True, retention=None,
+                 policies=None, **kwa):
         """
 
         Parameters:
             headDirPath:
             perm:
             reopen:
+            retention (Retention): default retention policy. None means
+                unlimited
+            policies (dict): of Retention keyed by topic route
             kwa:
         """
         self.tpcs = None
         self.msgs = None
+        self.refs = None
+        self.dtms = None
+        self.acks = None
+        self.tails = {}
+        self.stored = 0
+        self.retention = retention if retention is not None else Retention()
+        self.policies = policies if policies is not None else {}
 
         super(Mailboxer, self).__init__(name=name, headDirPath=headDirPath, reopen=reopen, **kwa)
 
@@ -50,6 +106,10 @@ class Mailboxer(dbing.LMDBer):
 
         self.tpcs = self.env.open_db(key=b'tpcs.', dupsort=True)
         self.msgs = subing.Suber(db=self, subkey='msgs.')  # key states
+        self.refs = subing.Suber(db=self, subkey='refs.')
+        self.dtms = subing.Suber(db=self, subkey='dtms.')
+        self.acks = subing.Suber(db=self, subkey='acks.')
+        self.tails = {}
 
         return self.env
 
@@ -59,6 +119,7 @@ class Mailboxer(dbing.LMDBer):
         Deletes value at key.
         Returns True If key exists in database Else False
         """
+        self.tails.pop(key.encode("utf-8") if hasattr(key, "encode") else key, None)
         return self.delIoSetVals(self.tpcs, key)
 
     def appendToTopic(self, topic, val):
@@ -73,7 +134,32 @@ class Mailboxer(dbing.LMDBer):
             topic is bytes identifier prefix/topic for message
             val is event digest
         """
-        return self.appendIoSetVal(db=self.tpcs, key=topic, val=val)
+        if hasattr(topic, "encode"):
+            topic = topic.encode("utf-8")
+
+        ion = self.appendIoSetVal(db=self.tpcs, key=topic, val=val)
+        self.tails[topic] = ion + 1  # publish advanced tail
+        self.stored += 1
+        return ion
+
+    def tail(self, topic):
+        """
+        Returns:
+            tail (int): ordinal one past the last message stored at topic so
+                topic has messages at or after fn when fn < tail
+
+        Loads tail from database on first use for topic, otherwise O(1).
+
+        Parameters:
+            topic (str | bytes): full topic key of mailbox
+        """
+        if hasattr(topic, "encode"):
+            topic = topic.encode("utf-8")
+
+        if (tail := self.tails.get(topic)) is None:
+            ion = self.getIoSetIonLast(db=self.tpcs, key=topic)
+            tail = self.tails[topic] = ion + 1 if ion is not None else 0
+        return tail
 
     def getTopicMsgs(self, topic, fn=0):
         """
@@ -112,9 +198,184 @@ class Mailboxer(dbing.LMDBer):
         if hasattr(msg, "encode"):
             msg = msg.encode("utf-8")
 
+        if metering.meter.enabled:
+            _, _, route = topic.partition(b"/")
+            route = "/" + route.decode("utf-8").lstrip("/")
+            metering.meter.counter("keri_mailbox_stored_total", help="Messages stored in mailbox by topic route",
+                                   labels=("route",)).inc(route)
+            metering.meter.counter("keri_mailbox_stored_bytes_total", help="Bytes stored in mailbox by topic route",
+                                   labels=("route",)).inc(route, amount=len(msg))
+
         digb = coring.Diger(ser=msg, code=MtrDex.Blake3_256).qb64b
-        self.appendToTopic(topic=topic, val=digb)
-        return self.msgs.pin(keys=digb, val=msg)
+        with self.txn(write=True):
+            self.appendToTopic(topic=topic, val=digb)
+            refs = self.refs.get(keys=digb)
+            self.refs.pin(keys=digb, val=f"{int(refs, 16) + 1 if refs else 1:x}")
+            self.dtms.pin(keys=digb, val=helping.nowIso8601())
+            return self.msgs.pin(keys=digb, val=msg)
+
+    def ack(self, topic, fn):
+        """
+        Records that a client has received the messages of topic below fn.
+        Only advances. Acknowledged messages expire when the topic's
+        Retention.acked is True. Since fn comes from the client it is clamped
+        to .tail so messages stored later are not acknowledged before they
+        are delivered.
+
+        Parameters:
+            topic (str | bytes): full topic key of mailbox
+            fn (int): ordinal of first message not yet received
+        """
+        fn = min(fn, self.tail(topic))
+        acked = self.acks.get(keys=topic)
+        if fn > 0 and (acked is None or fn > int(acked, 16)):
+            self.acks.pin(keys=topic, val=f"{fn:x}")
+
+    def policy(self, topic):
+        """
+        Returns:
+            retention (Retention): policy of topic by its route, the part of
+                topic following the recipient prefix, else default .retention
+
+        Parameters:
+            topic (str | bytes): full topic key of mailbox
+        """
+        if hasattr(topic, "decode"):
+            topic = topic.decode("utf-8")
+        _, _, route = topic.partition("/")
+        return self.policies.get("/" + route.lstrip("/"), self.retention)
+
+    def expired(self, now=None):
+        """
+        Returns list of (iokey, dig) of topic entries expired by policy in
+        topic and insertion order. Reads all topics in one transaction.
+
+        The newest entry of each topic is expired to a tombstone instead of
+        deleted so that ordinals of later messages keep increasing and client
+        cursors remain valid. A tombstone is deleted once superseded.
+
+        Parameters:
+            now (datetime): time to compute age against. None means now
+        """
+        now = now if now is not None else helping.nowUTC()
+        expired = []
+        with self.txn(write=False):
+            entries = []
+            for iokey, dig in self.getTopItemIter(db=self.tpcs):
+                topic, ion = dbing.unsuffix(iokey)
+                if entries and entries[0][0] != topic:
+                    expired.extend(self._expired(entries, now))
+                    entries = []
+                entries.append((topic, ion, iokey, bytes(dig)))
+            if entries:
+                expired.extend(self._expired(entries, now))
+
+        return expired
+
+    def _expired(self, entries, now):
+        """
+        Returns list of (iokey, dig) of expired entries of one topic
+
+        Parameters:
+            entries (list): of (topic, ion, iokey, dig) of topic in ion order
+            now (datetime): time to compute age against
+        """
+        topic = entries[0][0]
+        policy = self.policy(topic)
+        if not policy.bounded:
+            return []
+
+        acked = self.acks.get(keys=topic) if policy.acked else None
+        acked = int(acked, 16) if acked is not None else 0
+        count = size = 0
+        expired = []
+        for _, ion, iokey, dig in reversed(entries):  # newest first
+            if dig == self.Tomb:
+                if count:  # superseded
+                    expired.append((iokey, dig))
+                continue
+
+            count += 1
+            if policy.size is not None:
+                msg = self.msgs.get(keys=dig)
+                size += len(msg) if msg is not None else 0
+            if ((policy.count is not None and count > policy.count)
+                    or (policy.size is not None and size > policy.size)
+                    or ion < acked):
+                expired.append((iokey, dig))
+            elif policy.age is not None:
+                if (dts := self.dtms.get(keys=dig)) is not None:
+                    age = (now - helping.fromIso8601(dts)).total_seconds()
+                    if age > policy.age:
+                        expired.append((iokey, dig))
+
+        expired.reverse()
+        return expired
+
+    def purge(self, items):
+        """
+        Deletes topic entries in one transaction. Deletes message bodies
+        no longer referenced by any topic.
+
+        Returns:
+            result (tuple): (removed, reclaimed) where removed is int number
+                of entries deleted and reclaimed is int bytes of deleted bodies
+
+        Parameters:
+            items (Iterable): of (iokey, dig) as from .expired
+        """
+        removed = reclaimed = 0
+        with self.txn(write=True):
+            for iokey, dig in items:
+                topic, ion = dbing.unsuffix(iokey)
+                if dig != self.Tomb:
+                    if self.tail(topic) == ion + 1:  # newest so keep tombstone
+                        self.delIoSetIokey(db=self.tpcs, iokey=iokey)
+                        self.putVal(db=self.tpcs, key=iokey, val=self.Tomb)
+                    elif not self.delIoSetIokey(db=self.tpcs, iokey=iokey):
+                        continue
+                    reclaimed += self._unref(dig)
+                elif not self.delIoSetIokey(db=self.tpcs, iokey=iokey):
+                    continue
+                removed += 1
+
+        return removed, reclaimed
+
+    def _unref(self, dig):
+        """
+        Returns int bytes reclaimed by decrementing references to message at
+        dig and deleting message when unreferenced
+        """
+        refs = self.refs.get(keys=dig)
+        refs = int(refs, 16) - 1 if refs else 0
+        if refs > 0:
+            self.refs.pin(keys=dig, val=f"{refs:x}")
+            return 0
+
+        msg = self.msgs.get(keys=dig)
+        self.msgs.rem(keys=dig)
+        self.refs.rem(keys=dig)
+        self.dtms.rem(keys=dig)
+        return len(dig) + len(msg) if msg is not None else 0
+
+    def usage(self):
+        """
+        Returns:
+            used (int): bytes of the database map in use. Pages freed by
+                purge are reused by later writes so used stops growing once
+                retention is in effect
+        """
+        return (self.env.info()["last_pgno"] + 1) * self.env.stat()["psize"]
+
+    def compact(self, path):
+        """
+        Writes compacted copy of database, without free pages, to directory
+        path for backup or to replace the database file while closed.
+
+        Parameters:
+            path (str): existing empty directory for copy
+        """
+        self.env.copy(path, compact=True)
 
     def cloneTopicIter(self, topic, fn=0):
         """
@@ -131,6 +392,57 @@ class Mailboxer(dbing.LMDBer):
                 yield ion, topic, msg.encode("utf-8")
 
 
+class Sweeper(doing.Doer):
+    """
+    Sweeper is a Doer that periodically deletes the messages of a Mailboxer
+    expired by its retention policies. Each sweep reads the expired entries
+    in one transaction then purges them in batches of .BatchSize, one write
+    transaction per recur, so that other doers are not stalled.
+
+    Attributes:
+        mbx (Mailboxer): mailbox storage to sweep
+        period (float): seconds between sweeps
+        due (float | None): tyme of next sweep. None means sweep on next recur
+        plan (deque): of (iokey, dig) remaining to purge in current sweep
+        removed (int): total entries removed since created
+        reclaimed (int): total bytes of message bodies deleted since created
+
+    """
+    BatchSize = 256  # maximum entries purged per transaction
+
+    def __init__(self, mbx, period=60.0, **kwa):
+        """
+        Parameters:
+            mbx (Mailboxer): mailbox storage to sweep
+            period (float): seconds between sweeps
+        """
+        super(Sweeper, self).__init__(**kwa)
+        self.mbx = mbx
+        self.period = period
+        self.due = None
+        self.plan = deque()
+        self.removed = 0
+        self.reclaimed = 0
+
+    def recur(self, tyme):
+        """ Start sweep when due else purge next batch of current sweep """
+        if self.plan:
+            batch = [self.plan.popleft() for _ in range(min(self.BatchSize, len(self.plan)))]
+            removed, reclaimed = self.mbx.purge(batch)
+            self.removed += removed
+            self.reclaimed += reclaimed
+            if not self.plan:
+                logger.info("Mailbox sweep done: %d removed, %d bytes reclaimed "
+                            "in total, %d bytes in use.\n", self.removed,
+                            self.reclaimed, self.mbx.usage())
+
+        elif self.due is None or tyme >= self.due:
+            self.due = tyme + self.period
+            self.plan.extend(self.mbx.expired())
+
+        return False  # never done
+
+
 class Respondant(doing.DoDoer):
     """
     Respondant processes buffer of response messages from inbound 'exn' messages and
@@ -5,6 +5,7 @@ keri.core.coring module
 """
 import re
 import json
+from itertools import chain
 from typing import Union
 from collections.abc import Iterable
 
@@ -12,6 +13,7 @@ from dataclasses import dataclass, astuple
 from collections import namedtuple, deque
 from base64 import urlsafe_b64encode as encodeB64
 from base64 import urlsafe_b64decode as decodeB64
+from binascii import a2b_base64
 from fractions import Fraction
 
 import cbor2 as cbor
@@ -139,6 +141,7 @@ B64_CHARS = tuple(B64ChrByIdx.values())  # tuple of characters in Base64
 
 B64REX = b'^[A-Za-z0-9\-\_]*\Z'
 Reb64 = re.compile(B64REX)  # compile is faster
+B64URLTOSTD = bytes.maketrans(b'-_', b'+/')  # URL safe to standard alphabet
 
 
 def intToB64(i, l=1):
@@ -218,6 +221,46 @@ def codeB2ToB64(b, l):
     return (intToB64(i, l))  # return as B64
 
 
+def exfilTables(hards, sizes):
+    """
+    Returns tuple (ords, bords, bizes) of lookup tables precomputed from the
+    .Hards and .Sizes tables of a primitive class for the fast path of ._exfil
+    and ._bexfil so that no per call str conversion is needed to find a code.
+
+    ords (tuple): hard size hs indexed by ordinal of last selector char in
+        qb64b. 0 when not the selector of a supported code.
+    bords (tuple): hard size hs indexed by first byte of qb2 for single char
+        selectors. 0 when not the selector of a supported code.
+    bizes (dict): maps bytes hard code to tuple (hard, *sizes) where hard is
+        the str hard code and sizes the entry in .Sizes for hard
+
+    Parameters:
+        hards (dict): class .Hards table
+        sizes (dict): class .Sizes table
+    """
+    ords = [0] * 256
+    bords = [0] * 256
+    for sel, hs in hards.items():
+        ords[ord(sel[-1])] = hs
+        if len(sel) == 1:  # first sextet is in top six bits of first byte
+            idx = B64IdxByChr[sel]
+            for b in range(idx << 2, (idx << 2) + 4):
+                bords[b] = hs
+    bizes = {hard.encode("utf-8"): (hard, *sizage) for hard, sizage in sizes.items()}
+    return (tuple(ords), tuple(bords), bizes)
+
+
+def decodeB64b(b):
+    """
+    Returns bytes decoded from URL safe Base64 bytes b without pad chars.
+    Same result as decodeB64 but skips its per call input normalization.
+
+    Parameters:
+        b (bytes | bytearray): URL safe Base64 with len(b) multiple of 4
+    """
+    return a2b_base64(b.translate(B64URLTOSTD))
+
+
 def nabSextets(b, l):
     """
     Return first l sextets from front (left) of b as bytes (byte string).
@@ -459,7 +502,7 @@ class MatterCodex:
 
 
     def __iter__(self):
-        return iter(astuple(self))  # enables inclusion test with "in"
+        return iter(self.__dict__.values())  # enables inclusion test with "in"
 
 
 MtrDex = MatterCodex()  # Make instance
@@ -480,7 +523,7 @@ class SmallVarRawSizeCodex:
     Lead2: str = '6'  # First Selector Character for all ls == 2 codes
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())
 
 
 SmallVrzDex = SmallVarRawSizeCodex()  # Make instance
@@ -501,7 +544,7 @@ class LargeVarRawSizeCodex:
     Lead2_Big: str = '9'  # First Selector Character for all ls == 2 codes
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())
 
 
 LargeVrzDex = LargeVarRawSizeCodex()  # Make instance
@@ -520,7 +563,7 @@ class NonTransCodex:
     ECDSA_256r1N: str = "1AAI"  # ECDSA secp256r1 verification key non-transferable, basic derivation.
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())
 
 
 NonTransDex = NonTransCodex()  # Make instance
@@ -546,7 +589,7 @@ class DigCodex:
     SHA2_512: str = '0G'  # SHA2 512 bit digest self-addressing derivation.
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())
 
 
 DigDex = DigCodex()  # Make instance
@@ -567,7 +610,7 @@ class NumCodex:
     Huge:    str = '0A'  # Huge 16 byte b2 number (same as Salt_128)
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())
 
 
 NumDex = NumCodex()  # Make instance
@@ -588,7 +631,7 @@ class BextCodex:
     StrB64_Big_L2: str = '9AAA'  # String Base64 Only Big Leader Size 2
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())
 
 
 BexDex = BextCodex()  # Make instance
@@ -714,6 +757,9 @@ class Matter:
     # Bards table maps first code char. converted to binary sextext of hard size,
     # hs. Used for ._bexfil.
     Bards = ({codeB64ToB2(c): hs for c, hs in Hards.items()})
+    # Ords, Bords, and Bizes are precomputed from Hards and Sizes for the fast
+    # path of ._exfil and ._bexfil. See exfilTables.
+    Ords, Bords, Bizes = exfilTables(Hards, Sizes)
 
     def __init__(self, raw=None, code=MtrDex.Ed25519N, rize=None,
                  qb64b=None, qb64=None, qb2=None, strip=False):
@@ -1043,44 +1089,44 @@ class Matter:
 
         cs = hs + ss
         fs = (size * 4) + cs
+
+        Hard code is found from .Ords and .Bizes by first byte so fixed size
+        codes never convert code chars to str. Material is decoded directly
+        from its slice of qb64b.
         """
         if not qb64b:  # empty need more bytes
             raise ShortageError("Empty material.")
 
-        first = qb64b[:1]  # extract first char code selector
-        if hasattr(first, "decode"):
-            first = first.decode("utf-8")
-        if first not in self.Hards:
-            if first[0] == '-':
+        if hasattr(qb64b, "encode"):  # str so convert to bytes
+            qb64b = qb64b.encode("utf-8")
+
+        hs = self.Ords[qb64b[0]]  # get hard code size from first code char
+        if not hs:
+            first = chr(qb64b[0])
+            if first == '-':
                 raise UnexpectedCountCodeError("Unexpected count code start"
                                                "while extracing Matter.")
-            elif first[0] == '_':
+            elif first == '_':
                 raise UnexpectedOpCodeError("Unexpected  op code start"
                                             "while extracing Matter.")
             else:
                 raise UnexpectedCodeError(f"Unsupported code start char={first}.")
 
-        hs = self.Hards[first]  # get hard code size
         if len(qb64b) < hs:  # need more bytes
             raise ShortageError(f"Need {hs - len(qb64b)} more characters.")
 
-        hard = qb64b[:hs]  # extract hard code
-        if hasattr(hard, "decode"):
-            hard = hard.decode("utf-8")  # converts bytes/bytearray to str
-        if hard not in self.Sizes:
-            raise UnexpectedCodeError(f"Unsupported code ={hard}.")
+        hard = bytes(qb64b[:hs])  # extract hard code
+        if hard not in self.Bizes:
+            raise UnexpectedCodeError(f"Unsupported code ={hard.decode('utf-8')}.")
 
-        hs, ss, fs, ls = self.Sizes[hard]  # assumes hs in both tables match
+        hard, hs, ss, fs, ls = self.Bizes[hard]  # assumes hs in both tables match
         cs = hs + ss  # both hs and ss
         size = None
         if not fs:  # compute fs from size chars in ss part of code
             if cs % 4:
                 raise ValidationError(f"Whole code size not multiple of 4 for "
                                       f"variable length material. cs={cs}.")
-            size = qb64b[hs:hs + ss]  # extract size chars
-            if hasattr(size, "decode"):
-                size = size.decode("utf-8")
-            size = b64ToInt(size)  # compute int size
+            size = b64ToInt(bytes(qb64b[hs:hs + ss]))  # compute int size
             fs = (size * 4) + cs
 
         # assumes that unit tests on Matter and MatterCodex ensure that
@@ -1091,37 +1137,33 @@ class Matter:
         if len(qb64b) < fs:  # need more bytes
             raise ShortageError(f"Need {fs - len(qb64b)} more chars.")
 
-        qb64b = qb64b[:fs]  # fully qualified primitive code plus material
-        if hasattr(qb64b, "encode"):  # only convert extracted chars from stream
-            qb64b = qb64b.encode("utf-8")
-
         # check for non-zeroed pad bits or lead bytes
         ps = cs % 4  # code pad size ps = cs mod 4
-        pbs = 2 * (ps if ps else ls)  # pad bit size in bits
         if ps:  # ps. IF ps THEN not ls (lead) and vice versa OR not ps and not ls
-            base = ps * b'A' + qb64b[cs:]  # replace pre code with prepad chars of zero
-            paw = decodeB64(base)  # decode base to leave prepadded raw
-            pi = (int.from_bytes(paw[:ps], "big"))  # prepad as int
-            if pi & (2 ** pbs - 1 ):  # masked pad bits non-zero
+            # replace pre code with prepad chars of zero then decode
+            paw = decodeB64b(b'A' * ps + qb64b[cs:fs])
+            pi = paw[ps - 1] & ((1 << (2 * ps)) - 1)  # masked prepad bits
+            if pi:  # masked pad bits non-zero
                 raise ValueError(f"Non zeroed prepad bits = "
-                                 f"{pi & (2 ** pbs - 1 ):<06b} in {qb64b[cs:cs+1]}.")
+                                 f"{pi:<06b} in {bytes(qb64b[cs:cs+1])}.")
             raw = paw[ps:]  # strip off ps prepad paw bytes
 
         else:  # not ps. IF not ps THEN may or may not be ls (lead)
-            base = qb64b[cs:]  # strip off code leaving lead chars if any and value
             # decode lead chars + val leaving lead bytes + raw bytes
             # then strip off ls lead bytes leaving raw
-            paw = decodeB64(base) # decode base to leave prepadded paw bytes
-            li = int.from_bytes(paw[:ls], "big")  # lead as int
-            if li:  # pre pad lead bytes must be zero
-                if ls == 1:
-                    raise ValueError(f"Non zeroed lead byte = 0x{li:02x}.")
-                else:
-                    raise ValueError(f"Non zeroed lead bytes = 0x{li:04x}.")
+            paw = decodeB64b(bytes(qb64b[cs:fs]))
+            if ls:
+                li = int.from_bytes(paw[:ls], "big")  # lead as int
+                if li:  # pre pad lead bytes must be zero
+                    if ls == 1:
+                        raise ValueError(f"Non zeroed lead byte = 0x{li:02x}.")
+                    else:
+                        raise ValueError(f"Non zeroed lead bytes = 0x{li:04x}.")
             raw = paw[ls:]  # paw is bytes so raw is bytes
 
-        if len(raw) != ((len(qb64b) - cs) * 3 // 4) - ls:  # exact lengths
-            raise ConversionError(f"Improperly qualified material = {qb64b}")
+        if len(raw) != ((fs - cs) * 3 // 4) - ls:  # exact lengths
+            raise ConversionError(f"Improperly qualified material = "
+                                  f"{bytes(qb64b[:fs])}")
 
         self._code = hard  # hard only
         self._size = size
@@ -1138,8 +1180,9 @@ class Matter:
         if not qb2:  # empty need more bytes
             raise ShortageError("Empty material, Need more bytes.")
 
-        first = nabSextets(qb2, 1)  # extract first sextet as code selector
-        if first not in self.Bards:
+        hs = self.Bords[qb2[0]]  # get code hard size from first sextet
+        if not hs:
+            first = nabSextets(qb2, 1)  # extract first sextet as code selector
             if first[0] == b'\xf8':  # b64ToB2('-')
                 raise UnexpectedCountCodeError("Unexpected count code start"
                                                "while extracing Matter.")
@@ -1149,7 +1192,6 @@ class Matter:
             else:
                 raise UnexpectedCodeError(f"Unsupported code start sextet={first}.")
 
-        hs = self.Bards[first]  # get code hard size equvalent sextets
         bhs = sceil(hs * 3 / 4)  # bhs is min bytes to hold hs sextets
         if len(qb2) < bhs:  # need more bytes
             raise ShortageError(f"Need {bhs - len(qb2)} more bytes.")
@@ -1947,6 +1989,42 @@ class Pather(Bexter):
 
 
 
+def verifyItems(items):
+    """
+    Returns:
+        results (list): of bool, True means signature verified, one for each
+            item in items in order
+
+    Module level so may be pickled and run in a worker process of a pool.
+    Decodes each distinct ECDSA public key only once for all items.
+
+    Parameters:
+        items (Iterable): of (code, key, sig, ser) quadruples where code is the
+            verifier derivation code, key is bytes public key, sig is bytes
+            raw signature, and ser is bytes serialization that was signed
+    """
+    results = []
+    verkeys = {}  # decoded ECDSA public keys keyed by (code, key)
+    for code, key, sig, ser in items:
+        if code in (MtrDex.Ed25519N, MtrDex.Ed25519):
+            results.append(Verfer._ed25519(sig=sig, ser=ser, key=key))
+            continue
+
+        if code in (MtrDex.ECDSA_256r1N, MtrDex.ECDSA_256r1):
+            curve = ec.SECP256R1
+        elif code in (MtrDex.ECDSA_256k1N, MtrDex.ECDSA_256k1):
+            curve = ec.SECP256K1
+        else:
+            raise ValueError("Unsupported code = {} for verifier.".format(code))
+
+        if (code, key) not in verkeys:
+            verkeys[(code, key)] = ec.EllipticCurvePublicKey.from_encoded_point(curve(), key)
+        results.append(Verfer._ecdsa(sig=sig, ser=ser,
+                                     verkey=verkeys[(code, key)]))
+
+    return results
+
+
 class Verfer(Matter):
     """
     Verfer is Matter subclass with method to verify signature of serialization
@@ -1954,14 +2032,27 @@ class Verfer(Matter):
 
     See Matter for inherited attributes and properties:
 
+    Class Attributes:
+        BatchPoolMin (int): minimum batch size to fan out to a pool
+        BatchChunk (int): number of signatures per pool work item
+        Vouched (dict): memo of (code, key, sig, ser) quadruples of signatures
+            already verified elsewhere such as by a worker process. Shared by
+            all instances. Oldest entries evicted beyond .VouchCap
+        VouchCap (int): maximum entries in .Vouched
+
     Attributes:
 
     Properties:
 
     Methods:
         verify: verifies signature
+        verifyBatch: verifies batch of signatures
 
     """
+    BatchPoolMin = 256
+    BatchChunk = 64
+    Vouched = {}
+    VouchCap = 4096
 
     def __init__(self, **kwa):
         """
@@ -1989,8 +2080,69 @@ class Verfer(Matter):
             sig is bytes signature
             ser is bytes serialization
         """
+        if self.Vouched and (self.code, self.raw, bytes(sig), bytes(ser)) in self.Vouched:
+            return True
         return (self._verify(sig=sig, ser=ser, key=self.raw))
 
+    @classmethod
+    def vouch(cls, items):
+        """
+        Records signatures verified elsewhere, such as by a worker process,
+        in .Vouched so that later verification of the same signature by the
+        same key on the same serialization need not be repeated.
+
+        Parameters:
+            items (Iterable): of (code, key, sig, ser) quadruples as for
+                verifyItems that each verified
+        """
+        for item in items:
+            cls.Vouched[item] = True
+        while len(cls.Vouched) > cls.VouchCap:
+            del cls.Vouched[next(iter(cls.Vouched))]  # oldest first
+
+    @classmethod
+    def verifyBatch(cls, batch, pool=None):
+        """
+        Returns:
+            results (list): of bool, True means signature verified, one for
+                each triple in batch in order
+
+        Verifies batch of signatures in one pass without per signature method
+        dispatch and decodes each distinct ECDSA key only once. When pool is
+        provided and batch has at least .BatchPoolMin signatures then chunks
+        of .BatchChunk signatures are verified in parallel by pool.
+
+        Parameters:
+            batch (Iterable): of (verfer, sig, ser) triples where verfer is
+                Verfer instance, sig is bytes raw signature, and ser is bytes
+                serialization that was signed
+            pool (concurrent.futures.Executor | None): optional executor such
+                as ProcessPoolExecutor to fan out large batches
+        """
+        items = [(verfer.code, verfer.raw, bytes(sig), bytes(ser))
+                 for verfer, sig, ser in batch]
+        if cls.Vouched:  # only verify those not already vouched for
+            results = [True if item in cls.Vouched else None for item in items]
+            todos = iter(cls._verifyItems([item for item, result in
+                                           zip(items, results) if result is None],
+                                          pool=pool))
+            return [result if result else next(todos) for result in results]
+
+        return cls._verifyItems(items, pool=pool)
+
+    @classmethod
+    def _verifyItems(cls, items, pool=None):
+        """
+        Returns list of bool results of verifying items as in verifyItems,
+        fanned out to pool in chunks when items is large enough.
+        """
+        if pool is None or len(items) < cls.BatchPoolMin:
+            return verifyItems(items)
+
+        chunks = [items[i:i + cls.BatchChunk]
+                  for i in range(0, len(items), cls.BatchChunk)]
+        return list(chain.from_iterable(pool.map(verifyItems, chunks)))
+
     @staticmethod
     def _ed25519(sig, ser, key):
         """
@@ -2021,14 +2173,7 @@ class Verfer(Matter):
             key is bytes public key
         """
         verkey = ec.EllipticCurvePublicKey.from_encoded_point(ec.SECP256R1(), key)
-        r = int.from_bytes(sig[:32], "big")
-        s = int.from_bytes(sig[32:], "big")
-        der = utils.encode_dss_signature(r, s)
-        try:
-            verkey.verify(der, ser, ec.ECDSA(hashes.SHA256()))
-            return True
-        except exceptions.InvalidSignature:
-            return False
+        return Verfer._ecdsa(sig=sig, ser=ser, verkey=verkey)
 
     @staticmethod
     def _secp256k1(sig, ser, key):
@@ -2042,6 +2187,19 @@ class Verfer(Matter):
             key is bytes public key
         """
         verkey = ec.EllipticCurvePublicKey.from_encoded_point(ec.SECP256K1(), key)
+        return Verfer._ecdsa(sig=sig, ser=ser, verkey=verkey)
+
+    @staticmethod
+    def _ecdsa(sig, ser, verkey):
+        """
+        Returns True if verified False otherwise
+        Verify ECDSA SHA256 sig on ser using decoded public key verkey
+
+        Parameters:
+            sig is bytes signature as r and s concatenated
+            ser is bytes serialization
+            verkey is EllipticCurvePublicKey instance
+        """
         r = int.from_bytes(sig[:32], "big")
         s = int.from_bytes(sig[32:], "big")
         der = utils.encode_dss_signature(r, s)
@@ -3094,7 +3252,7 @@ class PreCodex:
     ECDSA_256r1:   str = "1AAJ"  # ECDSA secp256r1 verification or encryption key, basic derivation
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())
 
 
 PreDex = PreCodex()  # Make instance
@@ -3711,7 +3869,7 @@ class IndexerCodex:
     TBD4: str = '4z'  # Test of index sig lead 1 big
 
     def __iter__(self):
-        return iter(astuple(self))  # enables inclusion test with "in"
+        return iter(self.__dict__.values())  # enables inclusion test with "in"
 
 IdrDex = IndexerCodex()
 
@@ -3741,7 +3899,7 @@ class IndexedSigCodex:
     Ed448_Big_Crt_Sig: str = '3B'  # Ed448 signature appears in current list only.
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())
 
 IdxSigDex = IndexedSigCodex()  # Make instance
 
@@ -3763,7 +3921,7 @@ class IndexedCurrentSigCodex:
     Ed448_Big_Crt_Sig: str = '3B'  # Ed448 signature appears in current list only.
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())
 
 IdxCrtSigDex = IndexedCurrentSigCodex()  # Make instance
 
@@ -3786,7 +3944,7 @@ class IndexedBothSigCodex:
     Ed448_Big_Sig: str = '3A'  # Ed448 signature appears in both lists.
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())
 
 IdxBthSigDex = IndexedBothSigCodex()  # Make instance
 
@@ -3866,6 +4024,9 @@ class Indexer:
     # Bards table maps to hard size, hs, of code from bytes holding sextets
     # converted from first code char. Used for ._bexfil.
     Bards = ({codeB64ToB2(c): hs for c, hs in Hards.items()})
+    # Ords, Bords, and Bizes are precomputed from Hards and Sizes for the fast
+    # path of ._exfil and ._bexfil. See exfilTables.
+    Ords, Bords, Bizes = exfilTables(Hards, Sizes)
 
     def __init__(self, raw=None, code=IdrDex.Ed25519_Sig, index=0, ondex=None,
                  qb64b=None, qb64=None, qb2=None, strip=False):
@@ -4155,34 +4316,36 @@ class Indexer:
         cs = hs + ss
         ms = ss - os (main index size)
         when fs None then size computed & fs = size * 4 + cs
+
+        Hard code is found from .Ords and .Bizes by first byte. Material is
+        decoded directly from its slice of qb64b.
         """
         if not qb64b:  # empty need more bytes
             raise ShortageError("Empty material.")
 
-        first = qb64b[:1]  # extract first char code selector
-        if hasattr(first, "decode"):
-            first = first.decode("utf-8")
-        if first not in self.Hards:
-            if first[0] == '-':
+        if hasattr(qb64b, "encode"):  # str so convert to bytes
+            qb64b = qb64b.encode("utf-8")
+
+        hs = self.Ords[qb64b[0]]  # get hard code size from first code char
+        if not hs:
+            first = chr(qb64b[0])
+            if first == '-':
                 raise UnexpectedCountCodeError("Unexpected count code start"
                                                "while extracing Indexer.")
-            elif first[0] == '_':
+            elif first == '_':
                 raise UnexpectedOpCodeError("Unexpected  op code start"
                                             "while extracing Indexer.")
             else:
                 raise UnexpectedCodeError(f"Unsupported code start char={first}.")
 
-        hs = self.Hards[first]  # get hard code size
         if len(qb64b) < hs:  # need more bytes
             raise ShortageError(f"Need {hs - len(qb64b)} more characters.")
 
-        hard = qb64b[:hs]  # get hard code
-        if hasattr(hard, "decode"):
-            hard = hard.decode("utf-8")
-        if hard not in self.Sizes:
-            raise UnexpectedCodeError(f"Unsupported code ={hard}.")
+        hard = bytes(qb64b[:hs])  # get hard code
+        if hard not in self.Bizes:
+            raise UnexpectedCodeError(f"Unsupported code ={hard.decode('utf-8')}.")
 
-        hs, ss, os, fs, ls = self.Sizes[hard]  # assumes hs in both tables consistent
+        hard, hs, ss, os, fs, ls = self.Bizes[hard]  # assumes hs in both tables consistent
         cs = hs + ss  # both hard + soft code size
         ms = ss - os
         # assumes that unit tests on Indexer and IndexerCodex ensure that
@@ -4193,23 +4356,16 @@ class Indexer:
         if len(qb64b) < cs:  # need more bytes
             raise ShortageError(f"Need {cs - len(qb64b)} more characters.")
 
-        index = qb64b[hs:hs+ms]  # extract index/size chars
-        if hasattr(index, "decode"):
-            index = index.decode("utf-8")
-        index = b64ToInt(index)  # compute int index
-
-        ondex = qb64b[hs+ms:hs+ms+os]  # extract ondex chars
-        if hasattr(ondex, "decode"):
-            ondex = ondex.decode("utf-8")
+        index = b64ToInt(bytes(qb64b[hs:hs+ms]))  # compute int index
 
         if hard in IdxCrtSigDex:  # if current sig then ondex from code must be 0
-            ondex = b64ToInt(ondex) if os else None  # compute ondex from code
+            ondex = b64ToInt(bytes(qb64b[hs+ms:hs+ms+os])) if os else None
             if ondex:  # not zero or None so error
                 raise ValueError(f"Invalid ondex={ondex} for code={hard}.")
             else:
                 ondex = None  # zero so set to None when current only
         else:
-            ondex = b64ToInt(ondex) if os else index
+            ondex = b64ToInt(bytes(qb64b[hs+ms:hs+ms+os])) if os else index
 
         # index is index for some codes and variable length for others
         if not fs:  # compute fs from index which means variable length
@@ -4224,42 +4380,32 @@ class Indexer:
         if len(qb64b) < fs:  # need more bytes
             raise ShortageError(f"Need {fs - len(qb64b)} more chars.")
 
-        qb64b = qb64b[:fs]  # fully qualified primitive code plus material
-        if hasattr(qb64b, "encode"):  # only convert extracted chars from stream
-            qb64b = qb64b.encode("utf-8")
-
-        # strip off prepended code and append pad characters
-        #ps = cs % 4  # pad size ps = cs mod 4, same pad chars and lead bytes
-        #base = ps * b'A' + qb64b[cs:]  # replace prepend code with prepad zeros
-        #raw = decodeB64(base)[ps+ls:]  # decode and strip off ps+ls prepad bytes
-
         # check for non-zeroed pad bits or lead bytes
         ps = cs % 4  # code pad size ps = cs mod 4
-        pbs = 2 * (ps if ps else ls)  # pad bit size in bits
         if ps:  # ps. IF ps THEN not ls (lead) and vice versa OR not ps and not ls
-            base = ps * b'A' + qb64b[cs:]  # replace pre code with prepad chars of zero
-            paw = decodeB64(base)  # decode base to leave prepadded raw
-            pi = (int.from_bytes(paw[:ps], "big"))  # prepad as int
-            if pi & (2 ** pbs - 1 ):  # masked pad bits non-zero
+            # replace pre code with prepad chars of zero then decode
+            paw = decodeB64b(b'A' * ps + qb64b[cs:fs])
+            pi = paw[ps - 1] & ((1 << (2 * ps)) - 1)  # masked prepad bits
+            if pi:  # masked pad bits non-zero
                 raise ValueError(f"Non zeroed prepad bits = "
-                                 f"{pi & (2 ** pbs - 1 ):<06b} in {qb64b[cs:cs+1]}.")
+                                 f"{pi:<06b} in {bytes(qb64b[cs:cs+1])}.")
             raw = paw[ps:]  # strip off ps prepad paw bytes
         else:  # not ps. IF not ps THEN may or may not be ls (lead)
-            base = qb64b[cs:]  # strip off code leaving lead chars if any and value
             # decode lead chars + val leaving lead bytes + raw bytes
             # then strip off ls lead bytes leaving raw
-            paw = decodeB64(base) # decode base to leave prepadded paw bytes
-            li = int.from_bytes(paw[:ls], "big")  # lead as int
-            if li:  # pre pad lead bytes must be zero
-                if ls == 1:
-                    raise ValueError(f"Non zeroed lead byte = 0x{li:02x}.")
-                else:
-                    raise ValueError(f"Non zeroed lead bytes = 0x{li:04x}.")
-
+            paw = decodeB64b(bytes(qb64b[cs:fs]))
+            if ls:
+                li = int.from_bytes(paw[:ls], "big")  # lead as int
+                if li:  # pre pad lead bytes must be zero
+                    if ls == 1:
+                        raise ValueError(f"Non zeroed lead byte = 0x{li:02x}.")
+                    else:
+                        raise ValueError(f"Non zeroed lead bytes = 0x{li:04x}.")
             raw = paw[ls:]
 
-        if len(raw) != (len(qb64b) - cs) * 3 // 4:  # exact lengths
-            raise ConversionError(f"Improperly qualified material = {qb64b}")
+        if len(raw) != (fs - cs) * 3 // 4:  # exact lengths
+            raise ConversionError(f"Improperly qualified material = "
+                                  f"{bytes(qb64b[:fs])}")
 
         self._code = hard
         self._index = index
@@ -4279,8 +4425,9 @@ class Indexer:
         if not qb2:  # empty need more bytes
             raise ShortageError("Empty material, Need more bytes.")
 
-        first = nabSextets(qb2, 1)  # extract first sextet as code selector
-        if first not in self.Bards:
+        hs = self.Bords[qb2[0]]  # get code hard size from first sextet
+        if not hs:
+            first = nabSextets(qb2, 1)  # extract first sextet as code selector
             if first[0] == b'\xf8':  # b64ToB2('-')
                 raise UnexpectedCountCodeError("Unexpected count code start"
                                                "while extracing Matter.")
@@ -4290,7 +4437,6 @@ class Indexer:
             else:
                 raise UnexpectedCodeError(f"Unsupported code start sextet={first}.")
 
-        hs = self.Bards[first]  # get code hard size equvalent sextets
         bhs = sceil(hs * 3 / 4)  # bhs is min bytes to hold hs sextets
         if len(qb2) < bhs:  # need more bytes
             raise ShortageError(f"Need {bhs - len(qb2)} more bytes.")
@@ -4447,7 +4593,7 @@ class CounterCodex:
     KERIProtocolStack: str = '--AAA'  # KERI ACDC Protocol Stack CESR Version
 
     def __iter__(self):
-        return iter(astuple(self))  # enables inclusion test with "in"
+        return iter(self.__dict__.values())  # enables inclusion test with "in"
 
 CtrDex = CounterCodex()
 
@@ -4464,7 +4610,7 @@ class ProtocolGenusCodex:
 
 
     def __iter__(self):
-        return iter(astuple(self))  # enables inclusion test with "in"
+        return iter(self.__dict__.values())  # enables inclusion test with "in"
         # duplicate values above just result in multiple entries in tuple so
         # in inclusion still works
 
@@ -4506,7 +4652,7 @@ class AltCounterCodex:
 
 
     def __iter__(self):
-        return iter(astuple(self))  # enables inclusion test with "in"
+        return iter(self.__dict__.values())  # enables inclusion test with "in"
 
 
 class Counter:
@@ -4569,6 +4715,10 @@ class Counter:
     # Bards table maps to hard size, hs, of code from bytes holding sextets
     # converted from first two code char. Used for ._bexfil.
     Bards = ({codeB64ToB2(c): hs for c, hs in Hards.items()})
+    # Ords and Bizes are precomputed from Hards and Sizes for the fast path of
+    # ._exfil. Ords is indexed by the second selector char since all selectors
+    # start with '-'. See exfilTables.
+    Ords, Bizes = exfilTables(Hards, Sizes)[::2]  # Bords only single char
 
     def __init__(self, code=None, count=None, countB64=None,
                  qb64b=None, qb64=None, qb2=None, strip=False):
@@ -4787,31 +4937,34 @@ class Counter:
     def _exfil(self, qb64b):
         """
         Extracts self.code and self.count from qualified base64 bytes qb64b
+
+        Hard code is found from .Ords and .Bizes without converting code chars
+        to str.
         """
         if not qb64b:  # empty need more bytes
             raise ShortageError("Empty material, Need more characters.")
 
-        first = qb64b[:2]  # extract first two char code selector
-        if hasattr(first, "decode"):
-            first = first.decode("utf-8")
-        if first not in self.Hards:
+        if hasattr(qb64b, "encode"):  # str so convert to bytes
+            qb64b = qb64b.encode("utf-8")
+
+        # all selectors are '-' plus one char so index Ords by second char
+        if len(qb64b) < 2 or qb64b[0] != 0x2d or not self.Ords[qb64b[1]]:
+            first = bytes(qb64b[:2]).decode("utf-8")  # first two char selector
             if first[0] == '_':
                 raise UnexpectedOpCodeError("Unexpected op code start"
                                             "while extracing Counter.")
             else:
                 raise UnexpectedCodeError("Unsupported code start ={}.".format(first))
 
-        hs = self.Hards[first]  # get hard code size
+        hs = self.Ords[qb64b[1]]  # get hard code size
         if len(qb64b) < hs:  # need more bytes
             raise ShortageError("Need {} more characters.".format(hs - len(qb64b)))
 
-        hard = qb64b[:hs]  # get hard code
-        if hasattr(hard, "decode"):
-            hard = hard.decode("utf-8")  # decode converts bytearray/bytes to str
-        if hard not in self.Sizes:  # Sizes needs str not bytes
-            raise UnexpectedCodeError("Unsupported code ={}.".format(hard))
+        hard = bytes(qb64b[:hs])  # get hard code
+        if hard not in self.Bizes:
+            raise UnexpectedCodeError("Unsupported code ={}.".format(hard.decode("utf-8")))
 
-        hs, ss, fs, ls = self.Sizes[hard]  # assumes hs consistent in both tables
+        hard, hs, ss, fs, ls = self.Bizes[hard]  # assumes hs consistent in both tables
         cs = hs + ss  # both hard + soft code size
 
         # assumes that unit tests on Counter and CounterCodex ensure that
@@ -4821,10 +4974,7 @@ class Counter:
         if len(qb64b) < cs:  # need more bytes
             raise ShortageError("Need {} more characters.".format(cs - len(qb64b)))
 
-        count = qb64b[hs:hs + ss]  # extract count chars
-        if hasattr(count, "decode"):
-            count = count.decode("utf-8")
-        count = b64ToInt(count)  # compute int count
+        count = b64ToInt(bytes(qb64b[hs:hs + ss]))  # compute int count
 
         self._code = hard
         self._count = count
@@ -3,11 +3,13 @@
 keri.core.eventing module
 
 """
+import copy
 import datetime
 import json
 import logging
+import time
 from collections import namedtuple
-from dataclasses import dataclass, astuple, asdict
+from dataclasses import dataclass, asdict
 from urllib.parse import urlsplit
 from math import ceil
 from ordered_set import OrderedSet as oset
@@ -19,7 +21,7 @@ from .coring import (versify, Serials, Ilks, MtrDex, NonTransDex, CtrDex, Counte
                      Verfer, Diger, Prefixer, Serder, Tholder, Saider)
 from .. import help
 from .. import kering
-from ..db import basing, dbing
+from ..db import basing, dbing, subing
 from ..db.basing import KeyStateRecord, StateEERecord
 from ..db.dbing import dgKey, snKey, fnKey, splitKeySN, splitKey
 
@@ -33,7 +35,7 @@ from ..kering import Version, Versionage
 from ..kering import (ICP_LABELS, DIP_LABELS, ROT_LABELS, DRT_LABELS, IXN_LABELS,
                       KSN_LABELS, RPY_LABELS)
 
-from ..help import helping
+from ..help import helping, metering
 
 logger = help.ogler.getLogger()
 
@@ -53,7 +55,7 @@ class TraitCodex:
     NoBackers: str = 'NB'  # Do not allow any backers for registry
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())
 
 
 TraitDex = TraitCodex()  # Make instance
@@ -149,7 +151,7 @@ class ColdCodex:
     CtOpB2: int = 0o7  # CountCode or OpCode Base2
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())
 
 
 ColdDex = ColdCodex()  # Make instance
@@ -443,7 +445,7 @@ def validateSN(sn, inceptive=None):
     return sn
 
 
-def verifySigs(raw, sigers, verfers):
+def verifySigs(raw, sigers, verfers, pool=None):
     """
     Returns tuple of (vsigers, vindices) where:
         vsigers is list  of unique verified sigers with assigned verfer
@@ -458,6 +460,8 @@ def verifySigs(raw, sigers, verfers):
         raw (bytes) signed data
         sigers is list of indexed Siger instances (signatures)
         verfers is list of Verfer instance (public keys)
+        pool (concurrent.futures.Executor | None): optional executor to fan
+            out verification of large batches. See Verfer.verifyBatch
 
     """
     if sigers is None:
@@ -465,9 +469,14 @@ def verifySigs(raw, sigers, verfers):
     # Ensure no duplicate sigers by using set math on sigers' sigs otherwise
     # indices count for threshold will be erroneous. Does not modify in place
     # passed in sigers list, but instead depends on caller to use indices to
-    # modify its copy to filter out unverifiable or duplicate sigers
-    usigs = oset([siger.qb64 for siger in sigers])
-    usigers = [Siger(qb64=sig) for sig in usigs]
+    # modify its copy to filter out unverifiable or duplicate sigers.
+    # Dedupe on the parts that make up .qb64 and shallow copy so do not
+    # reparse each siger nor assign verfer to the passed in sigers.
+    usigers = {}
+    for siger in sigers:
+        usigers.setdefault((siger.code, siger.index, siger.ondex, siger.raw),
+                           siger)
+    usigers = [copy.copy(siger) for siger in usigers.values()]
 
     # verify indexes of attached signatures against verifiers and assign
     # verfer to each siger
@@ -477,17 +486,19 @@ def verifySigs(raw, sigers, verfers):
         siger.verfer = verfers[siger.index]  # assign verfer
 
     # create lists of unique verified signatures and indices
+    results = Verfer.verifyBatch([(siger.verfer, siger.raw, raw)
+                                  for siger in usigers], pool=pool)
     vindices = []
     vsigers = []
-    for siger in usigers:
-        if siger.verfer.verify(siger.raw, raw):
+    for siger, result in zip(usigers, results):
+        if result:
             vindices.append(siger.index)
             vsigers.append(siger)
 
     return (vsigers, vindices)
 
 
-def validateSigs(serder, sigers, verfers, tholder):
+def validateSigs(serder, sigers, verfers, tholder, pool=None):
     """
     Validates signatures given by sigers using keys given by verfers on msg
     given by serder subject to threshold given by tholder. Returns subset of
@@ -511,6 +522,8 @@ def validateSigs(serder, sigers, verfers, tholder):
             If this event is not delegated then seqner is ignored
         diger is Diger instance of of delegating event digest.
             If this event is not delegated then diger is ignored
+        pool (concurrent.futures.Executor | None): optional executor to fan
+            out verification of large batches. See Verfer.verifyBatch
 
     """
     valid = False
@@ -520,7 +533,8 @@ def validateSigs(serder, sigers, verfers, tholder):
                                         [verfer.qb64 for verfer in verfers]))
 
     # get unique verified sigers and indices lists from sigers list
-    sigers, indices = verifySigs(raw=serder.raw, sigers=sigers, verfers=verfers)
+    sigers, indices = verifySigs(raw=serder.raw, sigers=sigers, verfers=verfers,
+                                 pool=pool)
     # sigers  now have .verfer assigned
 
     # check if satisfies threshold for fully signed
@@ -1536,6 +1550,8 @@ class Kever:
         DoNotDelegate (bool):
                 True means do not allow delegation other identifiers
                 False means allow delegation of delegated identifiers
+        Lazies (tuple): names of attributes that a kever reloaded from key state
+                materializes on first use
 
     Attributes:
         db (Baser | None): instance that manages the LMDB database when provided.
@@ -1593,10 +1609,12 @@ class Kever:
     """
     EstOnly = False
     DoNotDelegate = False
+    Lazies = ("serder", "tholder", "ntholder", "verfers", "digers")
 
     def __init__(self, *, state=None, serder=None, sigers=None, wigers=None,
                  db=None, estOnly=None, delseqner=None, delsaider=None, firner=None,
-                 dater=None, cues=None, prefixes=None, local=False, check=False):
+                 dater=None, cues=None, prefixes=None, local=False, check=False,
+                 verify=True):
         """
         Create incepting kever and state from inception serder
         Verify incepting serder against sigers raises ValidationError if not
@@ -1636,6 +1654,9 @@ class Kever:
                 non-idempotent way. Useful for reinitializing the Kevers from
                 a persisted KEL without updating non-idempotent first seen .fels
                 and timestamps.
+            verify (bool): True means verify latest event of state is in
+                database when preloading from state. False means state is from
+                a validated checkpoint so skip the lookup.
         """
         if not (state or (serder and sigers)):
             raise ValueError("Missing required arguments. Need state or serder"
@@ -1649,7 +1670,7 @@ class Kever:
         self.local = True if local else False
 
         if state:  # preload from state
-            self.reload(state)
+            self.reload(state, verify=verify)
             return
 
         # may update state as we go because if invalid we fail to finish init
@@ -1694,14 +1715,17 @@ class Kever:
         # .validateSigsDelWigs above ensures thresholds met otherwise raises exception
         # all validated above so may add to KEL and FEL logs as first seen
         # returns fn == None if already logged fn log is non idempotent
-        fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers, wits=wits,
-                                first=True if not check else False, seqner=delseqner, saider=delsaider,
-                                firner=firner, dater=dater)
-        if fn is not None:  # first is non-idempotent for fn check mode fn is None
-            self.fner = Number(num=fn)
-            self.dater = Dater(dts=dts)
-            self.db.states.pin(keys=self.prefixer.qb64,
-                               val=self.state())
+        def accept():  # retried by .db.atomic after map grown when full
+            fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers, wits=wits,
+                                    first=True if not check else False, seqner=delseqner, saider=delsaider,
+                                    firner=firner, dater=dater)
+            if fn is not None:  # first is non-idempotent for fn check mode fn is None
+                self.fner = Number(num=fn)
+                self.dater = Dater(dts=dts)
+                self.db.states.pin(keys=self.prefixer.qb64,
+                                   val=self.state())
+
+        self.db.atomic(accept)  # accept event atomically in one commit
 
 
     @property
@@ -1750,12 +1774,14 @@ class Kever:
         return True if self.digers and self.prefixer.transferable else False
 
 
-    def reload(self, state):
+    def reload(self, state, verify=True):
         """
         Reload Kever attributes (aka its state) from state (KeyStateRecord)
 
         Parameters:
             state (KeyStateRecord | None): instance for key state notice
+            verify (bool): True means raise MissingEntryError when latest event
+                of state is not in database. False means skip the lookup
 
         """
         self.version = Versionage._make(state.vn)
@@ -1764,10 +1790,9 @@ class Kever:
         self.fner = Number(numh=state.f) # first seen ordinal Number hex str
         self.dater = Dater(dts=state.dt)
         self.ilk = state.et
-        self.tholder = Tholder(sith=state.kt)
-        self.ntholder = Tholder(sith=state.nt)
-        self.verfers = [Verfer(qb64=key) for key in state.k]
-        self.digers = [Diger(qb64=dig) for dig in state.n]
+        for name in self.Lazies:  # materialized from state on first use
+            self.__dict__.pop(name, None)
+        self._state = state
         self.toader = Number(numh=state.bt)  # auto converts from hex num
         self.wits = state.b
         self.cuts = state.ee.br
@@ -1780,13 +1805,39 @@ class Kever:
         self.delegator = state.di if state.di else None
         self.delegated = True if self.delegator else False
 
-        if (raw := self.db.getEvt(key=dgKey(pre=self.prefixer.qb64,
-                                            dig=state.d))) is None:
+        if verify and self.db.getEvt(key=dgKey(pre=self.prefixer.qb64, dig=state.d)) is None:
             raise MissingEntryError(f"Corresponding event not found for state="
                                     f"{state}.")
-        self.serder = Serder(raw=bytes(raw))
         # May want to do additional checks here
 
+    def __getattr__(self, name):
+        """
+        Materialize attribute in .Lazies from key state record of .reload on
+        first use so reloaded kevers stay compact until keys are needed.
+        Only called when normal attribute lookup fails.
+        """
+        state = self.__dict__.get("_state")
+        if state is None or name not in self.Lazies:
+            raise AttributeError(f"'{self.__class__.__name__}' object has no "
+                                 f"attribute '{name}'")
+
+        if name == "serder":
+            if (raw := self.db.getEvt(key=dgKey(pre=state.i, dig=state.d))) is None:
+                raise MissingEntryError(f"Corresponding event not found for "
+                                        f"state={state}.")
+            val = subing.serders.get(raw)
+        elif name == "tholder":
+            val = Tholder(sith=state.kt)
+        elif name == "ntholder":
+            val = Tholder(sith=state.nt)
+        elif name == "verfers":
+            val = [Verfer(qb64=key) for key in state.k]
+        else:  # digers
+            val = [Diger(qb64=dig) for dig in state.n]
+
+        setattr(self, name, val)
+        return val
+
 
     def incept(self, serder, estOnly=None):
         """
@@ -1986,30 +2037,33 @@ class Kever:
 
             # .validateSigsDelWigs above ensures thresholds met otherwise raises exception
             # all validated above so may add to KEL and FEL logs as first seen
-            fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers, wits=wits,
-                                    first=True if not check else False, seqner=delseqner, saider=delsaider,
-                                    firner=firner, dater=dater)
-
-            # nxt and signatures verify so update state
-            self.sner = sner  # sequence number Number instance
-            self.serder = serder  # need whole serder for digest agility compare
-            self.ilk = ilk
-            self.tholder = tholder
-            self.verfers = serder.verfers
-            self.digers = serder.digers
-            self.ntholder = serder.ntholder
-
-            self.toader = toader
-            self.wits = wits
-            self.cuts = cuts
-            self.adds = adds
-
-            # last establishment event location need this to recognize recovery events
-            self.lastEst = LastEstLoc(s=self.sner.num, d=self.serder.saider.qb64)
-            if fn is not None:  # first is non-idempotent for fn check mode fn is None
-                self.fner = Number(num=fn)
-                self.dater = Dater(dts=dts)
-                self.db.states.pin(keys=self.prefixer.qb64, val=self.state())
+            def accept():  # retried by .db.atomic after map grown when full
+                fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers, wits=wits,
+                                        first=True if not check else False, seqner=delseqner, saider=delsaider,
+                                        firner=firner, dater=dater)
+
+                # nxt and signatures verify so update state
+                self.sner = sner  # sequence number Number instance
+                self.serder = serder  # need whole serder for digest agility compare
+                self.ilk = ilk
+                self.tholder = tholder
+                self.verfers = serder.verfers
+                self.digers = serder.digers
+                self.ntholder = serder.ntholder
+
+                self.toader = toader
+                self.wits = wits
+                self.cuts = cuts
+                self.adds = adds
+
+                # last establishment event location need this to recognize recovery events
+                self.lastEst = LastEstLoc(s=self.sner.num, d=self.serder.saider.qb64)
+                if fn is not None:  # first is non-idempotent for fn check mode fn is None
+                    self.fner = Number(num=fn)
+                    self.dater = Dater(dts=dts)
+                    self.db.states.pin(keys=self.prefixer.qb64, val=self.state())
+
+            self.db.atomic(accept)  # accept event atomically in one commit
 
 
         elif ilk == Ilks.ixn:  # subsequent interaction event
@@ -2046,17 +2100,21 @@ class Kever:
 
             # .validateSigsDelWigs above ensures thresholds met otherwise raises exception
             # all validated above so may add to KEL and FEL logs as first seen
-            fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers,
-                                    first=True if not check else False)  # First seen accepted
-
-            # validates so update state
-            self.sner = sner  # sequence number Number instance
-            self.serder = serder  # need for digest agility includes .serder.diger
-            self.ilk = ilk
-            if fn is not None:  # first is non-idempotent for fn check mode fn is None
-                self.fner = Number(num=fn)
-                self.dater = Dater(dts=dts)
-                self.db.states.pin(keys=self.prefixer.qb64, val=self.state())
+            def accept():  # retried by .db.atomic after map grown when full
+                fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers,
+                                        first=True if not check else False,
+                                        firner=firner, dater=dater)  # First seen accepted
+
+                # validates so update state
+                self.sner = sner  # sequence number Number instance
+                self.serder = serder  # need for digest agility includes .serder.diger
+                self.ilk = ilk
+                if fn is not None:  # first is non-idempotent for fn check mode fn is None
+                    self.fner = Number(num=fn)
+                    self.dater = Dater(dts=dts)
+                    self.db.states.pin(keys=self.prefixer.qb64, val=self.state())
+
+            self.db.atomic(accept)  # accept event atomically in one commit
 
         else:  # unsupported event ilk so discard
             raise ValidationError("Unsupported ilk = {} for evt = {}.".format(ilk, ked))
@@ -2462,43 +2520,44 @@ class Kever:
                 If cloned mode then dater maybe provided (not None)
                 When dater provided then use dater for first seen datetime
         """
-        fn = None  # None means not a first seen log event so does not return an fn
-        dgkey = dgKey(serder.preb, serder.saidb)
-        dtsb = helping.nowIso8601().encode("utf-8")
-        self.db.putDts(dgkey, dtsb)  # idempotent do not change dts if already
-        if sigers:
-            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])  # idempotent
-        if wigers:
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
-        if wits:
-            self.db.wits.put(keys=dgkey, vals=[coring.Prefixer(qb64=w) for w in wits])
-        self.db.putEvt(dgkey, serder.raw)  # idempotent (maybe already excrowed)
-        val = (coring.Prefixer(qb64b=serder.preb), coring.Seqner(sn=serder.sn))
-        for verfer in serder.verfers:
-            self.db.pubs.add(keys=(verfer.qb64,), val=val)
-        for diger in serder.digers:
-            self.db.digs.add(keys=(diger.qb64,), val=val)
-        if first:  # append event dig to first seen database in order
-            if seqner and saider:  # authorized delegated or issued event
-                couple = seqner.qb64b + saider.qb64b
-                self.db.setAes(dgkey, couple)  # authorizer event seal (delegator/issuer)
-            fn = self.db.appendFe(serder.preb, serder.saidb)
-            if firner and fn != firner.sn:  # cloned replay but replay fn not match
-                if self.cues is not None:
-                    self.cues.append(dict(kin="noticeBadCloneFN", serder=serder,
-                                          fn=fn, firner=firner, dater=dater))
-                logger.info("Kever Mismatch Cloned Replay FN: %s First seen "
-                            "ordinal fn %s and clone fn %s \nEvent=\n%s\n",
-                            serder.preb, fn, firner.sn, serder.pretty())
-            if dater:  # cloned replay use original's dts from dater
-                dtsb = dater.dtsb
-            self.db.setDts(dgkey, dtsb)  # first seen so set dts to now
-            self.db.fons.pin(keys=dgkey, val=Seqner(sn=fn))
-            logger.info("Kever state: %s First seen ordinal %s at %s\nEvent=\n%s\n",
-                        serder.preb, fn, dtsb.decode("utf-8"), serder.pretty())
-        self.db.addKe(snKey(serder.preb, serder.sn), serder.saidb)
-        logger.info("Kever state: %s Added to KEL valid event=\n%s\n",
-                    serder.preb, serder.pretty())
+        with self.db.txn(write=True):  # all log writes in one transaction
+            fn = None  # None means not a first seen log event so does not return an fn
+            dgkey = dgKey(serder.preb, serder.saidb)
+            dtsb = helping.nowIso8601().encode("utf-8")
+            self.db.putDts(dgkey, dtsb)  # idempotent do not change dts if already
+            if sigers:
+                self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])  # idempotent
+            if wigers:
+                self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            if wits:
+                self.db.wits.put(keys=dgkey, vals=[coring.Prefixer(qb64=w) for w in wits])
+            self.db.putEvt(dgkey, serder.raw)  # idempotent (maybe already excrowed)
+            val = (coring.Prefixer(qb64b=serder.preb), coring.Seqner(sn=serder.sn))
+            for verfer in serder.verfers:
+                self.db.pubs.add(keys=(verfer.qb64,), val=val)
+            for diger in serder.digers:
+                self.db.digs.add(keys=(diger.qb64,), val=val)
+            if first:  # append event dig to first seen database in order
+                if seqner and saider:  # authorized delegated or issued event
+                    couple = seqner.qb64b + saider.qb64b
+                    self.db.setAes(dgkey, couple)  # authorizer event seal (delegator/issuer)
+                fn = self.db.appendFe(serder.preb, serder.saidb)
+                if firner and fn != firner.sn:  # cloned replay but replay fn not match
+                    if self.cues is not None:
+                        self.cues.append(dict(kin="noticeBadCloneFN", serder=serder,
+                                              fn=fn, firner=firner, dater=dater))
+                    logger.info("Kever Mismatch Cloned Replay FN: %s First seen "
+                                "ordinal fn %s and clone fn %s \nEvent=\n%s\n",
+                                serder.preb, fn, firner.sn, serder.pretty())
+                if dater:  # cloned replay use original's dts from dater
+                    dtsb = dater.dtsb
+                self.db.setDts(dgkey, dtsb)  # first seen so set dts to now
+                self.db.fons.pin(keys=dgkey, val=Seqner(sn=fn))
+                logger.info("Kever state: %s First seen ordinal %s at %s\nEvent=\n%s\n",
+                            serder.preb, fn, dtsb.decode("utf-8"), serder.pretty())
+            self.db.addKe(snKey(serder.preb, serder.sn), serder.saidb)
+            logger.info("Kever state: %s Added to KEL valid event=\n%s\n",
+                        serder.preb, serder.pretty())
         return (fn, dtsb.decode("utf-8"))  # (fn int, dts str) if first else (None, dts str)
 
     def escrowPSEvent(self, serder, sigers, wigers=None):
@@ -2781,12 +2840,26 @@ class Kevery:
                 non-idempotent way. Useful for reinitializing the Kevers from
                 a persisted KEL without updating non-idempotent first seen .fels
                 and timestamps.
+        escrowing (bool): True means .processEscrows is running so new escrow
+                material does not wake its own escrow
+        swept (float | None): monotonic time of last full walk of escrow tables
+                None means not swept yet
+        bulk (bool): True means bulk import of already validated replay stream
+                so do not cue receipts or notices nor wake escrows per event.
+                Caller runs .processEscrows once when import is done
 
 
     Properties:
         .kevers is dict of db kevers indexed by pre (qb64) of each Kever
         .prefixes is OrderedSet of fully qualified base64 identifier prefixes of db
             local habitats if any.
+        .wakes is dict .db.wakes of escrow table names in .Escrows mapped to set
+            of qb64 identifier prefixes whose escrow branches are retried on
+            next .processEscrows of any Kevery of .db
+        .waits is dict .db.waits dependency index of qb64 identifier prefix
+            mapped to set of (escrow name, escrowed prefix) duples of escrow
+            branches waiting on events from dependency prefix other than
+            escrowed prefix
 
 
     """
@@ -2799,9 +2872,12 @@ class Kevery:
     TimeoutVRE = 3600  # seconds to timeout unverified transferable receipt escrows
     TimeoutKSN = 3600  # seconds to timeout key state notice message escrows
     TimeoutQNF = 300   # seconds to timeout query not found escrows
+    EscrowSweep = 60  # seconds between full walks of escrow tables
+    Escrows = ("ooes", "uwes", "ures", "vres", "pwes", "pses", "ldes", "qnfs")
 
     def __init__(self, *, cues=None, db=None, rvy=None,
-                 lax=True, local=False, cloned=False, direct=True, check=False):
+                 lax=True, local=False, cloned=False, direct=True, check=False,
+                 bulk=False):
         """
         Initialize instance:
 
@@ -2823,6 +2899,8 @@ class Kevery:
                 non-idempotent way. Useful for reinitializing the Kevers from
                 a persisted KEL without updating non-idempotent first seen .fels
                 and timestamps.
+            bulk (bool): True means bulk import so do not cue receipts or
+                notices nor wake escrows per event
         """
         self.cues = cues if cues is not None else decking.Deck()  # subclass of deque
         if db is None:
@@ -2834,6 +2912,9 @@ class Kevery:
         self.cloned = True if cloned else False  # process as cloned
         self.direct = True if direct else False  # process as direct mode
         self.check = True if check else False  # process as check mode
+        self.escrowing = False
+        self.swept = None  # first .processEscrows walks all escrows
+        self.bulk = True if bulk else False  # process as bulk import
 
     @property
     def kevers(self):
@@ -2842,6 +2923,21 @@ class Kevery:
         """
         return self.db.kevers
 
+    @property
+    def wakes(self):
+        """
+        Returns .db.wakes shared by all Keverys of .db so that an event
+        accepted by any of them wakes the escrows of all
+        """
+        return self.db.wakes
+
+    @property
+    def waits(self):
+        """
+        Returns .db.waits
+        """
+        return self.db.waits
+
     @property
     def prefixes(self):
         """
@@ -2878,6 +2974,8 @@ class Kevery:
         return []
 
 
+    @metering.meter.timed("keri_kevery_event_seconds", help="Kevery event processing latency by ilk",
+                          label=metering.ilkLabel)
     def processEvent(self, serder, sigers, *, wigers=None,
                      delseqner=None, delsaider=None,
                      firner=None, dater=None):
@@ -2913,6 +3011,8 @@ class Kevery:
         ilk = ked["t"]
         said = serder.said
 
+        if not (self.escrowing or self.bulk):  # new event or sigs so retry escrows of pre
+            self.wake(pre)
 
         if pre not in self.kevers:  # first seen event for pre
             if ilk in (Ilks.icp, Ilks.dip):  # first seen and inception so verify event keys
@@ -2933,6 +3033,10 @@ class Kevery:
                               local=self.local,
                               check=self.check)
                 self.kevers[pre] = kever  # not exception so add to kevers
+                if self.bulk:  # escrows processed once after import
+                    return
+
+                self.wakeAccepted(serder)
 
                 if self.direct or self.lax or pre not in self.prefixes:  # not own event when owned
                     # create cue for receipt   direct mode for now
@@ -2996,6 +3100,10 @@ class Kevery:
                                  firner=firner if self.cloned else None,
                                  dater=dater if self.cloned else None,
                                  check=self.check)
+                    if self.bulk:  # escrows processed once after import
+                        return
+
+                    self.wakeAccepted(serder)
 
                     if self.direct or self.lax or pre not in self.prefixes:  # not own event when owned
                         # create cue for receipt   direct mode for now
@@ -3052,6 +3160,8 @@ class Kevery:
         # fetch  pre dig to process
         ked = serder.ked
         pre = serder.pre
+        if not self.escrowing:  # new receipts so retry escrows of pre
+            self.wake(pre)
 
         sn = serder.sn
 
@@ -3072,6 +3182,7 @@ class Kevery:
 
             # process each couple verify sig and write to db
             wits = [wit.qb64 for wit in self.fetchWitnessState(pre, sn)]
+            vwigers = []  # candidate wigers to verify as one batch
             for wiger in wigers:
                 # assign verfers from witness list
                 if wiger.index >= len(wits):
@@ -3091,8 +3202,12 @@ class Kevery:
                                     " on nonlocal event receipt=\n%s\n", serder.pretty())
                         continue  # skip own receipt attachment on non-local event
 
-                if wiger.verfer.verify(wiger.raw, lserder.raw):
-                    # write receipt indexed sig to database
+                vwigers.append(wiger)
+
+            results = Verfer.verifyBatch([(wiger.verfer, wiger.raw, lserder.raw)
+                                          for wiger in vwigers])
+            for wiger, result in zip(vwigers, results):
+                if result:  # write receipt indexed sig to database
                     self.db.addWig(key=dgkey, val=wiger.qb64b)
 
         else:  # no events to be receipted yet at that sn so escrow
@@ -3120,6 +3235,8 @@ class Kevery:
         # fetch  pre dig to process
         ked = serder.ked
         pre = serder.pre
+        if not self.escrowing:  # new receipts so retry escrows of pre
+            self.wake(pre)
         sn = serder.sn
 
         # Only accept receipt if for last seen version of event at sn
@@ -3139,6 +3256,7 @@ class Kevery:
                                       "".format(ked["s"], ked))
 
             # process each couple verify sig and write to db
+            vcigars = []  # candidate cigars to verify as one batch
             for cigar in cigars:
                 if cigar.verfer.transferable:  # skip transferable verfers
                     continue  # skip invalid couplets
@@ -3154,8 +3272,15 @@ class Kevery:
                                     " on nonlocal event receipt=\n%s\n", serder.pretty())
                         continue  # skip own receipt attachment on non-local event
 
-                if cigar.verfer.verify(cigar.raw, lserder.raw):
-                    wits = [wit.qb64 for wit in self.fetchWitnessState(pre, sn)]
+                vcigars.append(cigar)
+
+            results = Verfer.verifyBatch([(cigar.verfer, cigar.raw, lserder.raw)
+                                          for cigar in vcigars])
+            wits = None  # fetch witness state once only when needed
+            for cigar, result in zip(vcigars, results):
+                if result:
+                    if wits is None:
+                        wits = [wit.qb64 for wit in self.fetchWitnessState(pre, sn)]
                     rpre = cigar.verfer.qb64  # prefix of receiptor
                     if rpre in wits:  # its a witness receipt
                         index = wits.index(rpre)
@@ -3186,6 +3311,8 @@ class Kevery:
         # fetch  pre dig to process
         ked = serder.ked
         pre = serder.pre
+        if not self.escrowing:  # new receipts so retry escrows of pre
+            self.wake(pre)
         sn = serder.sn
 
         # Only accept receipt if event is latest event at sn. Means its been
@@ -3208,6 +3335,7 @@ class Kevery:
                                   "".format(ked["s"]))
 
         # process each couple to verify sig and write to db
+        vcigars = []  # candidate cigars to verify as one batch
         for cigar in cigars:
             if cigar.verfer.transferable:  # skip transferable verfers
                 continue  # skip invalid couplets
@@ -3222,8 +3350,15 @@ class Kevery:
                                 " on nonlocal event receipt=\n%s\n", serder.pretty())
                     continue  # skip own receipt attachment on non-local event
 
-            if cigar.verfer.verify(cigar.raw, serder.raw):
-                wits = self.fetchWitnessState(pre, sn)
+            vcigars.append(cigar)
+
+        results = Verfer.verifyBatch([(cigar.verfer, cigar.raw, serder.raw)
+                                      for cigar in vcigars])
+        wits = None  # fetch witness state once only when needed
+        for cigar, result in zip(vcigars, results):
+            if result:
+                if wits is None:
+                    wits = self.fetchWitnessState(pre, sn)
                 rpre = cigar.verfer.qb64  # prefix of receiptor
                 if rpre in wits:  # its a witness receipt
                     index = wits.index(rpre)
@@ -3254,6 +3389,8 @@ class Kevery:
         # fetch  pre, dig,seal to process
         ked = serder.ked
         pre = serder.pre
+        if not self.escrowing:  # new receipts so retry escrows of pre
+            self.wake(pre)
         sn = serder.sn
 
         # Only accept receipt if for last seen version of event at sn
@@ -3342,6 +3479,8 @@ class Kevery:
         # fetch  pre, dig,seal to process
         ked = serder.ked
         pre = serder.pre
+        if not self.escrowing:  # new receipts so retry escrows of pre
+            self.wake(pre)
         sn = serder.sn
 
         if firner:  # retrieve last event by fn ordinal
@@ -3875,8 +4014,9 @@ class Kevery:
                     self.escrowQueryNotFoundEvent(serder=serder, prefixer=source, sigers=sigers, cigars=cigars)
                     raise QueryNotFoundError("Query not found error={}.".format(ked))
 
+            fn = qry["fn"] if "fn" in qry else 0  # first seen resume cursor
             msgs = list()  # outgoing messages
-            for msg in self.db.clonePreIter(pre=pre, fn=0):
+            for msg in self.db.clonePreIter(pre=pre, fn=fn):
                 msgs.append(msg)
 
             if kever.delegator:
@@ -3949,7 +4089,7 @@ class Kevery:
             if not raw:
                 return None
 
-            serder = Serder(raw=raw)  # deserialize event raw
+            serder = subing.serders.get(raw)  # deserialize event raw
             if serder.ked["t"] in (Ilks.icp, Ilks.dip, Ilks.rot, Ilks.drt):
                 return serder  # establishment event so return
 
@@ -4001,6 +4141,7 @@ class Kevery:
 
         for cigar in cigars:
             self.db.addRct(key=dgkey, val=cigar.verfer.qb64b + cigar.qb64b)
+        self.wait("qnfs", pre=prefixer.qb64, dep=serder.ked["q"]["i"])  # queried KEL
 
         # log escrowed
         logger.info("Kevery process: escrowed query not found event=\n%s\n",
@@ -4130,6 +4271,7 @@ class Kevery:
             for siger in sigers:  # escrow each quintlet
                 quintuple = prelet + siger.qb64b  # quintuple
                 self.db.addVre(key=snKey(serder.preb, serder.sn), val=quintuple)
+            self.wait("vres", pre=serder.pre, dep=prefixer.qb64)
             # log escrowed
             logger.info("Kevery process: escrowed unverified transferable receipt "
                         "of pre=%s sn=%x dig=%s by pre=%s\n", serder.pre,
@@ -4172,6 +4314,7 @@ class Kevery:
         for siger in sigers:  # escrow each quintlet
             quintuple = prelet + siger.qb64b  # quintuple
             self.db.addVre(key=snKey(serder.preb, serder.sn), val=quintuple)
+        self.wait("vres", pre=serder.pre, dep=prefixer.qb64)
         # log escrowed
         logger.info("Kevery process: escrowed unverified transferable receipt "
                     "of pre=%s sn=%x dig=%s by pre=%s\n", serder.pre,
@@ -4205,27 +4348,119 @@ class Kevery:
         quintuple = (serder.saidb + sprefixer.qb64b + sseqner.qb64b +
                      saider.qb64b + siger.qb64b)
         self.db.addVre(key=snKey(serder.preb, serder.sn), val=quintuple)
+        self.wait("vres", pre=serder.pre, dep=sprefixer.qb64)
         # log escrowed
         logger.info("Kevery process: escrowed unverified transferabe validator "
                     "receipt of pre= %s sn=%x dig=%s\n", serder.pre, serder.sn,
                     serder.said)
 
+    def wake(self, pre, names=None):
+        """
+        Wake escrow branches of identifier prefix pre so that next .processEscrows
+        retries them. Also wakes escrow branches of other prefixes indexed in
+        .waits as waiting on pre.
+
+        Parameters:
+            pre (str | bytes): qb64 identifier prefix with new events or receipts
+            names (Iterable | None): escrow table names in .Escrows to wake for
+                pre. None means all escrow tables and dependents of pre in .waits
+        """
+        pre = pre.decode("utf-8") if hasattr(pre, "decode") else pre
+        for name in (names if names is not None else self.Escrows):
+            self.wakes.setdefault(name, set()).add(pre)
+
+        if names is None:
+            for name, epre in self.waits.pop(pre, ()):
+                self.wakes.setdefault(name, set()).add(epre)
+
+    def wakeAccepted(self, serder):
+        """
+        Wake escrows that may depend on event serder just accepted into its KEL.
+        These are the escrows of its own prefix, escrows waiting on its prefix in
+        .waits, and delegated events whose delegation seal serder anchors.
+
+        Parameters:
+            serder (Serder): accepted key event
+        """
+        self.wake(serder.pre)
+        for seal in serder.ked.get("a", []):
+            if isinstance(seal, dict) and "i" in seal:  # maybe delegation seal
+                self.wake(seal["i"], names=("pses", "pwes"))
+
+    def wait(self, name, pre, dep):
+        """
+        Index escrow branch of identifier prefix pre in escrow table name as
+        waiting on events of dependency prefix dep.
+
+        Parameters:
+            name (str): escrow table name in .Escrows
+            pre (str | bytes): qb64 identifier prefix of escrowed branch
+            dep (str | bytes): qb64 identifier prefix escrow is waiting on
+        """
+        pre = pre.decode("utf-8") if hasattr(pre, "decode") else pre
+        dep = dep.decode("utf-8") if hasattr(dep, "decode") else dep
+        if dep != pre:  # escrows always wake on events of own prefix
+            self.waits.setdefault(dep, set()).add((name, pre))
+
+    def _escrowItemIter(self, getter, pres=None):
+        """
+        Returns generator of escrow items (ekey, val) from escrow getter that
+        returns dup items at next key after key, walking one key per getter call.
+
+        Parameters:
+            getter (Callable): escrow items next iterator such as
+                .db.getOoeItemsNextIter
+            pres (Iterable | None): qb64 identifier prefixes of escrow branches
+                to walk. None means walk the whole escrow table.
+        """
+        tops = [b''] if pres is None else [f"{pre}.".encode("utf-8") for pre in sorted(pres)]
+        for top in tops:
+            key = top
+            while True:  # break when done
+                ekey = key  # when not same after pass then escrows found
+                for ekey, val in getter(key=key):
+                    if not bytes(ekey).startswith(top):  # past branch of top
+                        ekey = key
+                        break
+                    yield ekey, val
+                if ekey == key:  # still same so no escrows found on last pass
+                    break
+                key = bytes(ekey)  # setup next pass, with key after ekey
+
     def processEscrows(self):
         """
         Iterate throush escrows and process any that may now be finalized
 
+        Only retries escrow branches woken in .wakes since last call by new
+        events or receipts for their prefix or their dependencies in .waits.
+        Walks all escrows on first call and every .EscrowSweep seconds after to
+        timeout stale escrows and catch changes made outside of this Kevery.
+
         Parameters:
         """
-
+        now = time.monotonic()
+        sweep = self.swept is None or (now - self.swept) >= self.EscrowSweep
+        if sweep:
+            self.swept = now
+            self.wakes.clear()  # walking all so discard wakes
+            self.waits.clear()  # retries reindex dependencies
+
+        processors = (self.processEscrowOutOfOrders,
+                      self.processEscrowUnverWitness,
+                      self.processEscrowUnverNonTrans,
+                      self.processEscrowUnverTrans,
+                      self.processEscrowPartialWigs,
+                      self.processEscrowPartialSigs,
+                      self.processEscrowDuplicitous,
+                      self.processQueryNotFound)
+
+        self.escrowing = True
         try:
-            self.processEscrowOutOfOrders()
-            self.processEscrowUnverWitness()
-            self.processEscrowUnverNonTrans()
-            self.processEscrowUnverTrans()
-            self.processEscrowPartialWigs()
-            self.processEscrowPartialSigs()
-            self.processEscrowDuplicitous()
-            self.processQueryNotFound()
+            for name, processor in zip(self.Escrows, processors):
+                if sweep:
+                    processor()
+                elif pres := self.wakes.pop(name, None):
+                    processor(pres=pres)
 
         except Exception as ex:  # log diagnostics errors etc
             if logger.isEnabledFor(logging.DEBUG):
@@ -4234,7 +4469,10 @@ class Kevery:
                 logger.error("Kevery escrow process error: %s\n", ex.args[0])
             raise ex
 
-    def processEscrowOutOfOrders(self):
+        finally:
+            self.escrowing = False
+
+    def processEscrowOutOfOrders(self, pres=None):
         """
         Process events escrowed by Kever that are recieved out-of-order.
         An event is out of order if its prior event has not been accepted into its KEL.
@@ -4270,107 +4508,105 @@ class Kevery:
                         Get and Attach Signatures
                         Process event as if it came in over the wire
                         If successful then remove from escrow table
-        """
 
-        key = ekey = b''  # both start same. when not same means escrows found
-        while True:  # break when done
-            for ekey, edig in self.db.getOoeItemsNextIter(key=key):
-                try:
-                    pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgKey(pre, bytes(edig)))
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event datetime"
-                                    " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed event datetime "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow = helping.nowUTC()
-                    dte = helping.fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutOOE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale event escrow "
-                                    " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Stale event escrow "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # get the escrowed event using edig
-                    eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
-                    if eraw is None:
-                        # no event so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event at."
-                                    "dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed evt at dig = {}."
-                                              "".format(bytes(edig)))
-
-                    eserder = Serder(raw=bytes(eraw))  # escrowed event
-
-                    #  get sigs and attach
-                    sigs = self.db.getSigs(dgKey(pre, bytes(edig)))
-                    if not sigs:  # otherwise its a list of sigs
-                        # no sigs so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event sigs at."
-                                    "dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed evt sigs at "
-                                              "dig = {}.".format(bytes(edig)))
-
-                    # process event
-                    sigers = [Siger(qb64b=bytes(sig)) for sig in sigs]
-
-                    #  get wigs
-                    wigs = self.db.getWigs(dgKey(pre, bytes(edig)))  # list of wigs
-                    wigers = [Siger(qb64b=bytes(wig)) for wig in wigs]
-
-                    self.processEvent(serder=eserder, sigers=sigers, wigers=wigers)
-
-                    # If process does NOT validate event with sigs, becasue it is
-                    # still out of order then process will attempt to re-escrow
-                    # and then raise OutOfOrderError (subclass of ValidationError)
-                    # so we can distinquish between ValidationErrors that are
-                    # re-escrow vs non re-escrow. We want process to be idempotent
-                    # with respect to processing events that result in escrow items.
-                    # On re-escrow attempt by process, Ooe escrow is called by
-                    # Kevery.self.escrowOOEvent Which calls
-                    # self.db.addOoe(snKey(pre, sn), serder.digb)
-                    # which in turn will not enter dig as dup if one already exists.
-                    # So re-escrow attempt will not change the escrowed ooe db.
-                    # Non re-escrow ValidationError means some other issue so unescrow.
-                    # No error at all means processed successfully so also unescrow.
-
-                except OutOfOrderError as ex:
-                    # still waiting on missing prior event to validate
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrow failed: %s\n", ex.args[0])
+        Parameters:
+            pres (Iterable | None): qb64 identifier prefixes of woken escrow
+                branches to walk. None means walk the whole escrow table.
+        """
 
-                except Exception as ex:  # log diagnostics errors etc
-                    # error other than out of order so remove from OO escrow
-                    self.db.delOoe(snKey(pre, sn), edig)  # removes one escrow at key val
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception("Kevery unescrowed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrowed: %s\n", ex.args[0])
+        for ekey, edig in self._escrowItemIter(self.db.getOoeItemsNextIter, pres=pres):
+            try:
+                pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
+                # check date if expired then remove escrow.
+                dtb = self.db.getDts(dgKey(pre, bytes(edig)))
+                if dtb is None:  # othewise is a datetime as bytes
+                    # no date time so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Missing event datetime"
+                                " at dig = %s\n", bytes(edig))
+
+                    raise ValidationError("Missing escrowed event datetime "
+                                          "at dig = {}.".format(bytes(edig)))
+
+                # do date math here and discard if stale nowIso8601() bytes
+                dtnow = helping.nowUTC()
+                dte = helping.fromIso8601(bytes(dtb))
+                if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutOOE):
+                    # escrow stale so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Stale event escrow "
+                                " at dig = %s\n", bytes(edig))
+
+                    raise ValidationError("Stale event escrow "
+                                          "at dig = {}.".format(bytes(edig)))
+
+                # get the escrowed event using edig
+                eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
+                if eraw is None:
+                    # no event so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Missing event at."
+                                "dig = %s\n", bytes(edig))
+
+                    raise ValidationError("Missing escrowed evt at dig = {}."
+                                          "".format(bytes(edig)))
+
+                eserder = Serder(raw=bytes(eraw))  # escrowed event
+
+                #  get sigs and attach
+                sigs = self.db.getSigs(dgKey(pre, bytes(edig)))
+                if not sigs:  # otherwise its a list of sigs
+                    # no sigs so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Missing event sigs at."
+                                "dig = %s\n", bytes(edig))
+
+                    raise ValidationError("Missing escrowed evt sigs at "
+                                          "dig = {}.".format(bytes(edig)))
+
+                # process event
+                sigers = [Siger(qb64b=bytes(sig)) for sig in sigs]
+
+                #  get wigs
+                wigs = self.db.getWigs(dgKey(pre, bytes(edig)))  # list of wigs
+                wigers = [Siger(qb64b=bytes(wig)) for wig in wigs]
+
+                self.processEvent(serder=eserder, sigers=sigers, wigers=wigers)
+
+                # If process does NOT validate event with sigs, becasue it is
+                # still out of order then process will attempt to re-escrow
+                # and then raise OutOfOrderError (subclass of ValidationError)
+                # so we can distinquish between ValidationErrors that are
+                # re-escrow vs non re-escrow. We want process to be idempotent
+                # with respect to processing events that result in escrow items.
+                # On re-escrow attempt by process, Ooe escrow is called by
+                # Kevery.self.escrowOOEvent Which calls
+                # self.db.addOoe(snKey(pre, sn), serder.digb)
+                # which in turn will not enter dig as dup if one already exists.
+                # So re-escrow attempt will not change the escrowed ooe db.
+                # Non re-escrow ValidationError means some other issue so unescrow.
+                # No error at all means processed successfully so also unescrow.
+
+            except OutOfOrderError as ex:
+                # still waiting on missing prior event to validate
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrow failed: %s\n", ex.args[0])
 
-                else:  # unescrow succeeded, remove from escrow
-                    # We don't remove all escrows at pre,sn because some might be
-                    # duplicitous so we process remaining escrows in spite of found
-                    # valid event escrow.
-                    self.db.delOoe(snKey(pre, sn), edig)  # removes one escrow at key val
-                    logger.info("Kevery unescrow succeeded in valid event: "
-                                "event=\n%s\n", json.dumps(eserder.ked, indent=1))
+            except Exception as ex:  # log diagnostics errors etc
+                # error other than out of order so remove from OO escrow
+                self.db.delOoe(snKey(pre, sn), edig)  # removes one escrow at key val
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.exception("Kevery unescrowed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrowed: %s\n", ex.args[0])
 
-            if ekey == key:  # still same so no escrows found on last while iteration
-                break
-            key = ekey  # setup next while iteration, with key after ekey
+            else:  # unescrow succeeded, remove from escrow
+                # We don't remove all escrows at pre,sn because some might be
+                # duplicitous so we process remaining escrows in spite of found
+                # valid event escrow.
+                self.db.delOoe(snKey(pre, sn), edig)  # removes one escrow at key val
+                logger.info("Kevery unescrow succeeded in valid event: "
+                            "event=\n%s\n", json.dumps(eserder.ked, indent=1))
 
-    def processEscrowPartialSigs(self):
+    def processEscrowPartialSigs(self, pres=None):
         """
         Process events escrowed by Kever that were only partially fulfilled,
         either due to missing signatures or missing dependent events like a
@@ -4403,133 +4639,131 @@ class Kevery:
                         Get and Attach Signatures
                         Process event as if it came in over the wire
                         If successful then remove from escrow table
+
+        Parameters:
+            pres (Iterable | None): qb64 identifier prefixes of woken escrow
+                branches to walk. None means walk the whole escrow table.
         """
 
-        key = ekey = b''  # both start same. when not same means escrows found
-        while True:  # break when done
-            for ekey, edig in self.db.getPseItemsNextIter(key=key):
-                eserder = None
-                try:
-                    pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
-                    dgkey = dgKey(pre, bytes(edig))
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgkey)
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event datetime"
-                                    " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed event datetime "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow = helping.nowUTC()
-                    dte = helping.fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutPSE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale event escrow "
-                                    " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Stale event escrow "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # get the escrowed event using edig
-                    eraw = self.db.getEvt(dgkey)
-                    if eraw is None:
-                        # no event so so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event at."
-                                    "dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed evt at dig = {}."
-                                              "".format(bytes(edig)))
-
-                    eserder = Serder(raw=bytes(eraw))  # escrowed event
-                    #  get sigs and attach
-                    sigs = self.db.getSigs(dgkey)
-                    if not sigs:  # otherwise its a list of sigs
-                        # no sigs so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event sigs at."
-                                    "dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed evt sigs at "
-                                              "dig = {}.".format(bytes(edig)))
-
-                    # seal source (delegator issuer if any)
-                    delseqner = delsaider = None
-                    couple = self.db.getPde(dgkey)
-                    if couple is not None:
-                        delseqner, delsaider = deSourceCouple(couple)
-                    elif eserder.ked["t"] in (Ilks.dip, Ilks.drt,):
-                        if eserder.pre in self.kevers:
-                            delpre = self.kevers[eserder.pre].delegator
-                        else:
-                            delpre = eserder.ked["di"]
-
-                        anchor = dict(i=eserder.ked["i"], s=eserder.sn, d=eserder.said)
-                        srdr = self.db.findAnchoringEvent(pre=delpre, anchor=anchor)
-                        if srdr is not None:
-                            delseqner = coring.Seqner(sn=srdr.sn)
-                            delsaider = srdr.saider
-                            couple = delseqner.qb64b + delsaider.qb64b
-                            self.db.putPde(dgkey, couple)
-
-                    # process event
-                    sigers = [Siger(qb64b=bytes(sig)) for sig in sigs]
-                    self.processEvent(serder=eserder, sigers=sigers,
-                                      delseqner=delseqner, delsaider=delsaider)
-
-                    # If process does NOT validate sigs or delegation seal (when delegated),
-                    # but there is still one valid signature then process will
-                    # attempt to re-escrow and then raise MissingSignatureError
-                    # or MissingDelegationSealError (subclass of ValidationError)
-                    # so we can distinquish between ValidationErrors that are
-                    # re-escrow vs non re-escrow. We want process to be idempotent
-                    # with respect to processing events that result in escrow items.
-                    # On re-escrow attempt by process, Pse escrow is called by
-                    # Kever.self.escrowPSEvent Which calls
-                    # self.db.addPse(snKey(pre, sn), serder.digb)
-                    # which in turn will not enter dig as dup if one already exists.
-                    # So re-escrow attempt will not change the escrowed pse db.
-                    # Non re-escrow ValidationError means some other issue so unescrow.
-                    # No error at all means processed successfully so also unescrow.
-
-                except (MissingSignatureError, MissingDelegationError) as ex:
-                    # still waiting on missing sigs or missing seal to validate
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
+        for ekey, edig in self._escrowItemIter(self.db.getPseItemsNextIter, pres=pres):
+            eserder = None
+            try:
+                pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
+                dgkey = dgKey(pre, bytes(edig))
+                # check date if expired then remove escrow.
+                dtb = self.db.getDts(dgkey)
+                if dtb is None:  # othewise is a datetime as bytes
+                    # no date time so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Missing event datetime"
+                                " at dig = %s\n", bytes(edig))
+
+                    raise ValidationError("Missing escrowed event datetime "
+                                          "at dig = {}.".format(bytes(edig)))
+
+                # do date math here and discard if stale nowIso8601() bytes
+                dtnow = helping.nowUTC()
+                dte = helping.fromIso8601(bytes(dtb))
+                if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutPSE):
+                    # escrow stale so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Stale event escrow "
+                                " at dig = %s\n", bytes(edig))
+
+                    raise ValidationError("Stale event escrow "
+                                          "at dig = {}.".format(bytes(edig)))
+
+                # get the escrowed event using edig
+                eraw = self.db.getEvt(dgkey)
+                if eraw is None:
+                    # no event so so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Missing event at."
+                                "dig = %s\n", bytes(edig))
+
+                    raise ValidationError("Missing escrowed evt at dig = {}."
+                                          "".format(bytes(edig)))
+
+                eserder = Serder(raw=bytes(eraw))  # escrowed event
+                #  get sigs and attach
+                sigs = self.db.getSigs(dgkey)
+                if not sigs:  # otherwise its a list of sigs
+                    # no sigs so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Missing event sigs at."
+                                "dig = %s\n", bytes(edig))
+
+                    raise ValidationError("Missing escrowed evt sigs at "
+                                          "dig = {}.".format(bytes(edig)))
+
+                # seal source (delegator issuer if any)
+                delseqner = delsaider = None
+                couple = self.db.getPde(dgkey)
+                if couple is not None:
+                    delseqner, delsaider = deSourceCouple(couple)
+                elif eserder.ked["t"] in (Ilks.dip, Ilks.drt,):
+                    if eserder.pre in self.kevers:
+                        delpre = self.kevers[eserder.pre].delegator
                     else:
-                        logger.error("Kevery unescrow failed: %s\n", ex.args[0])
+                        delpre = eserder.ked["di"]
+
+                    anchor = dict(i=eserder.ked["i"], s=eserder.sn, d=eserder.said)
+                    srdr = self.db.findAnchoringEvent(pre=delpre, anchor=anchor)
+                    if srdr is not None:
+                        delseqner = coring.Seqner(sn=srdr.sn)
+                        delsaider = srdr.saider
+                        couple = delseqner.qb64b + delsaider.qb64b
+                        self.db.putPde(dgkey, couple)
+
+                # process event
+                sigers = [Siger(qb64b=bytes(sig)) for sig in sigs]
+                self.processEvent(serder=eserder, sigers=sigers,
+                                  delseqner=delseqner, delsaider=delsaider)
+
+                # If process does NOT validate sigs or delegation seal (when delegated),
+                # but there is still one valid signature then process will
+                # attempt to re-escrow and then raise MissingSignatureError
+                # or MissingDelegationSealError (subclass of ValidationError)
+                # so we can distinquish between ValidationErrors that are
+                # re-escrow vs non re-escrow. We want process to be idempotent
+                # with respect to processing events that result in escrow items.
+                # On re-escrow attempt by process, Pse escrow is called by
+                # Kever.self.escrowPSEvent Which calls
+                # self.db.addPse(snKey(pre, sn), serder.digb)
+                # which in turn will not enter dig as dup if one already exists.
+                # So re-escrow attempt will not change the escrowed pse db.
+                # Non re-escrow ValidationError means some other issue so unescrow.
+                # No error at all means processed successfully so also unescrow.
+
+            except (MissingSignatureError, MissingDelegationError) as ex:
+                # still waiting on missing sigs or missing seal to validate
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrow failed: %s\n", ex.args[0])
 
-                except Exception as ex:  # log diagnostics errors etc
-                    # error other than waiting on sigs or seal so remove from escrow
-                    self.db.delPse(snKey(pre, sn), edig)  # removes one escrow at key val
+            except Exception as ex:  # log diagnostics errors etc
+                # error other than waiting on sigs or seal so remove from escrow
+                self.db.delPse(snKey(pre, sn), edig)  # removes one escrow at key val
 
-                    if eserder is not None and eserder.ked["t"] in (Ilks.dip, Ilks.drt,):
-                        self.cues.append(dict(kin="psUnescrow", serder=eserder))
+                if eserder is not None and eserder.ked["t"] in (Ilks.dip, Ilks.drt,):
+                    self.cues.append(dict(kin="psUnescrow", serder=eserder))
 
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception("Kevery unescrowed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrowed: %s\n", ex.args[0])
-
-                else:  # unescrow succeeded, remove from escrow
-                    # We don't remove all escrows at pre,sn because some might be
-                    # duplicitous so we process remaining escrows in spite of found
-                    # valid event escrow.
-                    self.db.delPse(snKey(pre, sn), edig)  # removes one escrow at key val
-                    self.db.delPde(dgkey)  # remove escrow if any
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.exception("Kevery unescrowed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrowed: %s\n", ex.args[0])
 
-                    if eserder is not None and eserder.ked["t"] in (Ilks.dip, Ilks.drt,):
-                        self.cues.append(dict(kin="psUnescrow", serder=eserder))
+            else:  # unescrow succeeded, remove from escrow
+                # We don't remove all escrows at pre,sn because some might be
+                # duplicitous so we process remaining escrows in spite of found
+                # valid event escrow.
+                self.db.delPse(snKey(pre, sn), edig)  # removes one escrow at key val
+                self.db.delPde(dgkey)  # remove escrow if any
 
-                    logger.info("Kevery unescrow succeeded in valid event: "
-                                "event=\n%s\n", json.dumps(eserder.ked, indent=1))
+                if eserder is not None and eserder.ked["t"] in (Ilks.dip, Ilks.drt,):
+                    self.cues.append(dict(kin="psUnescrow", serder=eserder))
 
-            if ekey == key:  # still same so no escrows found on last while iteration
-                break
-            key = ekey  # setup next while iteration, with key after ekey
+                logger.info("Kevery unescrow succeeded in valid event: "
+                            "event=\n%s\n", json.dumps(eserder.ked, indent=1))
 
-    def processEscrowPartialWigs(self):
+    def processEscrowPartialWigs(self, pres=None):
         """
         Process events escrowed by Kever that were only partially fulfilled
         due to missing signatures from witnesses. Events only make into this
@@ -4564,128 +4798,126 @@ class Kevery:
                         Get and Attach Witness Signatures
                         Process event as if it came in over the wire
                         If successful then remove from escrow table
-        """
 
-        key = ekey = b''  # both start same. when not same means escrows found
-        while True:  # break when done
-            for ekey, edig in self.db.getPweItemsNextIter(key=key):
-                try:
-                    pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgKey(pre, bytes(edig)))
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event datetime"
-                                    " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed event datetime "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow = helping.nowUTC()
-                    dte = helping.fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutPWE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale event escrow "
-                                    " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Stale event escrow "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # get the escrowed event using edig
-                    eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
-                    if eraw is None:
-                        # no event so so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event at."
-                                    "dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed evt at dig = {}."
-                                              "".format(bytes(edig)))
-
-                    eserder = Serder(raw=bytes(eraw))  # escrowed event
-
-                    #  get sigs
-                    sigs = self.db.getSigs(dgKey(pre, bytes(edig)))  # list of sigs
-                    if not sigs:  # empty list
-                        # no sigs so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event sigs at."
-                                    "dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed evt sigs at "
-                                              "dig = {}.".format(bytes(edig)))
-
-                    #  get wigs
-                    wigs = self.db.getWigs(dgKey(pre, bytes(edig)))  # list of wigs
-
-                    if not wigs:  # empty list
-                        # wigs maybe empty while waiting for first witness signature
-                        # which may not arrive until some time after event is fully signed
-                        # so just log for debugging but do not unescrow by raising
-                        # ValidationError
-                        logger.info("Kevery unescrow wigs: No event wigs yet at."
-                                    "dig = %s\n", bytes(edig))
-
-                        # raise ValidationError("Missing escrowed evt wigs at "
-                        # "dig = {}.".format(bytes(edig)))
-
-                    # process event
-                    sigers = [Siger(qb64b=bytes(sig)) for sig in sigs]
-                    wigers = [Siger(qb64b=bytes(wig)) for wig in wigs]
-
-                    # seal source (delegator issuer if any)
-                    delseqner = delsaider = None
-                    couple = self.db.getPde(dgKey(pre, bytes(edig)))
-                    if couple is not None:
-                        delseqner, delsaider = deSourceCouple(couple)
-
-                    self.processEvent(serder=eserder, sigers=sigers, wigers=wigers,
-                                      delseqner=delseqner, delsaider=delsaider)
-
-                    # If process does NOT validate wigs then process will attempt
-                    # to re-escrow and then raise MissingWitnessSignatureError
-                    # (subclass of ValidationError)
-                    # so we can distinquish between ValidationErrors that are
-                    # re-escrow vs non re-escrow. We want process to be idempotent
-                    # with respect to processing events that result in escrow items.
-                    # On re-escrow attempt by process, Pwe escrow is called by
-                    # Kever.self.escrowPWEvent Which calls
-                    # self.db.addPwe(snKey(pre, sn), serder.digb)
-                    # which in turn will NOT enter dig as dup if one already exists.
-                    # So re-escrow attempt will not change the escrowed pwe db.
-                    # Non re-escrow ValidationError means some other issue so unescrow.
-                    # No error at all means processed successfully so also unescrow.
-                    # Assumes that controller signature validation and delegation
-                    # validation will be successful as event would not be in
-                    # partially witnessed escrow unless they had already validated
-
-                except MissingWitnessSignatureError as ex:
-                    # still waiting on missing witness sigs
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrow failed: %s\n", ex.args[0])
+        Parameters:
+            pres (Iterable | None): qb64 identifier prefixes of woken escrow
+                branches to walk. None means walk the whole escrow table.
+        """
 
-                except Exception as ex:  # log diagnostics errors etc
-                    # error other than waiting on sigs or seal so remove from escrow
-                    self.db.delPwe(snKey(pre, sn), edig)  # removes one escrow at key val
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception("Kevery unescrowed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrowed: %s\n", ex.args[0])
+        for ekey, edig in self._escrowItemIter(self.db.getPweItemsNextIter, pres=pres):
+            try:
+                pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
+                # check date if expired then remove escrow.
+                dtb = self.db.getDts(dgKey(pre, bytes(edig)))
+                if dtb is None:  # othewise is a datetime as bytes
+                    # no date time so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Missing event datetime"
+                                " at dig = %s\n", bytes(edig))
+
+                    raise ValidationError("Missing escrowed event datetime "
+                                          "at dig = {}.".format(bytes(edig)))
+
+                # do date math here and discard if stale nowIso8601() bytes
+                dtnow = helping.nowUTC()
+                dte = helping.fromIso8601(bytes(dtb))
+                if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutPWE):
+                    # escrow stale so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Stale event escrow "
+                                " at dig = %s\n", bytes(edig))
+
+                    raise ValidationError("Stale event escrow "
+                                          "at dig = {}.".format(bytes(edig)))
+
+                # get the escrowed event using edig
+                eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
+                if eraw is None:
+                    # no event so so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Missing event at."
+                                "dig = %s\n", bytes(edig))
+
+                    raise ValidationError("Missing escrowed evt at dig = {}."
+                                          "".format(bytes(edig)))
+
+                eserder = Serder(raw=bytes(eraw))  # escrowed event
+
+                #  get sigs
+                sigs = self.db.getSigs(dgKey(pre, bytes(edig)))  # list of sigs
+                if not sigs:  # empty list
+                    # no sigs so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Missing event sigs at."
+                                "dig = %s\n", bytes(edig))
+
+                    raise ValidationError("Missing escrowed evt sigs at "
+                                          "dig = {}.".format(bytes(edig)))
+
+                #  get wigs
+                wigs = self.db.getWigs(dgKey(pre, bytes(edig)))  # list of wigs
+
+                if not wigs:  # empty list
+                    # wigs maybe empty while waiting for first witness signature
+                    # which may not arrive until some time after event is fully signed
+                    # so just log for debugging but do not unescrow by raising
+                    # ValidationError
+                    logger.info("Kevery unescrow wigs: No event wigs yet at."
+                                "dig = %s\n", bytes(edig))
+
+                    # raise ValidationError("Missing escrowed evt wigs at "
+                    # "dig = {}.".format(bytes(edig)))
+
+                # process event
+                sigers = [Siger(qb64b=bytes(sig)) for sig in sigs]
+                wigers = [Siger(qb64b=bytes(wig)) for wig in wigs]
+
+                # seal source (delegator issuer if any)
+                delseqner = delsaider = None
+                couple = self.db.getPde(dgKey(pre, bytes(edig)))
+                if couple is not None:
+                    delseqner, delsaider = deSourceCouple(couple)
+
+                self.processEvent(serder=eserder, sigers=sigers, wigers=wigers,
+                                  delseqner=delseqner, delsaider=delsaider)
+
+                # If process does NOT validate wigs then process will attempt
+                # to re-escrow and then raise MissingWitnessSignatureError
+                # (subclass of ValidationError)
+                # so we can distinquish between ValidationErrors that are
+                # re-escrow vs non re-escrow. We want process to be idempotent
+                # with respect to processing events that result in escrow items.
+                # On re-escrow attempt by process, Pwe escrow is called by
+                # Kever.self.escrowPWEvent Which calls
+                # self.db.addPwe(snKey(pre, sn), serder.digb)
+                # which in turn will NOT enter dig as dup if one already exists.
+                # So re-escrow attempt will not change the escrowed pwe db.
+                # Non re-escrow ValidationError means some other issue so unescrow.
+                # No error at all means processed successfully so also unescrow.
+                # Assumes that controller signature validation and delegation
+                # validation will be successful as event would not be in
+                # partially witnessed escrow unless they had already validated
+
+            except MissingWitnessSignatureError as ex:
+                # still waiting on missing witness sigs
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrow failed: %s\n", ex.args[0])
 
-                else:  # unescrow succeeded, remove from escrow
-                    # We don't remove all escrows at pre,sn because some might be
-                    # duplicitous so we process remaining escrows in spite of found
-                    # valid event escrow.
-                    self.db.delPwe(snKey(pre, sn), edig)  # removes one escrow at key val
-                    logger.info("Kevery unescrow succeeded in valid event: "
-                                "event=\n%s\n", json.dumps(eserder.ked, indent=1))
+            except Exception as ex:  # log diagnostics errors etc
+                # error other than waiting on sigs or seal so remove from escrow
+                self.db.delPwe(snKey(pre, sn), edig)  # removes one escrow at key val
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.exception("Kevery unescrowed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrowed: %s\n", ex.args[0])
 
-            if ekey == key:  # still same so no escrows found on last while iteration
-                break
-            key = ekey  # setup next while iteration, with key after ekey
+            else:  # unescrow succeeded, remove from escrow
+                # We don't remove all escrows at pre,sn because some might be
+                # duplicitous so we process remaining escrows in spite of found
+                # valid event escrow.
+                self.db.delPwe(snKey(pre, sn), edig)  # removes one escrow at key val
+                logger.info("Kevery unescrow succeeded in valid event: "
+                            "event=\n%s\n", json.dumps(eserder.ked, indent=1))
 
-    def processEscrowUnverWitness(self):
+    def processEscrowUnverWitness(self, pres=None):
         """
         Process escrowed unverified event receipts from witness receiptors
         A receipt is unverified if the associated event has not been accepted
@@ -4732,83 +4964,81 @@ class Kevery:
                         compare dig so same event
                         verify wigs via wigers
                         If successful then remove from escrow table
+
+        Parameters:
+            pres (Iterable | None): qb64 identifier prefixes of woken escrow
+                branches to walk. None means walk the whole escrow table.
         """
 
         ims = bytearray()
-        key = ekey = b''  # both start same. when not same means escrows found
-        while True:  # break when done
-            for ekey, ecouple in self.db.getUweItemsNextIter(key=key):
-                try:
-                    pre, sn = splitKeySN(ekey)  # get pre and sn from escrow db key
-                    #  get escrowed receipt's rdiger of receipted event and
-                    # wiger indexed signature of receipted event
-                    rdiger, wiger = deWitnessCouple(ecouple)
-
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgKey(pre, bytes(rdiger.qb64b)))
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event datetime"
-                                    " at dig = %s\n", rdiger.qb64b)
-
-                        raise ValidationError("Missing escrowed event datetime "
-                                              "at dig = {}.".format(rdiger.qb64b))
-
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow = helping.nowUTC()
-                    dte = helping.fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutUWE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale event escrow "
-                                    " at dig = %s\n", rdiger.qb64b)
-
-                        raise ValidationError("Stale event escrow "
-                                              "at dig = {}.".format(rdiger.qb64b))
-
-                    # lookup database dig of the receipted event in pwes escrow
-                    # using pre and sn lastEvt
-                    found = self._processEscrowFindUnver(pre=pre,
-                                                         sn=sn,
-                                                         rsaider=rdiger,
-                                                         wiger=wiger)
-
-                    if not found:  # no partial witness escrow of event found
-                        # so keep in escrow by raising UnverifiedWitnessReceiptError
-                        logger.info("Kevery unescrow error: Missing witness "
-                                    "receipted evt at pre=%s sn=%x\n", (pre, sn))
-
-                        raise UnverifiedWitnessReceiptError("Missing witness "
-                                                            "receipted evt at pre={}  sn={:x}".format(pre, sn))
-
-                except UnverifiedWitnessReceiptError as ex:
-                    # still waiting on missing prior event to validate
-                    # only happens if we process above
-                    if logger.isEnabledFor(logging.DEBUG):  # adds exception data
-                        logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrow failed: %s\n", ex.args[0])
-
-                except Exception as ex:  # log diagnostics errors etc
-                    # error other than out of order so remove from OO escrow
-                    self.db.delUwe(snKey(pre, sn), ecouple)  # removes one escrow at key val
-                    if logger.isEnabledFor(logging.DEBUG):  # adds exception data
-                        logger.exception("Kevery unescrowed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrowed: %s\n", ex.args[0])
+        for ekey, ecouple in self._escrowItemIter(self.db.getUweItemsNextIter, pres=pres):
+            try:
+                pre, sn = splitKeySN(ekey)  # get pre and sn from escrow db key
+                #  get escrowed receipt's rdiger of receipted event and
+                # wiger indexed signature of receipted event
+                rdiger, wiger = deWitnessCouple(ecouple)
+
+                # check date if expired then remove escrow.
+                dtb = self.db.getDts(dgKey(pre, bytes(rdiger.qb64b)))
+                if dtb is None:  # othewise is a datetime as bytes
+                    # no date time so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Missing event datetime"
+                                " at dig = %s\n", rdiger.qb64b)
+
+                    raise ValidationError("Missing escrowed event datetime "
+                                          "at dig = {}.".format(rdiger.qb64b))
+
+                # do date math here and discard if stale nowIso8601() bytes
+                dtnow = helping.nowUTC()
+                dte = helping.fromIso8601(bytes(dtb))
+                if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutUWE):
+                    # escrow stale so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Stale event escrow "
+                                " at dig = %s\n", rdiger.qb64b)
+
+                    raise ValidationError("Stale event escrow "
+                                          "at dig = {}.".format(rdiger.qb64b))
+
+                # lookup database dig of the receipted event in pwes escrow
+                # using pre and sn lastEvt
+                found = self._processEscrowFindUnver(pre=pre,
+                                                     sn=sn,
+                                                     rsaider=rdiger,
+                                                     wiger=wiger)
+
+                if not found:  # no partial witness escrow of event found
+                    # so keep in escrow by raising UnverifiedWitnessReceiptError
+                    logger.info("Kevery unescrow error: Missing witness "
+                                "receipted evt at pre=%s sn=%x\n", (pre, sn))
+
+                    raise UnverifiedWitnessReceiptError("Missing witness "
+                                                        "receipted evt at pre={}  sn={:x}".format(pre, sn))
+
+            except UnverifiedWitnessReceiptError as ex:
+                # still waiting on missing prior event to validate
+                # only happens if we process above
+                if logger.isEnabledFor(logging.DEBUG):  # adds exception data
+                    logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrow failed: %s\n", ex.args[0])
 
-                else:  # unescrow succeeded, remove from escrow
-                    # We don't remove all escrows at pre,sn because some might be
-                    # duplicitous so we process remaining escrows in spite of found
-                    # valid event escrow.
-                    self.db.delUwe(snKey(pre, sn), ecouple)  # removes one escrow at key val
-                    logger.info("Kevery unescrow succeeded for event pre=%s "
-                                "sn=%s\n", pre, sn)
+            except Exception as ex:  # log diagnostics errors etc
+                # error other than out of order so remove from OO escrow
+                self.db.delUwe(snKey(pre, sn), ecouple)  # removes one escrow at key val
+                if logger.isEnabledFor(logging.DEBUG):  # adds exception data
+                    logger.exception("Kevery unescrowed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrowed: %s\n", ex.args[0])
 
-            if ekey == key:  # still same so no escrows found on last while iteration
-                break
-            key = ekey  # setup next while iteration, with key after ekey
+            else:  # unescrow succeeded, remove from escrow
+                # We don't remove all escrows at pre,sn because some might be
+                # duplicitous so we process remaining escrows in spite of found
+                # valid event escrow.
+                self.db.delUwe(snKey(pre, sn), ecouple)  # removes one escrow at key val
+                logger.info("Kevery unescrow succeeded for event pre=%s "
+                            "sn=%s\n", pre, sn)
 
-    def processEscrowUnverNonTrans(self):
+    def processEscrowUnverNonTrans(self, pres=None):
         """
         Process escrowed unverified event receipts from nontrans receiptors
         A receipt is unverified if the associated event has not been accepted
@@ -4853,135 +5083,133 @@ class Kevery:
                         compare dig so same event
                         verify sigs via cigars
                         If successful then remove from escrow table
+
+        Parameters:
+            pres (Iterable | None): qb64 identifier prefixes of woken escrow
+                branches to walk. None means walk the whole escrow table.
         """
 
         ims = bytearray()
-        key = ekey = b''  # both start same. when not same means escrows found
-        while True:  # break when done
-            for ekey, etriplet in self.db.getUreItemsNextIter(key=key):
-                try:
-                    pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
-                    rsaider, sprefixer, cigar = deReceiptTriple(etriplet)
-                    cigar.verfer = Verfer(qb64b=sprefixer.qb64b)
-
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgKey(pre, bytes(rsaider.qb64b)))
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event datetime"
-                                    " at dig = %s\n", rsaider.qb64b)
-
-                        raise ValidationError("Missing escrowed event datetime "
-                                              "at dig = {}.".format(rsaider.qb64b))
-
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow = helping.nowUTC()
-                    dte = helping.fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutURE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale event escrow "
-                                    " at dig = %s\n", rsaider.qb64b)
-
-                        raise ValidationError("Stale event escrow "
-                                              "at dig = {}.".format(rsaider.qb64b))
-
-                    # Is receipt for unverified witnessed event in .Pwes escrow
-                    # if found then try else clause will remove from escrow
-                    found = self._processEscrowFindUnver(pre=pre,
-                                                         sn=sn,
-                                                         rsaider=rsaider,
-                                                         cigar=cigar)
-
-                    if not found:  # no partial witness escrow of event found
-                        # so process as escrow of receipt for accept event
-                        # not two stage witnessed event escrow
-                        # get dig of receipted accepted event in kel using lastEvt
-                        # at pre and sn
-
-                        dig = self.db.getKeLast(snKey(pre, sn))
-                        if dig is None:  # no receipted event so keep in escrow
-                            logger.info("Kevery unescrow error: Missing receipted "
-                                        "event at pre=%s sn=%x\n", pre, sn)
-
-                            raise UnverifiedReceiptError("Missing receipted evt "
-                                                         "at pre={} sn={:x}".format(pre, sn))
-
-                        # get receipted event using pre and edig
-                        raw = self.db.getEvt(dgKey(pre, dig))
-                        if raw is None:  # receipted event superseded so remove from escrow
-                            logger.info("Kevery unescrow error: Invalid receipted "
-                                        "event refereance at pre=%s sn=%x\n", pre, sn)
-
-                            raise ValidationError("Invalid receipted evt reference"
-                                                  " at pre={} sn={:x}".format(pre, sn))
-
-                        serder = Serder(raw=bytes(raw))  # receipted event
-
-                        #  compare digs
-                        if rsaider.qb64b != serder.saidb:
-                            logger.info("Kevery unescrow error: Bad receipt dig."
-                                        "pre=%s sn=%x receipter=%s\n", pre, sn, sprefixer.qb64)
-
-                            raise ValidationError("Bad escrowed receipt dig at "
-                                                  "pre={} sn={:x} receipter={}."
-                                                  "".format(pre, sn, sprefixer.qb64))
-
-                        #  verify sig verfer key is prefixer from triple
-                        if not cigar.verfer.verify(cigar.raw, serder.raw):
-                            # no sigs so raise ValidationError which unescrows below
-                            logger.info("Kevery unescrow error: Bad receipt sig."
-                                        "pre=%s sn=%x receipter=%s\n", pre, sn, sprefixer.qb64)
-
-                            raise ValidationError("Bad escrowed receipt sig at "
-                                                  "pre={} sn={:x} receipter={}."
-                                                  "".format(pre, sn, sprefixer.qb64))
-
-                        # get current wits from kever state assuming not stale
-                        # receipt. Need function here to compute wits for actual
-                        # state at pre, sn. XXXX
-                        wits = self.kevers[serder.pre].wits
-                        rpre = cigar.verfer.qb64  # prefix of receiptor
-                        if rpre in wits:  # its a witness receipt
-                            # this only works for extra receipts that come in later
-                            # after event is out of .Pwes escrow
-                            index = wits.index(rpre)
-                            # create witness indexed signature and write to db
-                            wiger = Siger(raw=cigar.raw, index=index, verfer=cigar.verfer)
-                            self.db.addWig(key=dgKey(pre, serder.said), val=wiger.qb64b)
-                        else:  # write receipt couple to database
-                            couple = cigar.verfer.qb64b + cigar.qb64b
-                            self.db.addRct(key=dgKey(pre, serder.said), val=couple)
-
-
-                except UnverifiedReceiptError as ex:
-                    # still waiting on missing prior event to validate
-                    # only happens if we process above
-                    if logger.isEnabledFor(logging.DEBUG):  # adds exception data
-                        logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrow failed: %s\n", ex.args[0])
+        for ekey, etriplet in self._escrowItemIter(self.db.getUreItemsNextIter, pres=pres):
+            try:
+                pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
+                rsaider, sprefixer, cigar = deReceiptTriple(etriplet)
+                cigar.verfer = Verfer(qb64b=sprefixer.qb64b)
+
+                # check date if expired then remove escrow.
+                dtb = self.db.getDts(dgKey(pre, bytes(rsaider.qb64b)))
+                if dtb is None:  # othewise is a datetime as bytes
+                    # no date time so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Missing event datetime"
+                                " at dig = %s\n", rsaider.qb64b)
+
+                    raise ValidationError("Missing escrowed event datetime "
+                                          "at dig = {}.".format(rsaider.qb64b))
+
+                # do date math here and discard if stale nowIso8601() bytes
+                dtnow = helping.nowUTC()
+                dte = helping.fromIso8601(bytes(dtb))
+                if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutURE):
+                    # escrow stale so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Stale event escrow "
+                                " at dig = %s\n", rsaider.qb64b)
+
+                    raise ValidationError("Stale event escrow "
+                                          "at dig = {}.".format(rsaider.qb64b))
+
+                # Is receipt for unverified witnessed event in .Pwes escrow
+                # if found then try else clause will remove from escrow
+                found = self._processEscrowFindUnver(pre=pre,
+                                                     sn=sn,
+                                                     rsaider=rsaider,
+                                                     cigar=cigar)
+
+                if not found:  # no partial witness escrow of event found
+                    # so process as escrow of receipt for accept event
+                    # not two stage witnessed event escrow
+                    # get dig of receipted accepted event in kel using lastEvt
+                    # at pre and sn
+
+                    dig = self.db.getKeLast(snKey(pre, sn))
+                    if dig is None:  # no receipted event so keep in escrow
+                        logger.info("Kevery unescrow error: Missing receipted "
+                                    "event at pre=%s sn=%x\n", pre, sn)
 
-                except Exception as ex:  # log diagnostics errors etc
-                    # error other than out of order so remove from OO escrow
-                    self.db.delUre(snKey(pre, sn), etriplet)  # removes one escrow at key val
-                    if logger.isEnabledFor(logging.DEBUG):  # adds exception data
-                        logger.exception("Kevery unescrowed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrowed: %s\n", ex.args[0])
+                        raise UnverifiedReceiptError("Missing receipted evt "
+                                                     "at pre={} sn={:x}".format(pre, sn))
+
+                    # get receipted event using pre and edig
+                    raw = self.db.getEvt(dgKey(pre, dig))
+                    if raw is None:  # receipted event superseded so remove from escrow
+                        logger.info("Kevery unescrow error: Invalid receipted "
+                                    "event refereance at pre=%s sn=%x\n", pre, sn)
 
-                else:  # unescrow succeeded, remove from escrow
-                    # We don't remove all escrows at pre,sn because some might be
-                    # duplicitous so we process remaining escrows in spite of found
-                    # valid event escrow.
-                    self.db.delUre(snKey(pre, sn), etriplet)  # removes one escrow at key val
-                    logger.info("Kevery unescrow succeeded for event pre=%s "
-                                "sn=%s\n", pre, sn)
+                        raise ValidationError("Invalid receipted evt reference"
+                                              " at pre={} sn={:x}".format(pre, sn))
 
-            if ekey == key:  # still same so no escrows found on last while iteration
-                break
-            key = ekey  # setup next while iteration, with key after ekey
+                    serder = Serder(raw=bytes(raw))  # receipted event
+
+                    #  compare digs
+                    if rsaider.qb64b != serder.saidb:
+                        logger.info("Kevery unescrow error: Bad receipt dig."
+                                    "pre=%s sn=%x receipter=%s\n", pre, sn, sprefixer.qb64)
+
+                        raise ValidationError("Bad escrowed receipt dig at "
+                                              "pre={} sn={:x} receipter={}."
+                                              "".format(pre, sn, sprefixer.qb64))
+
+                    #  verify sig verfer key is prefixer from triple
+                    if not cigar.verfer.verify(cigar.raw, serder.raw):
+                        # no sigs so raise ValidationError which unescrows below
+                        logger.info("Kevery unescrow error: Bad receipt sig."
+                                    "pre=%s sn=%x receipter=%s\n", pre, sn, sprefixer.qb64)
+
+                        raise ValidationError("Bad escrowed receipt sig at "
+                                              "pre={} sn={:x} receipter={}."
+                                              "".format(pre, sn, sprefixer.qb64))
+
+                    # get current wits from kever state assuming not stale
+                    # receipt. Need function here to compute wits for actual
+                    # state at pre, sn. XXXX
+                    wits = self.kevers[serder.pre].wits
+                    rpre = cigar.verfer.qb64  # prefix of receiptor
+                    if rpre in wits:  # its a witness receipt
+                        # this only works for extra receipts that come in later
+                        # after event is out of .Pwes escrow
+                        index = wits.index(rpre)
+                        # create witness indexed signature and write to db
+                        wiger = Siger(raw=cigar.raw, index=index, verfer=cigar.verfer)
+                        self.db.addWig(key=dgKey(pre, serder.said), val=wiger.qb64b)
+                    else:  # write receipt couple to database
+                        couple = cigar.verfer.qb64b + cigar.qb64b
+                        self.db.addRct(key=dgKey(pre, serder.said), val=couple)
 
-    def processQueryNotFound(self):
+
+            except UnverifiedReceiptError as ex:
+                # still waiting on missing prior event to validate
+                # only happens if we process above
+                if logger.isEnabledFor(logging.DEBUG):  # adds exception data
+                    logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrow failed: %s\n", ex.args[0])
+
+            except Exception as ex:  # log diagnostics errors etc
+                # error other than out of order so remove from OO escrow
+                self.db.delUre(snKey(pre, sn), etriplet)  # removes one escrow at key val
+                if logger.isEnabledFor(logging.DEBUG):  # adds exception data
+                    logger.exception("Kevery unescrowed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrowed: %s\n", ex.args[0])
+
+            else:  # unescrow succeeded, remove from escrow
+                # We don't remove all escrows at pre,sn because some might be
+                # duplicitous so we process remaining escrows in spite of found
+                # valid event escrow.
+                self.db.delUre(snKey(pre, sn), etriplet)  # removes one escrow at key val
+                logger.info("Kevery unescrow succeeded for event pre=%s "
+                            "sn=%s\n", pre, sn)
+
+    def processQueryNotFound(self, pres=None):
         """
         Process qry events escrowed by Kevery for KELs that have not yet met the criteria of the query.
         A missing KEL or criteria for an event in a KEL at a particular sequence number or an event containing a
@@ -5004,96 +5232,94 @@ class Kevery:
                         Get and Attach Signatures
                         Process event as if it came in over the wire
                         If successful then remove from escrow table
+
+        Parameters:
+            pres (Iterable | None): qb64 identifier prefixes of woken escrow
+                branches to walk. None means walk the whole escrow table.
         """
 
-        key = ekey = b''  # both start same. when not same means escrows found
         pre = b''
         sn = 0
-        while True:  # break when done
-            for ekey, edig in self.db.getQnfItemsNextIter(key=key):
-                try:
-                    pre, _ = splitKey(ekey)  # get pre and sn from escrow item
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgKey(pre, bytes(edig)))
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event datetime"
-                                    " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed event datetime "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow = helping.nowUTC()
-                    dte = helping.fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutQNF):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale qry event escrow "
-                                    " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Stale qry event escrow "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # get the escrowed event using edig
-                    eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
-                    if eraw is None:
-                        # no event so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event at."
-                                    "dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed evt at dig = {}."
-                                              "".format(bytes(edig)))
-
-                    eserder = Serder(raw=bytes(eraw))  # escrowed event
-
-                    #  get sigs and attach
-                    sigs = self.db.getSigs(dgKey(pre, bytes(edig)))
-                    if not sigs:  # otherwise its a list of sigs
-                        # no sigs so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event sigs at."
-                                    "dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed evt sigs at "
-                                              "dig = {}.".format(bytes(edig)))
-
-                    # process event
-                    sigers = [Siger(qb64b=bytes(sig)) for sig in sigs]
-
-                    #  get wigs
-                    cigars = []
-                    cigs = self.db.getRcts(dgKey(pre, bytes(edig)))  # list of wigs
-                    for cig in cigs:
-                        (_, cigar) = deReceiptCouple(cig)
-                        cigars.append(cigar)
-
-                    source = coring.Prefixer(qb64b=pre)
-                    self.processQuery(serder=eserder, source=source, sigers=sigers, cigars=cigars)
-
-                except QueryNotFoundError as ex:
-                    # still waiting on missing prior event to validate
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrow failed: %s\n", ex.args[0])
+        for ekey, edig in self._escrowItemIter(self.db.getQnfItemsNextIter, pres=pres):
+            try:
+                pre, _ = splitKey(ekey)  # get pre and sn from escrow item
+                # check date if expired then remove escrow.
+                dtb = self.db.getDts(dgKey(pre, bytes(edig)))
+                if dtb is None:  # othewise is a datetime as bytes
+                    # no date time so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Missing event datetime"
+                                " at dig = %s\n", bytes(edig))
+
+                    raise ValidationError("Missing escrowed event datetime "
+                                          "at dig = {}.".format(bytes(edig)))
+
+                # do date math here and discard if stale nowIso8601() bytes
+                dtnow = helping.nowUTC()
+                dte = helping.fromIso8601(bytes(dtb))
+                if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutQNF):
+                    # escrow stale so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Stale qry event escrow "
+                                " at dig = %s\n", bytes(edig))
+
+                    raise ValidationError("Stale qry event escrow "
+                                          "at dig = {}.".format(bytes(edig)))
+
+                # get the escrowed event using edig
+                eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
+                if eraw is None:
+                    # no event so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Missing event at."
+                                "dig = %s\n", bytes(edig))
+
+                    raise ValidationError("Missing escrowed evt at dig = {}."
+                                          "".format(bytes(edig)))
+
+                eserder = Serder(raw=bytes(eraw))  # escrowed event
+
+                #  get sigs and attach
+                sigs = self.db.getSigs(dgKey(pre, bytes(edig)))
+                if not sigs:  # otherwise its a list of sigs
+                    # no sigs so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Missing event sigs at."
+                                "dig = %s\n", bytes(edig))
+
+                    raise ValidationError("Missing escrowed evt sigs at "
+                                          "dig = {}.".format(bytes(edig)))
+
+                # process event
+                sigers = [Siger(qb64b=bytes(sig)) for sig in sigs]
+
+                #  get wigs
+                cigars = []
+                cigs = self.db.getRcts(dgKey(pre, bytes(edig)))  # list of wigs
+                for cig in cigs:
+                    (_, cigar) = deReceiptCouple(cig)
+                    cigars.append(cigar)
+
+                source = coring.Prefixer(qb64b=pre)
+                self.processQuery(serder=eserder, source=source, sigers=sigers, cigars=cigars)
+
+            except QueryNotFoundError as ex:
+                # still waiting on missing prior event to validate
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrow failed: %s\n", ex.args[0])
 
-                except Exception as ex:  # log diagnostics errors etc
-                    # error other than out of order so remove from OO escrow
-                    self.db.delQnf(dgKey(pre, edig), edig)  # removes one escrow at key val
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception("Kevery unescrowed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrowed: %s\n", ex.args[0])
-                else:  # unescrow succeeded, remove from escrow
-                    # We don't remove all escrows at pre,sn because some might be
-                    # duplicitous so we process remaining escrows in spite of found
-                    # valid event escrow.
-                    self.db.delQnf(dgKey(pre, edig), edig)  # removes one escrow at key val
-                    logger.info("Kevery unescrow succeeded in valid event: "
-                                "event=\n%s\n", json.dumps(eserder.ked, indent=1))
-
-            if ekey == key:  # still same so no escrows found on last while iteration
-                break
-            key = ekey  # setup next while iteration, with key after ekey
+            except Exception as ex:  # log diagnostics errors etc
+                # error other than out of order so remove from OO escrow
+                self.db.delQnf(dgKey(pre, edig), edig)  # removes one escrow at key val
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.exception("Kevery unescrowed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrowed: %s\n", ex.args[0])
+            else:  # unescrow succeeded, remove from escrow
+                # We don't remove all escrows at pre,sn because some might be
+                # duplicitous so we process remaining escrows in spite of found
+                # valid event escrow.
+                self.db.delQnf(dgKey(pre, edig), edig)  # removes one escrow at key val
+                logger.info("Kevery unescrow succeeded in valid event: "
+                            "event=\n%s\n", json.dumps(eserder.ked, indent=1))
 
 
     def _processEscrowFindUnver(self, pre, sn, rsaider, wiger=None, cigar=None):
@@ -5201,10 +5427,11 @@ class Kevery:
             self.db.addWig(key=dgKey(pre, serder.said), val=wiger.qb64b)
             # processEscrowPartialWigs removes from this .Pwes escrow
             # when fully witnessed using self.db.delPwe(snkey, dig)
+            self.wake(pre, names=("pwes", ))  # new wig so retry partial witness escrow
 
         return found
 
-    def processEscrowUnverTrans(self):
+    def processEscrowUnverTrans(self, pres=None):
         """
         Process event receipts from transferable identifiers (validators)
         escrowed by Kever that are unverified.
@@ -5247,145 +5474,144 @@ class Kevery:
                         compare dig so same event
                         verify sigs via sigers
                         If successful then remove from escrow table
+
+        Parameters:
+            pres (Iterable | None): qb64 identifier prefixes of woken escrow
+                branches to walk. None means walk the whole escrow table.
         """
 
         ims = bytearray()
-        key = ekey = b''  # both start same. when not same means escrows found
-        while True:  # break when done
-            for ekey, equinlet in self.db.getVreItemsNextIter(key=key):
-                try:
-                    pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
-                    esaider, sprefixer, sseqner, ssaider, siger = deTransReceiptQuintuple(equinlet)
-
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgKey(pre, bytes(esaider.qb64b)))
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event datetime"
-                                    " at dig = %s\n", esaider.qb64b)
-
-                        raise ValidationError("Missing escrowed event datetime "
-                                              "at dig = {}.".format(esaider.qb64b))
-
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow = helping.nowUTC()
-                    dte = helping.fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutVRE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale event escrow "
-                                    " at dig = %s\n", esaider.qb64b)
-
-                        raise ValidationError("Stale event escrow "
-                                              "at dig = {}.".format(esaider.qb64b))
-
-                    # get dig of the receipted event using pre and sn lastEvt
-                    raw = self.db.getKeLast(snKey(pre, sn))
-                    if raw is None:
-                        # no event so keep in escrow
-                        logger.info("Kevery unescrow error: Missing receipted "
-                                    "event at pre=%s sn=%x\n", pre, sn)
-
-                        raise UnverifiedTransferableReceiptError("Missing receipted evt at pre={} "
-                                                                 " sn={:x}".format(pre, sn))
-
-                    dig = bytes(raw)
-                    # get receipted event using pre and edig
-                    raw = self.db.getEvt(dgKey(pre, dig))
-                    if raw is None:  # receipted event superseded so remove from escrow
-                        logger.info("Kevery unescrow error: Invalid receipted "
-                                    "event referenace at pre=%s sn=%x\n", pre, sn)
+        for ekey, equinlet in self._escrowItemIter(self.db.getVreItemsNextIter, pres=pres):
+            try:
+                pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
+                esaider, sprefixer, sseqner, ssaider, siger = deTransReceiptQuintuple(equinlet)
+
+                # check date if expired then remove escrow.
+                dtb = self.db.getDts(dgKey(pre, bytes(esaider.qb64b)))
+                if dtb is None:  # othewise is a datetime as bytes
+                    # no date time so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Missing event datetime"
+                                " at dig = %s\n", esaider.qb64b)
+
+                    raise ValidationError("Missing escrowed event datetime "
+                                          "at dig = {}.".format(esaider.qb64b))
+
+                # do date math here and discard if stale nowIso8601() bytes
+                dtnow = helping.nowUTC()
+                dte = helping.fromIso8601(bytes(dtb))
+                if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutVRE):
+                    # escrow stale so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Stale event escrow "
+                                " at dig = %s\n", esaider.qb64b)
+
+                    raise ValidationError("Stale event escrow "
+                                          "at dig = {}.".format(esaider.qb64b))
+
+                # get dig of the receipted event using pre and sn lastEvt
+                raw = self.db.getKeLast(snKey(pre, sn))
+                if raw is None:
+                    # no event so keep in escrow
+                    logger.info("Kevery unescrow error: Missing receipted "
+                                "event at pre=%s sn=%x\n", pre, sn)
+
+                    raise UnverifiedTransferableReceiptError("Missing receipted evt at pre={} "
+                                                             " sn={:x}".format(pre, sn))
+
+                dig = bytes(raw)
+                # get receipted event using pre and edig
+                raw = self.db.getEvt(dgKey(pre, dig))
+                if raw is None:  # receipted event superseded so remove from escrow
+                    logger.info("Kevery unescrow error: Invalid receipted "
+                                "event referenace at pre=%s sn=%x\n", pre, sn)
+
+                    raise ValidationError("Invalid receipted evt reference "
+                                          "at pre={} sn={:x}".format(pre, sn))
+
+                serder = Serder(raw=bytes(raw))  # receipted event
+
+                #  compare digs
+                if esaider.qb64b != serder.saidb:
+                    logger.info("Kevery unescrow error: Bad receipt dig."
+                                "pre=%s sn=%x receipter=%s\n", (pre, sn, sprefixer.qb64))
+
+                    raise ValidationError("Bad escrowed receipt dig at "
+                                          "pre={} sn={:x} receipter={}."
+                                          "".format(pre, sn, sprefixer.qb64))
 
-                        raise ValidationError("Invalid receipted evt reference "
-                                              "at pre={} sn={:x}".format(pre, sn))
+                # get receipter's last est event
+                # retrieve dig of last event at sn of receipter.
+                sdig = self.db.getKeLast(key=snKey(pre=sprefixer.qb64b,
+                                                   sn=sseqner.sn))
+                if sdig is None:
+                    # no event so keep in escrow
+                    logger.info("Kevery unescrow error: Missing receipted "
+                                "event at pre=%s sn=%x\n", pre, sn)
 
-                    serder = Serder(raw=bytes(raw))  # receipted event
+                    raise UnverifiedTransferableReceiptError("Missing receipted evt at pre={} "
+                                                             " sn={:x}".format(pre, sn))
 
-                    #  compare digs
-                    if esaider.qb64b != serder.saidb:
-                        logger.info("Kevery unescrow error: Bad receipt dig."
-                                    "pre=%s sn=%x receipter=%s\n", (pre, sn, sprefixer.qb64))
+                # retrieve last event itself of receipter
+                sraw = self.db.getEvt(key=dgKey(pre=sprefixer.qb64b, dig=bytes(sdig)))
+                # assumes db ensures that sraw must not be none because sdig was in KE
+                sserder = Serder(raw=bytes(sraw))
+                if not sserder.compare(said=ssaider.qb64):  # seal dig not match event
+                    # this unescrows
+                    raise ValidationError("Bad chit seal at sn = {} for rct = {}."
+                                          "".format(sseqner.sn, sserder.ked))
 
-                        raise ValidationError("Bad escrowed receipt dig at "
-                                              "pre={} sn={:x} receipter={}."
-                                              "".format(pre, sn, sprefixer.qb64))
+                # verify sigs and if so write quadruple to database
+                verfers = sserder.verfers
+                if not verfers:
+                    raise ValidationError("Invalid seal est. event dig = {} for "
+                                          "receipt from pre ={} no keys."
+                                          "".format(ssaider.qb64, sprefixer.qb64))
 
-                    # get receipter's last est event
-                    # retrieve dig of last event at sn of receipter.
-                    sdig = self.db.getKeLast(key=snKey(pre=sprefixer.qb64b,
-                                                       sn=sseqner.sn))
-                    if sdig is None:
-                        # no event so keep in escrow
-                        logger.info("Kevery unescrow error: Missing receipted "
-                                    "event at pre=%s sn=%x\n", pre, sn)
+                # Set up quadruple
+                sealet = sprefixer.qb64b + sseqner.qb64b + ssaider.qb64b
 
-                        raise UnverifiedTransferableReceiptError("Missing receipted evt at pre={} "
-                                                                 " sn={:x}".format(pre, sn))
-
-                    # retrieve last event itself of receipter
-                    sraw = self.db.getEvt(key=dgKey(pre=sprefixer.qb64b, dig=bytes(sdig)))
-                    # assumes db ensures that sraw must not be none because sdig was in KE
-                    sserder = Serder(raw=bytes(sraw))
-                    if not sserder.compare(said=ssaider.qb64):  # seal dig not match event
-                        # this unescrows
-                        raise ValidationError("Bad chit seal at sn = {} for rct = {}."
-                                              "".format(sseqner.sn, sserder.ked))
-
-                    # verify sigs and if so write quadruple to database
-                    verfers = sserder.verfers
-                    if not verfers:
-                        raise ValidationError("Invalid seal est. event dig = {} for "
-                                              "receipt from pre ={} no keys."
-                                              "".format(ssaider.qb64, sprefixer.qb64))
-
-                    # Set up quadruple
-                    sealet = sprefixer.qb64b + sseqner.qb64b + ssaider.qb64b
-
-                    if siger.index >= len(verfers):
-                        raise ValidationError("Index = {} to large for keys."
-                                              "".format(siger.index))
-
-                    siger.verfer = verfers[siger.index]  # assign verfer
-                    if not siger.verfer.verify(siger.raw, serder.raw):  # verify sig
-                        logger.info("Kevery unescrow error: Bad trans receipt sig."
-                                    "pre=%s sn=%x receipter=%s\n", pre, sn, sprefixer.qb64)
+                if siger.index >= len(verfers):
+                    raise ValidationError("Index = {} to large for keys."
+                                          "".format(siger.index))
 
-                        raise ValidationError("Bad escrowed trans receipt sig at "
-                                              "pre={} sn={:x} receipter={}."
-                                              "".format(pre, sn, sprefixer.qb64))
+                siger.verfer = verfers[siger.index]  # assign verfer
+                if not siger.verfer.verify(siger.raw, serder.raw):  # verify sig
+                    logger.info("Kevery unescrow error: Bad trans receipt sig."
+                                "pre=%s sn=%x receipter=%s\n", pre, sn, sprefixer.qb64)
 
-                    # good sig so write receipt quadruple to database
-                    quadruple = sealet + siger.qb64b
-                    self.db.addVrc(key=dgKey(pre, serder.said), val=quadruple)
+                    raise ValidationError("Bad escrowed trans receipt sig at "
+                                          "pre={} sn={:x} receipter={}."
+                                          "".format(pre, sn, sprefixer.qb64))
 
+                # good sig so write receipt quadruple to database
+                quadruple = sealet + siger.qb64b
+                self.db.addVrc(key=dgKey(pre, serder.said), val=quadruple)
 
-                except UnverifiedTransferableReceiptError as ex:
-                    # still waiting on missing prior event to validate
-                    # only happens if we process above
-                    if logger.isEnabledFor(logging.DEBUG):  # adds exception data
-                        logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrow failed: %s\n", ex.args[0])
 
-                except Exception as ex:  # log diagnostics errors etc
-                    # error other than out of order so remove from OO escrow
-                    self.db.delVre(snKey(pre, sn), equinlet)  # removes one escrow at key val
-                    if logger.isEnabledFor(logging.DEBUG):  # adds exception data
-                        logger.exception("Kevery unescrowed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrowed: %s\n", ex.args[0])
+            except UnverifiedTransferableReceiptError as ex:
+                # still waiting on missing prior event to validate
+                # only happens if we process above
+                self.wait("vres", pre=pre, dep=sprefixer.qb64)  # or receipter est evt
+                if logger.isEnabledFor(logging.DEBUG):  # adds exception data
+                    logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrow failed: %s\n", ex.args[0])
 
-                else:  # unescrow succeeded, remove from escrow
-                    # We don't remove all escrows at pre,sn because some might be
-                    # duplicitous so we process remaining escrows in spite of found
-                    # valid event escrow.
-                    self.db.delVre(snKey(pre, sn), equinlet)  # removes one escrow at key val
-                    logger.info("Kevery unescrow succeeded for event = %s\n", serder.ked)
+            except Exception as ex:  # log diagnostics errors etc
+                # error other than out of order so remove from OO escrow
+                self.db.delVre(snKey(pre, sn), equinlet)  # removes one escrow at key val
+                if logger.isEnabledFor(logging.DEBUG):  # adds exception data
+                    logger.exception("Kevery unescrowed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrowed: %s\n", ex.args[0])
 
-            if ekey == key:  # still same so no escrows found on last while iteration
-                break
-            key = ekey  # setup next while iteration, with key after ekey
+            else:  # unescrow succeeded, remove from escrow
+                # We don't remove all escrows at pre,sn because some might be
+                # duplicitous so we process remaining escrows in spite of found
+                # valid event escrow.
+                self.db.delVre(snKey(pre, sn), equinlet)  # removes one escrow at key val
+                logger.info("Kevery unescrow succeeded for event = %s\n", serder.ked)
 
-    def processEscrowDuplicitous(self):
+    def processEscrowDuplicitous(self, pres=None):
         """
         Process events escrowed by Kever that are likely duplicitous.
         An event is likely duplicitous if a different version of event already
@@ -5420,98 +5646,96 @@ class Kevery:
                         Get and Attach Signatures
                         Process event as if it came in over the wire
                         If successful then remove from escrow table
-        """
-        key = ekey = b''  # both start same. when not same means escrows found
-        while True:  # break when done
-            for ekey, edig in self.db.getLdeItemsNextIter(key=key):
-                try:
-                    pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgKey(pre, bytes(edig)))
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event datetime"
-                                    " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed event datetime "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow = helping.nowUTC()
-                    dte = helping.fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutLDE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale event escrow "
-                                    " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Stale event escrow "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # get the escrowed event using edig
-                    eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
-                    if eraw is None:
-                        # no event so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event at."
-                                    "dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed evt at dig = {}."
-                                              "".format(bytes(edig)))
-
-                    eserder = Serder(raw=bytes(eraw))  # escrowed event
-
-                    #  get sigs and attach
-                    sigs = self.db.getSigs(dgKey(pre, bytes(edig)))
-                    if not sigs:  # otherwise its a list of sigs
-                        # no sigs so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event sigs at."
-                                    "dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed evt sigs at "
-                                              "dig = {}.".format(bytes(edig)))
-
-                    sigers = [Siger(qb64b=bytes(sig)) for sig in sigs]
-                    self.processEvent(serder=eserder, sigers=sigers)
-
-                    # If process does NOT validate event with sigs, becasue it is
-                    # still out of order then process will attempt to re-escrow
-                    # and then raise OutOfOrderError (subclass of ValidationError)
-                    # so we can distinquish between ValidationErrors that are
-                    # re-escrow vs non re-escrow. We want process to be idempotent
-                    # with respect to processing events that result in escrow items.
-                    # On re-escrow attempt by process, Ooe escrow is called by
-                    # Kevery.self.escrowOOEvent Which calls
-                    # self.db.addOoe(snKey(pre, sn), serder.digb)
-                    # which in turn will not enter dig as dup if one already exists.
-                    # So re-escrow attempt will not change the escrowed ooe db.
-                    # Non re-escrow ValidationError means some other issue so unescrow.
-                    # No error at all means processed successfully so also unescrow.
-
-                except LikelyDuplicitousError as ex:
-                    # still can't determine if duplicitous
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrow failed: %s\n", ex.args[0])
 
-                except Exception as ex:  # log diagnostics errors etc
-                    # error other than likely duplicitous so remove from escrow
-                    self.db.delLde(snKey(pre, sn), edig)  # removes one escrow at key val
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception("Kevery unescrowed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrowed: %s\n", ex.args[0])
+        Parameters:
+            pres (Iterable | None): qb64 identifier prefixes of woken escrow
+                branches to walk. None means walk the whole escrow table.
+        """
+        for ekey, edig in self._escrowItemIter(self.db.getLdeItemsNextIter, pres=pres):
+            try:
+                pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
+                # check date if expired then remove escrow.
+                dtb = self.db.getDts(dgKey(pre, bytes(edig)))
+                if dtb is None:  # othewise is a datetime as bytes
+                    # no date time so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Missing event datetime"
+                                " at dig = %s\n", bytes(edig))
+
+                    raise ValidationError("Missing escrowed event datetime "
+                                          "at dig = {}.".format(bytes(edig)))
+
+                # do date math here and discard if stale nowIso8601() bytes
+                dtnow = helping.nowUTC()
+                dte = helping.fromIso8601(bytes(dtb))
+                if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutLDE):
+                    # escrow stale so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Stale event escrow "
+                                " at dig = %s\n", bytes(edig))
+
+                    raise ValidationError("Stale event escrow "
+                                          "at dig = {}.".format(bytes(edig)))
+
+                # get the escrowed event using edig
+                eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
+                if eraw is None:
+                    # no event so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Missing event at."
+                                "dig = %s\n", bytes(edig))
+
+                    raise ValidationError("Missing escrowed evt at dig = {}."
+                                          "".format(bytes(edig)))
+
+                eserder = Serder(raw=bytes(eraw))  # escrowed event
+
+                #  get sigs and attach
+                sigs = self.db.getSigs(dgKey(pre, bytes(edig)))
+                if not sigs:  # otherwise its a list of sigs
+                    # no sigs so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Missing event sigs at."
+                                "dig = %s\n", bytes(edig))
+
+                    raise ValidationError("Missing escrowed evt sigs at "
+                                          "dig = {}.".format(bytes(edig)))
+
+                sigers = [Siger(qb64b=bytes(sig)) for sig in sigs]
+                self.processEvent(serder=eserder, sigers=sigers)
+
+                # If process does NOT validate event with sigs, becasue it is
+                # still out of order then process will attempt to re-escrow
+                # and then raise OutOfOrderError (subclass of ValidationError)
+                # so we can distinquish between ValidationErrors that are
+                # re-escrow vs non re-escrow. We want process to be idempotent
+                # with respect to processing events that result in escrow items.
+                # On re-escrow attempt by process, Ooe escrow is called by
+                # Kevery.self.escrowOOEvent Which calls
+                # self.db.addOoe(snKey(pre, sn), serder.digb)
+                # which in turn will not enter dig as dup if one already exists.
+                # So re-escrow attempt will not change the escrowed ooe db.
+                # Non re-escrow ValidationError means some other issue so unescrow.
+                # No error at all means processed successfully so also unescrow.
+
+            except LikelyDuplicitousError as ex:
+                # still can't determine if duplicitous
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrow failed: %s\n", ex.args[0])
 
-                else:  # unescrow succeeded, remove from escrow
-                    # We don't remove all escrows at pre,sn because some might be
-                    # duplicitous so we process remaining escrows in spite of found
-                    # valid event escrow.
-                    self.db.delLde(snKey(pre, sn), edig)  # removes one escrow at key val
-                    logger.info("Kevery unescrow succeeded in valid event: "
-                                "event=\n%s\n", json.dumps(eserder.ked, indent=1))
+            except Exception as ex:  # log diagnostics errors etc
+                # error other than likely duplicitous so remove from escrow
+                self.db.delLde(snKey(pre, sn), edig)  # removes one escrow at key val
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.exception("Kevery unescrowed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrowed: %s\n", ex.args[0])
 
-            if ekey == key:  # still same so no escrows found on last while iteration
-                break
-            key = ekey  # setup next while iteration, with key after ekey
+            else:  # unescrow succeeded, remove from escrow
+                # We don't remove all escrows at pre,sn because some might be
+                # duplicitous so we process remaining escrows in spite of found
+                # valid event escrow.
+                self.db.delLde(snKey(pre, sn), edig)  # removes one escrow at key val
+                logger.info("Kevery unescrow succeeded in valid event: "
+                            "event=\n%s\n", json.dumps(eserder.ked, indent=1))
 
     def duplicity(self, serder, sigers):
         """
@@ -5543,8 +5767,8 @@ def loadEvent(db, preb, dig):
     if not (raw := db.getEvt(key=dgkey)):
         raise ValueError("Missing event for dig={}.".format(dig))
 
-    serder = coring.Serder(raw=bytes(raw))
-    event["ked"] = serder.ked
+    serder = subing.serders.get(raw)
+    event["ked"] = copy.deepcopy(serder.ked)  # so caller can't mutate shared cached serder
 
     sn = serder.sn
     sdig = db.getKeLast(key=dbing.snKey(pre=preb,
@@ -8,13 +8,14 @@ message stream parsing support
 import logging
 import traceback
 from collections import namedtuple
-from dataclasses import dataclass, astuple
+from dataclasses import dataclass
 
 from .coring import (Ilks, CtrDex, Counter, Seqner, Siger, Cigar, IdxSigDex,
                      Dater, Verfer, Prefixer, Serder, Saider, Pather, Protos,
                      Sadder, )
 from .. import help
 from .. import kering
+from ..help import metering
 from ..vc.proving import Creder
 
 logger = help.ogler.getLogger()
@@ -59,7 +60,7 @@ class ColdCodex:
     CtOpB2: int = 0o7  # CountCode or OpCode Base2
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())
 
 
 ColdDex = ColdCodex()  # Make instance
@@ -995,6 +996,12 @@ class Parser:
                                              "attachment group of size={}.".format(pags))
             raise  # no pipeline group so can't preflush, must flush stream
 
+        if metering.meter.enabled:  # message body bytes since attachments may span yields
+            metering.meter.counter("keri_parser_msgs_total", help="Messages parsed",
+                                   labels=("proto",)).inc(sadder.proto)
+            metering.meter.counter("keri_parser_bytes_total", help="Message body bytes parsed",
+                                   labels=("proto",)).inc(sadder.proto, amount=sadder.size)
+
         if sadder.proto == Protos.keri:
             serder = Serder(sad=sadder)
 
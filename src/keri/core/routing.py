@@ -12,7 +12,7 @@ from hio.help import decking
 from . import eventing, coring
 from .. import help, kering
 from ..db import dbing
-from ..help import helping
+from ..help import helping, metering
 
 logger = help.ogler.getLogger()
 
@@ -150,6 +150,8 @@ class Revery:
         """
         return self.db.prefixes
 
+    @metering.meter.timed("keri_revery_reply_seconds", help="Revery reply processing latency by route",
+                          label=metering.routeLabel)
     def processReply(self, serder, cigars=None, tsgs=None):
         """
          Process one reply message with either attached nontrans signing couples
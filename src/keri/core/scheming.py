@@ -6,9 +6,9 @@ self-addressing and schema support
 """
 
 import json
+from collections import OrderedDict
 
 import cbor2 as cbor
-import jsonschema
 import msgpack
 
 from . import coring
@@ -45,6 +45,7 @@ class CacheResolver:
             return
 
         self.db.schema.pin(key, schemer)
+        validators.get(schemer.sed, resolver=self)  # warm compiled validator
 
     def resolve(self, uri):
         schemer = self.db.schema.get(uri)
@@ -80,9 +81,92 @@ class CacheResolver:
             scer (Optional(bytes)) is the source document that is being processed for reference resolution
 
         """
+        import jsonschema  # deferred since slow to import and only used to validate
+
         return jsonschema.RefResolver("", scer, handlers={"did": self.handler})
 
 
+class ValidatorCache:
+    """ Bounded least recently used cache of compiled jsonschema validators
+
+    Validators are keyed by schema SAID and resolver.  A Schemer verifies the SAID
+    of its schema when loaded so the same SAID means the same schema, which is
+    checked against its metaschema once when compiled instead of on every
+    validation.  A hit must also match the cached schema so a dict claiming the
+    SAID of a different schema is compiled anew.  Schemas without a SAID are
+    compiled on every use.
+
+    Attributes:
+        size (int): max number of cached validators, 0 means do not cache
+        hits (int): number of lookups found in cache
+        misses (int): number of lookups that compiled a validator
+        evictions (int): number of validators evicted
+
+    """
+    Size = 256  # default max number of cached validators
+
+    def __init__(self, size=None):
+        """ Initialize instance
+
+        Parameters:
+            size (int | None): max number of cached validators, None means .Size
+
+        """
+        self.size = size if size is not None else self.Size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._validators = OrderedDict()
+
+    def __len__(self):
+        return len(self._validators)
+
+    def get(self, schema, resolver=None):
+        """ Returns compiled validator for schema, compiling and caching on miss
+
+        Parameters:
+            schema (dict): is the JSON schema with SAID at $id
+            resolver (Optional(CacheResolver)): instance used to resolve external refs
+
+        Raises:
+            jsonschema.exceptions.SchemaError: when schema is not valid JSON Schema
+
+        """
+        said = schema.get(JSONSchema.id_) if isinstance(schema, dict) else None
+        key = (said, resolver)
+        if said and (validator := self._validators.get(key)) is not None:
+            # guard against unverified dict reusing SAID of a different schema
+            if validator.schema is schema or validator.schema == schema:
+                self._validators.move_to_end(key)  # most recently used
+                self.hits += 1
+                return validator
+
+        self.misses += 1
+        import jsonschema  # deferred since slow to import and only used to validate
+
+        klas = jsonschema.validators.validator_for(schema, default=jsonschema.Draft7Validator)
+        klas.check_schema(schema)
+        kwargs = dict()
+        if resolver is not None:
+            kwargs["resolver"] = resolver.resolver(scer=schema)
+        validator = klas(schema, **kwargs)
+
+        if said and self.size:
+            self._validators[key] = validator
+            while len(self._validators) > self.size:
+                self._validators.popitem(last=False)  # least recently used
+                self.evictions += 1
+
+        return validator
+
+    def clear(self):
+        """ Remove all cached validators """
+        self._validators.clear()
+
+
+validators = ValidatorCache()  # module wide cache of compiled schema validators
+
+
 class JSONSchema:
     """ JSON Schema support class
     """
@@ -202,8 +286,10 @@ class JSONSchema:
         Parameters:
             schema (dict): is the JSON schema to verify
         """
+        import jsonschema
+
         try:
-            jsonschema.Draft7Validator.check_schema(schema=schema)
+            validators.get(schema)  # checked once per SAID when compiled
         except jsonschema.exceptions.SchemaError:
             return False
 
@@ -222,12 +308,13 @@ class JSONSchema:
                    if raw is not valid JSON, schema is not valid JSON Schema or
                    the validation fails
         """
+        import jsonschema
+
         try:
             d = json.loads(raw)
-            kwargs = dict()
-            if self.resolver is not None:
-                kwargs["resolver"] = self.resolver.resolver(scer=raw)
-            jsonschema.validate(instance=d, schema=schema, **kwargs)
+            validator = validators.get(schema, resolver=self.resolver)
+            if (error := jsonschema.exceptions.best_match(validator.iter_errors(d))) is not None:
+                raise error
         except jsonschema.exceptions.ValidationError as ex:
             raise kering.ValidationError(f'Credential validation exception: {ex}')
         except jsonschema.exceptions.SchemaError as ex:
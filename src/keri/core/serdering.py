@@ -22,7 +22,7 @@ from ..kering import (Versionage, Version, Vrsn_1_0, Vrsn_1_1,
 from ..kering import Protos, Serials, Rever, versify, deversify, Ilks
 from ..core import coring
 from .coring import MtrDex, DigDex, PreDex, Saids,  Digestage
-from .coring import Matter, Saider, Verfer, Diger, Number, Tholder
+from .coring import Matter, Saider, Verfer, Diger, Number, Tholder, encodeB64
 
 from .. import help
 from ..help import helping
@@ -172,6 +172,7 @@ class Serder:
     InhaleSize = MaxVSOffset + VERFULLSIZE  # min buffer size to inhale
 
     Dummy = "#"  # dummy spaceholder char for said. Must not be a valid Base64 char
+    Splice = True  # verify saids by splicing dummies into raw when possible
 
     # should be same set of codes as in coring.DigestCodex coring.DigDex so
     # .digestive property works. Use unit tests to ensure codex sets match
@@ -522,6 +523,9 @@ class Serder:
                                     f" from {list(saids.keys())} in sad = "
                                     f"{self._sad}.")
 
+        if self.Splice and self._splice(saids):  # fast path verified
+            return
+
         sad = self.sad  # make shallow copy so don't clobber original .sad
         for label in saids.keys():
             try:  # replace default code with code of value from sad
@@ -559,6 +563,63 @@ class Serder:
         # verified successfully since no exception
 
 
+    def _splice(self, saids):
+        """Fast path of ._verify that verifies digestive said(s) by splicing
+        dummy characters into .raw in place of the said values instead of
+        reserializing a dummied copy of .sad. Only used when each said value
+        occurs in .raw just in its said fields. A single serialization of .sad
+        checks that .raw round trips so that the spliced raw is exactly the
+        dummied serialization the said(s) were computed over.
+
+        Returns:
+            verified (bool): True means round trip and all digestive said(s)
+                verified. False means not verified by fast path so use full
+                path of ._verify to verify or raise diagnostic error.
+
+        Parameters:
+            saids (dict): said field labels with default codes
+        """
+        raw = self.raw
+        if self.dumps(self._sad, kind=self.kind) != raw:  # not round trip
+            return False
+
+        digs = {}  # digestive said values keyed by code
+        for label, default in saids.items():
+            said = self._sad[label]
+            if not isinstance(said, str):
+                return False
+            hs = Matter.Hards.get(said[:1])
+            code = said[:hs] if hs else None
+            if code in self.Digests and len(said) == Matter.Sizes[code].fs:
+                digs[said] = code
+            elif default in DigDex:  # valid non digestive value is not dummied
+                try:
+                    Matter(qb64=said)
+                except Exception:
+                    return False  # invalid so full path raises diagnostic error
+
+        for said in digs:
+            ser = said.encode("utf-8")
+            # said also elsewhere in raw, such as in a seal, would be dummied
+            if raw.count(ser) != sum(1 for label in saids if self._sad[label] == said):
+                return False  # so only full path dummies exactly said fields
+            raw = raw.replace(ser, self.Dummy.encode("utf-8") * len(said))
+
+        for said, code in digs.items():
+            klas, size, length = self.Digests[code]  # digest algo size & length
+            ikwa = dict(digest_size=size) if size else dict()
+            dkwa = dict(length=length) if length else dict()
+            dig = klas(raw, **ikwa).digest(**dkwa)
+            ps = (3 - (len(dig) % 3)) % 3  # pad size of fixed size digest code
+            if len(code) % 4 != ps:  # wrong digest size so let full path raise
+                return False
+            # prepad, convert, and replace upfront as in Matter._infil
+            if code.encode("utf-8") + encodeB64(bytes(ps) + dig)[ps:] != said.encode("utf-8"):
+                return False
+
+        return True
+
+
     def makify(self, sad, *, version=None,
                proto=None, vrsn=None, kind=None, ilk=None, saids=None):
         """Makify given sad dict makes the versions string and computes the said
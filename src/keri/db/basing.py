@@ -21,6 +21,8 @@ need to call it
 
 import os
 import shutil
+from collections import OrderedDict
+from itertools import chain
 from contextlib import contextmanager
 from dataclasses import dataclass, asdict, field
 import json
@@ -50,28 +52,71 @@ class dbdict(dict):
     Subclass of dict that has db as attribute and employs read through cache
     from db Baser.stts of kever states to reload kever from state in database
     if not in memory as dict item
+
+    When .cap is not None the cache is bounded to at most .cap kevers in least
+    recently used order. Kevers of local prefixes in .db.prefixes are pinned
+    and never evicted nor counted against .cap. Evicted kevers are reloaded
+    from .db.states on next access. Kevers reloaded for local prefixes are
+    marked local as in Baser.reload.
+
+    Attributes:
+        db (Baser | None): database for read through of kever states
+        cap (int | None): max number of unpinned kevers kept in memory
+            None means unbounded
+        hits (int): number of lookups found in memory
+        misses (int): number of lookups reloaded from .db
+        evictions (int): number of kevers evicted from memory
     """
-    __slots__ = ('db')  # no .__dict__ just for db reference
+    __slots__ = ('db', 'cap', 'hits', 'misses', 'evictions', '_lru')  # no .__dict__
 
-    def __init__(self, *pa, **kwa):
+    def __init__(self, *pa, cap=None, **kwa):
         super(dbdict, self).__init__(*pa, **kwa)
         self.db = None
+        self.cap = cap
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # keys of unpinned kevers least recently used first, pinned kept out
+        self._lru = OrderedDict.fromkeys(self)
 
     def __getitem__(self, k):
         try:
-            return super(dbdict, self).__getitem__(k)
+            val = super(dbdict, self).__getitem__(k)
         except KeyError as ex:
             if not self.db:
                 raise ex  # reraise KeyError
             if (ksr := self.db.states.get(keys=k)) is None:
                 raise ex  # reraise KeyError
             try:
-                kever = eventing.Kever(state=ksr, db=self.db)
+                local = k in self.db.prefixes
+                kever = eventing.Kever(state=ksr, db=self.db,
+                                       prefixes=self.db.prefixes if local else None,
+                                       local=local)
             except kering.MissingEntryError:  # no kel event for keystate
                 raise ex  # reraise KeyError
+            self.misses += 1
             self.__setitem__(k, kever)
             return kever
 
+        self.hits += 1
+        if k in self._lru:  # move to most recently used end
+            self._lru.move_to_end(k)
+        return val
+
+    def __setitem__(self, k, v):
+        super(dbdict, self).__setitem__(k, v)
+        if self.db is not None and k in self.db.prefixes:  # pinned
+            self._lru.pop(k, None)
+        else:
+            self._lru[k] = None
+            self._lru.move_to_end(k)
+            if self.cap is not None:
+                self.prune()
+
+    def __delitem__(self, k):
+        super(dbdict, self).__delitem__(k)
+        self._lru.pop(k, None)
+
     def __contains__(self, k):
         if not super(dbdict, self).__contains__(k):
             try:
@@ -88,6 +133,37 @@ class dbdict(dict):
         else:
             return self.__getitem__(k)
 
+    def pop(self, k, *pa):
+        self._lru.pop(k, None)
+        return super(dbdict, self).pop(k, *pa)
+
+    def clear(self):
+        self._lru.clear()
+        super(dbdict, self).clear()
+
+    def prune(self):
+        """
+        Evict least recently used unpinned kevers until at most .cap remain.
+        Kevers of local prefixes in .db.prefixes are pinned and kept out of
+        the least recently used order so each eviction is constant time
+        regardless of the number of local prefixes. A kever whose prefix
+        became local after it was cached is pinned instead of evicted.
+
+        Returns:
+            count (int): number of kevers evicted
+        """
+        if self.cap is None:
+            return 0
+        count = 0
+        while len(self._lru) > self.cap:
+            k, _ = self._lru.popitem(last=False)
+            if self.db is not None and k in self.db.prefixes:
+                continue  # became local so pinned
+            super(dbdict, self).__delitem__(k)
+            count += 1
+        self.evictions += count
+        return count
+
 
 @dataclass
 class RawRecord:
@@ -209,6 +285,26 @@ class KeyStateRecord(RawRecord):  # baser.state
 
 
 
+@dataclass
+class CheckpointRecord:  # baser.ckps
+    """
+    Checkpoint of the key state of local identifiers written on clean close
+    and periodically so that reload on open may rebuild .kevers of local
+    identifiers from one record instead of from .habs, .nmsp and .states.
+    Only valid while no other write has been committed to the database since,
+    that is, while txn is the last transaction id of the lmdb environment.
+    (see baser.ckps at 'ckps')
+
+    Attributes:
+        v (int): checkpoint format version
+        txn (int): lmdb transaction id of write transaction that stored checkpoint
+        states (list[dict]): key state records as dicts of local identifiers
+    """
+    v: int  # checkpoint format version
+    txn: int  # lmdb transaction id that stored checkpoint
+    states: list = field(default_factory=list)  # KeyStateRecord dicts
+
+
 @dataclass
 class HabitatRecord:  # baser.habs
     """
@@ -502,6 +598,11 @@ class Baser(dbing.LMDBer):
 
         kevers (dict): Kever instances indexed by identifier prefix qb64
         prefixes (OrderedSet): local prefixes corresponding to habitats for this db
+        wakes (dict): escrow table names mapped to set of qb64 identifier
+            prefixes whose escrow branches are retried by the next escrow
+            processing of any Kevery of this db
+        waits (dict): qb64 identifier prefix mapped to set of (escrow name,
+            escrowed prefix) duples of escrow branches waiting on its events
 
         .evts is named sub DB whose values are serialized events
             dgKey
@@ -745,12 +846,20 @@ class Baser(dbing.LMDBer):
             identical message bodies across participants in group multisig body trying
             to reach concensus on events or credentials.
 
+        .ckps is named subDB instance of Komer that holds the CheckpointRecord
+            of key state of local identifiers used by reload while valid.
+            key is .CheckpointKey, value is mgpk serialized CheckpointRecord
+
     Properties:
         kevers (dbdict): read through cache of kevers of states for KELs in db
 
     """
+    KeverCap = None  # max non-local kevers cached in memory, None is unbounded
+    ReplaySize = 65536  # bytes of messages cloned per read transaction in replay
+    CheckpointKey = "kevers"  # key of checkpoint of local key state in .ckps
+    CheckpointVersion = 1  # version of CheckpointRecord format
 
-    def __init__(self, headDirPath=None, reopen=False, **kwa):
+    def __init__(self, headDirPath=None, reopen=False, keverCap=None, **kwa):
         """
         Setup named sub databases.
 
@@ -765,12 +874,16 @@ class Baser(dbing.LMDBer):
                 If not provided use default .HeadDirpath
             mode is int numeric os dir permissions for database directory
             reopen (bool): True means database will be reopened by this init
+            keverCap (int | None): max number of non-local kevers cached in
+                memory by .kevers. None means use .KeverCap
 
 
         """
         self.prefixes = oset()
-        self._kevers = dbdict()
+        self._kevers = dbdict(cap=keverCap if keverCap is not None else self.KeverCap)
         self._kevers.db = self  # assign db for read through cache of kevers
+        self.wakes = dict()  # escrow name keyed sets of woken prefixes
+        self.waits = dict()  # dependency prefix keyed sets of (name, pre)
 
         super(Baser, self).__init__(headDirPath=headDirPath, reopen=reopen, **kwa)
 
@@ -1013,6 +1126,11 @@ class Baser(dbing.LMDBer):
         self.cfld = subing.Suber(db=self,
                                  subkey="cfld.")
 
+        # Inverted index of contact field values for search. Keyed by
+        # field/casefolded value/prefix with prefix as value
+        self.cidx = subing.Suber(db=self,
+                                 subkey="cidx.")
+
         # Global settings for the Habery environment
         self.hbys = subing.Suber(db=self, subkey='hbys.')
         # Signed contact data, keys by prefix
@@ -1049,15 +1167,104 @@ class Baser(dbing.LMDBer):
         # multisig sig embed payload SAID mapped to group multisig participants AIDs
         self.maids = subing.CesrIoSetSuber(db=self, subkey="maids.", klas=coring.Prefixer)
 
+        # checkpoint of key state of local identifiers for fast reload
+        self.ckps = koming.Komer(db=self,
+                                 schema=CheckpointRecord,
+                                 subkey='ckps.',
+                                 kind=coring.Serials.mgpk)
+
         self.reload()
 
         return self.env
 
+    def close(self, clear=False):
+        """
+        Checkpoint key state of local identifiers unless clearing then close
+
+        Parameters:
+           clear (bool): True means clear lmdb directory
+        """
+        if self.env and self.opened and not (clear or self.temp or self.readonly):
+            try:
+                self.checkpoint()
+            except (lmdb.Error, kering.KeriError) as ex:  # stale checkpoint falls back on reload
+                logger.error("Baser %s checkpoint failed: %s", self.path, ex)
+
+        return super(Baser, self).close(clear=clear)
+
+    def checkpoint(self):
+        """
+        Write checkpoint of key state of local identifiers in .habs and .nmsp
+        unless the current checkpoint is still valid. Not written while any
+        local identifier has no key state and is not a group, or has key state
+        without its latest event, since reload must remove it.
+
+        Returns:
+            CheckpointRecord | None: current checkpoint or None if not written
+        """
+        if (ckpt := self.ckps.get(keys=(self.CheckpointKey,))) is not None and \
+                ckpt.v == self.CheckpointVersion and \
+                ckpt.txn == self.env.info()["last_txnid"]:
+            return ckpt  # nothing written since
+
+        with self.txn() as txn:
+            states = []
+            for _, data in chain(self.habs.getItemIter(), self.nmsp.getItemIter()):
+                if (ksr := self.states.get(keys=data.hid)) is not None:
+                    if not self.getEvt(key=dbing.dgKey(pre=ksr.i, dig=ksr.d)):
+                        return None  # no kel event for keystate so removed by reload
+                    states.append(ksr._asdict())
+                elif data.mid is None:  # bare hab removed by reload
+                    return None
+
+            ckpt = CheckpointRecord(v=self.CheckpointVersion, txn=txn.id(), states=states)
+            self.ckps.pin(keys=(self.CheckpointKey,), val=ckpt)
+
+        return ckpt
+
+    def _reloadCheckpoint(self):
+        """
+        Reload stored prefixes and Kevers of local identifiers from checkpoint
+        when checkpoint is valid.
+
+        Returns:
+            bool: True if reloaded from checkpoint. False means checkpoint
+                missing, of other version or stale
+        """
+        ckpt = self.ckps.get(keys=(self.CheckpointKey,))
+        if (ckpt is None or ckpt.v != self.CheckpointVersion or
+                ckpt.txn != self.env.info()["last_txnid"]):
+            return False
+
+        kevers = []
+        try:
+            for state in ckpt.states:
+                kevers.append(eventing.Kever(state=KeyStateRecord._fromdict(state),
+                                             db=self,
+                                             prefixes=self.prefixes,
+                                             local=True,
+                                             verify=False))
+        except (TypeError, ValueError, kering.KeriError) as ex:
+            logger.error("Baser %s invalid checkpoint: %s", self.path, ex)
+            return False
+
+        for kever in kevers:
+            self.kevers[kever.prefixer.qb64] = kever
+            self.prefixes.add(kever.prefixer.qb64)
+
+        return True
+
     def reload(self):
         """
         Reload stored prefixes and Kevers from .habs
 
+        Reloads from checkpoint of key state when still valid. Otherwise
+        reloads from key state of each local identifier in .habs and .nmsp.
+
         """
+        if self._reloadCheckpoint():
+            return
+
         removes = []
         for keys, data in self.habs.getItemIter():
             if (ksr := self.states.get(keys=data.hid)) is not None:
@@ -1186,17 +1393,77 @@ class Baser(dbing.LMDBer):
         """
         Returns iterator of first seen event messages with attachments for the
         identifier prefix pre starting at first seen order number, fn.
-        Essentially a replay in first seen order with attachments
+        Essentially a replay in first seen order with attachments.
+        Messages are cloned in runs of .ReplaySize bytes, each run inside one
+        read transaction. See .clonePreRun
+        """
+        while fn is not None:  # None when FEL exhausted
+            msgs, fn = self.clonePreRun(pre=pre, fn=fn)
+            yield from msgs
+
+    def clonePreRun(self, pre, fn=0, size=None):
+        """
+        Clones a run of first seen event messages with attachments for the
+        identifier prefix pre starting at first seen order number fn. All
+        tables are read inside one read transaction so the FEL cursor and the
+        attachment lookups share one snapshot. Run ends after the first
+        message that brings its total length to at least size bytes.
+        Events that fail to clone are skipped.
+
+        Parameters:
+            pre (str | bytes): identifier prefix
+            fn (int): first seen order number at which to start run
+            size (int | None): bytes of messages in run. None means
+                use .ReplaySize
+
+        Returns:
+            result (tuple): (msgs, fn) where msgs is list of bytearray messages
+                and fn is first seen order number at which to resume with the
+                next run or None when the FEL is exhausted
         """
         if hasattr(pre, 'encode'):
             pre = pre.encode("utf-8")
+        size = size if size is not None else self.ReplaySize
 
-        for fn, dig in self.getFelItemPreIter(pre, fn=fn):
+        msgs = []
+        total = 0
+        with self.txn(write=False):
+            items = self.getFelItemPreIter(pre, fn=fn)
             try:
-                msg = self.cloneEvtMsg(pre=pre, fn=fn, dig=dig)
-            except Exception:
-                continue  # skip this event
-            yield msg
+                for on, dig in items:
+                    fn = on + 1  # resume after this event whether cloned or not
+                    try:
+                        msg = self.cloneEvtMsg(pre=pre, fn=on, dig=dig)
+                    except Exception:
+                        continue  # skip this event
+                    msgs.append(msg)
+                    total += len(msg)
+                    if total >= size:
+                        return (msgs, fn)
+            finally:
+                items.close()  # release cursor before transaction ends
+
+        return (msgs, None)
+
+    def streamPreIter(self, pre, fn=0, size=None):
+        """
+        Returns iterator of (fn, chunk) duples that stream the replay of the
+        FEL of identifier prefix pre starting at first seen order number fn.
+        Each chunk is the concatenated CESR messages with attachments of one
+        run from .clonePreRun. The paired fn is the cursor from which to
+        resume the replay after chunk or None when the run found the FEL
+        exhausted. Empty runs are not yielded. No transaction is held open between chunks.
+
+        Parameters:
+            pre (str | bytes): identifier prefix
+            fn (int): first seen order number from which to start or resume
+            size (int | None): approximate bytes per chunk. None means
+                use .ReplaySize
+        """
+        while fn is not None:  # None when FEL exhausted
+            msgs, fn = self.clonePreRun(pre=pre, fn=fn, size=size)
+            if msgs:
+                yield (fn, b''.join(msgs))
 
     def cloneAllPreIter(self, key=b''):
         """
@@ -1430,7 +1697,7 @@ class Baser(dbing.LMDBer):
             # retrieve last event itself of receipter est evt from sdig
             sraw = self.getEvt(key=dbing.dgKey(pre=prefixer.qb64b, dig=bytes(sdig)))
             # assumes db ensures that sraw must not be none because sdig was in KE
-            sserder = coring.Serder(raw=bytes(sraw))
+            sserder = subing.serders.get(sraw)
             if dig is not None and not sserder.compare(said=dig):  # endorser's dig not match event
                 raise kering.ValidationError("Bad proof sig group at sn = {}"
                                              " for ksn = {}."
@@ -2883,6 +3150,43 @@ class Baser(dbing.LMDBer):
         return self.delIoVal(self.ldes, key, val)
 
 
+class Checkpointer(doing.Doer):
+    """
+    Checkpointer is a Doer that periodically writes the checkpoint of key state
+    of local identifiers of a Baser so that a restart after an unclean shutdown
+    may still reload from it when nothing was written since.
+
+    Attributes:
+        db (Baser): database to checkpoint
+        period (float): seconds between checkpoints
+        due (float | None): tyme of next checkpoint. None means first recur
+            schedules one period out
+
+    """
+
+    def __init__(self, db, period=300.0, **kwa):
+        """
+        Parameters:
+            db (Baser): database to checkpoint
+            period (float): seconds between checkpoints
+        """
+        super(Checkpointer, self).__init__(**kwa)
+        self.db = db
+        self.period = period
+        self.due = None
+
+    def recur(self, tyme):
+        """ Checkpoint when due """
+        if self.due is None:
+            self.due = tyme + self.period
+        elif tyme >= self.due:
+            self.due = tyme + self.period
+            if self.db.opened and not self.db.readonly:
+                self.db.checkpoint()
+
+        return False  # never done
+
+
 class BaserDoer(doing.Doer):
     """
     Basic Baser Doer ( LMDB Database )
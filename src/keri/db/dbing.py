@@ -45,9 +45,11 @@ l
 
 """
 
+import functools
 import os
 import shutil
 import stat
+import threading
 from collections import abc
 from contextlib import contextmanager
 from typing import Union
@@ -59,8 +61,11 @@ from hio.base import filing
 
 from hio.base import filing
 
+from .. import help
 from ..help import helping
 
+logger = help.ogler.getLogger()
+
 ProemSize = 32  # does not include trailing separator
 MaxProem = int("f"*(ProemSize), 16)
 MaxON = int("f"*32, 16)  # largest possible ordinal number, sequence or first seen
@@ -220,6 +225,29 @@ def clearDatabaserDir(path):
         shutil.rmtree(path)
 
 
+def growing(f):
+    """
+    Decorator for LMDBer write methods. Upon lmdb.MapFullError grows the map
+    size of .env with .grow and retries the write. When the write joined an
+    outer transaction from .txn the error is reraised so that .txn may abort
+    the whole transaction before the map is grown. When the grow is deferred
+    by other live transactions the error is reraised.
+    """
+    @functools.wraps(f)
+    def wrapper(self, *pa, **kwa):
+        while True:
+            try:
+                return f(self, *pa, **kwa)
+            except lmdb.MapFullError:
+                if self.active is not None:  # grown by .txn after abort
+                    self._local.full = True  # so .txn aborts even when caught
+                    raise
+                if self.grow() is None:  # raises MapFullError when can't grow
+                    raise  # deferred until live transactions end
+
+    return wrapper
+
+
 @contextmanager
 def openLMDB(*, cls=None, name="test", temp=True, **kwa):
     """
@@ -279,8 +307,16 @@ class LMDBer(filing.Filer):
     Attributes:
         env (lmdb.env): LMDB main (super) database environment
         readonly (bool): True means open LMDB env as readonly
+        mapSize (int): initial map size in bytes of .env when opened
+        mapGrowth (float): geometric growth factor of map size when full
+        mapLimit (int): maximum map size in bytes that map may grow to
+        mapFill (float): fraction of map size in use above which the map is
+            grown before beginning an outer write transaction with .txn
 
     Properties:
+        active (lmdb.Transaction | None): outer transaction opened by .txn
+            in the current thread if any else None
+        highWater (int): high-water mark in bytes of map size used by .env
 
     File/Directory Creation Mode Notes:
         .Perm provides default restricted access permissions to directory and/or files
@@ -306,9 +342,14 @@ class LMDBer(filing.Filer):
     TempSuffix = "_test"
     Perm = stat.S_ISVTX | stat.S_IRUSR | stat.S_IWUSR | stat.S_IXUSR  # 0o1700==960
     MaxNamedDBs = 96
+    MapSize = 104857600  # 100 MB default initial map size
+    MapGrowth = 2.0  # double map size when full
+    MapLimit = 1099511627776  # 1 TB default maximum map size
+    MapFill = 0.9  # grow preemptively when over 90% full
 
 
-    def __init__(self, readonly=False, **kwa):
+    def __init__(self, readonly=False, mapSize=None, mapGrowth=None,
+                 mapLimit=None, mapFill=None, **kwa):
         """
         Setup main database directory at .dirpath.
         Create main database environment at .env using .path.
@@ -342,14 +383,27 @@ class LMDBer(filing.Filer):
 
             readonly (bool): True means open database in readonly mode
                                 False means open database in read/write mode
+            mapSize (int): initial map size in bytes. Default .MapSize
+            mapGrowth (float): map size growth factor. Default .MapGrowth
+            mapLimit (int): maximum map size in bytes. Default .MapLimit
+            mapFill (float): fraction of map used above which map is grown
+                preemptively. Default .MapFill
 
         """
         self.env = None
         self.readonly = True if readonly else False
+        self.mapSize = mapSize if mapSize is not None else self.MapSize
+        self.mapGrowth = mapGrowth if mapGrowth is not None else self.MapGrowth
+        self.mapLimit = mapLimit if mapLimit is not None else self.MapLimit
+        self.mapFill = mapFill if mapFill is not None else self.MapFill
+        self._local = threading.local()  # thread local stack of outer txns
+        self._lock = threading.Lock()  # guards ._live and ._pending
+        self._live = 0  # count of live transactions begun by this instance
+        self._pending = 0  # map size of grow deferred until no live transactions
         super(LMDBer, self).__init__(**kwa)
 
 
-    def reopen(self, readonly=False, **kwa):
+    def reopen(self, readonly=False, mapSize=None, **kwa):
         """
         Open if closed or close and reopen if opened or create and open if not
         if not preexistent, directory path for lmdb at .path and then
@@ -373,14 +427,18 @@ class LMDBer(filing.Filer):
             fext (str): File extension when .filed
             readonly (bool): True means open database in readonly mode
                                 False means open database in read/write mode
+            mapSize (int): initial map size in bytes. None means use .mapSize
+                When the existing database is larger, lmdb uses its size instead
         """
         opened = super(LMDBer, self).reopen(**kwa)
         if readonly is not None:
             self.readonly = readonly
+        if mapSize is not None:
+            self.mapSize = mapSize
 
         # open lmdb major database instance
         # creates files data.mdb and lock.mdb in .dbDirPath
-        self.env = lmdb.open(self.path, max_dbs=self.MaxNamedDBs, map_size=104857600,
+        self.env = lmdb.open(self.path, max_dbs=self.MaxNamedDBs, map_size=self.mapSize,
                              mode=self.perm, readonly=self.readonly)
         self.opened = True if opened and self.env else False
         return self.opened
@@ -403,7 +461,285 @@ class LMDBer(filing.Filer):
         return(super(LMDBer, self).close(clear=clear))
 
 
+    @property
+    def active(self):
+        """
+        Returns:
+            txn (lmdb.Transaction | None): innermost outer transaction opened
+                with .txn in the current thread if any else None
+        """
+        txns = getattr(self._local, "txns", None)
+        return txns[-1][0] if txns else None
+
+
+    @property
+    def highWater(self):
+        """
+        Returns:
+            used (int): high-water mark in bytes of the map used by .env.
+                lmdb reuses freed pages but never lowers its last page number
+        """
+        return (self.env.info()["last_pgno"] + 1) * self.env.stat()["psize"]
+
+
+    def grow(self, size=None):
+        """
+        Grow map size of .env to size or else geometrically by .mapGrowth up
+        to .mapLimit. Since lmdb remaps the memory map and so invalidates all
+        open transactions of .env in every thread, including readonly ones
+        held open by suspended iterators, the grow is deferred while this
+        instance has live transactions and is made when the last one ends.
+
+        Returns:
+            size (int | None): new map size in bytes or None when deferred
+
+        Parameters:
+            size (int | None): new map size in bytes. None means grow current
+                map size by factor .mapGrowth
+
+        Raises:
+            lmdb.MapFullError: when map is already at .mapLimit
+        """
+        current = self.env.info()["map_size"]
+        if size is None:
+            size = min(int(current * self.mapGrowth), self.mapLimit)
+        if size <= current:
+            raise lmdb.MapFullError(f"Map size {current} of {self.path} at "
+                                    f"limit {self.mapLimit}.")
+        with self._lock:
+            if self._live:
+                if size > self._pending:
+                    self._pending = size
+                    logger.info("LMDBer %s deferred growing map size from %d "
+                                "to %d bytes until %d live transactions end.",
+                                self.path, current, size, self._live)
+                return None
+            self._remap(size)
+        return size
+
+
+    def _remap(self, size):
+        """
+        Set map size of .env to size. Caller must hold ._lock with no live
+        transactions.
+
+        Parameters:
+            size (int): new map size in bytes
+        """
+        current = self.env.info()["map_size"]
+        self._pending = 0
+        if size <= current:  # already grown
+            return
+        self.env.set_mapsize(size)
+        logger.info("LMDBer %s grew map size from %d to %d bytes with "
+                    "high-water %d bytes.", self.path, current, size,
+                    self.highWater)
+
+
+    def _begin(self):
+        """
+        Count a live transaction about to begin
+        """
+        with self._lock:
+            self._live += 1
+
+
+    def _end(self):
+        """
+        Count a live transaction ended and make any deferred grow once no
+        live transactions remain
+        """
+        with self._lock:
+            self._live -= 1
+            if not self._live and self._pending:
+                self._remap(self._pending)
+
+
+    def atomic(self, fn, *pa, **kwa):
+        """
+        Calls fn(*pa, **kwa) within one write transaction from .txn and
+        returns its result. Upon lmdb.MapFullError the transaction is aborted,
+        the map is grown and fn is called again in a new transaction until it
+        commits. So fn must redo on retry any in memory changes it makes.
+
+        When called within an outer transaction fn joins it and any
+        lmdb.MapFullError is reraised so that the outermost .atomic or caller
+        of .txn may retry the whole transaction.
+
+        Usage:
+            fn, dts = db.atomic(kever.logEvent, serder=serder, sigers=sigers)
+
+        Returns:
+            result: of fn
+
+        Parameters:
+            fn (Callable): performs the writes of the transaction
+
+        Raises:
+            lmdb.MapFullError: when the map can't grow now because it is at
+                .mapLimit or the grow is deferred by other live transactions
+        """
+        while True:
+            size = self.env.info()["map_size"]
+            try:
+                with self.txn(write=True):
+                    return fn(*pa, **kwa)
+            except lmdb.MapFullError:
+                if self.active is not None:  # outer transaction retries
+                    raise
+                if self.env.info()["map_size"] <= size:  # not grown so can't retry
+                    raise
+
+
+    @contextmanager
+    def txn(self, write=True):
+        """
+        Reentrant thread local transaction context. Every LMDBer database
+        method (and hence every Suber and Komer built on it) called within the
+        context in the same thread transparently joins the outer transaction
+        so that a group of writes is committed atomically with one commit.
+        Commits on normal exit of the outermost context. Aborts on exception.
+
+        Nested contexts join the outermost transaction; they do not commit
+        on their own. A write context may not be nested inside a readonly
+        context.
+
+        Before beginning an outermost write transaction the map is grown when
+        more than .mapFill of it is used. Upon lmdb.MapFullError within the
+        context the transaction is aborted, the map is grown and the error is
+        reraised so that the caller may retry the whole transaction. This
+        holds even when the error was caught within the context, such as by a
+        Parser, since lmdb leaves the transaction unusable. Use .atomic to
+        retry automatically.
+
+        Usage:
+            with db.txn(write=True):
+                db.putEvt(dgkey, raw)
+                db.states.pin(keys=pre, val=ksr)
+
+        Parameters:
+            write (bool): True means read/write transaction
+                          False means readonly snapshot transaction
+
+        Returns:
+            txn (lmdb.Transaction): the active transaction
+        """
+        txns = getattr(self._local, "txns", None)
+        if txns is None:
+            txns = self._local.txns = []
+
+        if txns:  # join outer transaction
+            txn, outer = txns[-1]
+            if write and not outer:
+                raise ValueError("Write transaction may not be nested in a "
+                                 "readonly transaction.")
+            yield txn
+            return
+
+        size = self.env.info()["map_size"]
+        if (write and size < self.mapLimit and
+                self.highWater > self.mapFill * size):
+            self.grow()  # preemptively so whole transaction likely fits
+
+        # buffers=False since a memoryview into a dirty page of a write txn
+        # is invalidated by any later write within the same txn
+        self._begin()
+        try:
+            txn = self.env.begin(write=write, buffers=False)
+        except BaseException:
+            self._end()
+            raise
+        txns.append((txn, write))
+        try:
+            try:
+                yield txn
+            except BaseException:
+                txn.abort()
+                raise
+            else:
+                if getattr(self._local, "full", False):  # error caught within context
+                    txn.abort()
+                    raise lmdb.MapFullError(f"Map of {self.path} full within "
+                                            f"transaction.")
+                txn.commit()
+            finally:
+                self._local.full = False
+                txns.pop()
+                self._end()
+        except lmdb.MapFullError:
+            self.grow()  # so caller may retry, raises when at limit
+            raise
+
+
+    @contextmanager
+    def savepoint(self):
+        """
+        Nested write transaction context within the outer write transaction
+        from .txn in the current thread. Database methods called within the
+        context join the nested transaction. On normal exit its writes are
+        merged into the outer transaction. On exception they are discarded
+        while the earlier writes of the outer transaction are kept.
+
+        Usage:
+            with db.txn(write=True):
+                db.putEvt(dgkey, raw)
+                with db.savepoint():
+                    db.states.pin(keys=pre, val=ksr)  # dropped on exception
+
+        Returns:
+            txn (lmdb.Transaction): the nested transaction
+
+        Raises:
+            ValueError: when there is no outer write transaction
+        """
+        txns = getattr(self._local, "txns", None)
+        if not txns or not txns[-1][1]:
+            raise ValueError("Savepoint requires an outer write transaction.")
+
+        txn = self.env.begin(write=True, parent=txns[-1][0], buffers=False)
+        txns.append((txn, True))
+        try:
+            try:
+                yield txn
+            except BaseException:
+                txn.abort()
+                raise
+            else:
+                if getattr(self._local, "full", False):  # error caught within context
+                    txn.abort()
+                    raise lmdb.MapFullError(f"Map of {self.path} full within "
+                                            f"savepoint.")
+                txn.commit()
+        finally:
+            txns.pop()
+
+
+    @contextmanager
+    def _txn(self, write=False):
+        """
+        Transaction context used by database methods. Joins the active outer
+        transaction from .txn in the current thread when compatible, otherwise
+        begins its own transaction which is committed on exit.
+
+        Parameters:
+            write (bool): True means read/write transaction
+                          False means readonly transaction
+        """
+        txns = getattr(self._local, "txns", None)
+        if txns and (txns[-1][1] or not write):  # outer is write or want read
+            yield txns[-1][0]
+            return
+
+        self._begin()
+        try:
+            with self.env.begin(write=write, buffers=True) as txn:
+                yield txn
+        finally:
+            self._end()
+
+
     # For subdbs with no duplicate values allowed at each key. (dupsort==False)
+    @growing
     def putVal(self, db, key, val):
         """
         Write serialized bytes val to location key in db
@@ -416,14 +752,15 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             val is bytes of value to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._txn(write=True) as txn:
             try:
-                return (txn.put(key, val, overwrite=False))
+                return (txn.put(key, val, overwrite=False, db=db))
             except lmdb.BadValsizeError as ex:
                 raise KeyError(f"Key: `{key}` is either empty, too big (for lmdb),"
                                " or wrong DUPFIXED size. ref) lmdb.BadValsizeError")
 
 
+    @growing
     def setVal(self, db, key, val):
         """
         Write serialized bytes val to location key in db
@@ -435,9 +772,9 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             val is bytes of value to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._txn(write=True) as txn:
             try:
-                return (txn.put(key, val))
+                return (txn.put(key, val, db=db))
             except lmdb.BadValsizeError as ex:
                 raise KeyError(f"Key: `{key}` is either empty, too big (for lmdb),"
                                " or wrong DUPFIXED size. ref) lmdb.BadValsizeError")
@@ -453,14 +790,15 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
 
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._txn(write=False) as txn:
             try:
-                return(txn.get(key))
+                return(txn.get(key, db=db))
             except lmdb.BadValsizeError as ex:
                 raise KeyError(f"Key: `{key}` is either empty, too big (for lmdb),"
                                " or wrong DUPFIXED size. ref) lmdb.BadValsizeError")
 
 
+    @growing
     def delVal(self, db, key):
         """
         Deletes value at key in db.
@@ -470,9 +808,9 @@ class LMDBer(filing.Filer):
             db is opened named sub db with dupsort=False
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._txn(write=True) as txn:
             try:
-                return (txn.delete(key))
+                return (txn.delete(key, db=db))
             except lmdb.BadValsizeError as ex:
                 raise KeyError(f"Key: `{key}` is either empty, too big (for lmdb),"
                                " or wrong DUPFIXED size. ref) lmdb.BadValsizeError")
@@ -480,17 +818,31 @@ class LMDBer(filing.Filer):
 
     def cnt(self, db):
         """
-        Return count of values in db, or zero otherwise
+        Return count of values in db, or zero otherwise. Read from the
+        entries of the db stat so constant time. Includes duplicates when
+        dupsort==True
 
         Parameters:
             db is opened named sub db with dupsort=True
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
-            count = 0
-            for _, _ in cursor:
-                count += 1
-            return count
+        with self._txn(write=False) as txn:
+            return txn.stat(db)["entries"]
+
+
+    def stats(self):
+        """
+        Returns:
+            stats (dict): of environment statistics of lmdb at .env with
+                map_size and used bytes of map, last_txnid of last committed
+                transaction, and num_readers and max_readers of reader slots
+        """
+        info = self.env.info()
+        stat = self.env.stat()
+        return dict(map_size=info["map_size"],
+                    used=(info["last_pgno"] + 1) * stat["psize"],
+                    last_txnid=info["last_txnid"],
+                    num_readers=info["num_readers"],
+                    max_readers=info["max_readers"])
 
 
     def getAllItemIter(self, db, key=b'', split=True, sep=b'.'):
@@ -511,8 +863,8 @@ class LMDBer(filing.Filer):
             split (bool): True means split key at sep before returning
             sep (bytes): separator char for key
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._txn(write=False) as txn:
+            cursor = txn.cursor(db=db)
             if not cursor.set_range(key):  #  moves to val at key >= key, first if empty
                 return  # no values end of db
 
@@ -525,7 +877,7 @@ class LMDBer(filing.Filer):
                 yield tuple(splits)
 
 
-    def getTopItemIter(self, db, key=b''):
+    def getTopItemIter(self, db, key=b'', start=b''):
         """
         Iterates over branch of db given by key
 
@@ -545,10 +897,14 @@ class LMDBer(filing.Filer):
             key (bytes): truncated top key, a key space prefix to get all the items
                         from multiple branches of the key space. If top key is
                         empty then gets all items in database
-        """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
-            if cursor.set_range(key):  # move to val at key >= key if any
+            start (bytes): full or partial key within branch at which to resume
+                        iteration so pages of a large branch may be read without
+                        reading the items before start. Empty means start of
+                        branch
+        """
+        with self._txn(write=False) as txn:
+            cursor = txn.cursor(db=db)
+            if cursor.set_range(max(key, start)):  # move to val at key >= key if any
                 for ckey, cval in cursor.iternext():  # get key, val at cursor
                     ckey = bytes(ckey)
                     if not ckey.startswith(key): #  prev entry if any last in branch
@@ -557,6 +913,7 @@ class LMDBer(filing.Filer):
             return  # done raises StopIteration
 
 
+    @growing
     def delTopVal(self, db, key=b''):
         """
         Deletes all values in branch of db given top key.
@@ -580,9 +937,9 @@ class LMDBer(filing.Filer):
         """
         # when deleting can't use cursor.iternext() because the cursor advances
         # twice (skips one) once for iternext and once for delete.
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._txn(write=True) as txn:
             result = False
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=db)
             if cursor.set_range(key):  # move to val at key >= key if any
                 ckey, cval = cursor.item()
                 while ckey:  # end of database key == b''
@@ -597,6 +954,7 @@ class LMDBer(filing.Filer):
     # For subdbs with no duplicate values allowed at each key. (dupsort==False)
     # and use keys with ordinal as monotonically increasing number part
     # such as sn or fn
+    @growing
     def appendOrdValPre(self, db, pre, val):
         """
         Appends val in order after last previous key with same pre in db.
@@ -615,9 +973,9 @@ class LMDBer(filing.Filer):
         # set key with fn at max and then walk backwards to find last entry at pre
         # if any otherwise zeroth entry at pre
         key = onKey(pre, MaxON)
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._txn(write=True) as txn:
             on = 0  # unless other cases match then zeroth entry at pre
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=db)
             if not cursor.set_range(key):  # max is past end of database
                 #  so either empty database or last is earlier pre or
                 #  last is last entry  at same pre
@@ -662,8 +1020,8 @@ class LMDBer(filing.Filer):
             pre is bytes of itdentifier prefix
             on is int ordinal number to resume replay
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._txn(write=False) as txn:
+            cursor = txn.cursor(db=db)
             key = onKey(pre, on)  # start replay at this enty 0 is earliest
             if not cursor.set_range(key):  #  moves to val at key >= key
                 return  # no values end of db
@@ -690,8 +1048,8 @@ class LMDBer(filing.Filer):
             key is key location in db to resume replay,
                    If empty then start at first key in database
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._txn(write=False) as txn:
+            cursor = txn.cursor(db=db)
             if not cursor.set_range(key):  #  moves to val at key >= key, first if empty
                 return  # no values end of db
 
@@ -708,6 +1066,7 @@ class LMDBer(filing.Filer):
     # size limitation of 511 bytes.
 
 
+    @growing
     def putIoSetVals(self, db, key, vals, *, sep=b'.'):
         """
         Add each val in vals to insertion ordered set of values all with the
@@ -727,10 +1086,10 @@ class LMDBer(filing.Filer):
         """
         result = False
         vals = oset(vals)  # make set
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._txn(write=True) as txn:
             ion = 0
             iokey = suffix(key, ion, sep=sep)  # start zeroth entry if any
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=db)
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 pvals = oset()  # pre-existing vals at key
                 for iokey, val in cursor.iternext():  # get iokey, val at cursor
@@ -751,6 +1110,7 @@ class LMDBer(filing.Filer):
             return result
 
 
+    @growing
     def addIoSetVal(self, db, key, val, *, sep=b'.'):
         """
         Add val to insertion ordered set of values all with the same apparent
@@ -767,11 +1127,11 @@ class LMDBer(filing.Filer):
             val (bytes): serialized value to add
 
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._txn(write=True) as txn:
             vals = oset()
             ion = 0
             iokey = suffix(key, ion, sep=sep)  # start zeroth entry if any
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=db)
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 for iokey, cval in cursor.iternext():  # get iokey, val at cursor
                     ckey, cion = unsuffix(iokey, sep=sep)
@@ -788,6 +1148,7 @@ class LMDBer(filing.Filer):
             return cursor.put(iokey, val, dupdata=False, overwrite=False)
 
 
+    @growing
     def setIoSetVals(self, db, key, vals, *, sep=b'.'):
         """
         Erase all vals at key and then add unique vals as insertion ordered set of
@@ -806,13 +1167,14 @@ class LMDBer(filing.Filer):
         self.delIoSetVals(db=db, key=key, sep=sep)
         result = False
         vals = oset(vals)  # make set
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._txn(write=True) as txn:
             for i, val in enumerate(vals):
                 iokey = suffix(key, i, sep=sep)  # ion is at add on amount
-                result = txn.put(iokey, val, dupdata=False, overwrite=True) or result
+                result = txn.put(iokey, val, dupdata=False, overwrite=True, db=db) or result
             return result
 
 
+    @growing
     def appendIoSetVal(self, db, key, val, *, sep=b'.'):
         """
         Append val to insertion ordered set of values all with the same apparent
@@ -830,8 +1192,8 @@ class LMDBer(filing.Filer):
         """
         ion = 0  # default is zeroth insertion at key
         iokey = suffix(key, ion=MaxSuffix, sep=sep)  # make iokey at max and walk back
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
-            cursor = txn.cursor()  # create cursor to walk back
+        with self._txn(write=True) as txn:
+            cursor = txn.cursor(db=db)  # create cursor to walk back
             if not cursor.set_range(iokey):  # max is past end of database
                 # Three possibilities for max past end of database
                 # 1. last entry in db is for same key
@@ -880,10 +1242,10 @@ class LMDBer(filing.Filer):
             ion (int): starting ordinal value, default 0
 
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._txn(write=False) as txn:
             vals = []
             iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=db)
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 for iokey, val in cursor.iternext():  # get iokey, val at cursor
                     ckey, cion = unsuffix(iokey, sep=sep)
@@ -908,9 +1270,9 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
             ion (int): starting ordinal value, default 0
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._txn(write=False) as txn:
             iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=db)
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 for iokey, val in cursor.iternext():  # get key, val at cursor
                     ckey, cion = unsuffix(iokey, sep=sep)
@@ -920,6 +1282,37 @@ class LMDBer(filing.Filer):
             return  # done raises StopIteration
 
 
+    def getIoSetIonLast(self, db, key, *, sep=b'.'):
+        """
+        Returns:
+            ion (int | None): hidden insertion ordering ordinal of last added
+                entry at apparent effective key if any, otherwise None
+
+        Parameters:
+            db (lmdb._Database): instance of named sub db with dupsort==False
+            key (bytes): Apparent effective key
+        """
+        ion = None  # no last value
+        iokey = suffix(key, ion=MaxSuffix, sep=sep)  # make iokey at max and walk back
+        with self._txn(write=False) as txn:
+            cursor = txn.cursor(db=db)  # create cursor to walk back
+            if not cursor.set_range(iokey):  # max is past end of database
+                if cursor.last():  # not empty db so last is for key or before
+                    ckey, cion = unsuffix(cursor.key(), sep=sep)
+                    if ckey == key:
+                        ion = cion
+            else:  # cursor at max entry at key or at other key after key
+                ckey, cion = unsuffix(cursor.key(), sep=sep)
+                if ckey == key:
+                    ion = cion
+                elif cursor.prev():  # prior entry maybe same or earlier key
+                    ckey, cion = unsuffix(cursor.key(), sep=sep)
+                    if ckey == key:
+                        ion = cion
+
+        return ion
+
+
     def getIoSetValLast(self, db, key, *, sep=b'.'):
         """
         Returns:
@@ -936,8 +1329,8 @@ class LMDBer(filing.Filer):
         val = None
         ion = None  # no last value
         iokey = suffix(key, ion=MaxSuffix, sep=sep)  # make iokey at max and walk back
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()  # create cursor to walk back
+        with self._txn(write=False) as txn:
+            cursor = txn.cursor(db=db)  # create cursor to walk back
             if not cursor.set_range(iokey):  # max is past end of database
                 # Three possibilities for max past end of database
                 # 1. last entry in db is for same key
@@ -987,6 +1380,7 @@ class LMDBer(filing.Filer):
         return len(self.getIoSetVals(db=db, key=key, sep=sep))
 
 
+    @growing
     def delIoSetVals(self, db, key, *, sep=b'.'):
         """
         Deletes all values at apparent effective key.
@@ -1002,9 +1396,9 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
         """
         result = False
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._txn(write=True) as txn:
             iokey = suffix(key, 0, sep=sep)  # start at zeroth value for key
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=db)
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 iokey, cval = cursor.item()
                 while iokey:  # end of database iokey == b'' cant internext.
@@ -1016,6 +1410,7 @@ class LMDBer(filing.Filer):
             return result
 
 
+    @growing
     def delIoSetVal(self, db, key, val, *, sep=b'.'):
         """
         Deletes val at apparent effective key if exists.
@@ -1045,9 +1440,9 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
             val (bytes): value to delete
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._txn(write=True) as txn:
             iokey = suffix(key, 0, sep=sep)  # start zeroth value for key
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=db)
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 for iokey, cval in cursor.iternext():  # get iokey, val at cursor
                     ckey, cion = unsuffix(iokey, sep=sep)
@@ -1071,10 +1466,10 @@ class LMDBer(filing.Filer):
             ion (int): starting ordinal value, default 0
 
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._txn(write=False) as txn:
             items = []
             iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=db)
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 for iokey, val in cursor.iternext():  # get iokey, val at cursor
                     ckey, cion = unsuffix(iokey, sep=sep)
@@ -1099,9 +1494,9 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
             ion (int): starting ordinal value, default 0
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._txn(write=False) as txn:
             iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=db)
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 for iokey, val in cursor.iternext():  # get key, val at cursor
                     ckey, cion = unsuffix(iokey, sep=sep)
@@ -1111,6 +1506,7 @@ class LMDBer(filing.Filer):
             return  # done raises StopIteration
 
 
+    @growing
     def delIoSetIokey(self, db, iokey):
         """
         Deletes val at at actual iokey that includes ordinal key suffix.
@@ -1123,15 +1519,16 @@ class LMDBer(filing.Filer):
             db (lmdb._Database): instance of named sub db with dupsort==False
             iokey (bytes): actual key with ordinal key suffix
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._txn(write=True) as txn:
             try:
-                return txn.delete(iokey)
+                return txn.delete(iokey, db=db)
             except lmdb.BadValsizeError as ex:
                 raise KeyError(f"Key: `{iokey}` is either empty, too big (for lmdb),"
                                " or wrong DUPFIXED size. ref) lmdb.BadValsizeError")
 
 
     # For subdbs that support duplicates at each key (dupsort==True)
+    @growing
     def putVals(self, db, key, vals):
         """
         Write each entry from list of bytes vals to key in db
@@ -1148,17 +1545,18 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             vals is list of bytes of values to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._txn(write=True) as txn:
             result = True
             try:
                 for val in vals:
-                    result = result and txn.put(key, val, dupdata=True)
+                    result = result and txn.put(key, val, dupdata=True, db=db)
             except lmdb.BadValsizeError as ex:
                 raise KeyError(f"Key: `{key}` is either empty, too big (for lmdb),"
                                " or wrong DUPFIXED size. ref) lmdb.BadValsizeError")
             return result
 
 
+    @growing
     def addVal(self, db, key, val):
         """
         Add val bytes as dup to key in db
@@ -1181,9 +1579,9 @@ class LMDBer(filing.Filer):
         dups = set(self.getVals(db, key))  #get preexisting dups if any
         result = False
         if val not in dups:
-            with self.env.begin(db=db, write=True, buffers=True) as txn:
+            with self._txn(write=True) as txn:
                 try:
-                    result = txn.put(key, val, dupdata=True)
+                    result = txn.put(key, val, dupdata=True, db=db)
                 except lmdb.BadValsizeError as ex:
                     raise KeyError(f"Key: `{key}` is either empty, too big (for lmdb),"
                                    " or wrong DUPFIXED size. ref) lmdb.BadValsizeError")
@@ -1202,8 +1600,8 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._txn(write=False) as txn:
+            cursor = txn.cursor(db=db)
             vals = []
             try:
                 if cursor.set_key(key):  # moves to first_dup
@@ -1225,8 +1623,8 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._txn(write=False) as txn:
+            cursor = txn.cursor(db=db)
             val = None
             try:
                 if cursor.set_key(key):  # move to first_dup
@@ -1249,8 +1647,8 @@ class LMDBer(filing.Filer):
             db is opened named sub db with dupsort=True
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._txn(write=False) as txn:
+            cursor = txn.cursor(db=db)
             vals = []
             try:
                 if cursor.set_key(key):  # moves to first_dup
@@ -1269,8 +1667,8 @@ class LMDBer(filing.Filer):
             db is opened named sub db with dupsort=True
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._txn(write=False) as txn:
+            cursor = txn.cursor(db=db)
             count = 0
             try:
                 if cursor.set_key(key):  # moves to first_dup
@@ -1292,8 +1690,8 @@ class LMDBer(filing.Filer):
             db is opened named sub db
             pre is bytes of key within sub db's keyspace pre.on
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._txn(write=False) as txn:
+            cursor = txn.cursor(db=db)
             key = onKey(pre, on)  # start replay at this enty 0 is earliest
             count = 0
             if not cursor.set_range(key):  #  moves to val at key >= key
@@ -1308,6 +1706,7 @@ class LMDBer(filing.Filer):
             return count
 
 
+    @growing
     def delVals(self, db, key, val=b''):
         """
         Deletes all values at key in db if val=b'' else deletes the dup
@@ -1319,9 +1718,9 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             val is bytes of dup val at key to delete
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._txn(write=True) as txn:
             try:
-                return (txn.delete(key, val))
+                return (txn.delete(key, val, db=db))
             except lmdb.BadValsizeError as ex:
                 raise KeyError(f"Key: `{key}` is either empty, too big (for lmdb),"
                                " or wrong DUPFIXED size. ref) lmdb.BadValsizeError")
@@ -1329,6 +1728,7 @@ class LMDBer(filing.Filer):
 
     # For subdbs that support insertion order preserving duplicates at each key.
     # dupsort==True and prepends and strips io val proem
+    @growing
     def putIoVals(self, db, key, vals):
         """
         Write each entry from list of bytes vals to key in db in insertion order
@@ -1355,9 +1755,9 @@ class LMDBer(filing.Filer):
 
         result = False
         dups = set(self.getIoVals(db, key))  #get preexisting dups if any
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._txn(write=True) as txn:
             idx = 0
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=db)
             try:
                 if cursor.set_key(key): # move to key if any
                     if cursor.last_dup(): # move to last dup
@@ -1369,7 +1769,7 @@ class LMDBer(filing.Filer):
             for val in vals:
                 if val not in dups:
                     val = (b'%032x.' % (idx)) +  val  # prepend ordering proem
-                    txn.put(key, val, dupdata=True)
+                    txn.put(key, val, dupdata=True, db=db)
                     idx += 1
                     result = True
         return result
@@ -1403,8 +1803,8 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._txn(write=False) as txn:
+            cursor = txn.cursor(db=db)
             vals = []
             try:
                 if cursor.set_key(key):  # moves to first_dup
@@ -1428,8 +1828,8 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._txn(write=False) as txn:
+            cursor = txn.cursor(db=db)
             vals = []
             try:
                 if cursor.set_key(key):  # moves to first_dup
@@ -1452,8 +1852,8 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._txn(write=False) as txn:
+            cursor = txn.cursor(db=db)
             val = None
             try:
                 if cursor.set_key(key):  # move to first_dup
@@ -1486,8 +1886,8 @@ class LMDBer(filing.Filer):
                     Othewise don't skip for first pass
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._txn(write=False) as txn:
+            cursor = txn.cursor(db=db)
             items = []
             if cursor.set_range(key):  # moves to first_dup at key
                 found = True
@@ -1520,8 +1920,8 @@ class LMDBer(filing.Filer):
                     Othewise don't skip for first pass
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._txn(write=False) as txn:
+            cursor = txn.cursor(db=db)
             if cursor.set_range(key):  # moves to first_dup at key
                 found = True
                 if skip and key and cursor.key() == key:  # skip to next key
@@ -1541,8 +1941,8 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._txn(write=False) as txn:
+            cursor = txn.cursor(db=db)
             count = 0
             try:
                 if cursor.set_key(key):  # moves to first_dup
@@ -1553,6 +1953,7 @@ class LMDBer(filing.Filer):
             return count
 
 
+    @growing
     def delIoVals(self, db, key):
         """
         Deletes all values at key in db if key present.
@@ -1563,14 +1964,15 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._txn(write=True) as txn:
             try:
-                return (txn.delete(key))
+                return (txn.delete(key, db=db))
             except lmdb.BadValsizeError as ex:
                 raise KeyError(f"Key: `{key}` is either empty, too big (for lmdb),"
                                " or wrong DUPFIXED size. ref) lmdb.BadValsizeError")
 
 
+    @growing
     def delIoVal(self, db, key, val):
         """
         Deletes dup io val at key in db. Performs strip search to find match.
@@ -1600,8 +2002,8 @@ class LMDBer(filing.Filer):
             val is bytes of value to be deleted without intersion ordering proem
         """
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._txn(write=True) as txn:
+            cursor = txn.cursor(db=db)
             try:
                 if cursor.set_key(key):  # move to first_dup
                     for proval in cursor.iternext_dup():  #  value with proem
@@ -1631,8 +2033,8 @@ class LMDBer(filing.Filer):
             pre is bytes of itdentifier prefix prepended to sn in key
                 within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._txn(write=False) as txn:
+            cursor = txn.cursor(db=db)
             key = snKey(pre, cnt:=0)
             while cursor.set_key(key):  # moves to first_dup
                 for val in cursor.iternext_dup():
@@ -1661,8 +2063,8 @@ class LMDBer(filing.Filer):
                 within sub db's keyspace
             fn is first
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._txn(write=False) as txn:
+            cursor = txn.cursor(db=db)
             key = snKey(pre, cnt := fn)
             # set_key returns True if exact key else false
             while cursor.set_key(key):  # moves to first_dup if valid key
@@ -1691,8 +2093,8 @@ class LMDBer(filing.Filer):
             pre is bytes of itdentifier prefix prepended to sn in key
                 within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._txn(write=False) as txn:
+            cursor = txn.cursor(db=db)
             key = snKey(pre, cnt:=0)
             while cursor.set_key(key):  # moves to first_dup
                 if cursor.last_dup(): # move to last_dup
@@ -1723,8 +2125,8 @@ class LMDBer(filing.Filer):
             pre is bytes of itdentifier prefix prepended to sn in key
                 within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._txn(write=False) as txn:
+            cursor = txn.cursor(db=db)
             key = snKey(pre, cnt:=0)
             while cursor.set_range(key):  #  moves to first dup of key >= key
                 key = cursor.key()  # actual key
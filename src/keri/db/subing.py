@@ -28,6 +28,9 @@ Other special classer for special values
 
 SerderSuber stores Serialized Serder Instances of in JSON, CBOR, or MGPK
 
+SerderCache is bounded cache of deserialized Serder instances shared by
+SerderSuber and other accessors of serialized events via module instance serders
+
 Also for Secrets private keys
 SignerSuber
 CryptSignerSuber
@@ -39,6 +42,7 @@ CesrDupSuber
 
 """
 from typing import Type, Union
+from collections import OrderedDict
 from collections.abc import Iterable, Iterator
 
 from .. import help
@@ -153,7 +157,8 @@ class SuberBase():
         return (val.decode("utf-8") if hasattr(val, "decode") else val)
 
 
-    def getItemIter(self, keys: Union[str, Iterable]=b""):
+    def getItemIter(self, keys: Union[str, Iterable]=b"", *,
+                    start: Union[str, Iterable]=b""):
         """
         Returns:
             items (Iterator): if (key, val) tuples over the all the items in
@@ -166,9 +171,12 @@ class SuberBase():
                 a full keys tuple in  in order to get all the items from
                 multiple branches of the key space. If keys is empty then gets
                 all items in database.
+            start (Iterator): tuple of bytes or strs of key within branch at
+                which to resume iteration, inclusive. Empty means start of branch
 
         """
-        for key, val in self.db.getTopItemIter(db=self.sdb, key=self._tokey(keys)):
+        for key, val in self.db.getTopItemIter(db=self.sdb, key=self._tokey(keys),
+                                               start=self._tokey(start)):
             yield (self._tokeys(key), self._des(val))
 
 
@@ -1039,6 +1047,85 @@ class CryptSignerSuber(SignerSuber):
                                             transferable=verfer.transferable))
 
 
+class SerderCache:
+    """
+    Bounded least recently used cache of deserialized Serder (or Creder etc)
+    instances keyed by class and raw serialization. The raw serialization
+    embeds the SAID of its event so equal raw means the same already verified
+    event. Evicts least recently used entries once the total size of cached raw
+    serializations exceeds .budget.
+
+    Cached instances are shared so callers must not mutate them nor their
+    .ked or .sad. Functions that hand fields of a cached serder to callers
+    outside keri, such as eventing.loadEvent, return copies of them. Not
+    thread-safe, so the module global instance serders must only be used from
+    one thread such as the hio event loop.
+
+    Attributes:
+        budget (int): max total bytes of cached raw serializations.
+            Zero means do not cache.
+        size (int): total bytes of cached raw serializations
+        hits (int): number of lookups found in cache
+        misses (int): number of lookups deserialized from raw
+        evictions (int): number of entries evicted
+    """
+    Budget = 16777216  # 16 MiB of raw serializations
+
+    def __init__(self, budget=None):
+        """
+        Parameters:
+            budget (int | None): max total bytes of cached raw serializations
+                None means use .Budget
+        """
+        self.budget = budget if budget is not None else self.Budget
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._serders = OrderedDict()
+
+    def __len__(self):
+        return len(self._serders)
+
+    def get(self, raw, klas=coring.Serder):
+        """
+        Returns:
+            serder (Serder): cached instance of klas for raw, deserialized from
+                raw and cached when not found
+
+        Parameters:
+            raw (bytes | bytearray | memoryview): serialization of serder
+            klas (Type[Serder]): class to deserialize raw such as Serder or Creder
+        """
+        raw = bytes(raw)
+        key = (klas, raw)
+        if (serder := self._serders.get(key)) is not None:
+            self._serders.move_to_end(key)  # most recently used
+            self.hits += 1
+            return serder
+
+        self.misses += 1
+        serder = klas(raw=raw)  # raises error when raw is not valid
+        if self.budget:
+            self._serders[key] = serder
+            self.size += len(raw)
+            while self.size > self.budget:
+                (_, eraw), _ = self._serders.popitem(last=False)  # least recently used
+                self.size -= len(eraw)
+                self.evictions += 1
+        return serder
+
+    def clear(self):
+        """
+        Remove all cached entries
+        """
+        self._serders.clear()
+        self.size = 0
+
+
+serders = SerderCache()  # shared cache of deserialized serders
+
+
 class SerderSuber(Suber):
     """
     Sub class of Suber where data is serialized Serder instance
@@ -1107,7 +1194,7 @@ class SerderSuber(Suber):
 
         """
         val = self.db.getVal(db=self.sdb, key=self._tokey(keys))
-        return coring.Serder(raw=bytes(val)) if val is not None else None
+        return serders.get(val) if val is not None else None
 
 
     def rem(self, keys: Union[str, Iterable]):
@@ -1139,7 +1226,7 @@ class SerderSuber(Suber):
 
         """
         for iokey, val in self.db.getTopItemIter(db=self.sdb, key=self._tokey(keys)):
-            yield self._tokeys(iokey), coring.Serder(raw=bytes(val))
+            yield self._tokeys(iokey), serders.get(val)
 
 
 class SchemerSuber(Suber):
@@ -0,0 +1,439 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.help.metering module
+
+Opt in runtime metrics of counters, gauges, and histograms
+
+Module global .meter is the registry that instrumented code records to. It
+is disabled by default so each hook costs one attribute check. Enable with
+meter.enabled = True such as by kli witness start --metrics. Gauges may be
+given a callable so that expensive values such as database statistics are
+only read when the metrics are rendered.
+"""
+import bisect
+import functools
+import time
+from collections import deque
+
+from hio.base import doing
+
+from .. import help
+
+logger = help.ogler.getLogger()
+
+
+class Metric:
+    """
+    Metric is base class of named metrics with optional label names
+
+    Attributes:
+        name (str): metric name such as keri_kevery_event_seconds
+        help (str): description of metric
+        labels (tuple): label names. Label values are given positionally in
+            the same order when recording
+        values (dict): recorded values keyed by tuple of label values
+
+    """
+    Kind = "untyped"  # Prometheus TYPE of metric
+
+    def __init__(self, name, help="", labels=()):
+        """
+        Parameters:
+            name (str): metric name
+            help (str): description of metric
+            labels (Iterable): label names
+        """
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.values = {}
+
+    def items(self):
+        """
+        Returns:
+            items (list): of (labels, value) duples where labels is dict of
+                label values keyed by label name
+        """
+        return [(dict(zip(self.labels, key)), val) for key, val in self.values.items()]
+
+    def clear(self):
+        """ Remove all recorded values """
+        self.values.clear()
+
+
+class Counter(Metric):
+    """
+    Counter is monotonically increasing count such as of events processed
+    """
+    Kind = "counter"
+
+    def inc(self, *labels, amount=1):
+        """
+        Increment count of labels by amount
+
+        Parameters:
+            labels (str): label values in order of .labels
+            amount (int | float): increment
+        """
+        self.values[labels] = self.values.get(labels, 0) + amount
+
+
+class Gauge(Metric):
+    """
+    Gauge is current value such as a queue depth or table size
+
+    Attributes:
+        fn (Callable | None): returns current value when rendered instead of
+            set values. Either a number when there are no labels or a dict of
+            numbers keyed by label value, or tuple of label values
+
+    """
+    Kind = "gauge"
+
+    def __init__(self, name, help="", labels=(), fn=None):
+        """
+        Parameters:
+            name (str): metric name
+            help (str): description of metric
+            labels (Iterable): label names
+            fn (Callable | None): returns current value when read
+        """
+        super(Gauge, self).__init__(name=name, help=help, labels=labels)
+        self.fn = fn
+
+    def set(self, value, *labels):
+        """
+        Set current value of labels
+
+        Parameters:
+            value (int | float): current value
+            labels (str): label values in order of .labels
+        """
+        self.values[labels] = value
+
+    def items(self):
+        """
+        Returns:
+            items (list): of (labels, value) duples read from .fn when any
+        """
+        if self.fn is None:
+            return super(Gauge, self).items()
+
+        try:
+            values = self.fn()
+        except Exception as ex:  # gauge of closed database or similar
+            logger.error("Metric gauge %s read failed: %s", self.name, ex)
+            return []
+
+        if not isinstance(values, dict):
+            return [({}, values)]
+        return [(dict(zip(self.labels, key if isinstance(key, tuple) else (key,))), val)
+                for key, val in values.items()]
+
+
+class Histogram(Metric):
+    """
+    Histogram counts observations such as latencies into fixed buckets and
+    keeps their count and sum
+
+    Attributes:
+        buckets (tuple): sorted upper bounds of buckets. An implicit last
+            bucket holds observations above the largest bound
+        values (dict): of [counts, sum] keyed by tuple of label values where
+            counts is list with one count per bucket, not cumulative
+
+    """
+    Kind = "histogram"
+    Buckets = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+               0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)  # seconds
+
+    def __init__(self, name, help="", labels=(), buckets=None):
+        """
+        Parameters:
+            name (str): metric name
+            help (str): description of metric
+            labels (Iterable): label names
+            buckets (Iterable | None): upper bounds of buckets. None means
+                .Buckets
+        """
+        super(Histogram, self).__init__(name=name, help=help, labels=labels)
+        self.buckets = tuple(sorted(buckets if buckets is not None else self.Buckets))
+
+    def observe(self, value, *labels):
+        """
+        Record observation value of labels
+
+        Parameters:
+            value (int | float): observation
+            labels (str): label values in order of .labels
+        """
+        if (entry := self.values.get(labels)) is None:
+            entry = self.values[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+        entry[0][bisect.bisect_left(self.buckets, value)] += 1
+        entry[1] += value
+
+    def items(self):
+        """
+        Returns:
+            items (list): of (labels, value) duples where value is dict with
+                count, sum, and cumulative counts of buckets keyed by bound
+        """
+        items = []
+        for key, (counts, total) in self.values.items():
+            cumulative, buckets = 0, {}
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                buckets[bound] = cumulative
+            items.append((dict(zip(self.labels, key)),
+                          dict(count=cumulative, sum=total, buckets=buckets)))
+        return items
+
+
+class Meter:
+    """
+    Meter is registry of metrics that instrumented code records to when
+    enabled
+
+    Attributes:
+        enabled (bool): True means hooks record metrics. False means hooks
+            return after checking this attribute only
+        metrics (dict): of Metric instances keyed by name
+
+    """
+
+    def __init__(self, enabled=False):
+        """
+        Parameters:
+            enabled (bool): True means record metrics
+        """
+        self.enabled = True if enabled else False
+        self.metrics = {}
+
+    def _metric(self, klas, name, **kwa):
+        """ Returns existing metric of name else registers new one of klas """
+        if (metric := self.metrics.get(name)) is None:
+            metric = self.metrics[name] = klas(name=name, **kwa)
+        elif not isinstance(metric, klas):
+            raise ValueError(f"Metric {name} already registered as {metric.Kind}.")
+        return metric
+
+    def counter(self, name, help="", labels=()):
+        """
+        Returns:
+            counter (Counter): registered under name, made when missing
+        """
+        return self._metric(Counter, name, help=help, labels=labels)
+
+    def gauge(self, name, help="", labels=(), fn=None):
+        """
+        Returns:
+            gauge (Gauge): registered under name, made when missing. When fn
+                is provided it replaces any prior fn of the gauge
+        """
+        gauge = self._metric(Gauge, name, help=help, labels=labels)
+        if fn is not None:
+            gauge.fn = fn
+        return gauge
+
+    def histogram(self, name, help="", labels=(), buckets=None):
+        """
+        Returns:
+            histogram (Histogram): registered under name, made when missing
+        """
+        return self._metric(Histogram, name, help=help, labels=labels, buckets=buckets)
+
+    def remove(self, name):
+        """ Unregister metric of name if any """
+        self.metrics.pop(name, None)
+
+    def clear(self):
+        """ Remove recorded values of all metrics keeping registrations """
+        for metric in self.metrics.values():
+            metric.clear()
+
+    def timed(self, name, help="", label=None):
+        """
+        Returns decorator that records the seconds each call of the decorated
+        function takes in histogram name with labels kind and outcome. Outcome
+        is "ok" or the class name of the exception raised. Does not time
+        calls when .enabled is False
+
+        Parameters:
+            name (str): histogram name
+            help (str): description of histogram
+            label (Callable | None): called with the arguments of each call
+                returns its kind label value. None means no kind label
+        """
+        def decorator(f):
+            @functools.wraps(f)
+            def wrapper(*pa, **kwa):
+                if not self.enabled:
+                    return f(*pa, **kwa)
+
+                kind = label(*pa, **kwa) if label is not None else ""
+                outcome = "ok"
+                start = time.perf_counter()
+                try:
+                    return f(*pa, **kwa)
+                except Exception as ex:
+                    outcome = type(ex).__name__
+                    raise
+                finally:
+                    self.histogram(name, help=help, labels=("kind", "outcome")).observe(
+                        time.perf_counter() - start, kind, outcome)
+
+            return wrapper
+
+        return decorator
+
+    def snapshot(self):
+        """
+        Returns:
+            snapshot (dict): of current values of all metrics keyed by name
+                such as for JSON serialization
+        """
+        snap = {}
+        for name, metric in self.metrics.items():
+            items = []
+            for labels, value in metric.items():
+                if isinstance(value, dict):  # histogram
+                    value = dict(value, buckets={("+Inf" if bound == float("inf") else str(bound)): cnt
+                                                 for bound, cnt in value["buckets"].items()})
+                items.append(dict(labels=labels, value=value))
+            snap[name] = dict(type=metric.Kind, help=metric.help, values=items)
+        return snap
+
+    def render(self):
+        """
+        Returns:
+            text (str): all metrics in Prometheus text exposition format
+        """
+        lines = []
+        for name, metric in self.metrics.items():
+            lines.append(f"# HELP {name} {metric.help}")
+            lines.append(f"# TYPE {name} {metric.Kind}")
+            for labels, value in metric.items():
+                if isinstance(value, dict):  # histogram
+                    for bound, count in value["buckets"].items():
+                        le = "+Inf" if bound == float("inf") else repr(bound)
+                        lines.append(f"{name}_bucket{_labels(dict(labels, le=le))} {count}")
+                    lines.append(f"{name}_count{_labels(labels)} {value['count']}")
+                    lines.append(f"{name}_sum{_labels(labels)} {value['sum']}")
+                else:
+                    lines.append(f"{name}{_labels(labels)} {value}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(labels):
+    """ Returns Prometheus label set text of labels dict """
+    if not labels:
+        return ""
+    escaped = (str(val).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+               for val in labels.values())
+    return "{" + ",".join(f'{key}="{val}"' for key, val in zip(labels, escaped)) + "}"
+
+
+meter = Meter()  # module global registry
+
+
+def ilkLabel(obj, serder, *pa, **kwa):
+    """ Returns ilk of serder as label of timed process method of obj """
+    return serder.ked["t"]
+
+
+def routeLabel(obj, serder, *pa, **kwa):
+    """ Returns first segment of route of serder as label of timed process
+    method of obj. Later segments may hold identifier prefixes so would make
+    unbounded label values """
+    return "/" + serder.ked.get("r", "").strip("/").split("/")[0]
+
+
+class MeteredDoist(doing.Doist):
+    """
+    MeteredDoist is Doist that records the duration of each run of each of
+    its doers and of each recur through all of them to .meter when enabled.
+    Doers are labeled by class name or by function name for doified
+    functions
+    """
+
+    def __init__(self, mtr=None, **kwa):
+        """
+        Parameters:
+            mtr (Meter | None): registry to record to. None means module
+                global meter
+        """
+        self.meter = mtr if mtr is not None else meter
+        super(MeteredDoist, self).__init__(**kwa)
+
+    def enter(self, doers=None):
+        """ Enter context wrapping each dog so that its runs are timed """
+        deeds = super(MeteredDoist, self).enter(doers=doers)
+        metered = deque((Dog(dog=dog, name=_name(doer), mtr=self.meter), retyme, doer)
+                        for dog, retyme, doer in deeds)
+        deeds.clear()
+        deeds.extend(metered)
+        return deeds
+
+    def recur(self, deeds=None):
+        """ Recur once through deeds recording duration when enabled """
+        if not self.meter.enabled:
+            return super(MeteredDoist, self).recur(deeds=deeds)
+
+        start = time.perf_counter()
+        super(MeteredDoist, self).recur(deeds=deeds)
+        self.meter.histogram("keri_doist_recur_seconds",
+                             help="Duration of each run through all doers").observe(
+            time.perf_counter() - start)
+        self.meter.gauge("keri_doist_doers", help="Number of running doers").set(
+            len(deeds if deeds is not None else self.deeds))
+
+
+class Dog:
+    """
+    Dog wraps doer generator to time each send to it
+
+    Attributes:
+        dog (Generator): wrapped generator
+        name (str): doer label
+        meter (Meter): registry to record to
+    """
+
+    def __init__(self, dog, name, mtr):
+        """
+        Parameters:
+            dog (Generator): doer generator to wrap
+            name (str): doer label
+            mtr (Meter): registry to record to
+        """
+        self.dog = dog
+        self.name = name
+        self.meter = mtr
+
+    def send(self, value):
+        """ Send value to .dog recording duration when .meter enabled """
+        if not self.meter.enabled:
+            return self.dog.send(value)
+
+        start = time.perf_counter()
+        try:
+            return self.dog.send(value)
+        finally:
+            self.meter.histogram("keri_doer_run_seconds", help="Duration of each run of doer",
+                                 labels=("doer",)).observe(time.perf_counter() - start, self.name)
+
+    def close(self):
+        return self.dog.close()
+
+    def throw(self, *pa):
+        return self.dog.throw(*pa)
+
+    def __bool__(self):
+        return True
+
+
+def _name(doer):
+    """ Returns label of doer """
+    if (func := getattr(doer, "__func__", None)) is not None:  # bound method
+        return func.__qualname__
+    return getattr(doer, "__qualname__", type(doer).__name__)
@@ -11,7 +11,7 @@ from hio.help import decking
 from .. import help, kering
 from ..app import habbing
 from ..core import eventing, coring
-from ..help import helping
+from ..help import helping, metering
 from ..kering import ValidationError, MissingSignatureError
 
 ExchangeMessageTimeWindow = timedelta(seconds=300)
@@ -54,6 +54,8 @@ class Exchanger:
 
         self.routes[handler.resource] = handler
 
+    @metering.meter.timed("keri_exchanger_exn_seconds", help="Exchanger exn processing latency by route",
+                          label=metering.routeLabel)
     def processEvent(self, serder, tsgs=None, cigars=None, **kwargs):
         """ Process one serder event with attached indexed signatures representing a Peer to Peer exchange message.
 
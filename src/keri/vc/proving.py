@@ -251,7 +251,7 @@ class CrederSuber(subing.Suber):
 
         """
         val = self.db.getVal(db=self.sdb, key=self._tokey(keys))
-        return Creder(raw=bytes(val)) if val is not None else None
+        return subing.serders.get(val, klas=Creder) if val is not None else None
 
     def rem(self, keys: Union[str, Iterable]):
         """ Removes entry at keys
@@ -276,4 +276,4 @@ class CrederSuber(subing.Suber):
 
         """
         for key, val in self.db.getTopItemIter(db=self.sdb, key=self._tokey(keys)):
-            yield self._tokeys(key), Creder(raw=bytes(val))
+            yield self._tokeys(key), subing.serders.get(val, klas=Creder)
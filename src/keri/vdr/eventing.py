@@ -20,14 +20,14 @@ from .. import help
 from ..core.coring import (MtrDex, Serder, Serials, versify, Prefixer,
                            Ilks, Seqner, Verfer)
 from ..core.eventing import SealEvent, ample, TraitDex, verifySigs, validateSN
-from ..db import basing, dbing
+from ..db import basing, dbing, subing
 from ..db.dbing import dgKey, snKey
-from ..help import helping
+from ..help import helping, metering
 from ..kering import (MissingWitnessSignatureError, Version,
                       MissingAnchorError, ValidationError, OutOfOrderError, LikelyDuplicitousError)
 from ..kering import (VCP_LABELS, VRT_LABELS, ISS_LABELS, BIS_LABELS, REV_LABELS,
                       BRV_LABELS, TSN_LABELS, CRED_TSN_LABELS)
-from ..vdr.viring import Reger
+from ..vdr.viring import Reger, CredStatusRecord
 
 logger = help.ogler.getLogger()
 
@@ -1209,6 +1209,61 @@ class Tever:
         Returns:
             status (Serder): transaction event state notification message
         """
+        if (record := self.reger.vcss.get(keys=vci)) is None:
+            if (record := self.vcRecord(vci)) is None:
+                return None
+            self.reger.vcss.pin(keys=vci, val=record)  # backfill status index
+
+        return vcstate(vcpre=vci,
+                       said=record.d,
+                       sn=record.sn,
+                       ri=record.ri,
+                       dts=record.dt,
+                       eilk=record.et,
+                       ra=record.ra if record.ra is not None else dict(),
+                       a=record.a,
+                       )
+
+    def vcStates(self, saids):
+        """ Bulk state (issued/revoked) of many VCs read in one transaction
+
+        Parameters:
+            saids (Iterable): qb64 VC identifiers
+
+        Returns:
+            states (dict): status Serder, or None if never issued, keyed by
+                VC identifier
+        """
+        with self.reger.txn(write=False):
+            records = {vci: self.reger.vcss.get(keys=vci) for vci in sorted(saids)}
+
+        states = {}
+        for vci, record in records.items():
+            if record is None:  # not indexed so compute and backfill
+                states[vci] = self.vcState(vci)
+                continue
+            states[vci] = vcstate(vcpre=vci,
+                                  said=record.d,
+                                  sn=record.sn,
+                                  ri=record.ri,
+                                  dts=record.dt,
+                                  eilk=record.et,
+                                  ra=record.ra if record.ra is not None else dict(),
+                                  a=record.a,
+                                  )
+        return states
+
+    def vcRecord(self, vci):
+        """ Computes status record of VC from its TEL in db.
+
+        Returns None if never issued from this Registry
+
+        Parameters:
+          vci (str):  qb64 VC identifier
+
+        Returns:
+            record (CredStatusRecord): state of latest TEL event of VC
+        """
         digs = []
         for _, dig in self.reger.getTelItemPreIter(pre=vci.encode("utf-8")):
             digs.append(dig)
@@ -1221,30 +1276,27 @@ class Tever:
 
         dgkey = dbing.dgKey(vci, vcdig)  # get message
         raw = self.reger.getTvt(key=dgkey)
-        serder = coring.Serder(raw=bytes(raw))
+        serder = subing.serders.get(raw)
 
         if self.noBackers:
             vcilk = Ilks.iss if len(digs) == 1 else Ilks.rev
-            ra = dict()
+            ra = None
         else:
             vcilk = Ilks.bis if len(digs) == 1 else Ilks.brv
-            ra = serder.ked["ra"]
+            ra = list(serder.ked["ra"])  # copy not list of shared cached serder
 
-        dgkey = dbing.dgKey(vci, vcdig)
         couple = self.reger.getAnc(dgkey)
         ancb = bytearray(couple)
         seqner = coring.Seqner(qb64b=ancb, strip=True)
         saider = coring.Saider(qb64b=ancb, strip=True)
 
-        return vcstate(vcpre=vci,
-                       said=vcdig.decode("utf-8"),
-                       sn=vcsn,
-                       ri=self.prefixer.qb64,
-                       dts=serder.ked['dt'],
-                       eilk=vcilk,
-                       ra=ra,
-                       a=dict(s=seqner.sn, d=saider.qb64),
-                       )
+        return CredStatusRecord(ri=self.prefixer.qb64,
+                                sn=vcsn,
+                                d=vcdig.decode("utf-8"),
+                                et=vcilk,
+                                dt=serder.ked['dt'],
+                                a=dict(s=seqner.sn, d=saider.qb64),
+                                ra=ra)
 
     def vcSn(self, vci):
         """ Calculates the current seq no of VC from db.
@@ -1258,6 +1310,9 @@ class Tever:
             int: current TEL sequence number of credential or None if not found
 
         """
+        if (record := self.reger.vcss.get(keys=vci)) is not None:
+            return record.sn
+
         cnt = self.reger.cntTels(vci)
 
         return None if cnt == 0 else cnt - 1
@@ -1291,6 +1346,20 @@ class Tever:
         self.reger.tets.pin(keys=(pre.decode("utf-8"), dig.decode("utf-8")), val=coring.Dater())
         self.reger.putTvt(key, serder.raw)
         self.reger.putTel(snKey(pre, sn), dig)
+
+        ilk = serder.ked["t"]
+        if ilk in (Ilks.iss, Ilks.rev, Ilks.bis, Ilks.brv):  # update status index
+            vci = pre.decode("utf-8")
+            record = self.reger.vcss.get(keys=vci)
+            if record is None or sn >= record.sn:
+                self.reger.vcss.pin(keys=vci, val=CredStatusRecord(
+                    ri=self.prefixer.qb64,
+                    sn=sn,
+                    d=dig.decode("utf-8"),
+                    et=ilk,
+                    dt=serder.ked["dt"],
+                    a=dict(s=seqner.sn, d=saider.qb64),
+                    ra=serder.ked["ra"] if ilk in (Ilks.bis, Ilks.brv) else None))
         logger.info("Tever state: %s Added to TEL valid event=\n%s\n",
                     pre, json.dumps(serder.ked, indent=1))
 
@@ -1505,6 +1574,7 @@ class Tevery:
     """
 
     TimeoutTSN = 3600
+    Escrows = ("oots", "twes", "taes")  # escrow tables of .reger
 
     def __init__(self, reger=None, db=None, local=False, lax=False, cues=None, rvy=None):
         """ Initialize instance:
@@ -1543,6 +1613,8 @@ class Tevery:
 
         return self.reger.registries
 
+    @metering.meter.timed("keri_tevery_event_seconds", help="Tevery event processing latency by ilk",
+                          label=metering.ilkLabel)
     def processEvent(self, serder, seqner=None, saider=None, wigers=None):
         """ Process one event serder with attached indexed signatures sigers
 
@@ -1687,7 +1759,7 @@ class Tevery:
                 self.cues.push(dict(kin="reply", route="/tsn/registry", data=tsn.ked, dest=source))
 
                 if vcpre := qry["i"]:
-                    tsn = tever.vcState(vcpre=vcpre)
+                    tsn = tever.vcState(vci=vcpre)
                     self.cues.push(dict(kin="reply", route="/tsn/credential", data=tsn.ked, dest=source))
 
         else:
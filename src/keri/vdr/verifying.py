@@ -150,13 +150,16 @@ class Verifier:
             print(f"Invalid type for edges: {prov}")
             raise kering.ValidationError(f"invalid type for edges: {prov}")
 
+        verified = dict()  # state by (nodeSaid, op) of nodes verified for creder
         for edge in edges:
             for label, node in edge.items():
                 if label in ('d', 'o'):  # SAID or Operator of this edge block
                     continue
                 nodeSaid = node["n"]
                 op = node['o'] if 'o' in node else None
-                state = self.verifyChain(nodeSaid, op, creder.issuer)
+                if (nodeSaid, op) not in verified:
+                    verified[(nodeSaid, op)] = self.verifyChain(nodeSaid, op, creder.issuer)
+                state = verified[(nodeSaid, op)]
                 if state is None:
                     self.escrowMCE(creder, prefixer, seqner, saider)
                     self.cues.append(dict(kin="proof",  said=nodeSaid))
@@ -324,12 +327,16 @@ class Verifier:
         Returns:
             Serder: transaction event state notification message
 
+        A saved node was fully verified, chain included, when it was saved so
+        only the edge itself is checked here. Verification thus scales with
+        edges rather than paths through the chain.
+
         """
         said = self.reger.saved.get(keys=nodeSaid)
         if said is None:
             return None
 
-        creder = self.reger.creds.get(keys=nodeSaid)
+        creder, *_ = self.reger.cloneCred(said=nodeSaid)  # memoized across calls
 
         if op not in ['I2I', 'DI2I', 'NI2I']:
             op = 'I2I' if 'i' in creder.subject else 'NI2I'
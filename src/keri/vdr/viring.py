@@ -8,6 +8,7 @@ Provides public simple Verifiable Credential Issuance/Revocation Registry
 A special purpose Verifiable Data Registry (VDR)
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass
 from  ordered_set import OrderedSet as oset
 
@@ -94,6 +95,22 @@ class RegistryRecord:
     prefix: str
 
 
+@dataclass
+class CredStatusRecord:
+    """ Materialized transaction state of a credential keyed by credential SAID
+
+    Updated by Tever.logEvent on each accepted credential TEL event so that the
+    state notice of a credential is built from one read instead of its TEL.
+    """
+    ri: str  # qb64 registry identifier
+    sn: int  # sequence number of latest TEL event
+    d: str  # qb64 SAID of latest TEL event
+    et: str  # ilk of latest TEL event, one of iss rev bis brv
+    dt: str  # iso8601 datetime of latest TEL event
+    a: dict  # seal of anchoring KEL event with s sn and d SAID
+    ra: dict = None  # registry seal of latest TEL event when backers
+
+
 def openReger(name="test", **kwa):
     """ Returns contextmanager generated by openLMDB but with Baser instance
 
@@ -166,12 +183,16 @@ class Reger(dbing.LMDBer):
         .regs is named subDB instance of Komer that maps registry names to registry keys
             key is habitat name str
             value is serialized RegistryRecord dataclass
+        .vcss is named subDB instance of Komer of materialized credential status
+            key is credential SAID
+            value is serialized CredStatusRecord dataclass of latest TEL event
 
 
     """
     TailDirPath = "keri/reg"
     AltTailDirPath = ".keri/reg"
     TempPrefix = "keri_reg_"
+    CloneSize = 1024  # max credentials memoized by cloneCred across calls
 
     def __init__(self, headDirPath=None, reopen=True, **kwa):
         """
@@ -203,6 +224,7 @@ class Reger(dbing.LMDBer):
         """
 
         self.registries = oset()
+        self.clones = OrderedDict()  # bounded memo of cloneCred by said
         if "db" in kwa:
             self._tevers = RegerDict()
             self._tevers.reger = self  # assign db for read thorugh cache of kevers
@@ -288,6 +310,11 @@ class Reger(dbing.LMDBer):
                                  subkey='regs.',
                                  schema=RegistryRecord, )
 
+        # credential status keyed by credential SAID
+        self.vcss = koming.Komer(db=self,
+                                 subkey='vcss.',
+                                 schema=CredStatusRecord, )
+
         # TEL partial witness escrow
         self.tpwe = subing.CatCesrIoSetSuber(db=self, subkey='tpwe.',
                                              klas=(coring.Prefixer, coring.Seqner, coring.Saider))
@@ -312,48 +339,73 @@ class Reger(dbing.LMDBer):
 
         return self.env
 
-    def cloneCreds(self, saids):
+    def cloneCreds(self, saids, memo=None):
         """ Returns fully expanded credential with chained credentials attached.
 
+        Each unique credential in the chains is hydrated once per call no
+        matter how many paths lead to it. Hydrated credentials are shared so
+        callers must not mutate them.
+
         Parameters:
            saids (list): of Saider objects:
+           memo (dict | None): hydrated credentials by SAID to share across
+               calls. None means memoize for this call only
 
         Returns:
             list: fully hydrated credentials with full chains provided
 
         """
-        creds = []
-        for saider in saids:
-            key = saider.qb64
-            creder, prefixer, seqner, asaider = self.cloneCred(said=key)
-
-            chainSaids = []
-            for k, p in creder.chains.items():
-                if k == "d":
-                    continue
-
-                if not isinstance(p, dict):
-                    continue
-
-                chainSaids.append(coring.Saider(qb64=p["n"]))
-            chains = self.cloneCreds(chainSaids)
-
-            regk = creder.status
-            status = self.tevers[regk].vcState(saider.qb64)
-            cred = dict(
-                sad=creder.crd,
-                pre=creder.issuer,
-                chains=chains,
-                status=status.ked,
-                anchor=dict(
-                    pre=prefixer.qb64,
-                    sn=seqner.sn,
-                    d=asaider.qb64
-                )
+        memo = memo if memo is not None else dict()
+        return [self.hydrate(saider.qb64, memo=memo, path=set()) for saider in saids]
+
+    def hydrate(self, said, memo, path):
+        """ Returns fully expanded credential at said with chained credentials
+        attached, reusing credentials already hydrated in memo.
+
+        Parameters:
+            said (str): qb64 SAID of credential
+            memo (dict): hydrated credentials by SAID
+            path (set): SAIDs of credentials being hydrated that lead to said
+
+        Raises:
+            ValidationError: when the chains of said lead back to said
+        """
+        if (cred := memo.get(said)) is not None:
+            return cred
+
+        if said in path:
+            raise kering.ValidationError(f"Cycle in credential chain at said={said}.")
+
+        creder, prefixer, seqner, asaider = self.cloneCred(said=said)
+
+        path.add(said)
+        chains = []
+        for k, p in creder.chains.items():
+            if k == "d":
+                continue
+
+            if not isinstance(p, dict):
+                continue
+
+            chains.append(self.hydrate(p["n"], memo=memo, path=path))
+        path.remove(said)
+
+        regk = creder.status
+        status = self.tevers[regk].vcState(said)
+        cred = dict(
+            sad=creder.crd,
+            pre=creder.issuer,
+            chains=chains,
+            status=status.ked,
+            anchor=dict(
+                pre=prefixer.qb64,
+                sn=seqner.sn,
+                d=asaider.qb64
             )
+        )
 
-            creds.append(cred)
-        return creds
+        memo[said] = cred
+        return cred
 
     def logCred(self, creder, prefixer, seqner, saider):
         """ Save the base credential and seals (est evt+sigs quad) with no indices.
@@ -368,6 +420,7 @@ class Reger(dbing.LMDBer):
         key = creder.saider.qb64b
         self.cancs.pin(keys=key, val=[prefixer, seqner, saider])
         self.creds.put(keys=key, val=creder)
+        self.clones.pop(creder.said, None)  # anchor may have changed
 
     def cloneCred(self, said):
         """ Load base credential and CESR proof signatures from database.
@@ -377,14 +430,29 @@ class Reger(dbing.LMDBer):
         that path as the root.  This is used to embed the credential in another SAD
         at the location of the specified root.
 
+        Credentials are content addressed so the result is memoized in the
+        bounded .clones across calls until the credential is logged again.
+
         Parameters:
             said(str or bytes): qb64 SAID of credential
 
         """
 
+        if hasattr(said, "decode"):
+            said = said.decode("utf-8")
+
+        if (clone := self.clones.get(said)) is not None:
+            self.clones.move_to_end(said)  # most recently used
+            return clone
+
         creder = self.creds.get(keys=(said,))
         prefixer, seqner, saider = self.cancs.get(keys=(said,))
-        return creder, prefixer, seqner, saider
+        clone = (creder, prefixer, seqner, saider)
+        if creder is not None and self.CloneSize:  # credentials are immutable
+            self.clones[said] = clone
+            while len(self.clones) > self.CloneSize:
+                self.clones.popitem(last=False)  # least recently used
+        return clone
 
     def clonePreIter(self, pre, fn=0):
         """ Iterator of first seen event messages
@@ -445,17 +513,23 @@ class Reger(dbing.LMDBer):
         msg.extend(atc)
         return msg
 
-    def sources(self, db, creder):
+    def sources(self, db, creder, seen=None):
         """ Returns raw bytes of any source ('e') credential that is in our database
 
+        Each unique source credential is included once, at its first position
+        in depth first order, no matter how many chains lead to it.
+
         Parameters:
             db (LMDBer): table to search
             creder (Creder): root credential
+            seen (set | None): SAIDs of credentials already included. None
+                means new set
 
         Returns:
             list: credential sources as resolved from `e` in creder.crd
 
         """
+        seen = seen if seen is not None else {creder.said}
         chains = creder.chains
         saids = []
         for key, source in chains.items():
@@ -469,15 +543,18 @@ class Reger(dbing.LMDBer):
 
         sources = []
         for said in saids:
+            if said in seen:  # shared ancestor or cycle
+                continue
+            seen.add(said)
             screder, prefixer, seqner, saider = self.cloneCred(said=said)
 
             atc = bytearray(coring.Counter(coring.CtrDex.SealSourceTriples, count=1).qb64b)
             atc.extend(prefixer.qb64b)
             atc.extend(seqner.qb64b)
-            atc.extend(saider.qb64)
+            atc.extend(saider.qb64b)
 
             sources.append((screder, atc))
-            sources.extend(self.sources(db, screder))
+            sources.extend(self.sources(db, screder, seen=seen))
 
         return sources
 
@@ -1,10 +1,12 @@
 import os
+import subprocess
+import sys
 
 import multicommand
 import pytest
 
 from keri.app import directing, habbing
-from keri.app.cli import commands
+from keri.app.cli import commands, kli
 from keri.app.cli.common import existing
 from keri.core import coring
 from keri.kering import ValidationError
@@ -291,5 +293,40 @@ def test_incept_and_rotate_opts(helpers, capsys):
     directing.runController(doers=doers)
 
 
+def test_kli_resolve():
+    parser, rest = kli.resolve(["vc", "registry", "incept", "--name", "test"])
+    assert parser.prog == "kli vc registry incept"
+    assert rest == ["--name", "test"]
+    args = parser.parse_args(rest + ["--registry-name", "reg", "--alias", "a"])
+    assert args.handler is not None
+
+    parser, rest = kli.resolve(["vc", "--help"])  # package lists its subcommands
+    assert parser.prog == "kli vc"
+    assert rest == ["--help"]
+
+    parser, rest = kli.resolve(["bogus"])
+    assert parser.prog == "kli"
+    assert rest == ["bogus"]
+    with pytest.raises(SystemExit):
+        parser.parse_args(rest)
+
+    # only the named command module and none of the heavy dependencies are imported
+    code = ("import sys; from keri.app.cli import kli; kli.resolve(['version']); "
+            "print(sorted(m for m in sys.modules if m.startswith('keri.app.cli.commands.')), "
+            "'jsonschema' in sys.modules, 'falcon' in sys.modules)")
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "['keri.app.cli.commands.version'] False False"
+
+
+def test_kli_stats():
+    from keri.app.cli.commands import stats
 
+    assert stats.metricsUrl("http://127.0.0.1:5631") == "http://127.0.0.1:5631/metrics"
+    assert stats.metricsUrl("http://127.0.0.1:5631/", "json") == "http://127.0.0.1:5631/metrics?format=json"
+    assert stats.metricsUrl("https://wit.example/m?x=1") == "https://wit.example/m?x=1"
 
+    parser, rest = kli.resolve(["stats", "--url", "http://127.0.0.1:5631", "--json"])
+    args = parser.parse_args(rest)
+    assert args.url == "http://127.0.0.1:5631"
+    assert args.json is True
+    assert args.name is None
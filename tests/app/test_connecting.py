@@ -155,6 +155,65 @@ def test_organizer():
             org.find(field="company", val="GLEIF")
 
 
+def test_organizer_index():
+    pres = [coring.Diger(ser=b"%d" % i).qb64 for i in range(30)]
+
+    with habbing.openHby(name="test", temp=True) as hby:
+        org = connecting.Organizer(hby=hby, fields=("alias", "company"))
+        for i, pre in enumerate(pres):
+            org.replace(pre=pre, data=dict(alias=f"Contact.{i:02}", company="GLEIF" if i % 3 else "HCF",
+                                           city="Lawrence"))
+
+        found = org.search(field="alias", val="contact.07")
+        assert [d["id"] for d in found] == [pres[7]]
+        assert org.search(field="alias", val="contact.0") == []  # exact needs whole value
+        assert len(org.search(field="alias", val="CONTACT.0", prefix=True)) == 10
+        assert len(org.search(field="company", val="hcf")) == 10
+        with pytest.raises(kering.ConfigurationError):
+            org.search(field="city", val="Lawrence")
+        assert len(org.find(field="city", val="law")) == 30  # unindexed scan
+
+        # paged search resumes after last contact of previous page
+        pages = []
+        page = org.search(field="company", val="gleif", limit=7)
+        while page:
+            pages.append(page)
+            page = org.search(field="company", val="gleif", after=page[-1], limit=7)
+        assert [len(p) for p in pages] == [7, 7, 6]
+        assert sorted(d["id"] for p in pages for d in p) == sorted(pres[i] for i in range(30) if i % 3)
+
+        # updates move index entries
+        org.set(pre=pres[7], field="alias", val="Seven")
+        assert org.search(field="alias", val="contact.07") == []
+        assert [d["id"] for d in org.search(field="alias", val="seven")] == [pres[7]]
+        org.update(pre=pres[7], data=dict(company="HCF"))
+        assert len(org.search(field="company", val="hcf")) == 11
+        org.unset(pre=pres[7], field="alias")
+        assert org.search(field="alias", val="seven") == []
+        org.rem(pre=pres[7])
+        assert len(org.search(field="company", val="hcf")) == 10
+        assert org.values(field="company") == ["GLEIF", "HCF"]
+
+        # long values are truncated in index but matched in full
+        long = "x" * 200
+        org.update(pre=pres[0], data=dict(alias=long))
+        assert [d["id"] for d in org.search(field="alias", val=long)] == [pres[0]]
+        assert org.search(field="alias", val=long + "y") == []
+
+        # paged list in prefix order
+        ordered = sorted(pres[:7] + pres[8:])
+        contacts = org.list(limit=10)
+        assert [d["id"] for d in contacts] == ordered[:10]
+        contacts = org.list(after=contacts[-1]["id"], limit=10)
+        assert [d["id"] for d in contacts] == ordered[10:20]
+        assert [d["id"] for d in org.list(after=contacts[-1]["id"])] == ordered[20:]
+
+        # rebuild index for contacts stored before index existed
+        hby.db.cidx.trim()
+        org = connecting.Organizer(hby=hby, fields=("alias", "company"))
+        assert len(org.search(field="company", val="hcf")) == 10
+
+
 def test_organizer_imgs():
 
     with habbing.openHab(name="test", transferable=True, temp=True) as (hby, hab):
@@ -0,0 +1,155 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.app.importing module
+
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+from keri.app import habbing, importing
+from keri.core import coring
+from keri.db import basing, dbing
+
+
+def test_importer():
+    with habbing.openHby(name="source", temp=True) as hby:
+        habs = [hby.makeHab(name=f"hab{i}") for i in range(5)]
+        for hab in habs:
+            for _ in range(3):
+                hab.interact()
+
+        msgs = [bytes(msg) for msg in hby.db.cloneAllPreIter()]
+        assert len(msgs) == hby.db.cnt(hby.db.fels)
+
+        # first event of last hab moved to end so its other events escrow out of order
+        late = next(i for i, msg in enumerate(msgs) if habs[-1].pre.encode() in msg)
+        msgs.append(msgs.pop(late))
+
+        with basing.openDB(name="target", temp=True) as db:
+            importer = importing.Importer(db=db, size=4)
+            assert importer.kvy.bulk and importer.kvy.cloned
+
+            stats = importer.load(bytearray(b"".join(msgs)))
+            assert stats.msgs == len(msgs)
+            assert stats.events == len(msgs)
+            assert stats.rate > 0.0
+            assert len(importer.kvy.cues) == 0  # no receipt cues
+
+            for hab in habs:
+                kever = db.kevers[hab.pre]
+                assert kever.sn == 3
+                assert kever.serder.said == hab.kever.serder.said
+
+            for hab in habs[:-1]:  # first seen datetimes of source kept when in order
+                dgkey = dbing.dgKey(hab.pre, hab.kever.serder.said)
+                assert bytes(db.getDts(dgkey)) == bytes(hby.db.getDts(dgkey))
+
+            # reimport is idempotent
+            stats = importing.Importer(db=db).load(bytearray(b"".join(msgs)))
+            assert stats.events == 0
+
+        # stream supplied in chunks that split messages
+        stream = b"".join(msgs)
+        with basing.openDB(name="target", temp=True) as db:
+            importer = importing.Importer(db=db, size=4)
+            stats = importer.load(bytearray(), chunks=(stream[i:i + 100]
+                                                       for i in range(0, len(stream), 100)))
+            assert stats.msgs == stats.events == len(msgs)
+            assert stats.failed == 0
+            for hab in habs:
+                assert db.kevers[hab.pre].serder.said == hab.kever.serder.said
+
+
+def test_importer_grow():
+    with habbing.openHby(name="source", temp=True) as hby:
+        habs = [hby.makeHab(name=f"hab{i}") for i in range(10)]
+        for hab in habs:
+            for _ in range(20):
+                hab.interact()
+
+        msgs = [bytes(msg) for msg in hby.db.cloneAllPreIter()]
+        first = [msg for msg in msgs if habs[0].pre.encode() in msg]
+        rest = [msg for msg in msgs if habs[0].pre.encode() not in msg]
+
+        # batch too big for small map so aborted and replayed after map grown
+        with basing.openDB(name="target", temp=True, mapSize=131072) as db:
+            importer = importing.Importer(db=db)
+            importer.load(bytearray(b"".join(first)))
+            kever = db.kevers[habs[0].pre]
+            size = db.env.info()["map_size"]
+            stats = importer.load(bytearray(b"".join(rest)))
+            assert db.env.info()["map_size"] > size
+            assert stats.msgs == len(rest)
+            assert len(msgs) == db.cnt(db.fels)
+            assert db.kevers[habs[0].pre] is kever  # untouched kever kept on retry
+
+            for hab in habs:
+                kever = db.kevers[hab.pre]
+                assert kever.sn == 20
+                assert kever.serder.said == hab.kever.serder.said
+
+
+def test_importer_vouch():
+    with habbing.openHby(name="source", temp=True) as hby:
+        habs = [hby.makeHab(name=f"hab{i}") for i in range(4)]
+        for hab in habs:
+            hab.rotate()
+            for _ in range(2):
+                hab.interact()
+
+        msgs = [bytes(msg) for msg in hby.db.cloneAllPreIter()]
+
+        verified = []  # signatures verified in this process
+        ed25519 = coring.Verfer._ed25519
+
+        def spy(sig, ser, key):
+            verified.append(sig)
+            return ed25519(sig=sig, ser=ser, key=key)
+
+        coring.Verfer._ed25519 = staticmethod(spy)
+        poolMin = coring.Verfer.BatchPoolMin
+        coring.Verfer.BatchPoolMin = 1
+        try:
+            # signatures of each batch verified by pool so none on acceptance
+            with (basing.openDB(name="target", temp=True) as db,
+                  ProcessPoolExecutor(max_workers=2) as pool):
+                importer = importing.Importer(db=db, size=8, pool=pool)
+                signees = importing.Importer(db=db).signees(
+                    importer.record(bytearray(b"".join(msgs[:8]))))
+                assert [len(triples) for triples in signees] == [1] * 8
+
+                stats = importer.load(bytearray(b"".join(msgs)))
+                assert stats.events == len(msgs)
+                assert stats.failed == 0
+                assert verified == []
+                for hab in habs:
+                    assert db.kevers[hab.pre].sn == 3
+        finally:
+            coring.Verfer._ed25519 = staticmethod(ed25519)
+            coring.Verfer.BatchPoolMin = poolMin
+
+        # unexpected error fails its message only, discarding its writes,
+        # and batch still commits
+        with basing.openDB(name="target", temp=True) as db:
+            importer = importing.Importer(db=db)
+            processEvent = importer.kvy.processEvent
+
+            def broken(serder, **kwa):
+                result = processEvent(serder=serder, **kwa)
+                if serder.pre == habs[0].pre:
+                    raise RuntimeError("broken")
+                return result
+
+            importer.kvy.processEvent = broken
+            stats = importer.load(bytearray(b"".join(msgs)))
+            assert stats.msgs == len(msgs)
+            assert stats.failed == 1  # inception, later events escrowed out of order
+            assert stats.events == len(msgs) - 4
+            assert list(db.getFelItemPreIter(habs[0].pre)) == []
+            assert db.getEvt(dbing.dgKey(habs[0].pre, habs[0].pre)) is None  # icp write discarded
+            assert habs[0].pre not in db.kevers
+            for hab in habs[1:]:
+                assert db.kevers[hab.pre].sn == 3
+
+            # stream ending in partial message
+            stats = importing.Importer(db=db).load(bytearray(msgs[0][:-10]))
+            assert stats.msgs == stats.failed == 1
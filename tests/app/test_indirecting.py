@@ -6,6 +6,7 @@ tests.app.indirecting module
 import json
 
 import falcon
+from falcon import testing
 import hio
 import pytest
 from hio.core import tcp, http
@@ -13,6 +14,8 @@ from hio.help import decking
 
 from keri.app import indirecting, storing, habbing
 from keri.core import coring
+from keri.db import basing, dbing
+from keri.help import metering
 
 
 def test_mailbox_iter():
@@ -59,6 +62,19 @@ def test_mailbox_iter():
     assert val == (b'id: 1\nevent: /challenge\nretry: 1000\ndata: {"i": "EA3mbE6upuYnFlx'
                    b'68GmLYCQd7cCcwG_AtHM6dW_GT068", "t": "rct"}\n\n')
 
+    # nothing stored since last read so no topic is read
+    cloned = []
+    cloneTopicIter = mbx.cloneTopicIter
+    mbx.cloneTopicIter = lambda *pa, **kwa: cloned.append(pa) or cloneTopicIter(*pa, **kwa)
+    assert next(mbi) == b''
+    assert cloned == []
+
+    # only advanced topic is read
+    mbx.storeMsg(topic=f"{pre}/multisig", msg=json.dumps(msg).encode("utf-8"))
+    val = next(mbi)
+    assert val.startswith(b'id: 1\nevent: /multisig\n')
+    assert cloned == [(pre + "/multisig", 1)]
+
     # Store a message that does not match any topics
     mbx.storeMsg(topic=f"{pre}/replay", msg=json.dumps(msg).encode("utf-8"))
     val = next(mbi)
@@ -162,6 +178,50 @@ class MockHttpServer:
         self.servant = servant
 
 
+def test_poller_cursors():
+    """
+    Test Poller resumes topics from received events and batches cursor writes
+    """
+    with habbing.openHby(name="pal") as hby:
+        hab = hby.makeHab(name="pal")
+        wit = "BBilc4-L3tFUnfM_wJr4S4OJanAv_VmF_dJNN6vkf2Ha"
+        poller = indirecting.Poller(hab=hab, witness=wit, topics=["/receipt", "/replay"])
+        poller.FlushCount = 3
+        poller.FlushPeriod = 3600.0
+        poller.witrec = basing.TopicsRecord(topics=dict())
+
+        assert not poller.receive(dict(id="", name="/receipt", data="{}"))
+        assert poller.receive(dict(id="4", name="/receipt", data='{"v": 1}'))
+        assert poller.receive(dict(id="5", name="/receipt", data='{"v": 2}'))
+        assert list(poller.msgs) == [b'{"v": 1}', b'{"v": 2}']
+        assert poller.leid == "5"
+        assert not poller.flush()  # not due yet
+        assert hab.db.tops.get((hab.pre, wit)) is None
+
+        assert poller.receive(dict(id="0", name="/replay", data='{"v": 3}'))
+        assert poller.flush()  # FlushCount reached
+        assert hab.db.tops.get((hab.pre, wit)).topics == {"/receipt": 5, "/replay": 0}
+        assert not poller.flush(force=True)  # nothing new
+
+        poller.receive(dict(id="6", name="/receipt", data='{"v": 4}'))
+        assert poller.flush(force=True)
+        assert hab.db.tops.get((hab.pre, wit)).topics == {"/receipt": 6, "/replay": 0}
+
+        # resume query from cursors with last event id
+        client = http.clienting.Client(hostname="127.0.0.1", port=5632)
+        assert not poller.failed(client)
+        poller.query(client)
+        request = client.requests.popleft()
+        assert request["headers"]["Last-Event-ID"] == "6"
+        serder = coring.Serder(raw=request["body"])
+        assert serder.ked["q"]["topics"] == {"/receipt": 7, "/replay": 1}
+
+        client.connector.cutoff = True
+        assert poller.failed(client)
+
+    """End Test"""
+
+
 def test_createHttpServer(monkeypatch):
     port = 5632
     app = falcon.App()
@@ -177,8 +237,49 @@ def test_createHttpServer(monkeypatch):
     assert isinstance(server.servant, MockServerTls)
 
 
+def test_metrics_end():
+    with habbing.openHby(name="wit", temp=True) as hby, \
+            dbing.openLMDB(cls=storing.Mailboxer, name="wit") as mbx:
+        mtr = metering.meter
+        names = set(mtr.metrics)
+        cues = decking.Deck()
+        app = falcon.App()
+        try:
+            indirecting.setupMetrics(app=app, hby=hby, mbx=mbx, queues=dict(witness=cues))
+            assert mtr.enabled
+
+            mbx.storeMsg(topic="EA3mbE6upuYnFlx68GmLYCQd7cCcwG_AtHM6dW_GT068/receipt", msg="msg")
+            cues.extend([dict(kin="receipt"), dict(kin="notice")])
+            hby.makeHab(name="wit")  # recorded by Kevery hook to served meter
+
+            client = testing.TestClient(app=app)
+            rep = client.simulate_get("/metrics")
+            assert rep.status == falcon.HTTP_OK
+            assert rep.headers["content-type"].startswith("text/plain")
+            assert 'keri_cue_depth{queue="witness"} 2\n' in rep.text
+            assert 'keri_escrow_entries{escrow="ooes"} 0\n' in rep.text
+            assert "keri_mailbox_messages 1\n" in rep.text
+            assert 'keri_lmdb_map_bytes{db="baser"}' in rep.text
+            assert 'keri_lmdb_used_bytes{db="mailbox"}' in rep.text
+            assert 'keri_kevery_event_seconds_count{kind="icp",outcome="ok"} 1\n' in rep.text
+
+            rep = client.simulate_get("/metrics", params=dict(format="json"))
+            assert rep.status == falcon.HTTP_OK
+            snap = rep.json
+            assert snap["keri_cue_depth"]["type"] == "gauge"
+            assert snap["keri_cue_depth"]["values"] == [dict(labels=dict(queue="witness"), value=2)]
+            assert snap["keri_lmdb_last_txnid"]["values"][0]["value"] > 0
+        finally:
+            mtr.enabled = False
+            for name in set(mtr.metrics) - names:
+                mtr.remove(name)
+
+
+
 
 
 if __name__ == "__main__":
     test_mailbox_iter()
     test_qrymailbox_iter()
+    test_poller_cursors()
+    test_metrics_end()
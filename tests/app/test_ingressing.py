@@ -0,0 +1,183 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.app.ingressing module
+
+"""
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from keri.app import habbing, ingressing
+from keri.core import coring, eventing, routing
+
+
+def test_preverify():
+    """
+    Test worker side parse and stateless verify of frames
+    """
+    with habbing.openHby(name="pal") as palHby:
+        palHab = palHby.makeHab(name="pal")
+        icp = palHab.makeOwnInception()
+        ixn = palHab.interact()
+
+        results = ingressing.preverify([icp, icp + ixn, ixn[:-10], b''])
+        assert len(results) == 4
+
+        msgs, vouched = results[0]
+        assert len(msgs) == 1
+        ((role, name, pa, kwa),) = msgs[0]
+        assert (role, name) == ("kvy", "processEvent")
+        assert kwa["serder"].ked["t"] == "icp"
+        assert len(vouched) == 1  # icp carries its own keys
+        code, key, sig, ser = vouched[0]
+        assert key == palHab.kever.verfers[0].raw
+        assert ser == icp[:kwa["serder"].size]
+
+        msgs, vouched = results[1]
+        assert len(msgs) == 2
+        assert msgs[1][0][3]["serder"].ked["t"] == "ixn"
+        assert len(vouched) == 1  # ixn needs key state so not vouched
+
+        msgs, vouched = results[2]  # partial message abandoned
+        assert msgs == []
+        assert vouched == []
+
+        assert results[3] == ([], [])
+
+    """End Test"""
+
+
+def test_ingress():
+    """
+    Test Ingress dispatches parsed frames in order with vouched signatures
+    """
+    with habbing.openHby(name="pal") as palHby, habbing.openHby(name="wat") as watHby:
+        palHab = palHby.makeHab(name="pal")
+        frames = [palHab.makeOwnInception()]
+        for i in range(3):
+            frames.append(palHab.interact())
+        frames.append(palHab.rotate())
+        frames.append(palHab.interact())
+
+        kvy = eventing.Kevery(db=watHby.db, lax=False, local=False)
+        pool = ThreadPoolExecutor(max_workers=2)
+        ingress = ingressing.Ingress(kvy=kvy, pool=pool)
+        ingress.BatchSize = 2
+        try:
+            ingress.enter()
+            for frame in frames:
+                ingress.frames.push(frame)
+
+            ingress.submit()
+            assert len(ingress.pending) == 3
+
+            while ingress.pending:
+                ingress.recur(tyme=0.0)
+
+            assert palHab.pre in kvy.kevers
+            kever = kvy.kevers[palHab.pre]
+            assert kever.sn == 5
+            assert kever.serder.said == palHab.kever.serder.said
+            assert coring.Verfer.Vouched  # signatures verified by workers
+
+        finally:
+            ingress.exit()
+            pool.shutdown()
+            coring.Verfer.Vouched.clear()
+
+        # pool injected so not owned
+        assert ingress.pool is pool
+
+    """End Test"""
+
+
+def test_ingress_receipts_replies():
+    """
+    Test Ingress verifies receipt and reply signatures in worker processes
+    """
+    with habbing.openHby(name="pal") as palHby, habbing.openHby(name="wat") as watHby, \
+            habbing.openHby(name="wit") as witHby:
+        palHab = palHby.makeHab(name="pal")
+        witHab = witHby.makeHab(name="wit", transferable=False)
+        icp = palHab.makeOwnInception()
+        icpSerder = palHab.kever.serder
+
+        rct = eventing.receipt(pre=palHab.pre, sn=0, said=icpSerder.said)
+        cigar = witHab.sign(ser=icpSerder.raw, indexed=False)[0]
+        rctMsg = eventing.messagize(serder=rct, cigars=[cigar])
+        rpyMsg = witHab.makeLocScheme(url="http://127.0.0.1:5631", scheme="http")
+        rpySerder = coring.Serder(raw=bytes(rpyMsg))
+
+        rvy = routing.Revery(db=watHby.db)
+        kvy = eventing.Kevery(db=watHby.db, lax=True, local=False, rvy=rvy)
+        kvy.registerReplyRoutes(router=rvy.rtr)
+        pool = ProcessPoolExecutor(max_workers=2)
+        ingress = ingressing.Ingress(kvy=kvy, rvy=rvy, pool=pool)
+        coring.Verfer.Vouched.clear()
+        try:
+            ingress.enter()
+            ingress.frames.push(icp)
+            ingress.submit()
+            while ingress.pending:
+                ingress.recur(tyme=0.0)
+            assert palHab.pre in kvy.kevers
+
+            ingress.frames.push(rctMsg)
+            ingress.frames.push(rpyMsg)
+            ingress.submit()
+            while ingress.pending:
+                ingress.recur(tyme=0.0)
+
+            wit = witHab.kever.verfers[0]
+            assert (wit.code, wit.raw, cigar.raw, bytes(icpSerder.raw)) in coring.Verfer.Vouched
+            rpyItems = [item for item in coring.Verfer.Vouched if item[3] == bytes(rpySerder.raw)]
+            assert len(rpyItems) == 1
+            assert rpyItems[0][:2] == (wit.code, wit.raw)
+
+            rcts = watHby.db.getRcts(eventing.dgKey(palHab.pre, icpSerder.said))
+            assert len(rcts) == 1  # receipt accepted
+            assert watHby.db.locs.get(keys=(witHab.pre, "http")).url == "http://127.0.0.1:5631"
+
+        finally:
+            ingress.exit()
+            pool.shutdown()
+            coring.Verfer.Vouched.clear()
+
+    """End Test"""
+
+
+def test_verfer_vouch():
+    """
+    Test Verfer vouched memo skips verification of vouched signatures
+    """
+    signer = coring.Signer(transferable=True)
+    ser = b"abc"
+    cigar = signer.sign(ser)
+    bad = b"\x00" * 64
+    verfer = signer.verfer
+    try:
+        assert not verfer.verify(bad, ser)
+        coring.Verfer.vouch([(verfer.code, verfer.raw, bad, ser)])
+        assert verfer.verify(bad, ser)  # vouched so not verified
+        assert coring.Verfer.verifyBatch([(verfer, bad, ser),
+                                          (verfer, cigar.raw, ser),
+                                          (verfer, bad, b"abd")]) == [True, True, False]
+
+        VouchCap = coring.Verfer.VouchCap
+        coring.Verfer.VouchCap = 2
+        try:
+            coring.Verfer.vouch([(verfer.code, verfer.raw, cigar.raw, b"x"),
+                                 (verfer.code, verfer.raw, cigar.raw, b"y")])
+            assert len(coring.Verfer.Vouched) == 2
+            assert not verfer.verify(bad, ser)  # oldest evicted
+        finally:
+            coring.Verfer.VouchCap = VouchCap
+    finally:
+        coring.Verfer.Vouched.clear()
+
+    """End Test"""
+
+
+if __name__ == "__main__":
+    test_preverify()
+    test_ingress()
+    test_ingress_receipts_replies()
+    test_verfer_vouch()
@@ -1992,5 +1992,70 @@ def test_manager_sign_dual_indices():
     assert not manager.ks.opened
     """End Test"""
 
+def test_signer_cache():
+    """
+    Test Manager.sign with SignerCache of decrypted signers
+    """
+    salt = coring.Salter(raw=b'0123456789abcdef').qb64
+    cryptsigner = coring.Signer(raw=b'h,#|\x8ap"\x12\xc43t2\xa6\xe1\x18\x19\xf0f2,y\xc4\xc21@\xf5@\x15.\xa2\x1a\xcf',
+                                code=coring.MtrDex.Ed25519_Seed, transferable=False)
+    ser = b'abcdefghijklmnopqrstuvwxyz0123456789'
+
+    with keeping.openKS() as keeper:
+        cache = keeping.SignerCache(size=2)
+        manager = keeping.Manager(ks=keeper, seed=cryptsigner.qb64, salt=salt,
+                                  aeid=cryptsigner.verfer.qb64, cache=cache)
+        assert manager.cache is cache
+        verfers, _ = manager.incept(icount=3, salt=salt, temp=True)
+        pubs = [verfer.qb64 for verfer in verfers]
+
+        sigers = manager.sign(ser, pubs=pubs)
+        assert cache.misses == 3
+        assert cache.hits == 0
+        assert len(cache) == 2  # signers added after signing so none evicted in use
+        assert cache.evictions == 1
+        assert [siger.index for siger in sigers] == [0, 1, 2]
+        assert all(verfer.verify(siger.raw, ser) for verfer, siger in zip(verfers, sigers))
+
+        cigars = manager.sign(ser, verfers=verfers[1:], indexed=False)
+        assert cache.hits == 2
+        assert cache.rate == 2 / 5
+        assert all(verfer.verify(cigar.raw, ser) for verfer, cigar in zip(verfers[1:], cigars))
+        assert ([cigar.qb64 for cigar in cigars] ==  # deterministic
+                [cigar.qb64 for cigar in manager.sign(ser, verfers=verfers[1:], indexed=False)])
+
+        signer = cache.get(pubs[2])
+        assert signer.raw == keeper.pris.get(pubs[2], decrypter=manager.decrypter).raw
+        raw = signer.raw
+        cache.pop(pubs[2])
+        assert signer.raw == b''  # released
+        assert raw == keeper.pris.get(pubs[2], decrypter=manager.decrypter).raw  # not overwritten
+        assert cache.get(pubs[2]) is None
+
+        # lifetime
+        cache.ttl = 0.0
+        manager.sign(ser, pubs=pubs[:1])
+        evictions = cache.evictions
+        assert cache.get(pubs[0]) is None  # expired
+        assert cache.evictions == evictions + 1
+
+        # change of aeid clears cache
+        cache.ttl = None
+        manager.sign(ser, pubs=pubs[:2])
+        assert len(cache) == 2
+        manager.updateAeid(aeid="", seed="")
+        assert len(cache) == 0
+        sigers = manager.sign(ser, pubs=pubs)
+        assert all(verfer.verify(siger.raw, ser) for verfer, siger in zip(verfers, sigers))
+
+        # no cache by default
+        manager = keeping.Manager(ks=keeper, salt=salt)
+        assert manager.cache is None
+        assert [siger.qb64 for siger in manager.sign(ser, pubs=pubs)] == [siger.qb64 for siger in sigers]
+
+    """End Test"""
+
+
 if __name__ == "__main__":
     test_manager_sign_dual_indices()
+    test_signer_cache()
@@ -167,6 +167,45 @@ def test_noter():
 
     cnt = noter.getNoteCnt()
     assert cnt == 13
+    assert noter.getUnreadCnt() == 13
+
+    # keyed pagination resumes after rid of last note on previous page
+    pages = []
+    page = noter.getNotePage(limit=5)
+    while page:
+        pages.append(page)
+        page = noter.getNotePage(after=page[-1][0].rid, limit=5)
+    assert [len(p) for p in pages] == [5, 5, 3]
+    assert [n.rid for p in pages for n, _ in p] == [n.rid for n, _ in noter.getNotes(end=-1)]
+
+    third = pages[0][2][0]
+    page = noter.getNotePage(dt=third.datetime, limit=3)
+    assert [n.rid for n, _ in page] == [n.rid for n, _ in pages[0][2:5]]
+    assert [n.rid for n, _ in noter.getNotes(start=third.datetime, end=1)] == [n.rid for n, _ in pages[0][2:4]]
+
+    # removed cursor note resumes at its datetime
+    assert noter.rem(third.rid) is True
+    page = noter.getNotePage(after=third.rid, dt=third.datetime, limit=2)
+    assert [n.rid for n, _ in page] == [n.rid for n, _ in pages[0][3:5]]
+    assert noter.getNotePage(after=third.rid) == []
+    assert noter.getNoteCnt() == 12
+    assert noter.getUnreadCnt() == 12
+
+    # unread counter follows read state
+    note, cig = pages[0][0]
+    note.read = True
+    assert noter.update(note, cig) is True
+    assert noter.getUnreadCnt() == 11
+    assert noter.update(note, cig) is True
+    assert noter.getUnreadCnt() == 11
+    assert noter.rem(note.rid) is True
+    assert noter.getUnreadCnt() == 11
+    assert noter.getNoteCnt() == 11
+
+    noter.ncnts.trim()
+    assert noter.getUnreadCnt() == 0
+    assert noter.recount() == 11
+    assert noter.getUnreadCnt() == 11
 
 
 def test_notifier():
@@ -207,6 +246,17 @@ def test_notifier():
 
         notes = notifier.getNotes()
         assert len(notes) == 3
+        assert notifier.getUnreadCnt() == 3
+
+        assert notifier.mars(rids=[notes[0].rid, 'ABC']) == 1
+        assert notifier.getUnreadCnt() == 2
+        assert notifier.mars() == 2
+        assert notifier.getUnreadCnt() == 0
+        assert all(note.read for note in notifier.getNotePage())
+
+        assert notifier.rems(rids=[note.rid for note in notes[:2]] + ['ABC']) == 2
+        assert [note.rid for note in notifier.getNotePage(limit=None)] == [notes[2].rid]
+        assert notifier.getNoteCnt() == 1
 
     payload = dict(a=1, b=2, c=3)
     dt = helping.fromIso8601("2022-07-08T15:01:05.453632")
@@ -3,6 +3,7 @@
 tests.peer.mailboxing
 
 """
+import datetime
 import os
 
 import lmdb
@@ -11,7 +12,8 @@ from keri.app import keeping
 from keri.core import coring
 from keri.db import dbing, basing
 from keri.peer import exchanging
-from keri.app.storing import Mailboxer
+from keri.app.storing import Mailboxer, Retention, Sweeper
+from keri.help import helping
 
 
 def test_mailboxing():
@@ -110,5 +112,109 @@ def test_mailboxing():
 
 
 
+def test_mailbox_tails():
+    """
+    Test Mailboxer tail index and stored counter
+    """
+    with dbing.openLMDB(cls=Mailboxer) as mber:
+        topic = b"EAD919wF4oiG7ck6mnBWTRD_Z-Io0wZKCxL0zjx5je9I/receipt"
+        assert mber.tail(topic) == 0
+        assert mber.stored == 0
+
+        for idx in range(3):
+            mber.storeMsg(topic=topic, msg=b"msg%d" % idx)
+        assert mber.tail(topic) == 3
+        assert mber.tail(topic.decode("utf-8")) == 3
+        assert mber.stored == 3
+
+        other = b"EAD919wF4oiG7ck6mnBWTRD_Z-Io0wZKCxL0zjx5je9I/multisig"
+        mber.storeMsg(topic=other, msg=b"other")
+        assert mber.tail(other) == 1
+        assert mber.tail(topic) == 3
+
+        # tail index loaded from database after reopen
+        mber.tails = {}
+        assert mber.tail(topic) == 3
+        assert mber.tail(other) == 1
+        assert mber.getIoSetIonLast(db=mber.tpcs, key=topic) == 2
+        assert mber.getIoSetIonLast(db=mber.tpcs, key=b"unknown") is None
+
+        assert mber.delTopic(key=topic)
+        assert mber.tail(topic) == 0
+
+    """End Test"""
+
+
+def test_mailbox_retention():
+    """
+    Test Mailboxer retention policies, purge, and Sweeper
+    """
+    pre = "EAD919wF4oiG7ck6mnBWTRD_Z-Io0wZKCxL0zjx5je9I"
+    with dbing.openLMDB(cls=Mailboxer) as mber:
+        rct = f"{pre}/receipt"
+        rpy = f"{pre}/reply"
+        for idx in range(5):
+            mber.storeMsg(topic=rct, msg=b"receipt%d" % idx)
+        mber.storeMsg(topic=rpy, msg=b"receipt0")  # shared body
+        assert mber.refs.get(keys=coring.Diger(ser=b"receipt0").qb64b) == "2"
+
+        assert mber.expired() == []  # unlimited by default
+
+        mber.policies["/receipt"] = Retention(count=2)
+        expired = mber.expired()
+        assert [dbing.unsuffix(iokey)[1] for iokey, _ in expired] == [0, 1, 2]
+        assert mber.purge(expired) == (3, 2 * (44 + 8))  # receipt0 still in reply
+        assert [msg for _, _, msg in mber.cloneTopicIter(rct)] == [b"receipt3", b"receipt4"]
+        assert [msg for _, _, msg in mber.cloneTopicIter(rpy)] == [b"receipt0"]
+        assert mber.refs.get(keys=coring.Diger(ser=b"receipt0").qb64b) == "1"
+
+        # acknowledged cursor expires everything below it
+        mber.policies["/receipt"] = Retention(acked=True)
+        mber.ack(rct, 5)
+        mber.ack(rct, 4)  # only advances
+        assert mber.acks.get(keys=rct) == "5"
+        mber.ack(rct, 100)  # clamped to tail so later messages not acknowledged
+        assert mber.acks.get(keys=rct) == "5"
+        assert mber.purge(mber.expired()) == (2, 2 * (44 + 8))
+        assert list(mber.cloneTopicIter(rct)) == []
+        assert mber.tail(rct) == 5  # newest kept as tombstone
+        mber.tails = {}
+        assert mber.tail(rct) == 5
+        assert mber.storeMsg(topic=rct, msg=b"receipt5")
+        assert [(fn, msg) for fn, _, msg in mber.cloneTopicIter(rct)] == [(5, b"receipt5")]
+        assert len(mber.expired()) == 1  # superseded tombstone
+        assert mber.purge(mber.expired()) == (1, 0)
+
+        # age applies by default policy
+        mber.retention = Retention(age=60)
+        later = helping.fromIso8601(helping.nowIso8601()) + datetime.timedelta(seconds=61)
+        assert mber.expired() == []
+        assert len(mber.expired(now=later)) == 1  # reply
+        assert mber.policy(rpy) is mber.retention
+        assert mber.policy(rct) is mber.policies["/receipt"]
+
+        sweeper = Sweeper(mbx=mber, period=10.0)
+        sweeper.BatchSize = 1
+        mber.retention = Retention(count=0)
+        mber.policies = {}
+        sweeper.recur(tyme=0.0)
+        assert len(sweeper.plan) == 2
+        sweeper.recur(tyme=1.0)
+        sweeper.recur(tyme=2.0)
+        assert not sweeper.plan
+        assert sweeper.removed == 2
+        assert sweeper.reclaimed == 2 * (44 + 8)
+        assert mber.msgs.get(keys=coring.Diger(ser=b"receipt0").qb64b) is None
+        sweeper.recur(tyme=3.0)  # not due
+        assert not sweeper.plan
+        sweeper.recur(tyme=10.0)
+        assert len(sweeper.plan) == 0  # only tombstones left
+        assert mber.usage() > 0
+
+    """End Test"""
+
+
 if __name__ == '__main__':
     test_mailboxing()
+    test_mailbox_tails()
+    test_mailbox_retention()
@@ -3,6 +3,7 @@
 tests.core.test_coring module
 
 """
+import concurrent.futures
 import dataclasses
 import hashlib
 import json
@@ -41,7 +42,7 @@ from keri.core.coring import (intToB64, intToB64b, b64ToInt, codeB64ToB2, codeB2
 from keri.help import helping
 from keri.kering import (EmptyMaterialError, RawMaterialError, DerivationError,
                          ShortageError, InvalidCodeSizeError, InvalidVarIndexError,
-                         InvalidValueError, DeserializeError)
+                         InvalidValueError, DeserializeError, UnexpectedCodeError)
 from keri.kering import Version, Versionage, VersionError
 from keri.kering import (ICP_LABELS, DIP_LABELS, ROT_LABELS, DRT_LABELS, IXN_LABELS,
                       KSN_LABELS, RPY_LABELS)
@@ -343,6 +344,48 @@ def test_b64_conversions():
     """End Test"""
 
 
+def test_exfil_tables():
+    """
+    Test precomputed exfil lookup tables and fast path extraction
+    """
+    ords, bords, bizes = coring.exfilTables(Matter.Hards, Matter.Sizes)
+    assert len(ords) == len(bords) == 256
+    for sel, hs in Matter.Hards.items():
+        assert ords[ord(sel)] == hs
+        assert bords[codeB64ToB2(sel)[0]] == hs
+    assert ords[ord('-')] == ords[ord('_')] == 0
+    assert bizes[b'E'] == ('E', 1, 0, 44, 0)
+    assert bizes[b'4B'] == ('4B', 2, 2, None, 0)
+    assert Matter.Ords == ords and Matter.Bizes == bizes
+    assert Counter.Ords[ord('A')] == 2
+    assert Counter.Ords[ord('0')] == 3
+    assert Counter.Ords[ord('-')] == 5
+
+    assert coring.decodeB64b(b'A_-A') == decodeB64(b'A_-A')
+
+    # fast path accepts bytes, bytearray, memoryview, and str alike
+    diger = coring.Diger(ser=b"abc")
+    for qb64b in (diger.qb64b, bytearray(diger.qb64b), memoryview(diger.qb64b),
+                  diger.qb64):
+        matter = Matter(qb64b=qb64b)
+        assert matter.code == MtrDex.Blake3_256
+        assert matter.raw == diger.raw
+        assert isinstance(matter.raw, bytes)
+
+    matter = Matter(raw=b'\x00' * 61, code=MtrDex.Bytes_L0)
+    assert Matter(qb64b=memoryview(matter.qb64b + b'extra')).raw == matter.raw
+    assert Matter(qb2=memoryview(matter.qb2)).qb64 == matter.qb64
+
+    counter = Counter(code=CtrDex.ControllerIdxSigs, count=5)
+    assert Counter(qb64b=memoryview(counter.qb64b)).count == 5
+    with pytest.raises(UnexpectedCodeError):
+        Counter(qb64b=b'-')
+    with pytest.raises(ShortageError):
+        Counter(qb64b=b'-0')
+
+    """End Test"""
+
+
 def test_matter():
     """
     Test Matter class
@@ -3899,6 +3942,40 @@ def test_verfer():
     """ Done Test """
 
 
+def test_verfer_batch():
+    """
+    Test batch verification of signatures with Verfer.verifyBatch
+    """
+    ser = b'abcdefghijklmnopqrstuvwxyz0123456789'
+    signers = generateSigners(salt=b'0123456789abcdef', count=3)
+
+    # secp256r1 signer
+    d = int.from_bytes(b'0123456789abcdef0123456789abcdef', byteorder="big")
+    sigkey = ec.derive_private_key(d, ec.SECP256R1())
+    verkey = sigkey.public_key().public_bytes(encoding=Encoding.X962,
+                                              format=PublicFormat.CompressedPoint)
+    ecverfer = Verfer(raw=verkey, code=MtrDex.ECDSA_256r1)
+    (r, s) = utils.decode_dss_signature(sigkey.sign(ser, ec.ECDSA(hashes.SHA256())))
+    ecsig = r.to_bytes(32, "big") + s.to_bytes(32, "big")
+
+    batch = [(signer.verfer, signer.sign(ser).raw, ser) for signer in signers]
+    batch.append((ecverfer, ecsig, ser))
+    batch.append((signers[0].verfer, signers[1].sign(ser).raw, ser))  # wrong key
+    batch.append((ecverfer, ecsig, b'ABC'))  # wrong ser
+    results = Verfer.verifyBatch(batch)
+    assert results == [True, True, True, True, False, False]
+    assert results == [verfer.verify(sig, ser) for verfer, sig, ser in batch]
+    assert Verfer.verifyBatch([]) == []
+
+    # large batch fans out to pool in chunks and preserves order
+    batch = batch * (Verfer.BatchPoolMin // len(batch) + 1)
+    assert len(batch) >= Verfer.BatchPoolMin
+    with concurrent.futures.ProcessPoolExecutor(max_workers=2) as pool:
+        assert Verfer.verifyBatch(batch, pool=pool) == Verfer.verifyBatch(batch)
+
+    """ Done Test """
+
+
 def test_cigar():
     """
     Test Cigar subclass of CryMat
@@ -6474,6 +6551,7 @@ def test_tholder():
 
 
 if __name__ == "__main__":
+    #test_exfil_tables()
     #test_matter()
     #test_counter()
     #test_prodex()
@@ -1399,6 +1399,94 @@ def test_unverified_trans_receipt_escrow():
     """End Test"""
 
 
+def test_escrow_wakes():
+    """
+    Test Kevery only retries escrow branches woken by new events or receipts
+    """
+    def kel(path, count):  # signed messages of KEL with count events
+        signer = coring.Salter(raw=b'0123456789abcdef').signer(path=path, temp=True)
+        nxt = coring.Salter(raw=b'0123456789abcdef').signer(path=path + "n", temp=True)
+        serder = eventing.incept(keys=[signer.verfer.qb64],
+                                 ndigs=[coring.Diger(ser=nxt.verfer.qb64b).qb64])
+        pre = serder.pre
+        msgs = []
+        for sn in range(count):
+            if sn:
+                serder = eventing.interact(pre=pre, dig=serder.said, sn=sn)
+            siger = signer.sign(ser=serder.raw, index=0)
+            msgs.append(eventing.messagize(serder, sigers=[siger]))
+        return pre, msgs
+
+    apre, amsgs = kel("a", 3)
+    bpre, bmsgs = kel("b", 2)
+
+    with basing.openDB(name="edy") as db:
+        kvy = eventing.Kevery(db=db)
+        psr = parsing.Parser(kvy=kvy)
+
+        retried = []  # prefixes of events retried by escrow processing
+        processEvent = kvy.processEvent
+
+        def spy(serder, sigers, **kwa):
+            if kvy.escrowing:
+                retried.append(serder.pre)
+            return processEvent(serder, sigers, **kwa)
+
+        kvy.processEvent = spy
+
+        psr.parse(ims=bytearray(amsgs[2]))  # out of order for a
+        psr.parse(ims=bytearray(bmsgs[1]))  # out of order for b
+        assert kvy.wakes["ooes"] == {apre, bpre}
+        assert len(kvy.db.getOoes(dbing.snKey(apre, 2))) == 1
+        assert len(kvy.db.getOoes(dbing.snKey(bpre, 1))) == 1
+
+        kvy.processEscrows()  # first call walks all escrows
+        assert sorted(retried) == sorted([apre, bpre])
+        assert kvy.swept is not None
+        assert not kvy.wakes  # own retries do not wake
+
+        retried.clear()
+        kvy.processEscrows()  # nothing woken so nothing retried
+        assert retried == []
+
+        psr.parse(ims=bytearray(amsgs[0]))  # inception of a wakes only a
+        assert apre in kvy.kevers
+        assert kvy.wakes["ooes"] == {apre}
+        kvy.processEscrows()
+        assert retried == [apre]  # still missing sn 1
+        assert kvy.kevers[apre].sn == 0
+
+        retried.clear()
+        psr.parse(ims=bytearray(amsgs[1]))  # accepts sn 1 so sn 2 retried
+        kvy.processEscrows()
+        assert retried == [apre]
+        assert kvy.kevers[apre].sn == 2
+        assert len(kvy.db.getOoes(dbing.snKey(apre, 2))) == 0
+        assert len(kvy.db.getOoes(dbing.snKey(bpre, 1))) == 1  # b untouched
+        assert bpre not in kvy.kevers
+
+        retried.clear()
+        kvy.swept -= kvy.EscrowSweep  # sweep due so walks all escrows again
+        kvy.processEscrows()
+        assert retried == [bpre]
+
+        # dependency accepted by another Kevery of same db wakes escrow
+        retried.clear()
+        other = eventing.Kevery(db=db)
+        assert other.wakes is kvy.wakes is db.wakes
+        parsing.Parser(kvy=other).parse(ims=bytearray(bmsgs[0]))
+        assert other.kevers[bpre].sn == 0
+        assert db.wakes["ooes"] == {bpre}
+        kvy.processEscrows()  # not sweep due yet
+        assert retried == [bpre]
+        assert kvy.kevers[bpre].sn == 1
+        assert len(kvy.db.getOoes(dbing.snKey(bpre, 1))) == 0
+
+    assert not os.path.exists(db.path)
+
+    """End Test"""
+
+
 if __name__ == "__main__":
     test_unverified_receipt_escrow()
 
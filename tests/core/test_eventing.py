@@ -4885,6 +4885,14 @@ def test_load_event(mockHelpingNowUTC):
                                                             'EjYZRkrnty3VfkYhMv-XkGJuY-JWQI'}],
                        'witnesses': ['BAbSj3jfaeJbpuqg0WtvHw31UoRZOnN_RZQYBwbAqteP']}
 
+        # mutating loaded ked does not corrupt shared cached serder
+        evt['ked']['k'].append('bogus')
+        evt['ked']['s'] = '9'
+        ked = eventing.loadEvent(wanHab.db, torHab.pre, torHab.pre)['ked']
+        assert ked['k'] == ['DDgZRj4y6XmkeCsjxLQ-WeAU_U0D3ttTBHW-yicX9hjT']
+        assert ked['s'] == '0'
+        assert wanHab.kevers[torHab.pre].serder.ked['k'] == ked['k']
+
         # Create Tee the delegaTEE and pass to witness Wan
         teeHab = teeHby.makeHab(name="tee", delpre=torHab.pre, icount=1, isith='1', ncount=1, nsith='1',
                                 wits=[wanHab.pre], toad=1)
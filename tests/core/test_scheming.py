@@ -5,10 +5,12 @@ tests keri.core.scheming
 """
 import json
 
+import jsonschema
 import pytest
 
 from keri.core.coring import MtrDex, dumps, Saider, Saids
-from keri.core.scheming import Schemer, JSONSchema, CacheResolver
+from keri.core import scheming
+from keri.core.scheming import Schemer, JSONSchema, CacheResolver, ValidatorCache
 from keri.db import basing
 from keri.kering import ValidationError
 
@@ -294,7 +296,58 @@ def test_resolution():
             schemer.verify(badload)
 
 
+def test_validator_cache():
+    """ Test compiled validators cached by schema SAID """
+    sad = {
+        "$id": "",
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "type": "object",
+        "properties": {"a": {"type": "string"}, "b": {"type": "number"}},
+        "required": ["a"]
+    }
+    _, sad = Saider.saidify(sad=sad, label=Saids.dollar)
+    other = dict(sad, required=["b"])
+    _, other = Saider.saidify(sad=other, label=Saids.dollar)
+
+    cache = ValidatorCache(size=1)
+    validator = cache.get(sad)
+    assert cache.misses == 1 and cache.hits == 0 and len(cache) == 1
+    assert cache.get(dict(sad)) is validator  # equal schema hits
+    assert cache.hits == 1
+
+    forged = dict(other, **{"$id": sad["$id"]})  # same SAID different schema
+    assert cache.get(forged) is not validator
+    assert cache.misses == 2
+
+    cache.get(other)  # evicts least recently used
+    assert cache.evictions == 1 and len(cache) == 1
+    assert cache.get(sad) is not validator
+    assert cache.misses == 4
+
+    unsaid = dict(sad, **{"$id": ""})  # no SAID never cached
+    cache.get(unsaid)
+    assert cache.get(unsaid) is not cache.get(unsaid)
+
+    with pytest.raises(jsonschema.exceptions.SchemaError):
+        cache.get(dict(sad, type=5))
+
+    cache.clear()
+    assert len(cache) == 0
+
+    # verify through module cache compiles schema once
+    scheming.validators.clear()
+    hits = scheming.validators.hits
+    schemer = Schemer(sed=sad)
+    for i in range(5):
+        assert schemer.verify(json.dumps(dict(a="x", b=i)).encode())
+    with pytest.raises(ValidationError):
+        schemer.verify(b'{"b": 1}')
+    assert scheming.validators.hits - hits >= 6
+    assert len(scheming.validators) == 1
+
+
 if __name__ == '__main__':
     test_json_schema()
     test_json_schema_dict()
     test_resolution()
+    test_validator_cache()
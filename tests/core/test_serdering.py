@@ -2269,6 +2269,65 @@ def test_serdery():
 
     """End Test"""
 
+
+def test_serder_splice():
+    """Test splice fast path of Serder._verify"""
+    for kind in (kering.Serials.json, kering.Serials.cbor, kering.Serials.mgpk):
+        serder = SerderKERI(makify=True, ilk=kering.Ilks.icp, kind=kind)
+        saids = dict(serder.Fields[serder.proto][serder.vrsn][serder.ilk].saids)
+        assert serder._splice(saids)  # both 'd' and 'i' saidive
+        assert SerderKERI(raw=serder.raw).said == serder.said
+
+        # same verification result with full path
+        Serder.Splice = False
+        try:
+            assert SerderKERI(raw=serder.raw).said == serder.said
+        finally:
+            Serder.Splice = True
+
+        # tampered said fails both paths
+        said = serder.said
+        raw = serder.raw.replace(said.encode("utf-8"),
+                                 ("E" + "A" * (len(said) - 1)).encode("utf-8"))
+        with pytest.raises(kering.ValidationError):
+            SerderKERI(raw=raw)
+
+    # non digestive prefix in said field
+    sad = serder.sad
+    sad['i'] = 'BDzwEHHzq7K0gzQPYGGwTmuupUhPx5_yZ-Wk1x4ejhcc'
+    serder = SerderKERI(sad=sad, makify=True, kind=kering.Serials.json,
+                        saids={'i': coring.PreDex.Ed25519})
+    saids = dict(serder.Fields[serder.proto][serder.vrsn][serder.ilk].saids)
+    assert serder._splice(saids)
+    assert SerderKERI(raw=serder.raw).pre == sad['i']
+
+    # raw that does not round trip falls back to full path
+    assert b'"kt":"0"' in serder.raw
+    serder._raw = serder.raw.replace(b'"kt":"0"', b'"kt":"1"')
+    assert not serder._splice(saids)
+
+    # said also elsewhere in raw, here a seal of itself, falls back to full
+    # path so is rejected on both paths
+    dummy = Serder.Dummy * 44
+    serder = SerderKERI(makify=True, ilk=kering.Ilks.ixn, kind=kering.Serials.json,
+                        sad=dict(v=serder.sad['v'], t=kering.Ilks.ixn, d="", i=sad['i'],
+                                 s="1", p=sad['d'], a=[dict(d=dummy)]))
+    raw = serder.raw.replace(dummy.encode("utf-8"), serder.said.encode("utf-8"))
+    assert raw.count(serder.said.encode("utf-8")) == 2
+    serder._raw = raw
+    serder._sad = json.loads(raw)
+    saids = dict(serder.Fields[serder.proto][serder.vrsn][serder.ilk].saids)
+    assert not serder._splice(saids)
+    for splice in (True, False):
+        Serder.Splice = splice
+        try:
+            with pytest.raises(kering.ValidationError):
+                SerderKERI(raw=raw)
+        finally:
+            Serder.Splice = True
+
+    """End Test"""
+
 if __name__ == "__main__":
     test_serder()
     test_serderkeri()
@@ -2286,3 +2345,4 @@ if __name__ == "__main__":
     test_serderkeri_vcp()
     test_serderacdc()
     test_serdery()
+    test_serder_splice()
@@ -5,6 +5,8 @@ tests.db.dbing module
 """
 import json
 import os
+import shutil
+import tempfile
 from dataclasses import dataclass, asdict
 
 import lmdb
@@ -1911,6 +1913,61 @@ def test_fetchkeldel():
 
 
 
+def test_clone_pre_run():
+    """
+    Test Baser replay in runs of one read transaction and streamed chunks
+    """
+    with habbing.openHby(name="nat") as hby:
+        hab = hby.makeHab(name="nat")
+        for i in range(5):
+            hab.interact()
+
+        msgs = list(hby.db.clonePreIter(pre=hab.pre))
+        assert len(msgs) == 6
+
+        # small size makes runs of one message each with resume cursor
+        run, fn = hby.db.clonePreRun(pre=hab.pre, fn=0, size=1)
+        assert run == msgs[:1]
+        assert fn == 1
+        run, fn = hby.db.clonePreRun(pre=hab.pre, fn=4, size=1)
+        assert run == msgs[4:5]
+        assert fn == 5
+        run, fn = hby.db.clonePreRun(pre=hab.pre, fn=0)  # default ReplaySize
+        assert run == msgs
+        assert fn is None
+        run, fn = hby.db.clonePreRun(pre=hab.pre, fn=6)
+        assert run == []
+        assert fn is None
+
+        # runs never hold a transaction between them
+        ReplaySize = hby.db.ReplaySize
+        hby.db.ReplaySize = 1
+        try:
+            assert list(hby.db.clonePreIter(pre=hab.pre, fn=2)) == msgs[2:]
+        finally:
+            hby.db.ReplaySize = ReplaySize
+
+        chunks = list(hby.db.streamPreIter(pre=hab.pre, size=1))
+        assert [chunk for _, chunk in chunks] == msgs
+        assert [fn for fn, _ in chunks] == [1, 2, 3, 4, 5, 6]
+        chunks = list(hby.db.streamPreIter(pre=hab.pre))
+        assert chunks == [(None, b''.join(msgs))]
+
+        # resume from a cursor
+        fn = 3
+        assert (b''.join(chunk for _, chunk in hby.db.streamPreIter(pre=hab.pre, fn=fn))
+                == b''.join(msgs[fn:]))
+
+        assert list(hby.db.streamPreIter(pre=hab.pre, fn=6)) == []
+
+        # replay from streamed chunk yields same key state
+        with habbing.openHby(name="bob") as bobHby:
+            bobHby.psr.parse(ims=bytearray(chunks[0][1]))
+            assert bobHby.kevers[hab.pre].sn == 5
+
+    """End Test"""
+
+
 def test_usebaser():
     """
     Test using Baser
@@ -2165,6 +2222,81 @@ def test_dbdict():
 
 
 
+    """End Test"""
+
+
+def test_dbdict_cap():
+    """
+    Test bounded least recently used dbdict with pinned local prefixes and
+    lazily materialized kevers
+    """
+    with basing.openDB(name="nat", keverCap=2) as db:
+        dbd = db.kevers
+        assert dbd.cap == 2
+        salter = coring.Salter(raw=b'0123456789abcdef')
+        pres = []
+        for i in range(4):  # put key states and events for 4 prefixes
+            pre = salter.signer(path=f"{i}", temp=True).verfer.qb64
+            dig = 'EAskHI462CuIMS_gNkcl_QewzrRSKH2p9zHQIO132Z30'
+            serder = eventing.interact(pre=pre, dig=dig, sn=4)
+            eevt = eventing.StateEstEvent(s='3', d=dig, br=[], ba=[])
+            state = eventing.state(pre=pre, sn=4, pig=dig, dig=serder.said, fn=4,
+                                   eilk=coring.Ilks.ixn, keys=[pre], eevt=eevt)
+            db.putEvt(key=eventing.dgKey(pre=pre, dig=serder.said), val=serder.raw)
+            db.states.pin(keys=pre, val=state)
+            pres.append(pre)
+
+        db.prefixes.add(pres[0])  # local so pinned
+        for pre in pres:
+            assert dbd[pre].prefixer.qb64 == pre  # read through
+        assert dbd.misses == 4
+        assert dbd.evictions == 1
+        assert list(dbd.keys()) == [pres[0], pres[2], pres[3]]  # pres[1] evicted
+        assert list(dbd._lru) == [pres[2], pres[3]]  # pinned kept out
+
+        assert dbd[pres[2]]  # hit moves to most recently used
+        assert dbd[pres[0]]  # hit on pinned
+        assert dbd.hits == 2
+        assert list(dbd._lru) == [pres[3], pres[2]]
+        assert pres[1] in dbd  # reloaded from db so evicts pres[3]
+        assert dbd.misses == 5
+        assert dbd.evictions == 2
+        assert list(dbd.keys()) == [pres[0], pres[2], pres[1]]
+        assert list(dbd._lru) == [pres[2], pres[1]]
+
+        # prefix made local after its kever was cached is pinned not evicted
+        db.prefixes.add(pres[2])
+        assert pres[3] in dbd
+        assert dbd.evictions == 2
+        assert list(dbd.keys()) == [pres[0], pres[2], pres[1], pres[3]]
+        assert list(dbd._lru) == [pres[1], pres[3]]
+        assert dbd.pop(pres[3]) and list(dbd._lru) == [pres[1]]
+        del dbd[pres[1]]
+        assert not dbd._lru
+        assert pres[1] in dbd and list(dbd._lru) == [pres[1]]
+        db.prefixes.remove(pres[2])
+
+        kever = dbd[pres[1]]  # reloaded kever is compact until keys needed
+        assert "verfers" not in kever.__dict__
+        assert "serder" not in kever.__dict__
+        assert [verfer.qb64 for verfer in kever.verfers] == [pres[1]]
+        assert "verfers" in kever.__dict__
+        assert kever.serder.pre == pres[1]
+        assert kever.tholder.sith == "1"
+        assert kever.state() == db.states.get(keys=pres[1])
+
+        with pytest.raises(AttributeError):
+            kever.bogus
+
+        dbd.cap = None  # unbounded
+        assert pres[3] in dbd
+        assert dbd.prune() == 0
+        assert len(dbd) == 4
+        dbd.clear()
+        assert not dbd._lru
+
+    assert not os.path.exists(db.path)
+
     """End Test"""
 
 
@@ -2232,6 +2364,61 @@ def test_baserdoer():
     """End Test"""
 
 
+def test_checkpoint():
+    """
+    Test checkpoint of local key state reloaded only while valid
+    """
+    headDirPath = tempfile.mkdtemp()
+    with habbing.openHby(name="test", temp=False, headDirPath=headDirPath) as hby:
+        hab = hby.makeHab(name="alpha")
+        nhab = hby.makeHab(name="beta", ns="gamma")
+        hab.rotate()
+        assert hby.db._reloadCheckpoint() is False  # none yet
+
+        ckpt = hby.db.checkpoint()
+        assert ckpt.v == Baser.CheckpointVersion
+        assert ckpt.txn == hby.db.env.info()["last_txnid"]
+        assert {state["i"] for state in ckpt.states} == {hab.pre, nhab.pre}
+        assert hby.db.checkpoint().txn == ckpt.txn  # still valid so not rewritten
+        sn = hab.kever.sn
+        sdig = hab.kever.serder.said
+
+    # clean close wrote valid checkpoint so reload skips event lookups
+    db = Baser(name="test", headDirPath=headDirPath, reopen=True)
+    try:
+        assert db.ckps.get(keys=(Baser.CheckpointKey,)).txn == db.env.info()["last_txnid"]
+        assert db._reloadCheckpoint() is True
+        assert db.kevers[hab.pre].sn == sn
+        assert db.kevers[hab.pre].verfers[0].qb64 == hab.kever.verfers[0].qb64
+        assert {hab.pre, nhab.pre} <= set(db.prefixes)
+
+        db.hbys.pin(keys=("other",), val="value")  # any write makes it stale
+        assert db._reloadCheckpoint() is False
+    finally:
+        db.close()
+
+    # periodic checkpointer
+    db = Baser(name="test", headDirPath=headDirPath, reopen=True)
+    try:
+        db.hbys.pin(keys=("other",), val="again")
+        assert db._reloadCheckpoint() is False
+        doer = basing.Checkpointer(db=db, period=1.0)
+        doer.recur(tyme=0.0)
+        assert db._reloadCheckpoint() is False  # not due yet
+        doer.recur(tyme=1.0)
+        assert db._reloadCheckpoint() is True
+
+        # key state without its latest event is not checkpointed
+        assert db.delEvt(key=dbing.dgKey(pre=hab.pre, dig=sdig))
+        assert db.checkpoint() is None
+        assert db._reloadCheckpoint() is False
+    finally:
+        db.close(clear=True)
+        shutil.rmtree(headDirPath, ignore_errors=True)
+
+    """End Test"""
+
+
 def test_group_members():
     with openMultiSig(prefix="test") as ((hby1, ghab1), (hby2, ghab2), (hby3, ghab3)):
         keys = hby1.db.signingMembers(pre=ghab1.pre)
@@ -2278,6 +2465,9 @@ if __name__ == "__main__":
     test_baser()
     test_clean_baser()
     test_fetchkeldel()
+    test_clone_pre_run()
     test_usebaser()
     test_dbdict()
+    test_dbdict_cap()
     test_baserdoer()
+    test_checkpoint()
@@ -854,6 +854,182 @@ def test_lmdber():
     """ End Test """
 
 
+def test_lmdber_txn():
+    """
+    Test LMDBer reentrant batched write transaction context .txn
+    """
+    with dbing.openLMDB() as dber:
+        assert dber.active is None
+        db = dber.env.open_db(key=b'beep.')
+        ddb = dber.env.open_db(key=b'boop.', dupsort=True)
+
+        # writes within .txn commit together on exit and are readable within
+        with dber.txn(write=True) as txn:
+            assert dber.active is txn
+            assert dber.putVal(db, b'a', b'Alpha')
+            assert dber.getVal(db, b'a') == b'Alpha'  # read your own write
+            assert dber.putIoVals(ddb, b'a', [b'z', b'm'])
+            with dber.txn(write=True) as inner:  # reentrant joins outer
+                assert inner is txn
+                assert dber.addIoVal(ddb, b'a', b'b')
+            assert dber.getIoVals(ddb, b'a') == [b'z', b'm', b'b']
+            # not yet visible to a separate transaction
+            with dber.env.begin(db=db, write=False) as other:
+                assert other.get(b'a') is None
+
+        assert dber.active is None
+        assert bytes(dber.getVal(db, b'a')) == b'Alpha'
+        assert [bytes(val) for val in dber.getIoVals(ddb, b'a')] == [b'z', b'm', b'b']
+
+        # exception aborts all writes in the transaction
+        with pytest.raises(ValueError):
+            with dber.txn(write=True):
+                assert dber.setVal(db, b'a', b'Beta')
+                assert dber.putVal(db, b'b', b'Gamma')
+                raise ValueError("Abort")
+
+        assert dber.active is None
+        assert bytes(dber.getVal(db, b'a')) == b'Alpha'
+        assert dber.getVal(db, b'b') is None
+
+        # readonly snapshot does not allow nested write transaction
+        with dber.txn(write=False):
+            assert dber.getVal(db, b'a') == b'Alpha'
+            with pytest.raises(ValueError):
+                with dber.txn(write=True):
+                    pass
+
+        # deleting while iterating within one transaction
+        with dber.txn(write=True):
+            for key in (b'c', b'd', b'e'):
+                dber.putVal(db, key, key)
+            for key, val in dber.getTopItemIter(db):
+                dber.delVal(db, key)
+        assert [item for item in dber.getTopItemIter(db)] == []
+
+        # savepoint discards only its own writes on exception
+        with pytest.raises(ValueError):
+            with dber.savepoint():  # requires outer write transaction
+                pass
+        with dber.txn(write=True) as txn:
+            assert dber.putVal(db, b'f', b'Foxtrot')
+            with pytest.raises(ValueError):
+                with dber.savepoint() as child:
+                    assert dber.active is child
+                    assert dber.putVal(db, b'g', b'Golf')
+                    assert dber.delVal(db, b'f')
+                    raise ValueError("Abort")
+            assert dber.active is txn
+            with dber.savepoint():
+                assert dber.putVal(db, b'h', b'Hotel')
+        assert bytes(dber.getVal(db, b'f')) == b'Foxtrot'
+        assert dber.getVal(db, b'g') is None
+        assert bytes(dber.getVal(db, b'h')) == b'Hotel'
+
+    assert not os.path.exists(dber.path)
+    """ End Test """
+
+
+def test_lmdber_grow():
+    """
+    Test LMDBer configurable map size with automatic growth when full
+    """
+    with dbing.openLMDB(mapSize=65536, mapLimit=4194304) as dber:
+        assert dber.mapSize == 65536
+        assert dber.mapGrowth == LMDBer.MapGrowth == 2.0
+        assert dber.mapLimit == 4194304
+        assert dber.env.info()["map_size"] == 65536
+        db = dber.env.open_db(key=b'beep.')
+
+        # standalone writes grow map and retry
+        for i in range(1000):
+            assert dber.putVal(db, b'%05d' % i, b'x' * 200)
+        size = dber.env.info()["map_size"]
+        assert size > 65536
+        assert dber.highWater <= size
+        assert dber.cnt(db) == 1000
+
+        # outer transaction aborts then grows so caller may retry
+        while (size := dber.env.info()["map_size"]) < dber.mapLimit:
+            with pytest.raises(lmdb.MapFullError):
+                with dber.txn(write=True):
+                    for i in range(1000, 100000):
+                        dber.putVal(db, b'%05d' % i, b'x' * 200)
+            assert dber.cnt(db) == 1000  # aborted
+            assert dber.env.info()["map_size"] == min(2 * size, dber.mapLimit)
+
+        with pytest.raises(lmdb.MapFullError):  # at limit
+            dber.grow()
+
+        # remap deferred until suspended iterator ends
+        dber.mapLimit = 8388608
+        it = dber.getTopItemIter(db)
+        assert next(it) == (b'00000', b'x' * 200)  # holds read txn open
+        assert dber.grow() is None  # deferred
+        assert dber.env.info()["map_size"] == 4194304
+        assert len(list(it)) == 999  # iterator not invalidated
+        assert dber.env.info()["map_size"] == 8388608  # grown when txn ended
+
+    assert not os.path.exists(dber.path)
+
+    # writes fail while suspended iterator holds read txn then succeed
+    with dbing.openLMDB(mapSize=65536, mapLimit=4194304) as dber:
+        db = dber.env.open_db(key=b'beep.')
+        dber.putVal(db, b'00000', b'x' * 200)
+        it = dber.getTopItemIter(db)
+        assert next(it) == (b'00000', b'x' * 200)
+        with pytest.raises(lmdb.MapFullError):
+            for i in range(1, 1000):
+                dber.putVal(db, b'%05d' % i, b'x' * 200)
+        assert dber.env.info()["map_size"] == 65536
+        assert list(it) == []  # still valid
+        assert dber.env.info()["map_size"] == 131072
+        for i in range(1, 1000):
+            assert dber.setVal(db, b'%05d' % i, b'x' * 200)
+        assert dber.cnt(db) == 1000
+
+    assert not os.path.exists(dber.path)
+    """ End Test """
+
+
+def test_lmdber_atomic():
+    """
+    Test LMDBer.atomic retries whole transaction after growing map when full
+    """
+    with dbing.openLMDB(mapSize=65536, mapLimit=4194304) as dber:
+        db = dber.env.open_db(key=b'beep.')
+        calls = []
+
+        def fill(count):
+            calls.append(count)
+            for i in range(count):
+                dber.putVal(db, b'%05d' % i, b'x' * 200)
+            return count
+
+        assert dber.atomic(fill, 1000) == 1000
+        assert len(calls) > 1  # retried after growing
+        assert dber.cnt(db) == 1000
+        assert dber.env.info()["map_size"] > 65536
+
+        # nested joins outer so outermost atomic retries
+        calls.clear()
+        assert dber.atomic(lambda: dber.atomic(fill, 4000)) == 4000
+        assert len(calls) > 1
+        assert dber.cnt(db) == 4000
+
+        # at limit reraises with transaction aborted
+        with pytest.raises(lmdb.MapFullError):
+            dber.atomic(fill, 100000)
+        assert dber.cnt(db) == 4000
+        assert dber.env.info()["map_size"] == dber.mapLimit
+
+    assert not os.path.exists(dber.path)
+    """ End Test """
+
+
 if __name__ == "__main__":
     test_key_funcs()
     test_lmdber()
+    test_lmdber_txn()
+    test_lmdber_grow()
+    test_lmdber_atomic()
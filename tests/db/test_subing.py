@@ -683,6 +683,60 @@ def test_serder_suber():
 
 
 
+def test_serder_cache():
+    """
+    Test SerderCache bounded cache of deserialized serders
+    """
+    pre = "BDzwEHHzq7K0gzQPYGGwTmuupUhPx5_yZ-Wk1x4ejhcc"
+    srdr0 = eventing.incept(keys=[pre])
+    srdr1 = eventing.rotate(pre=pre, keys=[pre], dig=srdr0.said)
+    srdr2 = eventing.rotate(pre=pre, keys=[pre], dig=srdr1.said, sn=2)
+
+    cache = subing.SerderCache(budget=srdr0.size + srdr1.size)
+    assert cache.budget == srdr0.size + srdr1.size
+    assert len(cache) == 0
+
+    serder = cache.get(srdr0.raw)
+    assert isinstance(serder, coring.Serder)
+    assert serder.said == srdr0.said
+    assert cache.misses == 1
+    assert cache.get(bytearray(srdr0.raw)) is serder  # same instance
+    assert cache.get(memoryview(srdr0.raw)) is serder
+    assert cache.hits == 2
+    assert cache.size == srdr0.size
+
+    serder1 = cache.get(srdr1.raw)
+    assert serder1.said == srdr1.said
+    assert cache.get(srdr0.raw) is serder  # srdr0 now most recently used
+    assert cache.get(srdr2.raw).said == srdr2.said  # evicts srdr1 over budget
+    assert cache.evictions == 1
+    assert len(cache) == 2
+    assert cache.size == srdr0.size + srdr2.size
+    assert cache.get(srdr1.raw) is not serder1  # evicted so deserialized again
+    assert cache.misses == 4
+
+    with pytest.raises(Exception):
+        cache.get(b"not a serder")
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.size == 0
+
+    cache = subing.SerderCache(budget=0)  # disabled
+    assert cache.get(srdr0.raw) is not cache.get(srdr0.raw)
+    assert len(cache) == 0
+
+    assert subing.serders.budget == subing.SerderCache.Budget
+
+    with dbing.openLMDB() as db:  # SerderSuber consults shared cache
+        sdb = subing.SerderSuber(db=db, subkey='bags.')
+        sdb.put(keys=(pre, srdr0.said), val=srdr0)
+        assert sdb.get(keys=(pre, srdr0.said)) is sdb.get(keys=(pre, srdr0.said))
+
+    """End Test"""
+
+
+
 def test_cesr_suber():
     """
     Test CesrSuber LMDBer sub database class
@@ -1635,6 +1689,7 @@ def test_crypt_signer_suber():
 if __name__ == "__main__":
     test_cesr_ioset_suber()
     test_serder_suber()
+    test_serder_cache()
     test_cesr_suber()
     test_cat_suber()
     test_cat__cesr_ioset_suber()
@@ -0,0 +1,149 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.help.test_metering module
+
+"""
+import pytest
+from hio.base import doing
+
+from keri.app import habbing
+from keri.core import eventing, parsing
+from keri.help import metering
+
+
+def test_meter():
+    """
+    Test Meter counters, gauges, histograms, and rendering
+    """
+    mtr = metering.Meter()
+    assert not mtr.enabled
+    assert mtr.metrics == {}
+
+    counter = mtr.counter("keri_test_total", help="Test count", labels=("kind",))
+    assert mtr.counter("keri_test_total") is counter
+    counter.inc("a")
+    counter.inc("a", amount=2)
+    counter.inc("b")
+    assert counter.values == {("a",): 3, ("b",): 1}
+
+    with pytest.raises(ValueError):
+        mtr.gauge("keri_test_total")
+
+    depth = []
+    gauge = mtr.gauge("keri_test_depth", help="Test depth", fn=lambda: len(depth))
+    depth.extend([1, 2])
+    assert gauge.items() == [({}, 2)]
+    sizes = mtr.gauge("keri_test_sizes", labels=("table",), fn=lambda: dict(x=1, y=5))
+    assert sizes.items() == [(dict(table="x"), 1), (dict(table="y"), 5)]
+    broken = mtr.gauge("keri_test_broken", fn=lambda: 1 / 0)
+    assert broken.items() == []
+    mtr.remove("keri_test_broken")
+
+    hist = mtr.histogram("keri_test_seconds", labels=("kind",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        hist.observe(value, "a")
+    (labels, value), = hist.items()
+    assert labels == dict(kind="a")
+    assert value["count"] == 4
+    assert value["sum"] == pytest.approx(2.65)
+    assert value["buckets"] == {0.1: 2, 1.0: 3, float("inf"): 4}
+
+    text = mtr.render()
+    assert "# TYPE keri_test_total counter\n" in text
+    assert 'keri_test_total{kind="a"} 3\n' in text
+    assert "keri_test_depth 2\n" in text
+    assert 'keri_test_sizes{table="y"} 5\n' in text
+    assert 'keri_test_seconds_bucket{kind="a",le="+Inf"} 4\n' in text
+    assert 'keri_test_seconds_count{kind="a"} 4\n' in text
+
+    snap = mtr.snapshot()
+    assert snap["keri_test_total"]["type"] == "counter"
+    assert snap["keri_test_seconds"]["values"][0]["value"]["buckets"]["+Inf"] == 4
+
+    assert metering._labels({"route": 'a"b\\c\n'}) == '{route="a\\"b\\\\c\\n"}'
+
+    mtr.clear()
+    assert counter.values == {}
+    assert "keri_test_total" in mtr.metrics
+
+    @mtr.timed("keri_test_call_seconds", label=lambda x: "odd" if x % 2 else "even")
+    def check(x):
+        if x < 0:
+            raise ValueError("negative")
+        return x
+
+    assert check(3) == 3  # disabled so not timed
+    assert "keri_test_call_seconds" not in mtr.metrics
+    mtr.enabled = True
+    assert check(3) == 3
+    assert check(4) == 4
+    with pytest.raises(ValueError):
+        check(-1)
+    timed = mtr.metrics["keri_test_call_seconds"]
+    assert {tuple(labels.values()): value["count"] for labels, value in timed.items()} == {
+        ("odd", "ok"): 1, ("even", "ok"): 1, ("odd", "ValueError"): 1}
+
+
+def test_instrumented():
+    """
+    Test hooks of Parser and Kevery record to global meter only when enabled
+    """
+    mtr = metering.meter
+    with habbing.openHby(name="meter", temp=True) as hby:
+        hab = hby.makeHab(name="hab")
+        msgs = bytearray()
+        for msg in hby.db.clonePreIter(pre=hab.pre):
+            msgs.extend(msg)
+
+        with habbing.openHby(name="other", temp=True) as other:
+            kvy = eventing.Kevery(db=other.db, lax=True, local=False)
+            parsing.Parser(kvy=kvy).parse(ims=bytearray(msgs))
+            assert "keri_kevery_event_seconds" not in mtr.metrics
+
+            try:
+                mtr.enabled = True
+                hab.interact()
+                msg = bytearray(next(hby.db.clonePreIter(pre=hab.pre, fn=1)))
+                size = len(msg)
+                parsing.Parser(kvy=kvy).parse(ims=msg)
+                parsing.Parser(kvy=kvy).parse(ims=bytearray(msgs))  # duplicate
+
+                hist = mtr.metrics["keri_kevery_event_seconds"]
+                counts = {tuple(labels.values()): value["count"] for labels, value in hist.items()}
+                assert counts[("ixn", "ok")] == 2  # by hab's own Kevery and by other's
+                assert counts[("icp", "ok")] == 1
+                assert mtr.metrics["keri_parser_msgs_total"].values[("KERI",)] == 2
+                assert 0 < mtr.metrics["keri_parser_bytes_total"].values[("KERI",)] < 2 * size
+            finally:
+                mtr.enabled = False
+                for name in ("keri_kevery_event_seconds", "keri_parser_msgs_total",
+                             "keri_parser_bytes_total"):
+                    mtr.remove(name)
+
+
+def test_metered_doist():
+    """
+    Test MeteredDoist times runs of its doers
+    """
+    mtr = metering.Meter(enabled=True)
+
+    def counting(tymth=None, tock=0.0, **opts):
+        for _ in range(3):
+            yield tock
+        return True
+
+    doer = doing.doify(counting)
+    doist = metering.MeteredDoist(mtr=mtr, tock=0.03125, limit=1.0)
+    doist.do(doers=[doer])
+    assert doer.done is True
+
+    (labels, value), = mtr.metrics["keri_doer_run_seconds"].items()
+    assert labels == dict(doer="test_metered_doist.<locals>.counting")
+    assert value["count"] == 3
+    assert mtr.metrics["keri_doist_recur_seconds"].items()[0][1]["count"] >= 3
+
+
+if __name__ == "__main__":
+    test_meter()
+    test_instrumented()
+    test_metered_doist()
@@ -749,6 +749,26 @@ def test_tevery():
         assert status.ked["et"] == Ilks.rev
         assert status.sn == 1
 
+        # status index maintained by logEvent matches state computed from TEL
+        vci = vcdig.decode("utf-8")
+        record = reg.vcss.get(keys=vci)
+        assert record.sn == 1
+        assert record.d == rev.said
+        assert record.et == Ilks.rev
+        assert record.ri == regk
+        assert record.a == dict(s=seqner.sn, d=diger.qb64)
+        assert record == tev.vcRecord(vci)
+        assert tev.vcSn(vci) == 1
+
+        missing = "EBWNHdSXCJnFJL5OuQPyM5K0neuniccMBdXt3gIXOf2B"
+        states = tev.vcStates([vci, missing])
+        assert states[missing] is None
+        assert states[vci].ked == status.ked
+
+        reg.vcss.rem(keys=vci)  # backfilled on read
+        assert tev.vcStates([vci])[vci].ked == status.ked
+        assert reg.vcss.get(keys=vci) == record
+
 
 def test_tevery_process_escrow(mockCoringRandomNonce):
     with basing.openDB() as db, keeping.openKS() as kpr, viring.openReger() as reg:
@@ -468,6 +468,28 @@ def test_verifier_chained_credential(seeder):
         saider = ianreg.reger.schms.get(vLeiSchema)
         assert saider[0].qb64 == vLeiCreder.said
 
+        # chains hydrated once per unique credential
+        memo = dict()
+        creds = ianreg.reger.cloneCreds([vLeiCreder.saider, creder.saider, vLeiCreder.saider],
+                                        memo=memo)
+        assert set(memo) == {vLeiCreder.said, creder.said}
+        assert creds[0] is creds[2]
+        assert creds[0]["chains"][0] is creds[1]
+        assert creds[1]["sad"]["d"] == creder.said
+        assert creds[0]["status"]["et"] == coring.Ilks.iss
+
+        assert vLeiCreder.said in ianreg.reger.clones  # memoized across calls
+        clone = ianreg.reger.cloneCred(said=vLeiCreder.said)
+        assert clone is ianreg.reger.cloneCred(said=vLeiCreder.said)
+
+        sources = ianreg.reger.sources(ian.db, vLeiCreder)
+        assert [screder.said for screder, _ in sources] == [creder.said]
+
+        # cycle protection
+        path = {creder.said}
+        with pytest.raises(kering.ValidationError):
+            ianreg.reger.hydrate(creder.said, memo=dict(), path=path)
+
         # test operators
 
         untargetedSubject = dict(